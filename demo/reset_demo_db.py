@@ -51,8 +51,21 @@ Preserved (not touched by this script):
   - Any indexes not in the list above
   - Any other Neo4j databases on the same server
 
+Batching and scope:
+  Nodes are deleted in batches of ``--batch-size`` (default
+  ``POWER_ATLAS_RESET_BATCH_SIZE`` or 10000), each batch in its own
+  transaction, so a large graph never has to fit in one transaction.  Progress
+  is logged while the reset runs.  If a reset is interrupted, the committed
+  batches stay deleted and re-running the same command continues from there.
+
+  ``--run-id RUN_ID`` deletes only nodes carrying that ``run_id``.
+  ``--dataset-id DATASET_ID`` deletes the nodes tagged with that dataset plus
+  the run-scoped nodes (claims, mentions, clusters) of every run that wrote
+  them.  Scoped resets keep the demo indexes and skip the stale-edge cleanup.
+
 Reset actions are written to a JSON report file in the output directory for
-inspection/debugging.  See ``run_reset()`` for the report schema.
+inspection/debugging.  The report includes batch count, elapsed time and
+deletion throughput.  See ``run_reset()`` for the report schema.
 """
 from __future__ import annotations
 
@@ -58,6 +58,7 @@ from power_atlas.orchestration.stage_dependency_registry import (
 from power_atlas.orchestration.orchestrated_runner import (
     run_orchestrated_request_context as _run_orchestrated_request_context_impl,
 )
+from power_atlas.graph_schema_migrations import ensure_graph_schema_request_context
 from power_atlas.run_scope_queries import fetch_dataset_id_for_run
 from power_atlas.run_scope_queries import fetch_latest_unstructured_run_id
 
@@ -134,6 +135,10 @@ def run_interactive_qa_request_context(*args, **kwargs):
     return _stage_entrypoints().run_interactive_qa_request_context(*args, **kwargs)
 
 
+def run_batch_qa_request_context(*args, **kwargs):
+    return _stage_entrypoints().run_batch_qa_request_context(*args, **kwargs)
+
+
 def run_retrieval_and_qa_request_context(*args, **kwargs):
     return _stage_entrypoints().run_retrieval_and_qa_request_context(*args, **kwargs)
 
@@ -615,6 +620,8 @@ def _build_run_demo_main_kwargs() -> dict[str, Any]:
         ),
         run_independent_stage=_run_independent_stage,
         format_scope_label=_format_scope_label,
+        resolve_ensure_graph_schema=lambda: ensure_graph_schema_request_context,
+        resolve_run_batch_qa_request_context=lambda: run_batch_qa_request_context,
         **_run_demo_entrypoint.build_run_demo_main_runtime_resolvers(
             run_interactive_qa_request_context=run_interactive_qa_request_context,
             create_driver=create_neo4j_driver,
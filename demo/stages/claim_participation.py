@@ -86,6 +86,7 @@ from power_atlas.claim_participation_edges import (
     MATCH_OUTCOME_AMBIGUOUS,
     ROLE_OBJECT,
     ROLE_SUBJECT,
+    MentionMatchIndex,
     ParticipationMatchMetrics,
     _METRICS_SAMPLE_SIZE,
     build_participation_edges,
@@ -114,6 +115,7 @@ __all__ = [
     "EDGE_TYPE_HAS_PARTICIPANT",
     "ROLE_SUBJECT",
     "ROLE_OBJECT",
+    "MentionMatchIndex",
     "ParticipationMatchMetrics",
     "split_slot_text",
     "match_slot_to_mention",
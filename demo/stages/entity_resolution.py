@@ -272,6 +272,7 @@ from power_atlas.entity_resolution_runner import write_alignment_results as _wri
 from power_atlas.entity_resolution_runner import write_cluster_memberships as _write_cluster_memberships_impl
 from power_atlas.entity_resolution_runner import write_resolution_results as _write_resolution_results_impl
 from power_atlas.entity_resolution_runner import write_resolved_mentions as _write_resolved_mentions_impl
+from power_atlas.neo4j_batch_writes import BatchWriteStats
 from power_atlas.settings import Neo4jSettings
 from power_atlas.text_utils import normalize_mention_text
 
@@ -382,8 +383,8 @@ def _write_resolution_results(
     unresolved_rows: list[dict[str, Any]],
     neo4j_database: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
-    _write_resolution_results_impl(
+) -> list[BatchWriteStats]:
+    return _write_resolution_results_impl(
         driver,
         run_id=run_id,
         source_uri=source_uri,
@@ -409,8 +410,8 @@ def _write_cluster_memberships(
     cluster_rows: list[dict[str, Any]],
     neo4j_database: str,
     created_at: str,
-) -> None:
-    _write_cluster_memberships_impl(
+) -> list[BatchWriteStats]:
+    return _write_cluster_memberships_impl(
         driver,
         run_id=run_id,
         cluster_rows=cluster_rows,
@@ -427,8 +428,8 @@ def _write_resolved_mentions(
     source_uri: str | None,
     resolved_rows: list[dict[str, Any]],
     neo4j_database: str,
-) -> None:
-    _write_resolved_mentions_impl(
+) -> list[BatchWriteStats]:
+    return _write_resolved_mentions_impl(
         driver,
         run_id=run_id,
         source_uri=source_uri,
@@ -444,8 +445,8 @@ def _write_alignment_results(
     alignment_rows: list[dict[str, Any]],
     neo4j_database: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
-    _write_alignment_results_impl(
+) -> list[BatchWriteStats]:
+    return _write_alignment_results_impl(
         driver,
         run_id=run_id,
         source_uri=source_uri,
@@ -14,6 +14,7 @@ class DemoStageEntrypoints:
     run_pdf_ingest_request_context: Callable[..., dict[str, Any]]
     run_structured_ingest_request_context: Callable[..., dict[str, Any]]
     run_interactive_qa_request_context: Callable[..., Any]
+    run_batch_qa_request_context: Callable[..., dict[str, Any]]
     run_retrieval_and_qa_request_context: Callable[..., dict[str, Any]]
     run_retrieval_benchmark: Callable[..., dict[str, Any]]
     run_retrieval_benchmark_request_context: Callable[..., dict[str, Any]]
@@ -27,6 +28,7 @@ def load_demo_stage_entrypoints() -> DemoStageEntrypoints:
     from demo.stages.pdf_ingest import run_pdf_ingest_request_context, sha256_file
     from demo.stages.retrieval_and_qa import (
         _format_scope_label,
+        run_batch_qa_request_context,
         run_interactive_qa_request_context,
         run_retrieval_and_qa_request_context,
     )
@@ -48,6 +50,7 @@ def load_demo_stage_entrypoints() -> DemoStageEntrypoints:
         run_pdf_ingest_request_context=run_pdf_ingest_request_context,
         run_structured_ingest_request_context=run_structured_ingest_request_context,
         run_interactive_qa_request_context=run_interactive_qa_request_context,
+        run_batch_qa_request_context=run_batch_qa_request_context,
         run_retrieval_and_qa_request_context=run_retrieval_and_qa_request_context,
         run_retrieval_benchmark=run_retrieval_benchmark,
         run_retrieval_benchmark_request_context=run_retrieval_benchmark_request_context,
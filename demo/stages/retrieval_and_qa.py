@@ -1,22 +1,25 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
 import re
 import types
 from collections.abc import Mapping
+from pathlib import Path
 from typing import Literal, TypedDict, cast
 
 import neo4j
 from power_atlas.adapters.graphrag_retrieval import (
     GraphRAG,
-    InMemoryMessageHistory,
     MessageHistory,
     OpenAIEmbeddings,
 )
 
 from power_atlas.adapters.llm import build_embedder, build_llm as build_openai_llm
 from power_atlas.bootstrap import require_openai_api_key
+from power_atlas.contracts.runtime import timestamp
 from power_atlas.context import RequestContext
 from power_atlas.contracts import (
     ALIGNMENT_VERSION,
@@ -81,6 +84,14 @@ from power_atlas.retrieval_interactive_session import (
     initialize_interactive_session,
     run_interactive_session_loop,
 )
+from power_atlas.retrieval_batch_session import (
+    BatchQaSettings,
+    read_batch_questions,
+    run_batch_qa_session,
+)
+from power_atlas.retrieval_message_history import TokenBudgetMessageHistory
+from power_atlas.query_embedding_cache import shared_query_embedding_cache
+from power_atlas.retrieval_result_cache import shared_retrieval_result_cache
 from power_atlas.retrieval_live_preflight import require_live_retrieval_openai_api_key
 from power_atlas.retrieval_live_preflight import resolve_live_neo4j_settings
 from power_atlas.retrieval_execution_setup import (
@@ -106,6 +117,7 @@ from power_atlas.retrieval_runtime import (
     run_live_retrieval_session,
 )
 from power_atlas.settings import Neo4jSettings
+from power_atlas.retrieval_scoped_search import RETRIEVAL_SCOPE_POST_FILTER
 from power_atlas.adapters.graphrag_retrieval import (
     LLMMessage,
     RetrieverResultItem,
@@ -437,8 +449,20 @@ def _build_retriever_and_rag(
         OpenAI model name to use for answer generation.
     neo4j_database:
         Optional Neo4j database name; ``None`` uses the driver's default database.
+    retrieval_policy:
+        Optional retrieval policy.  A ``scope_strategy`` other than
+        ``post_filter`` selects ``RunScopedVectorCypherRetriever``, which picks
+        in-scope candidates before the retrieval query runs.
     """
     resolved_retrieval_policy = _resolve_retrieval_policy(retrieval_policy)
+    retriever_factory = VectorCypherRetriever
+    if resolved_retrieval_policy.scope_strategy != RETRIEVAL_SCOPE_POST_FILTER:
+        from power_atlas.adapters.neo4j.scoped_vector_retriever import RunScopedVectorCypherRetriever
+
+        retriever_factory = functools.partial(
+            RunScopedVectorCypherRetriever,
+            scope_strategy=resolved_retrieval_policy.scope_strategy,
+        )
     retriever, rag = build_retriever_and_rag_impl(
         driver,
         index_name=index_name,
@@ -448,11 +472,13 @@ def _build_retriever_and_rag(
         embedder_model_name=_pipeline_contract_value("EMBEDDER_MODEL_NAME", pipeline_contract),
         result_formatter=_chunk_citation_formatter,
         embedder_factory=OpenAIEmbeddings,
-        retriever_factory=VectorCypherRetriever,
+        retriever_factory=retriever_factory,
         rag_factory=GraphRAG,
         build_embedder=build_embedder,
         build_llm=build_openai_llm,
         prompt_template=resolved_retrieval_policy.rag_template,
+        query_embedding_cache=shared_query_embedding_cache(),
+        retrieval_result_cache=shared_retrieval_result_cache(),
     )
     return retriever, rag
 
@@ -739,7 +765,9 @@ def _run_interactive_qa_impl(
     - vendor-resources/examples/question_answering/graphrag_with_message_history.py
       (list[dict]-based history)
     - vendor-resources/examples/question_answering/graphrag_with_neo4j_message_history.py
-      (MessageHistory-based; this REPL uses InMemoryMessageHistory)
+      (MessageHistory-based; this REPL uses TokenBudgetMessageHistory, an
+      InMemoryMessageHistory that keeps the last turns verbatim, condenses older
+      turns and strips citation tokens to stay within a token budget)
 
     Parameters
     ----------
@@ -766,7 +794,8 @@ def _run_interactive_qa_impl(
         When True, prints a compact postprocessing summary after each answer showing
         citation quality metadata sourced from the shared postprocessing contract
         (raw/final citation state, repair/fallback applied, evidence level, warning
-        count).  Default is False so normal interactive output is unaffected.
+        count), followed by the turn's estimated prompt tokens and latency.  Default
+        is False so normal interactive output is unaffected.
     pipeline_contract:
         Optional explicit pipeline contract snapshot. RequestContext-driven calls
         should always provide this rather than relying on config/global fallback.
@@ -812,7 +841,7 @@ def _run_interactive_qa_impl(
     history: MessageHistory = initialize_interactive_session(
         run_id=run_id,
         all_runs=all_runs,
-        history_factory=InMemoryMessageHistory,
+        history_factory=TokenBudgetMessageHistory,
         format_scope_label=_format_scope_label,
     )
 
@@ -884,9 +913,188 @@ def run_interactive_qa_request_context(
     )
 
 
+def _batch_answer_fields(
+    rag: GraphRAG,
+    question: str,
+    *,
+    top_k: int,
+    query_params: dict[str, object],
+    all_runs: bool,
+) -> dict[str, object]:
+    search_result = execute_retrieval_search(
+        rag,
+        question=question,
+        top_k=top_k,
+        query_params=query_params,
+        citation_optional_fields=_CITATION_OPTIONAL_FIELDS,
+        logger=_logger,
+    )
+    pp = _postprocess_answer(
+        search_result.answer_text,
+        search_result.hits,
+        all_runs=all_runs,
+        existing_citation_warnings=search_result.citation_warnings,
+    )
+    return {
+        **_project_postprocess_to_public(pp),
+        "evidence_level": pp["evidence_level"],
+        "citation_warning_count": pp["warning_count"],
+        "hit_count": len(search_result.hits),
+        "warnings": search_result.warnings,
+    }
+
+
+def _run_batch_qa_impl(
+    config: object,
+    *,
+    questions_path: Path,
+    output_path: Path | None = None,
+    run_id: str | None = None,
+    source_uri: str | None = None,
+    top_k: int = _DEFAULT_TOP_K,
+    index_name: str | None = None,
+    expand_graph: bool | None = None,
+    cluster_aware: bool | None = None,
+    all_runs: bool = False,
+    settings: BatchQaSettings | None = None,
+    pipeline_contract: PipelineContractSnapshot | None = None,
+    retrieval_policy: RetrievalPolicy | None = None,
+    neo4j_settings: Neo4jSettings | None = None,
+) -> dict[str, object]:
+    """Answer every question in a JSONL file over one retrieval session.
+
+    The driver, retriever, LLM and GraphRAG objects are built once; questions
+    are embedded in batches and answered concurrently without message history
+    (see :mod:`power_atlas.retrieval_batch_session`).  Results stream to
+    *output_path* (default ``<output_dir>/batch_qa/batch_qa_<timestamp>.jsonl``),
+    one line per question with latency and citation-quality fields; the
+    returned summary is also written next to it as ``*.summary.json``.
+    """
+    questions = read_batch_questions(questions_path)
+    effective_expand_graph, effective_cluster_aware = _resolve_retrieval_traversal_options(
+        retrieval_policy=retrieval_policy,
+        expand_graph=expand_graph,
+        cluster_aware=cluster_aware,
+    )
+    execution_context = prepare_retrieval_execution_context(
+        config=config,
+        pipeline_contract=pipeline_contract,
+        index_name=index_name,
+        expand_graph=effective_expand_graph,
+        cluster_aware=effective_cluster_aware,
+        all_runs=all_runs,
+        resolve_pipeline_contract=_resolve_pipeline_contract,
+        pipeline_contract_value=_pipeline_contract_value,
+        select_runtime_retrieval_query=lambda **kwargs: _select_runtime_retrieval_query(
+            **kwargs,
+            retrieval_policy=retrieval_policy,
+        ),
+    )
+    query_params = build_live_retrieval_query_params(
+        run_id=run_id,
+        source_uri=source_uri,
+        all_runs=all_runs,
+        cluster_aware=effective_cluster_aware,
+        build_query_params=_build_query_params,
+        run_id_error_message=(
+            "run_id is required for batch retrieval. "
+            "Pass --run-id, --latest, or use --all-runs to query across all data."
+        ),
+    )
+    resolved_output_path = (
+        Path(getattr(config, "output_dir")) / "batch_qa" / f"batch_qa_{timestamp()}.jsonl"
+        if output_path is None
+        else Path(output_path)
+    )
+
+    def _run_batch_session(*, driver: object, retriever: object, rag: GraphRAG) -> dict[str, object]:
+        del driver
+        return run_batch_qa_session(
+            retriever=retriever,
+            questions=questions,
+            output_path=resolved_output_path,
+            answer_question=lambda question: _batch_answer_fields(
+                rag,
+                question,
+                top_k=top_k,
+                query_params=query_params,
+                all_runs=all_runs,
+            ),
+            settings=settings,
+        )
+
+    summary = run_live_retrieval_session(
+        config=config,
+        neo4j_settings=neo4j_settings,
+        neo4j_settings_type=Neo4jSettings,
+        require_openai_api_key=require_openai_api_key,
+        openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+        openai_error_message="OPENAI_API_KEY environment variable is required for live retrieval.",
+        neo4j_error_message=(
+            "Live retrieval requires config.settings.neo4j or an explicit neo4j_settings "
+            "argument from RequestContext/AppContext-backed config"
+        ),
+        index_name=execution_context.resolved_index_name,
+        retrieval_query=execution_context.retrieval_query,
+        qa_model=execution_context.effective_qa_model,
+        pipeline_contract=execution_context.pipeline_contract,
+        build_retriever_and_rag=lambda *args, **kwargs: _build_retriever_and_rag(
+            *args,
+            **kwargs,
+            retrieval_policy=retrieval_policy,
+        ),
+        run_session=_run_batch_session,
+    )
+    summary = {
+        **summary,
+        "retrieval_scope": {"run_id": None if all_runs else run_id, "source_uri": source_uri, "all_runs": all_runs},
+        "top_k": top_k,
+        "qa_model": execution_context.effective_qa_model,
+    }
+    retrieval_cache = shared_retrieval_result_cache()
+    if retrieval_cache is not None:
+        summary["retrieval_cache"] = retrieval_cache.stats().to_summary()
+    summary_path = resolved_output_path.with_suffix(".summary.json")
+    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    summary["summary_path"] = str(summary_path)
+    return summary
+
+
+def run_batch_qa_request_context(
+    request_context: RequestContext,
+    *,
+    questions_path: Path,
+    output_path: Path | None = None,
+    top_k: int = _DEFAULT_TOP_K,
+    index_name: str | None = None,
+    expand_graph: bool | None = None,
+    cluster_aware: bool | None = None,
+    settings: BatchQaSettings | None = None,
+) -> dict[str, object]:
+    """Run batch question answering using request-scoped context as the primary input."""
+    runtime = request_context.runtime
+    return _run_batch_qa_impl(
+        runtime.config,
+        questions_path=questions_path,
+        output_path=output_path,
+        run_id=runtime.run_id,
+        source_uri=runtime.source_uri,
+        top_k=top_k,
+        index_name=index_name,
+        expand_graph=expand_graph,
+        cluster_aware=cluster_aware,
+        all_runs=runtime.all_runs,
+        settings=settings,
+        pipeline_contract=runtime.pipeline_contract,
+        retrieval_policy=runtime.policies.retrieval,
+        neo4j_settings=runtime.settings.neo4j,
+    )
+
+
 __all__ = [
     "run_retrieval_and_qa_request_context",
     "run_interactive_qa_request_context",
+    "run_batch_qa_request_context",
     "_CITATION_FALLBACK_PREFIX",
     "_format_scope_label",
     "_format_retrieval_path_summary",
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import unittest
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import neo4j
 
@@ -16,6 +16,7 @@ from demo.stages.claim_participation import (
     MATCH_OUTCOME_AMBIGUOUS,
     ROLE_OBJECT,
     ROLE_SUBJECT,
+    MentionMatchIndex,
     ParticipationMatchMetrics,
     build_participation_edges,
     build_participation_edges_with_metrics,
@@ -2360,3 +2361,74 @@ class TestResidualListSplitPartial(unittest.TestCase):
         self.assertIn("residual_list_split_partial", serialised)
         self.assertIn("UnknownCo", serialised)
 
+
+# ---------------------------------------------------------------------------
+# MentionMatchIndex
+# ---------------------------------------------------------------------------
+
+
+class TestMentionMatchIndex(unittest.TestCase):
+    """The per-chunk-group index must match exactly like the linear scan."""
+
+    def _linear_match(self, slot_text: str, mentions: list[dict[str, Any]]):
+        from power_atlas.text_utils import normalize_mention_text
+
+        slot = slot_text.strip()
+        if not slot or not mentions:
+            return None, None
+        raw_forms = [(m, str(m.get("name") or "").strip()) for m in mentions]
+        for key, method in (
+            (lambda text: text, MATCH_METHOD_RAW_EXACT),
+            (str.casefold, MATCH_METHOD_CASEFOLD_EXACT),
+            (normalize_mention_text, MATCH_METHOD_NORMALIZED_EXACT),
+        ):
+            matches = [m for m, raw in raw_forms if key(raw) == key(slot)]
+            if len(matches) == 1:
+                return matches[0], method
+            if matches:
+                return None, MATCH_OUTCOME_AMBIGUOUS
+        return None, None
+
+    def test_index_matches_linear_scan_including_ambiguity(self):
+        mentions = [
+            {"mention_id": "m1", "name": "Acme Corp"},
+            {"mention_id": "m2", "name": "ACME CORP"},
+            {"mention_id": "m3", "name": "Café Nero"},
+            {"mention_id": "m4", "name": "Cafe Nero"},
+            {"mention_id": "m5", "name": "  Straße  "},
+            {"mention_id": "m6", "name": "O’Brien"},
+            {"mention_id": "m7", "name": None},
+        ]
+        index = MentionMatchIndex.build(mentions)
+        slots = [
+            "Acme Corp", "acme corp", "Café Nero", "cafe nero", "CAFÉ NERO",
+            "strasse", "Straße", "O'Brien", "o’brien", "Unknown", "   ", "",
+        ]
+        for slot in slots:
+            with self.subTest(slot=slot):
+                self.assertEqual(index.match(slot), self._linear_match(slot, mentions))
+                self.assertEqual(match_slot_to_mention(slot, mentions), self._linear_match(slot, mentions))
+        self.assertEqual(index.match("acme corp"), (None, MATCH_OUTCOME_AMBIGUOUS))
+        self.assertEqual(MentionMatchIndex.build([]).match("Acme Corp"), (None, None))
+
+    def test_index_built_once_per_chunk_group(self):
+        mentions = [
+            _mention("Google", "m-google", chunk_ids=["chunk-1"]),
+            _mention("Alphabet", "m-alpha", chunk_ids=["chunk-1", "chunk-2"]),
+            _mention("Google", "m-google-2", chunk_ids=["chunk-2"]),
+        ]
+        claims = [
+            _claim("c1", subject="Google", obj="Alphabet"),
+            _claim("c2", subject="google", chunk_ids=["chunk-1"]),
+            _claim("c3", subject="Google", obj="Alphabet and Google", chunk_ids=["chunk-2"]),
+            _claim("c4", subject="Google", chunk_ids=["chunk-1", "chunk-2"]),
+        ]
+        with patch.object(MentionMatchIndex, "build", wraps=MentionMatchIndex.build) as build:
+            edges, metrics = build_participation_edges_with_metrics(claims, mentions)
+        self.assertEqual(build.call_count, 3)
+        by_claim = {(e["claim_id"], e["slot"]): e["mention_id"] for e in edges if e.get("match_method") != MATCH_METHOD_LIST_SPLIT}
+        self.assertEqual(by_claim[("c1", "subject")], "m-google")
+        self.assertEqual(by_claim[("c2", "subject")], "m-google")
+        self.assertEqual(by_claim[("c3", "subject")], "m-google-2")
+        self.assertNotIn(("c4", "subject"), by_claim)
+        self.assertEqual(metrics.ambiguous_slots, 1)
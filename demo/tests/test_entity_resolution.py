@@ -781,6 +781,28 @@ class TestEntityResolutionRequestContextLive(unittest.TestCase):
             self.assertEqual(result["unresolved"], 0)
             self.assertEqual(result["resolution_breakdown"].get("qid_exact"), 1)
 
+    def test_live_summary_records_write_batches(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _live_config(Path(tmpdir))
+            mentions = [{"mention_id": "m1", "name": "Q42", "entity_type": "person"}]
+            canonicals = [{"entity_id": "Q42", "run_id": "run-s1", "name": "Douglas Adams", "aliases": None, "dataset_id": "demo_dataset_v1"}]
+            driver = self._make_driver(mentions, canonicals)
+
+            with patch("neo4j.GraphDatabase.driver", return_value=driver):
+                result = _run_entity_resolution_via_request_context(
+                    config,
+                    run_id="run-live-batches",
+                    source_uri="file:///doc.pdf",
+                    resolution_mode="structured_anchor",
+                )
+
+            written = json.loads(Path(result["entity_resolution_summary_path"]).read_text(encoding="utf-8"))
+            self.assertEqual(written["write_batches"], result["write_batches"])
+            self.assertEqual(
+                [(item["name"], item["rows"], item["batches"]) for item in result["write_batches"]],
+                [("resolves_to", 1, 1)],
+            )
+
     def test_live_resolves_label_match(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config = _live_config(Path(tmpdir))
@@ -2873,6 +2895,78 @@ class TestClusterMentionsUnstructuredOnly(unittest.TestCase):
         self.assertEqual(rows, [])
 
 
+class TestFuzzyCandidateIndex(unittest.TestCase):
+    """Tests for the per-type fuzzy candidate index used by unstructured-only clustering."""
+
+    @staticmethod
+    def _linear_first_match(keys, query, threshold):
+        for key in keys:
+            if not key and not query:
+                return key, 1.0
+            if not key or not query:
+                continue
+            min_len, max_len = sorted((len(key), len(query)))
+            if 2 * min_len / (min_len + max_len) < threshold:
+                continue
+            ratio = _fuzzy_ratio(query, key)
+            if ratio >= threshold:
+                return key, ratio
+        return None, 0.0
+
+    def test_first_match_agrees_with_linear_scan(self):
+        import random
+
+        from power_atlas.entity_resolution_clustering import _FuzzyCandidateIndex
+
+        rng = random.Random(7)
+        alphabet = "abcdeor nst"
+        keys = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(200)]
+        index = _FuzzyCandidateIndex()
+        for key in keys:
+            index.add(key)
+        ranked = index.ranked_keys()
+        for threshold in (0.0, 0.5, 0.85, 1.0):
+            for _ in range(200):
+                query = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                self.assertEqual(
+                    index.find_first_match(query, threshold),
+                    self._linear_first_match(ranked, query, threshold),
+                )
+
+    def test_replace_inherits_rank_of_short_form(self):
+        from power_atlas.entity_resolution_clustering import _FuzzyCandidateIndex
+
+        index = _FuzzyCandidateIndex()
+        for key in ("fbi", "alice smith", "bob jones"):
+            index.add(key)
+        index.replace("fbi", "federal bureau of investigation")
+        self.assertEqual(
+            index.ranked_keys(),
+            ["federal bureau of investigation", "alice smith", "bob jones"],
+        )
+        self.assertNotIn("fbi", index)
+
+    def test_replace_keeps_earlier_rank_when_long_form_exists(self):
+        from power_atlas.entity_resolution_clustering import _FuzzyCandidateIndex
+
+        index = _FuzzyCandidateIndex()
+        for key in ("alice smith", "fbi", "federal bureau of investigation", "cia"):
+            index.add(key)
+        index.replace("cia", "alice smith")
+        index.replace("fbi", "federal bureau of investigation")
+        self.assertEqual(index.ranked_keys(), ["alice smith", "federal bureau of investigation"])
+
+    def test_first_match_prefers_earliest_registered_key(self):
+        from power_atlas.entity_resolution_clustering import _FuzzyCandidateIndex
+
+        index = _FuzzyCandidateIndex()
+        index.add("alice smyth")
+        index.add("alice smith")
+        key, score = index.find_first_match("alice smith", 0.85)
+        self.assertEqual(key, "alice smyth")
+        self.assertAlmostEqual(score, _fuzzy_ratio("alice smith", "alice smyth"))
+
+
 class TestEntityResolutionRequestContextHybrid(unittest.TestCase):
     """Tests for request-context entity resolution with resolution_mode='hybrid'."""
 
@@ -1068,7 +1068,7 @@ def test_claim_extraction_live_path_uses_create_lexical_graph_false(tmp_path: Pa
 
     captured_write_all: dict = {"call_kwargs": None}
 
-    def _fake_write_all_extraction_data(
+    def _fake_write_extraction_rows_batch(
         driver, *, neo4j_database, lexical_graph_config, claim_rows, mention_rows, edge_rows
     ):
         captured_write_all["call_kwargs"] = {
@@ -1100,8 +1100,8 @@ def test_claim_extraction_live_path_uses_create_lexical_graph_false(tmp_path: Pa
         "demo.io.RunScopedNeo4jChunkReader",
         _FakeChunkReader,
     ), mock.patch(
-        "power_atlas.extraction_writes.write_all_extraction_data",
-        side_effect=_fake_write_all_extraction_data,
+        "power_atlas.extraction_writes.write_extraction_rows_batch",
+        side_effect=_fake_write_extraction_rows_batch,
     ), mock.patch("neo4j.GraphDatabase.driver"), mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
         summary = run_claim_and_mention_extraction_request_context(request_context)
 
@@ -1113,8 +1113,8 @@ def test_claim_extraction_live_path_uses_create_lexical_graph_false(tmp_path: Pa
     assert summary["claims"] == 1
     assert summary["mentions"] == 1
 
-    # write_all_extraction_data must have been called with all row data.
-    assert captured_write_all["call_kwargs"] is not None, "write_all_extraction_data was never called"
+    # write_extraction_rows_batch must have been called with all row data.
+    assert captured_write_all["call_kwargs"] is not None, "write_extraction_rows_batch was never called"
     kw = captured_write_all["call_kwargs"]
 
     # Verify chunk-linked provenance: every extracted row must reference the source chunk_id
@@ -1125,7 +1125,7 @@ def test_claim_extraction_live_path_uses_create_lexical_graph_false(tmp_path: Pa
 
     # Verify participation edge counts in the summary.
     # The claim subject is "s" and the mention name is "Live Entity" — no raw match,
-    # so no edges are expected; but write_all_extraction_data must still have been invoked.
+    # so no edges are expected; but write_extraction_rows_batch must still have been invoked.
     assert summary["subject_edges"] == 0
     assert summary["object_edges"] == 0
 
@@ -1180,7 +1180,7 @@ def test_claim_extraction_live_path_uses_claim_extraction_policy_override(tmp_pa
 
     captured_write_all: dict = {"call_kwargs": None}
 
-    def _fake_write_all_extraction_data(
+    def _fake_write_extraction_rows_batch(
         driver, *, neo4j_database, lexical_graph_config, claim_rows, mention_rows, edge_rows
     ):
         captured_write_all["call_kwargs"] = {
@@ -1231,8 +1231,8 @@ def test_claim_extraction_live_path_uses_claim_extraction_policy_override(tmp_pa
         "demo.io.RunScopedNeo4jChunkReader",
         _FakeChunkReader,
     ), mock.patch(
-        "power_atlas.extraction_writes.write_all_extraction_data",
-        side_effect=_fake_write_all_extraction_data,
+        "power_atlas.extraction_writes.write_extraction_rows_batch",
+        side_effect=_fake_write_extraction_rows_batch,
     ), mock.patch("neo4j.GraphDatabase.driver"), mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
         summary = run_claim_and_mention_extraction_request_context(request_context)
 
@@ -1305,7 +1305,7 @@ def test_claim_extraction_live_writes_participation_edges_when_mention_matches(t
 
     captured_write_all: dict = {"call_kwargs": None}
 
-    def _fake_write_all_extraction_data(
+    def _fake_write_extraction_rows_batch(
         driver, *, neo4j_database, lexical_graph_config, claim_rows, mention_rows, edge_rows
     ):
         captured_write_all["call_kwargs"] = {
@@ -1334,13 +1334,13 @@ def test_claim_extraction_live_writes_participation_edges_when_mention_matches(t
         "demo.io.RunScopedNeo4jChunkReader",
         _FakeChunkReader,
     ), mock.patch(
-        "power_atlas.extraction_writes.write_all_extraction_data",
-        side_effect=_fake_write_all_extraction_data,
+        "power_atlas.extraction_writes.write_extraction_rows_batch",
+        side_effect=_fake_write_extraction_rows_batch,
     ), mock.patch("neo4j.GraphDatabase.driver"), mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
         summary = run_claim_and_mention_extraction_request_context(request_context)
 
-    # write_all_extraction_data must have been called.
-    assert captured_write_all["call_kwargs"] is not None, "write_all_extraction_data was never called"
+    # write_extraction_rows_batch must have been called.
+    assert captured_write_all["call_kwargs"] is not None, "write_extraction_rows_batch was never called"
 
     # Both subject ("Google") and object ("revenue") should have matched a mention.
     assert summary["subject_edges"] == 1
@@ -1617,6 +1617,38 @@ def test_retrieval_and_qa_live_path_uses_vector_cypher_retriever(tmp_path: Path)
     assert captured_embedder_args[0][1].get("model") == pipeline_contract.embedder_model_name
 
 
+def test_build_retriever_and_rag_uses_scoped_retriever_for_scope_strategy_policy():
+    from demo.stages.retrieval_and_qa import _build_retriever_and_rag
+    from power_atlas.contracts import get_default_retrieval_policy
+
+    captured_init: dict = {}
+
+    class _FakeScopedRetriever:
+        def __init__(self, **kwargs):
+            captured_init.update(kwargs)
+
+    policy = replace(get_default_retrieval_policy(), scope_strategy="over_fetch")
+    with mock.patch(
+        "power_atlas.adapters.neo4j.scoped_vector_retriever.RunScopedVectorCypherRetriever",
+        _FakeScopedRetriever,
+    ), mock.patch("demo.stages.retrieval_and_qa.OpenAIEmbeddings"), mock.patch(
+        "demo.stages.retrieval_and_qa.GraphRAG"
+    ), mock.patch("demo.stages.retrieval_and_qa.build_openai_llm"):
+        retriever, _ = _build_retriever_and_rag(
+            mock.Mock(),
+            index_name="chunk_embedding_index",
+            retrieval_query="RETURN 1",
+            qa_model="gpt-4o-mini",
+            neo4j_database=None,
+            pipeline_contract=get_pipeline_contract_snapshot(),
+            retrieval_policy=policy,
+        )
+
+    assert isinstance(retriever, _FakeScopedRetriever)
+    assert captured_init["scope_strategy"] == "over_fetch"
+    assert captured_init["index_name"] == "chunk_embedding_index"
+
+
 def test_retrieval_and_qa_live_path_uses_explicit_pipeline_contract(tmp_path: Path):
     from demo.run_demo import _request_context_from_config
     from demo.stages.retrieval_and_qa import run_retrieval_and_qa_request_context
@@ -5632,6 +5664,73 @@ def test_resolve_ask_scope_dry_run_no_env_var_returns_none(
     assert all_runs is False
 
 
+def test_ask_scope_strategy_flag_and_env_set_the_retrieval_policy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """--scope-strategy (or POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY) reaches the ask request's retrieval policy."""
+    from demo.run_demo import (
+        _request_context_from_config,
+        _resolve_ask_scope,
+        _resolve_ask_source_uri,
+        parse_args,
+    )
+    from power_atlas.interfaces.cli.run_demo_entrypoint import (
+        prepare_run_demo_ask_request_context,
+    )
+
+    monkeypatch.setenv("FIXTURE_DATASET", "demo_dataset_v1")
+    monkeypatch.setenv("POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY", "over_fetch")
+
+    def _prepare(argv: list[str]):
+        return prepare_run_demo_ask_request_context(
+            parse_args(argv),
+            _request_context_from_config(_dry_run_config(tmp_path), command="ask"),
+            resolve_ask_scope=_resolve_ask_scope,
+            resolve_ask_source_uri=_resolve_ask_source_uri,
+        )
+
+    # The option's value must not be mistaken for a positional when it follows the subcommand.
+    flagged = _prepare(["ask", "--scope-strategy", "exact", "--run-id", "run-1", "--dry-run"])
+    assert flagged.policies.retrieval.scope_strategy == "exact"
+    assert flagged.run_id == "run-1"
+    assert _prepare(["--dry-run", "ask"]).policies.retrieval.scope_strategy == "over_fetch"
+
+    monkeypatch.delenv("POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY")
+    assert _prepare(["--dry-run", "ask"]).policies.retrieval.scope_strategy == "post_filter"
+    with pytest.raises(SystemExit):
+        parse_args(["ask", "--scope-strategy", "nearest"])
+    monkeypatch.setenv("POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY", "nearest")
+    with pytest.raises(ValueError, match="Unknown retrieval scope strategy"):
+        _prepare(["--dry-run", "ask"])
+
+
+
+def test_ask_batch_option_values_are_not_scanned_as_mode_flags(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    """Values of --questions-file/--batch-output/--batch-concurrency are skipped by the --dry-run/--live pre-scan."""
+    from demo.run_demo import parse_args
+
+    questions_file = tmp_path / "questions.jsonl"
+    args = parse_args(
+        [
+            "--live",
+            "ask",
+            "--questions-file",
+            str(questions_file),
+            "--batch-output",
+            str(tmp_path / "answers.jsonl"),
+            "--batch-concurrency",
+            "2",
+        ]
+    )
+    assert args.dry_run is False
+    assert (args.questions_file, args.batch_concurrency) == (questions_file, 2)
+
+    for option in ("--questions-file", "--batch-output", "--batch-concurrency"):
+        with pytest.raises(SystemExit):
+            parse_args(["--dry-run", "ask", option, "--live"])
+        # argparse reports the missing value instead of a --dry-run/--live conflict.
+        error = capsys.readouterr().err
+        assert "expected one argument" in error
+        assert "not allowed with argument --live" not in error
+
 def test_main_ask_dry_run_prints_scope_run_id(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
 ):
@@ -0,0 +1,316 @@
+"""Concurrent mixed-traffic load test for the FastAPI backend.
+
+Sends a weighted mix of requests (``/health``, ``/runs``, ``/datasets``,
+``/graph/status``, ``/graph/summary``, ``POST /graph/run-scoped-counts`` and
+``POST /graph/health-summary``) at a fixed arrival ``--rate`` with at most
+``--concurrency`` requests in flight, and reports p50/p95/p99 latency per route
+and overall, plus throughput.  Latency is measured from each request's
+scheduled send time, so a stalled event loop shows up in every route's
+latency rather than just delaying the load generator.
+
+By default the backend is served in-process through ``httpx.ASGITransport``
+with a simulated graph service whose queries block their thread for
+``--graph-latency-ms``; no Neo4j instance is needed.  This isolates the
+event-loop behaviour: with ``--compare-inline`` the same traffic is replayed
+with graph and filesystem work run inline on the event loop (the behaviour
+before routes offloaded blocking work), so the latency of cheap routes such as
+``/health`` can be compared directly.
+
+Pass ``--base-url`` to load-test a running server instead (for example
+``uvicorn backend.main:app``); graph routes then hit the configured Neo4j.
+
+Usage
+-----
+    # In-process, simulated 200 ms graph queries, 100 req/s, 32 in flight
+    python pipelines/experiment/backend_load_test.py
+
+    # Compare against inline (event-loop blocking) execution
+    python pipelines/experiment/backend_load_test.py --compare-inline \\
+        --requests 300 --graph-latency-ms 100
+
+    # Against a running server, report written to a file
+    python pipelines/experiment/backend_load_test.py \\
+        --base-url http://localhost:8000 --run-id <run_id> \\
+        --rate 500 --concurrency 64 --requests 5000 \\
+        --output /tmp/backend_load_test.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Ensure the repository root is on sys.path when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from power_atlas.backend_app import build_backend_runtime, create_backend_app  # noqa: E402
+from power_atlas.backend_blocking_calls import (  # noqa: E402
+    DEFAULT_BACKEND_BLOCKING_WORKERS,
+    BackendBlockingCalls,
+)
+from power_atlas.backend_graph import build_backend_graph_query_service  # noqa: E402
+from power_atlas.bootstrap import build_app_context  # noqa: E402
+from power_atlas.graph_health_summary import GraphHealthSummaryResult  # noqa: E402
+from power_atlas.graph_status import GraphStatusResult  # noqa: E402
+from power_atlas.graph_summary import GraphSummaryResult  # noqa: E402
+from power_atlas.run_scoped_graph_counts import RunScopedGraphCountsResult  # noqa: E402
+
+_DEFAULT_RUN_ID = "load-test-run"
+
+# (route label, method, path, weight)
+_TRAFFIC_MIX: tuple[tuple[str, str, str, int], ...] = (
+    ("GET /health", "GET", "/health", 4),
+    ("GET /runs", "GET", "/runs", 2),
+    ("GET /datasets", "GET", "/datasets", 1),
+    ("GET /graph/status", "GET", "/graph/status", 2),
+    ("GET /graph/summary", "GET", "/graph/summary", 1),
+    ("POST /graph/run-scoped-counts", "POST", "/graph/run-scoped-counts", 1),
+    ("POST /graph/health-summary", "POST", "/graph/health-summary", 1),
+)
+
+
+class _InlineBlockingCalls(BackendBlockingCalls):
+    """Runs blocking work directly on the event loop, as routes did before offloading."""
+
+    async def run(self, func, /, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _latency_summary(latencies_ms: list[float]) -> dict[str, Any]:
+    return {
+        "requests": len(latencies_ms),
+        "p50_ms": round(_percentile(latencies_ms, 0.5), 2),
+        "p95_ms": round(_percentile(latencies_ms, 0.95), 2),
+        "p99_ms": round(_percentile(latencies_ms, 0.99), 2),
+        "max_ms": round(max(latencies_ms, default=0.0), 2),
+    }
+
+
+def _build_simulated_app(graph_latency_seconds: float, blocking_calls: BackendBlockingCalls) -> Any:
+    app_context = build_app_context(environ={"NEO4J_PASSWORD": "load-test"})
+    neo4j_settings = app_context.settings.neo4j
+
+    def _graph_status(_app_context):
+        time.sleep(graph_latency_seconds)
+        return GraphStatusResult(200, "available", "simulated", neo4j_settings.uri, neo4j_settings.database)
+
+    def _graph_summary(_app_context):
+        time.sleep(graph_latency_seconds)
+        return GraphSummaryResult(200, "available", "simulated", neo4j_settings.uri, neo4j_settings.database)
+
+    def _run_scoped_graph_counts(_app_context, request):
+        time.sleep(graph_latency_seconds)
+        return RunScopedGraphCountsResult(
+            404, "not_found", "simulated", request.run_id, neo4j_settings.uri, neo4j_settings.database
+        )
+
+    def _graph_health_summary(_app_context, request):
+        time.sleep(graph_latency_seconds)
+        return GraphHealthSummaryResult(
+            404,
+            "not_found",
+            "simulated",
+            request.run_id,
+            request.alignment_version,
+            neo4j_settings.uri,
+            neo4j_settings.database,
+        )
+
+    runtime = build_backend_runtime(
+        app_context=app_context,
+        environ={},
+        graph_queries=build_backend_graph_query_service(
+            app_context,
+            graph_status_resolver=_graph_status,
+            graph_summary_resolver=_graph_summary,
+            run_scoped_graph_counts_resolver=_run_scoped_graph_counts,
+            graph_health_summary_resolver=_graph_health_summary,
+        ),
+    )
+    return create_backend_app(runtime=replace(runtime, blocking_calls=blocking_calls))
+
+
+async def _drive_traffic(
+    client_factory: Callable[[], httpx.AsyncClient],
+    *,
+    concurrency: int,
+    requests: int,
+    rate: float,
+    run_id: str,
+    seed: int,
+) -> dict[str, Any]:
+    rng = random.Random(seed)
+    labels = [label for label, _, _, _ in _TRAFFIC_MIX]
+    weights = [weight for _, _, _, weight in _TRAFFIC_MIX]
+    routes = {label: (method, path) for label, method, path, _ in _TRAFFIC_MIX}
+    schedule = rng.choices(labels, weights=weights, k=requests)
+
+    latencies: dict[str, list[float]] = {label: [] for label in labels}
+    status_codes: dict[str, dict[str, int]] = {label: {} for label in labels}
+    errors: list[str] = []
+    in_flight = asyncio.Semaphore(concurrency)
+
+    async def _send(client: httpx.AsyncClient, label: str, scheduled_at: float) -> None:
+        method, path = routes[label]
+        async with in_flight:
+            try:
+                if method == "POST":
+                    response = await client.post(path, json={"run_id": run_id})
+                else:
+                    response = await client.get(path)
+            except httpx.HTTPError as exc:
+                errors.append(f"{label}: {exc}")
+                return
+        # Measured from the scheduled send time, so time spent waiting for a
+        # blocked event loop or a free client slot counts as latency.
+        latencies[label].append((time.perf_counter() - scheduled_at) * 1000)
+        codes = status_codes[label]
+        codes[str(response.status_code)] = codes.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    async with client_factory() as client:
+        tasks: list[asyncio.Task[None]] = []
+        for index, label in enumerate(schedule):
+            scheduled_at = started + index / rate
+            await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+            tasks.append(asyncio.create_task(_send(client, label, scheduled_at)))
+        await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for values in latencies.values() for latency in values]
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(all_latencies) / elapsed, 1) if elapsed else 0.0,
+        "errors": len(errors),
+        "overall": _latency_summary(all_latencies),
+        "routes": {
+            label: {**_latency_summary(values), "status_codes": status_codes[label]}
+            for label, values in latencies.items()
+            if values
+        },
+    }
+
+
+def run_load_test(
+    *,
+    base_url: str | None,
+    concurrency: int,
+    requests: int,
+    rate: float,
+    run_id: str,
+    graph_latency_ms: float,
+    blocking_workers: int,
+    compare_inline: bool,
+    seed: int,
+    timeout_seconds: float,
+) -> dict[str, Any]:
+    scenarios: dict[str, Callable[[], httpx.AsyncClient]] = {}
+    if base_url is not None:
+        scenarios["server"] = lambda: httpx.AsyncClient(base_url=base_url, timeout=timeout_seconds)
+    else:
+        graph_latency_seconds = graph_latency_ms / 1000
+        offloaded_app = _build_simulated_app(graph_latency_seconds, BackendBlockingCalls(blocking_workers))
+        scenarios["offloaded"] = lambda: httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=offloaded_app),
+            base_url="http://loadtest",
+            timeout=timeout_seconds,
+        )
+        if compare_inline:
+            inline_app = _build_simulated_app(graph_latency_seconds, _InlineBlockingCalls())
+            scenarios["inline"] = lambda: httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=inline_app),
+                base_url="http://loadtest",
+                timeout=timeout_seconds,
+            )
+
+    results: dict[str, Any] = {}
+    for name, client_factory in scenarios.items():
+        results[name] = asyncio.run(
+            _drive_traffic(
+                client_factory,
+                concurrency=concurrency,
+                requests=requests,
+                rate=rate,
+                run_id=run_id,
+                seed=seed,
+            )
+        )
+        print(json.dumps({"scenario": name, "overall": results[name]["overall"]}), file=sys.stderr)
+
+    return {
+        "benchmark": "backend_load_test",
+        "target": base_url or "in_process",
+        "concurrency": concurrency,
+        "requests": requests,
+        "rate_rps": rate,
+        "graph_latency_ms": None if base_url is not None else graph_latency_ms,
+        "blocking_workers": None if base_url is not None else blocking_workers,
+        "traffic_mix": {label: weight for label, _, _, weight in _TRAFFIC_MIX},
+        "seed": seed,
+        "scenarios": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load-test the backend with concurrent mixed traffic and report latency percentiles.",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--base-url", default=None, help="Load-test a running server instead of an in-process app.")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=100.0, help="Target request arrival rate (requests/second).")
+    parser.add_argument("--run-id", default=_DEFAULT_RUN_ID, help="run_id sent to the POST graph routes.")
+    parser.add_argument("--graph-latency-ms", type=float, default=200.0)
+    parser.add_argument("--blocking-workers", type=int, default=DEFAULT_BACKEND_BLOCKING_WORKERS)
+    parser.add_argument("--compare-inline", action="store_true", help="Also run with blocking work inline on the event loop.")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    report = run_load_test(
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        requests=args.requests,
+        rate=args.rate,
+        run_id=args.run_id,
+        graph_latency_ms=args.graph_latency_ms,
+        blocking_workers=args.blocking_workers,
+        compare_inline=args.compare_inline,
+        seed=args.seed,
+        timeout_seconds=args.timeout,
+    )
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Micro-benchmark for claim participation slot matching.
+
+Builds a synthetic claim/mention input (by default 1M claims spread over
+50k chunks with 20 mentions per chunk) and runs
+``build_participation_edges_with_metrics`` over it in two modes:
+
+``linear``
+    Every slot and list-split part re-scans the candidate mentions and
+    re-normalizes each mention name (the pre-index behaviour).
+``indexed``
+    The default path: one ``MentionMatchIndex`` per chunk group, so matching is
+    a dict lookup per strategy.
+
+The synthetic names mix exact, case-only, diacritic/punctuation variants,
+ambiguous duplicates, misses and ``"A and B"`` list slots, so every match
+outcome is exercised.  Both modes must produce identical edges and metrics;
+the report records wall time, claims/s and whether the outputs agree.
+
+No Neo4j or OpenAI access is needed.
+
+Usage
+-----
+    # Default: 1M claims, both modes
+    python pipelines/experiment/claim_participation_matching_benchmark.py
+
+    # Smaller sweep, indexed only, report written to a file
+    python pipelines/experiment/claim_participation_matching_benchmark.py \\
+        --claims 10000 100000 --modes indexed \\
+        --output /tmp/claim_participation_matching_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Ensure the repository root is on sys.path when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import power_atlas.claim_participation_edges as _edges  # noqa: E402
+from power_atlas.text_utils import normalize_mention_text  # noqa: E402
+
+_DEFAULT_CLAIMS = (1_000_000,)
+_MODES = ("linear", "indexed")
+_RUN_ID = "benchmark-run"
+
+
+class _LinearMentionIndex:
+    """Drop-in for ``MentionMatchIndex`` that scans and re-normalizes per lookup."""
+
+    def __init__(self, mentions: list[dict[str, Any]]) -> None:
+        self.by_raw = mentions
+        self._mentions = mentions
+
+    @classmethod
+    def build(cls, mentions: list[dict[str, Any]], **_: Any) -> "_LinearMentionIndex":
+        return cls(mentions)
+
+    def match(self, slot_text: str, **_: Any) -> tuple[dict[str, Any] | None, str | None]:
+        if not slot_text or not self._mentions:
+            return None, None
+        slot_stripped = slot_text.strip()
+        if not slot_stripped:
+            return None, None
+        raw_forms = [(m, str(m.get("name") or "").strip()) for m in self._mentions]
+        for key, method in (
+            (lambda text: text, _edges.MATCH_METHOD_RAW_EXACT),
+            (str.casefold, _edges.MATCH_METHOD_CASEFOLD_EXACT),
+            (normalize_mention_text, _edges.MATCH_METHOD_NORMALIZED_EXACT),
+        ):
+            slot_key = key(slot_stripped)
+            matches = [m for m, raw in raw_forms if key(raw) == slot_key]
+            if len(matches) == 1:
+                return matches[0], method
+            if matches:
+                return None, _edges.MATCH_OUTCOME_AMBIGUOUS
+        return None, None
+
+
+def _mention_name(chunk: int, slot: int) -> str:
+    if slot == 0:
+        return f"Café Société {chunk}"
+    if slot in (1, 2):
+        return f"Twin Holdings {chunk}"  # ambiguous within the chunk
+    return f"Entity {chunk}-{slot}"
+
+
+def build_synthetic_input(
+    claims: int, *, claims_per_chunk: int = 20, mentions_per_chunk: int = 20
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    chunks = max(1, claims // claims_per_chunk)
+    mentions = [
+        {
+            "mention_id": f"m-{chunk}-{slot}",
+            "chunk_ids": [f"chunk-{chunk}"],
+            "run_id": _RUN_ID,
+            "source_uri": "uri://benchmark",
+            "properties": {"name": _mention_name(chunk, slot), "entity_type": "ORG"},
+        }
+        for chunk in range(chunks)
+        for slot in range(mentions_per_chunk)
+    ]
+    claim_rows: list[dict[str, Any]] = []
+    for index in range(claims):
+        chunk = index % chunks
+        target = 3 + index % max(1, mentions_per_chunk - 3)
+        variant = index % 6
+        subject = (
+            f"Entity {chunk}-{target}",
+            f"ENTITY {chunk}-{target}",
+            f"cafe societe {chunk}",
+            f"Twin Holdings {chunk}",
+            f"Unknown {index}",
+            f"  Entity {chunk}-{target}  ",
+        )[variant]
+        obj = f"Entity {chunk}-{target} and Café Société {chunk}" if index % 3 == 0 else f"Entity {chunk}-3"
+        chunk_ids = [f"chunk-{chunk}"] if index % 10 else [f"chunk-{chunk}", f"chunk-{(chunk + 1) % chunks}"]
+        claim_rows.append(
+            {
+                "claim_id": f"c-{index}",
+                "chunk_ids": chunk_ids,
+                "run_id": _RUN_ID,
+                "source_uri": "uri://benchmark",
+                "properties": {
+                    "run_id": _RUN_ID,
+                    "source_uri": "uri://benchmark",
+                    "subject": subject,
+                    "object": obj,
+                },
+            }
+        )
+    return claim_rows, mentions
+
+
+def _measure(mode: str, claims: list[dict[str, Any]], mentions: list[dict[str, Any]]) -> tuple[dict[str, Any], str]:
+    original_index = _edges.MentionMatchIndex
+    if mode == "linear":
+        _edges.MentionMatchIndex = _LinearMentionIndex  # type: ignore[misc,assignment]
+    try:
+        started = time.perf_counter()
+        edges, metrics = _edges.build_participation_edges_with_metrics(claims, mentions)
+        elapsed = time.perf_counter() - started
+    finally:
+        _edges.MentionMatchIndex = original_index  # type: ignore[misc]
+    digest = hashlib.sha256(
+        json.dumps([edges, metrics.to_dict()], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return {
+        "mode": mode,
+        "seconds": round(elapsed, 3),
+        "claims_per_second": round(len(claims) / elapsed, 1) if elapsed else None,
+        "edges": len(edges),
+        "ambiguous_slots": metrics.ambiguous_slots,
+        "unmatched_slots": metrics.unmatched_slots,
+    }, digest
+
+
+def run_benchmark(claim_counts: list[int], *, modes: list[str]) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for count in claim_counts:
+        claims, mentions = build_synthetic_input(count)
+        digests: set[str] = set()
+        for mode in modes:
+            measured, digest = _measure(mode, claims, mentions)
+            digests.add(digest)
+            result = {"claims": count, "mentions": len(mentions), **measured}
+            results.append(result)
+            print(json.dumps(result), file=sys.stderr)
+        if len(modes) > 1:
+            for result in results[-len(modes):]:
+                result["outputs_match"] = len(digests) == 1
+        del claims, mentions
+    return {"benchmark": "claim_participation_matching", "results": results}
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark linear vs indexed claim participation slot matching.",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--claims", type=int, nargs="+", default=list(_DEFAULT_CLAIMS))
+    parser.add_argument("--modes", nargs="+", choices=_MODES, default=list(_MODES))
+    parser.add_argument("--output", type=Path, default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    report = run_benchmark(args.claims, modes=args.modes)
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Scaling benchmark for unstructured-only mention clustering.
+
+Generates a synthetic, deterministic mention corpus (person/organization/place
+names with typo variants, abbreviations and exact repeats), runs
+``_cluster_mentions_unstructured_only`` over increasing corpus sizes and prints
+a JSON report of wall time and throughput per size.
+
+No Neo4j or OpenAI access is needed — the benchmark exercises the pure clustering
+function used by ``resolve-entities``.
+
+Linear baseline
+---------------
+For sizes up to ``--baseline-max-mentions`` the benchmark also runs the
+clustering with a linear-scan candidate index that scores every prior cluster
+key of the same entity type (the pre-index behaviour).  The two results are
+compared row for row and the report records ``parity: true`` when they are
+identical, so the benchmark doubles as an equivalence check for the indexed
+candidate search.  The baseline is quadratic, so keep the cap modest.
+
+Usage
+-----
+    # Default sweep: 1k, 5k, 20k, 100k, 500k mentions
+    python pipelines/experiment/entity_resolution_clustering_benchmark.py
+
+    # Custom sweep, baseline up to 5k mentions, report written to a file
+    python pipelines/experiment/entity_resolution_clustering_benchmark.py \\
+        --sizes 1000 20000 100000 --baseline-max-mentions 5000 \\
+        --output /tmp/clustering_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Ensure the repository root is on sys.path when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from power_atlas import entity_resolution_clustering as _clustering  # noqa: E402
+
+_DEFAULT_SIZES = (1_000, 5_000, 20_000, 100_000, 500_000)
+_ENTITY_TYPES = ("person", "organization", "place")
+_SYLLABLES = (
+    "al", "an", "ar", "ba", "be", "co", "da", "de", "el", "en", "fa", "go", "ha", "in",
+    "ka", "la", "le", "ma", "mo", "na", "ne", "or", "pa", "ra", "re", "sa", "so", "ta",
+    "te", "to", "va", "vi", "za",
+)
+_ORG_SUFFIXES = ("holdings", "group", "capital", "partners", "foundation", "bank", "institute")
+
+
+class _LinearCandidateIndex(_clustering._FuzzyCandidateIndex):
+    """Candidate index that scores every key in rank order (pre-index baseline)."""
+
+    def find_first_match(self, query: str, threshold: float) -> tuple[str | None, float]:
+        for key in self.ranked_keys():
+            if not key and not query:
+                return key, 1.0
+            if not key or not query:
+                continue
+            min_len = min(len(query), len(key))
+            max_len = max(len(query), len(key))
+            if 2 * min_len / (min_len + max_len) < threshold:
+                continue
+            ratio = _clustering._fuzzy_ratio(query, key)
+            if ratio >= threshold:
+                return key, ratio
+        return None, 0.0
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _base_name(rng: random.Random, entity_type: str) -> str:
+    if entity_type == "organization":
+        return f"{_word(rng).title()} {_word(rng).title()} {rng.choice(_ORG_SUFFIXES).title()}"
+    if entity_type == "person":
+        return f"{_word(rng).title()} {_word(rng).title()}"
+    return _word(rng).title()
+
+
+def _typo(rng: random.Random, text: str) -> str:
+    chars = list(text)
+    position = rng.randrange(len(chars))
+    operation = rng.random()
+    if operation < 0.33:
+        del chars[position]
+    elif operation < 0.66:
+        chars.insert(position, rng.choice("aeiou"))
+    else:
+        chars[position] = rng.choice("aeiou")
+    return "".join(chars)
+
+
+def build_synthetic_mentions(size: int, *, seed: int = 0) -> list[dict[str, Any]]:
+    """Return *size* deterministic mention rows shaped like the resolver's input."""
+    rng = random.Random(seed)
+    bases: list[tuple[str, str]] = []
+    mentions: list[dict[str, Any]] = []
+    for index in range(size):
+        roll = rng.random()
+        if bases and roll < 0.35:
+            entity_type, name = rng.choice(bases)
+        elif bases and roll < 0.5:
+            entity_type, base = rng.choice(bases)
+            name = _typo(rng, base)
+        elif bases and roll < 0.53:
+            entity_type, base = rng.choice(bases)
+            name = "".join(word[0] for word in base.split()).upper()
+        else:
+            entity_type = rng.choice(_ENTITY_TYPES)
+            name = _base_name(rng, entity_type)
+            bases.append((entity_type, name))
+        mentions.append(
+            {
+                "mention_id": f"mention-{index}",
+                "name": name,
+                "entity_type": entity_type,
+                "source_uri": "synthetic://benchmark",
+            }
+        )
+    return mentions
+
+
+def _timed_clustering(
+    mentions: list[dict[str, Any]],
+    *,
+    fuzzy_threshold: float,
+    index_factory: type[_clustering._FuzzyCandidateIndex],
+) -> tuple[list[dict[str, Any]], float]:
+    original_factory = _clustering._FuzzyCandidateIndex
+    _clustering._FuzzyCandidateIndex = index_factory
+    try:
+        started = time.perf_counter()
+        rows = _clustering._cluster_mentions_unstructured_only(
+            mentions,
+            fuzzy_threshold=fuzzy_threshold,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        _clustering._FuzzyCandidateIndex = original_factory
+    return rows, elapsed
+
+
+def run_benchmark(
+    sizes: list[int],
+    *,
+    fuzzy_threshold: float = 0.85,
+    baseline_max_mentions: int = 5_000,
+    seed: int = 0,
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for size in sizes:
+        mentions = build_synthetic_mentions(size, seed=seed)
+        rows, indexed_seconds = _timed_clustering(
+            mentions,
+            fuzzy_threshold=fuzzy_threshold,
+            index_factory=_clustering._FuzzyCandidateIndex,
+        )
+        result: dict[str, Any] = {
+            "mentions": size,
+            "clusters": len({(row["entity_type"], row["normalized_text"]) for row in rows}),
+            "fuzzy_matches": sum(1 for row in rows if row["resolution_method"] == "fuzzy"),
+            "indexed_seconds": round(indexed_seconds, 4),
+            "indexed_mentions_per_second": round(size / indexed_seconds, 1) if indexed_seconds else None,
+            "linear_seconds": None,
+            "speedup": None,
+            "parity": None,
+        }
+        if size <= baseline_max_mentions:
+            baseline_rows, linear_seconds = _timed_clustering(
+                mentions,
+                fuzzy_threshold=fuzzy_threshold,
+                index_factory=_LinearCandidateIndex,
+            )
+            result["linear_seconds"] = round(linear_seconds, 4)
+            result["speedup"] = round(linear_seconds / indexed_seconds, 2) if indexed_seconds else None
+            result["parity"] = baseline_rows == rows
+        results.append(result)
+        print(json.dumps(result), file=sys.stderr)
+    return {
+        "benchmark": "entity_resolution_clustering",
+        "fuzzy_threshold": fuzzy_threshold,
+        "seed": seed,
+        "baseline_max_mentions": baseline_max_mentions,
+        "results": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark unstructured-only mention clustering at increasing corpus sizes.",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(_DEFAULT_SIZES))
+    parser.add_argument("--fuzzy-threshold", type=float, default=0.85)
+    parser.add_argument(
+        "--baseline-max-mentions",
+        type=int,
+        default=5_000,
+        help="Largest size for which the linear-scan baseline is also run (0 disables it).",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        args.sizes,
+        fuzzy_threshold=args.fuzzy_threshold,
+        baseline_max_mentions=args.baseline_max_mentions,
+        seed=args.seed,
+    )
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""MERGE throughput benchmark for the run-scoped key constraints.
+
+Seeds a throwaway label (``SchemaMergeBenchmarkMention``) with an increasing
+number of existing nodes spread over many runs, then times the ``UNWIND $rows
+MERGE (n {mention_id, run_id})`` shape used by the claim extraction writes
+twice per graph size:
+
+``without_schema``
+    No index or constraint on the label (the pre-migration behaviour).
+``with_schema``
+    After creating the key with the same fallback chain as
+    ``power_atlas.graph_schema_migrations`` (node key, then composite
+    uniqueness, then a range index).  The report records which form the server
+    accepted.
+
+Each timed batch MERGEs half existing and half new keys, so both the match and
+the create path are exercised.  The graph is re-seeded before each measurement.
+Benchmark nodes, the constraint and the index are removed at the end unless
+``--keep`` is passed.
+
+Requires a running Neo4j 5 instance; connection settings come from the usual
+``NEO4J_URI``/``NEO4J_USERNAME``/``NEO4J_PASSWORD``/``NEO4J_DATABASE``
+environment variables.
+
+Usage
+-----
+    # Default sweep: 10k, 50k, 200k existing nodes, 5k-row MERGE batches
+    python pipelines/experiment/schema_merge_benchmark.py
+
+    # Custom sweep, more repeats, report written to a file
+    python pipelines/experiment/schema_merge_benchmark.py \\
+        --existing-nodes 10000 500000 --batch-rows 10000 --repeats 5 \\
+        --output /tmp/schema_merge_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Ensure the repository root is on sys.path when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from power_atlas.bootstrap import create_neo4j_driver  # noqa: E402
+from power_atlas.graph_schema_migrations import SchemaObject, apply_schema_object  # noqa: E402
+from power_atlas.settings import AppSettings  # noqa: E402
+
+_LABEL = "SchemaMergeBenchmarkMention"
+_SCHEMA_OBJECT = SchemaObject("schema_merge_benchmark_key", _LABEL, ("mention_id", "run_id"))
+_DEFAULT_EXISTING_NODES = (10_000, 50_000, 200_000)
+_MENTIONS_PER_RUN = 500
+_SEED_BATCH_SIZE = 10_000
+
+_MERGE_QUERY = (
+    "UNWIND $rows AS row\n"
+    f"MERGE (n:{_LABEL} {{mention_id: row.mention_id, run_id: row.run_id}})\n"
+    "ON CREATE SET n.name = row.name\n"
+    "ON MATCH SET n.seen = coalesce(n.seen, 0) + 1"
+)
+
+
+def _row(index: int) -> dict[str, Any]:
+    return {
+        "mention_id": f"mention-{index % _MENTIONS_PER_RUN}",
+        "run_id": f"benchmark-run-{index // _MENTIONS_PER_RUN}",
+        "name": f"Entity {index}",
+    }
+
+
+def _drop_schema(driver: Any, database: str) -> None:
+    driver.execute_query(f"DROP CONSTRAINT {_SCHEMA_OBJECT.name} IF EXISTS", database_=database)
+    driver.execute_query(f"DROP INDEX {_SCHEMA_OBJECT.name} IF EXISTS", database_=database)
+
+
+def _reset(driver: Any, database: str) -> None:
+    _drop_schema(driver, database)
+    while True:
+        records, _, _ = driver.execute_query(
+            f"MATCH (n:{_LABEL}) WITH n LIMIT 10000 DETACH DELETE n RETURN count(*) AS deleted",
+            database_=database,
+        )
+        if not records or records[0]["deleted"] == 0:
+            break
+
+
+def _seed(driver: Any, database: str, existing_nodes: int) -> None:
+    for start in range(0, existing_nodes, _SEED_BATCH_SIZE):
+        rows = [_row(index) for index in range(start, min(start + _SEED_BATCH_SIZE, existing_nodes))]
+        driver.execute_query(
+            f"UNWIND $rows AS row CREATE (:{_LABEL} {{mention_id: row.mention_id, run_id: row.run_id, name: row.name}})",
+            parameters_={"rows": rows},
+            database_=database,
+        )
+
+
+def _timed_merges(driver: Any, database: str, existing_nodes: int, batch_rows: int, repeats: int) -> list[float]:
+    half = batch_rows // 2
+    seconds: list[float] = []
+    for repeat in range(repeats):
+        offset = repeat * batch_rows
+        existing = [_row(index % existing_nodes) for index in range(offset, offset + half)]
+        fresh = [_row(existing_nodes + offset + index) for index in range(batch_rows - half)]
+        started = time.perf_counter()
+        driver.execute_query(_MERGE_QUERY, parameters_={"rows": existing + fresh}, database_=database)
+        seconds.append(time.perf_counter() - started)
+    return seconds
+
+
+def _measure(
+    driver: Any,
+    database: str,
+    *,
+    existing_nodes: int,
+    batch_rows: int,
+    repeats: int,
+    with_schema: bool,
+) -> dict[str, Any]:
+    _reset(driver, database)
+    _seed(driver, database, existing_nodes)
+    strategy = None
+    if with_schema:
+        with driver.session(database=database) as session:
+            strategy, _ = apply_schema_object(session, _SCHEMA_OBJECT)
+        driver.execute_query("CALL db.awaitIndexes(300)", database_=database)
+    seconds = _timed_merges(driver, database, existing_nodes, batch_rows, repeats)
+    median = statistics.median(seconds)
+    return {
+        "strategy": strategy,
+        "median_seconds": round(median, 4),
+        "rows_per_second": round(batch_rows / median, 1) if median else None,
+    }
+
+
+def run_benchmark(
+    driver: Any,
+    database: str,
+    *,
+    existing_nodes: list[int],
+    batch_rows: int = 5_000,
+    repeats: int = 3,
+    keep: bool = False,
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    try:
+        for size in existing_nodes:
+            without_schema = _measure(
+                driver, database, existing_nodes=size, batch_rows=batch_rows, repeats=repeats, with_schema=False
+            )
+            with_schema = _measure(
+                driver, database, existing_nodes=size, batch_rows=batch_rows, repeats=repeats, with_schema=True
+            )
+            result: dict[str, Any] = {
+                "existing_nodes": size,
+                "without_schema": without_schema,
+                "with_schema": with_schema,
+                "speedup": (
+                    round(without_schema["median_seconds"] / with_schema["median_seconds"], 2)
+                    if with_schema["median_seconds"]
+                    else None
+                ),
+            }
+            results.append(result)
+            print(json.dumps(result), file=sys.stderr)
+    finally:
+        if not keep:
+            _reset(driver, database)
+
+    return {
+        "benchmark": "schema_merge",
+        "batch_rows": batch_rows,
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark run-scoped MERGE throughput with and without the key constraint.",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--existing-nodes", type=int, nargs="+", default=list(_DEFAULT_EXISTING_NODES))
+    parser.add_argument("--batch-rows", type=int, default=5_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="Leave benchmark nodes and schema in place.")
+    parser.add_argument("--output", type=Path, default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    settings = AppSettings.from_env()
+    with create_neo4j_driver(settings.neo4j) as driver:
+        report = run_benchmark(
+            driver,
+            settings.neo4j.database,
+            existing_nodes=args.existing_nodes,
+            batch_rows=args.batch_rows,
+            repeats=args.repeats,
+            keep=args.keep,
+        )
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
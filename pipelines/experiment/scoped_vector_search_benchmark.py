@@ -0,0 +1,329 @@
+"""Recall/latency benchmark for run-scoped chunk vector search.
+
+Seeds a throwaway label (``ScopedSearchBenchmarkChunk``) with random unit
+vectors spread over an increasing number of runs, builds a cosine vector index
+over it, and for each run count measures every scope strategy in
+``power_atlas.retrieval_scoped_search`` against the same target run:
+
+``post_filter``
+    The pre-existing behaviour: top-k from the ANN index, then ``WHERE run_id``.
+``over_fetch``
+    ANN over-fetch with refill (``select_scoped_candidates``).
+``exact``
+    Exact cosine ranking over the target run only; used as ground truth.
+
+The report records recall@k against ``exact``, mean candidates discarded, and
+p50/p95 latency per strategy.  Benchmark nodes and the index are removed at the
+end unless ``--keep`` is passed.
+
+Requires a running Neo4j 5.18+ instance; connection settings come from the
+usual ``NEO4J_URI``/``NEO4J_USERNAME``/``NEO4J_PASSWORD``/``NEO4J_DATABASE``
+environment variables.
+
+Usage
+-----
+    # Default sweep: 1, 10, 50, 200 runs of 200 chunks each, top_k=5
+    python pipelines/experiment/scoped_vector_search_benchmark.py
+
+    # Larger runs, more queries, report written to a file
+    python pipelines/experiment/scoped_vector_search_benchmark.py \\
+        --run-counts 1 20 100 --chunks-per-run 1000 --queries 50 \\
+        --output /tmp/scoped_vector_search_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Ensure the repository root is on sys.path when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from power_atlas.bootstrap import create_neo4j_driver  # noqa: E402
+from power_atlas.retrieval_scoped_search import (  # noqa: E402
+    DEFAULT_MAX_CANDIDATES,
+    DEFAULT_OVER_FETCH_FACTOR,
+    RETRIEVAL_SCOPE_EXACT,
+    RETRIEVAL_SCOPE_OVER_FETCH,
+    RETRIEVAL_SCOPE_POST_FILTER,
+    select_scoped_candidates,
+)
+from power_atlas.settings import AppSettings  # noqa: E402
+
+_LABEL = "ScopedSearchBenchmarkChunk"
+_INDEX_NAME = "scoped_search_benchmark_embedding"
+_TARGET_RUN_ID = "benchmark-run-0"
+_DEFAULT_RUN_COUNTS = (1, 10, 50, 200)
+_SEED_BATCH_SIZE = 2_000
+
+_POST_FILTER_QUERY = (
+    "CALL db.index.vector.queryNodes($vector_index_name, $top_k, $query_vector)\n"
+    "YIELD node, score\n"
+    "WITH collect({node: node, score: score}) AS candidates\n"
+    "WITH size(candidates) AS candidates_fetched,\n"
+    "     [candidate IN candidates WHERE candidate.node.run_id = $run_id] AS in_scope\n"
+    "RETURN candidates_fetched,\n"
+    "       [candidate IN in_scope | {element_id: elementId(candidate.node), score: candidate.score}] AS hits"
+)
+
+
+def _unit_vector(rng: random.Random, dimensions: int) -> list[float]:
+    values = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    return [value / norm for value in values]
+
+
+def _perturb(rng: random.Random, vector: list[float], noise: float) -> list[float]:
+    values = [value + rng.gauss(0.0, noise) for value in vector]
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    return [value / norm for value in values]
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _reset(driver: Any, database: str) -> None:
+    driver.execute_query(f"DROP INDEX {_INDEX_NAME} IF EXISTS", database_=database)
+    while True:
+        records, _, _ = driver.execute_query(
+            f"MATCH (c:{_LABEL}) WITH c LIMIT 10000 DETACH DELETE c RETURN count(*) AS deleted",
+            database_=database,
+        )
+        if not records or records[0]["deleted"] == 0:
+            break
+
+
+def _create_index(driver: Any, database: str, dimensions: int) -> None:
+    driver.execute_query(
+        f"CREATE VECTOR INDEX {_INDEX_NAME} IF NOT EXISTS "
+        f"FOR (c:{_LABEL}) ON (c.embedding) "
+        "OPTIONS {indexConfig: {`vector.dimensions`: $dimensions, `vector.similarity_function`: 'cosine'}}",
+        parameters_={"dimensions": dimensions},
+        database_=database,
+    )
+
+
+def _seed_runs(
+    driver: Any,
+    database: str,
+    rng: random.Random,
+    *,
+    first_run: int,
+    last_run: int,
+    chunks_per_run: int,
+    dimensions: int,
+) -> dict[str, list[list[float]]]:
+    vectors_by_run: dict[str, list[list[float]]] = {}
+    rows: list[dict[str, Any]] = []
+    for run_index in range(first_run, last_run):
+        run_id = f"benchmark-run-{run_index}"
+        vectors = [_unit_vector(rng, dimensions) for _ in range(chunks_per_run)]
+        vectors_by_run[run_id] = vectors
+        rows.extend(
+            {"chunk_id": f"{run_id}-{chunk_index}", "run_id": run_id, "embedding": vector}
+            for chunk_index, vector in enumerate(vectors)
+        )
+    for start in range(0, len(rows), _SEED_BATCH_SIZE):
+        driver.execute_query(
+            f"UNWIND $rows AS row CREATE (c:{_LABEL}) SET c = row",
+            parameters_={"rows": rows[start:start + _SEED_BATCH_SIZE]},
+            database_=database,
+        )
+    driver.execute_query("CALL db.awaitIndexes(300)", database_=database)
+    return vectors_by_run
+
+
+def _post_filter(driver: Any, database: str, query_vector: list[float], top_k: int) -> tuple[list[str], int]:
+    records, _, _ = driver.execute_query(
+        _POST_FILTER_QUERY,
+        parameters_={
+            "vector_index_name": _INDEX_NAME,
+            "top_k": top_k,
+            "query_vector": query_vector,
+            "run_id": _TARGET_RUN_ID,
+        },
+        database_=database,
+    )
+    row = records[0]
+    hits = [hit["element_id"] for hit in row["hits"]]
+    return hits, row["candidates_fetched"] - len(hits)
+
+
+def _scoped(
+    driver: Any,
+    database: str,
+    query_vector: list[float],
+    top_k: int,
+    strategy: str,
+    *,
+    over_fetch_factor: int,
+    max_candidates: int,
+) -> tuple[list[str], int]:
+    hits, stats = select_scoped_candidates(
+        driver,
+        strategy=strategy,
+        index_name=_INDEX_NAME,
+        query_vector=query_vector,
+        top_k=top_k,
+        run_id=_TARGET_RUN_ID,
+        source_uri=None,
+        neo4j_database=database,
+        node_label=_LABEL,
+        embedding_property="embedding",
+        over_fetch_factor=over_fetch_factor,
+        max_candidates=max_candidates,
+    )
+    return [hit["element_id"] for hit in hits], stats.candidates_discarded
+
+
+def run_benchmark(
+    driver: Any,
+    database: str,
+    *,
+    run_counts: list[int],
+    chunks_per_run: int = 200,
+    dimensions: int = 64,
+    queries: int = 20,
+    top_k: int = 5,
+    over_fetch_factor: int = DEFAULT_OVER_FETCH_FACTOR,
+    max_candidates: int = DEFAULT_MAX_CANDIDATES,
+    seed: int = 0,
+    keep: bool = False,
+) -> dict[str, Any]:
+    rng = random.Random(seed)
+    _reset(driver, database)
+    _create_index(driver, database, dimensions)
+    target_vectors: list[list[float]] = []
+    seeded_runs = 0
+    results: list[dict[str, Any]] = []
+    try:
+        for run_count in sorted(set(run_counts)):
+            seeded = _seed_runs(
+                driver,
+                database,
+                rng,
+                first_run=seeded_runs,
+                last_run=run_count,
+                chunks_per_run=chunks_per_run,
+                dimensions=dimensions,
+            )
+            target_vectors.extend(seeded.get(_TARGET_RUN_ID, []))
+            seeded_runs = max(seeded_runs, run_count)
+            query_vectors = [
+                _perturb(rng, rng.choice(target_vectors), noise=0.05) for _ in range(queries)
+            ]
+
+            samples: dict[str, dict[str, list[float]]] = {
+                strategy: {"latency_ms": [], "recall": [], "discarded": []}
+                for strategy in (RETRIEVAL_SCOPE_POST_FILTER, RETRIEVAL_SCOPE_OVER_FETCH, RETRIEVAL_SCOPE_EXACT)
+            }
+            for query_vector in query_vectors:
+                outcomes: dict[str, tuple[list[str], int, float]] = {}
+                for strategy in samples:
+                    started = time.perf_counter()
+                    if strategy == RETRIEVAL_SCOPE_POST_FILTER:
+                        hits, discarded = _post_filter(driver, database, query_vector, top_k)
+                    else:
+                        hits, discarded = _scoped(
+                            driver,
+                            database,
+                            query_vector,
+                            top_k,
+                            strategy,
+                            over_fetch_factor=over_fetch_factor,
+                            max_candidates=max_candidates,
+                        )
+                    outcomes[strategy] = (hits, discarded, (time.perf_counter() - started) * 1000)
+                truth = set(outcomes[RETRIEVAL_SCOPE_EXACT][0])
+                for strategy, (hits, discarded, latency_ms) in outcomes.items():
+                    samples[strategy]["latency_ms"].append(latency_ms)
+                    samples[strategy]["discarded"].append(discarded)
+                    samples[strategy]["recall"].append(len(truth & set(hits)) / len(truth) if truth else 1.0)
+
+            result: dict[str, Any] = {
+                "runs": run_count,
+                "chunks": run_count * chunks_per_run,
+                "strategies": {
+                    strategy: {
+                        "recall_at_k": round(statistics.fmean(values["recall"]), 4),
+                        "mean_candidates_discarded": round(statistics.fmean(values["discarded"]), 1),
+                        "p50_ms": round(_percentile(values["latency_ms"], 0.5), 2),
+                        "p95_ms": round(_percentile(values["latency_ms"], 0.95), 2),
+                    }
+                    for strategy, values in samples.items()
+                },
+            }
+            results.append(result)
+            print(json.dumps(result), file=sys.stderr)
+    finally:
+        if not keep:
+            _reset(driver, database)
+
+    return {
+        "benchmark": "scoped_vector_search",
+        "top_k": top_k,
+        "chunks_per_run": chunks_per_run,
+        "dimensions": dimensions,
+        "queries": queries,
+        "over_fetch_factor": over_fetch_factor,
+        "max_candidates": max_candidates,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark recall@k and latency of run-scoped vector search strategies.",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--run-counts", type=int, nargs="+", default=list(_DEFAULT_RUN_COUNTS))
+    parser.add_argument("--chunks-per-run", type=int, default=200)
+    parser.add_argument("--dimensions", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--over-fetch-factor", type=int, default=DEFAULT_OVER_FETCH_FACTOR)
+    parser.add_argument("--max-candidates", type=int, default=DEFAULT_MAX_CANDIDATES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="Leave benchmark nodes and index in place.")
+    parser.add_argument("--output", type=Path, default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    settings = AppSettings.from_env()
+    with create_neo4j_driver(settings.neo4j) as driver:
+        report = run_benchmark(
+            driver,
+            settings.neo4j.database,
+            run_counts=args.run_counts,
+            chunks_per_run=args.chunks_per_run,
+            dimensions=args.dimensions,
+            queries=args.queries,
+            top_k=args.top_k,
+            over_fetch_factor=args.over_fetch_factor,
+            max_candidates=args.max_candidates,
+            seed=args.seed,
+            keep=args.keep,
+        )
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Peak-memory and throughput benchmark for streaming structured CSV lint.
+
+Generates synthetic structured datasets (``entities.csv`` plus facts,
+relationships and claims that reference them, with a share of duplicate rows)
+at increasing sizes and runs both the in-memory
+``lint_and_clean_structured_csvs`` and the streaming
+``stream_lint_and_clean_structured_csvs`` over each one.
+
+Every measurement runs in a fresh spawned process so ``ru_maxrss`` reflects only
+that run.  The report records wall time, rows/s and peak RSS per mode and size.
+The streaming peak RSS should stay flat as the input grows, while the
+in-memory peak grows with it.
+
+No Neo4j or OpenAI access is needed.  The graph-write half of streaming ingest
+uses the same batches (``POWER_ATLAS_STRUCTURED_BATCH_SIZE``) and is exercised
+by ``python -m demo.run_demo --live ingest-structured`` with
+``POWER_ATLAS_STRUCTURED_STREAMING=on``.
+
+Usage
+-----
+    # Default sweep: 10k, 100k, 1M entities
+    python pipelines/experiment/structured_stream_ingest_benchmark.py
+
+    # Streaming only, larger sweep, report written to a file
+    python pipelines/experiment/structured_stream_ingest_benchmark.py \\
+        --entities 100000 1000000 5000000 --modes streaming \\
+        --output /tmp/structured_stream_ingest_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Ensure the repository root is on sys.path when run as a script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from power_atlas.contracts import get_default_structured_schema_contract  # noqa: E402
+from power_atlas.structured_ingest_runner import lint_and_clean_structured_csvs  # noqa: E402
+from power_atlas.structured_stream_ingest import (  # noqa: E402
+    peak_rss_mib,
+    stream_lint_and_clean_structured_csvs,
+)
+
+_DEFAULT_ENTITIES = (10_000, 100_000, 1_000_000)
+_MODES = ("in_memory", "streaming")
+
+
+def write_synthetic_dataset(root: Path, entities: int, *, duplicate_every: int = 20) -> int:
+    """Write a lint-clean structured dataset under *root*; return the total row count."""
+    schema = get_default_structured_schema_contract()
+    structured_dir = root / "structured"
+    structured_dir.mkdir(parents=True, exist_ok=True)
+    writers: dict[str, Any] = {}
+    handles = []
+    for file_name, headers in schema.file_headers.items():
+        handle = (structured_dir / file_name).open("w", encoding="utf-8", newline="")
+        handles.append(handle)
+        writers[file_name] = csv.DictWriter(handle, fieldnames=headers)
+        writers[file_name].writeheader()
+    rows = 0
+    try:
+        for index in range(entities):
+            entity_id = f"Q{index + 1}"
+            entity = {
+                "entity_id": entity_id,
+                "name": f"Entity {index}",
+                "entity_type": "organization",
+                "aliases": "",
+                "description": "synthetic benchmark entity",
+                "wikidata_url": f"https://www.wikidata.org/wiki/{entity_id}",
+            }
+            writers[schema.entity_file_name].writerow(entity)
+            rows += 1
+            if duplicate_every and index % duplicate_every == 0:
+                writers[schema.entity_file_name].writerow(entity)
+                rows += 1
+            fact_id = f"F{index + 1:07d}"
+            writers[schema.fact_file_name].writerow(
+                {
+                    "fact_id": fact_id,
+                    "subject_id": entity_id,
+                    "subject_label": f"Entity {index}",
+                    "predicate_pid": "P571",
+                    "predicate_label": "inception",
+                    "value": "2001",
+                    "value_type": "date",
+                    "source": "wikidata",
+                    "source_url": f"https://www.wikidata.org/wiki/{entity_id}",
+                    "retrieved_at": "2026-03-01",
+                }
+            )
+            writers[schema.claim_file_name].writerow(
+                {
+                    "claim_id": f"C{index + 1:07d}",
+                    "claim_type": "fact",
+                    "subject_id": entity_id,
+                    "subject_label": f"Entity {index}",
+                    "predicate_pid": "P571",
+                    "predicate_label": "inception",
+                    "object_id": "",
+                    "object_label": "",
+                    "value": "2001",
+                    "value_type": "date",
+                    "claim_text": f"Entity {index} was founded in 2001.",
+                    "confidence": "0.9",
+                    "source": "wikidata",
+                    "source_url": f"https://www.wikidata.org/wiki/{entity_id}",
+                    "retrieved_at": "2026-03-01",
+                    "source_row_id": fact_id,
+                }
+            )
+            rows += 2
+    finally:
+        for handle in handles:
+            handle.close()
+    return rows
+
+
+def _measure(mode: str, entities: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="structured_stream_benchmark_") as scratch:
+        root = Path(scratch) / "dataset"
+        rows = write_synthetic_dataset(root, entities)
+        baseline_rss = peak_rss_mib()
+        lint = stream_lint_and_clean_structured_csvs if mode == "streaming" else lint_and_clean_structured_csvs
+        started = time.perf_counter()
+        lint(run_id="benchmark", output_dir=Path(scratch) / "out", fixtures_dir=root)
+        elapsed = time.perf_counter() - started
+        shutil.rmtree(Path(scratch) / "out", ignore_errors=True)
+    return {
+        "mode": mode,
+        "entities": entities,
+        "rows": rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+        "peak_rss_mib": peak_rss_mib(),
+        "generator_peak_rss_mib": baseline_rss,
+    }
+
+
+def run_benchmark(entity_counts: list[int], *, modes: list[str]) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    context = multiprocessing.get_context("spawn")
+    for entities in entity_counts:
+        for mode in modes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(_measure, mode, entities).result()
+            results.append(result)
+            print(json.dumps(result), file=sys.stderr)
+    return {"benchmark": "structured_stream_ingest", "results": results}
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark peak memory and rows/s of in-memory vs streaming structured lint.",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--entities", type=int, nargs="+", default=list(_DEFAULT_ENTITIES))
+    parser.add_argument("--modes", nargs="+", choices=_MODES, default=list(_MODES))
+    parser.add_argument("--output", type=Path, default=None, help="Optional path for the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    report = run_benchmark(args.entities, modes=args.modes)
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
@@ -67,6 +67,16 @@ NEO4J_URI       (default: bolt://localhost:7687)
 NEO4J_USERNAME  (default: neo4j)
 NEO4J_PASSWORD  (required)
 NEO4J_DATABASE  (default: neo4j)
+
+POWER_ATLAS_RETRIEVAL_BENCHMARK_WORKERS  (default: 1)
+    Number of benchmark queries run concurrently over one pooled driver.
+POWER_ATLAS_RETRIEVAL_BENCHMARK_REPEATS  (default: 1)
+    Run every query this many times for steadier p50/p95 latencies.
+POWER_ATLAS_RETRIEVAL_BENCHMARK_PROFILE  (default: off)
+    Run queries under ``PROFILE`` and record db hits per query.
+
+Per-query latency percentiles (and db hits when profiled) are written under
+``query_performance`` in the artifact.
 """
 
 from __future__ import annotations
@@ -110,6 +110,7 @@ _EXPORTS = {
     "build_app_context": ("power_atlas.bootstrap", "build_app_context"),
     "build_default_app_policies": ("power_atlas.runtime_carriers", "build_default_app_policies"),
     "build_entity_type_cypher_case": ("power_atlas.contracts", "build_entity_type_cypher_case"),
+    "entity_type_policy_version": ("power_atlas.contracts", "entity_type_policy_version"),
     "build_batch_manifest": ("power_atlas.contracts", "build_batch_manifest"),
     "build_embedder_for_settings": ("power_atlas.bootstrap", "build_embedder_for_settings"),
     "build_llm_for_settings": ("power_atlas.bootstrap", "build_llm_for_settings"),
@@ -8,6 +8,8 @@ from neo4j_graphrag.experimental.components.schema import GraphSchema, NodeType,
 from neo4j_graphrag.experimental.pipeline.config.runner import PipelineRunner
 from neo4j_graphrag.experimental.pipeline.types.context import RunContext
 from neo4j_graphrag.experimental.components.data_loader import PdfLoader, is_default_fs
+from neo4j_graphrag.experimental.components.embedder import TextChunkEmbedder
+from neo4j_graphrag.experimental.components.text_splitters.base import TextSplitter
 from neo4j_graphrag.experimental.components.text_splitters.fixed_size_splitter import FixedSizeSplitter
 
 
@@ -34,4 +36,6 @@ __all__ = [
     "PdfLoader",
     "is_default_fs",
     "FixedSizeSplitter",
+    "TextChunkEmbedder",
+    "TextSplitter",
 ]
@@ -6,9 +6,11 @@ from neo4j_graphrag.llm import OpenAILLM
 from neo4j_graphrag.message_history import InMemoryMessageHistory, MessageHistory
 from neo4j_graphrag.retrievers import VectorCypherRetriever
 from neo4j_graphrag.types import LLMMessage, RetrieverResultItem
+from neo4j_graphrag.utils.rate_limit import NoOpRateLimitHandler
 
 __all__ = [
     "OpenAILLM",
+    "NoOpRateLimitHandler",
     "OpenAIEmbeddings",
     "GraphRAG",
     "InMemoryMessageHistory",
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from neo4j_graphrag.retrievers.base import Retriever
+from neo4j_graphrag.types import RawSearchResult, RetrieverResult
+
+from power_atlas.retrieval_result_cache import (
+    RetrievalResultCache,
+    read_retrieval_generation,
+    retrieval_generation_scope,
+    retrieval_result_cache_key,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class ResultCachingRetriever(Retriever):
+    """Serve repeated searches of a wrapped retriever from a :class:`RetrievalResultCache`.
+
+    The query text is embedded once; the vector, the wrapped retriever's index
+    and retrieval query, ``top_k``, the query parameters and the scope's
+    generation stamp form the cache key.  A miss runs the wrapped retriever with
+    the already computed vector.  Searches the cache cannot key (positional
+    arguments, filters, no embedder) and failed generation lookups go straight
+    to the wrapped retriever.  Other attributes are delegated to it.
+    """
+
+    VERIFY_NEO4J_VERSION = False
+
+    def __init__(self, retriever: Any, cache: RetrievalResultCache, *, driver: Any) -> None:
+        # Retriever.__init__ is skipped on purpose: the wrapped retriever has
+        # already validated the driver and server version.
+        self.retriever = retriever
+        self.cache = cache
+        self.driver = driver
+        self.neo4j_database = getattr(retriever, "neo4j_database", None)
+
+    def __getattr__(self, name: str) -> Any:
+        retriever = self.__dict__.get("retriever")
+        if retriever is None:
+            raise AttributeError(name)
+        return getattr(retriever, name)
+
+    def get_search_results(self, *args: Any, **kwargs: Any) -> RawSearchResult:
+        return self.retriever.get_search_results(*args, **kwargs)
+
+    def search(self, *args: Any, **kwargs: Any) -> RetrieverResult:
+        query_text = kwargs.get("query_text")
+        embedder = getattr(self.retriever, "embedder", None)
+        if args or kwargs.get("filters") or kwargs.get("query_vector") is not None or not query_text or embedder is None:
+            self.cache.record_bypass()
+            return self.retriever.search(*args, **kwargs)
+
+        query_params = kwargs.get("query_params") or {}
+        try:
+            generation = read_retrieval_generation(
+                self.driver,
+                scope=retrieval_generation_scope(query_params),
+                neo4j_database=self.neo4j_database,
+            )
+        except Exception as exc:  # the cache never fails a search
+            _logger.debug("Retrieval cache bypassed; generation lookup failed: %s", exc)
+            self.cache.record_bypass()
+            return self.retriever.search(*args, **kwargs)
+
+        query_vector = embedder.embed_query(query_text)
+        search_kwargs = {key: value for key, value in kwargs.items() if key != "query_text"}
+        search_kwargs["query_vector"] = query_vector
+        key = retrieval_result_cache_key(
+            query_vector=query_vector,
+            index_name=str(getattr(self.retriever, "index_name", "")),
+            retrieval_query=str(getattr(self.retriever, "retrieval_query", "")),
+            top_k=int(kwargs.get("top_k", 5)),
+            query_params=query_params,
+            variant=f"{type(self.retriever).__name__}:{getattr(self.retriever, 'scope_strategy', '')}",
+            generation=generation,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self.retriever.search(**search_kwargs)
+        self.cache.put(key, result)
+        return result
+
+
+__all__ = ["ResultCachingRetriever"]
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from power_atlas.bootstrap import create_neo4j_driver
 from power_atlas.contracts import EntityResolutionAlignmentContract
 from power_atlas.contracts import EntityResolutionCanonicalLookupContract
 from power_atlas.contracts import EntityResolutionGraphContract
+from power_atlas.neo4j_batch_writes import BatchWriteStats
 from power_atlas.settings import Neo4jSettings
 
 
@@ -25,6 +26,14 @@ class EntityResolutionLiveResult:
     graph_mentions_in_aligned: int
     graph_alignment_breakdown: dict[str, int]
     warnings: list[str]
+    write_batches: list[BatchWriteStats] = field(default_factory=list)
+
+
+def _batch_write_stats(result: Any) -> list[BatchWriteStats]:
+    # Injected writers may predate batch stats and return None.
+    if not isinstance(result, list):
+        return []
+    return [stats for stats in result if isinstance(stats, BatchWriteStats)]
 
 
 def run_entity_resolution_live(
@@ -46,10 +55,11 @@ def run_entity_resolution_live(
     make_cluster_id: Callable[[str, str | None, str], str],
     align_clusters_to_canonical: Callable[..., list[dict[str, Any]]],
     resolve_mention: Callable[..., dict[str, Any]],
-    write_resolution_results: Callable[..., None],
-    write_alignment_results: Callable[..., None],
+    write_resolution_results: Callable[..., list[BatchWriteStats] | None],
+    write_alignment_results: Callable[..., list[BatchWriteStats] | None],
     fetch_member_of_coverage: Callable[..., Any],
     fetch_alignment_coverage: Callable[..., Any],
+    refresh_run_state: Callable[..., None] | None = None,
 ) -> EntityResolutionLiveResult:
     graph_mentions_clustered = 0
     graph_mentions_unclustered = 0
@@ -59,6 +69,7 @@ def run_entity_resolution_live(
     graph_mentions_in_aligned = 0
     graph_alignment_breakdown: dict[str, int] = {}
     stage_warnings: list[str] = []
+    write_batches: list[BatchWriteStats] = []
 
     with create_neo4j_driver(neo4j_settings) as driver:
         mentions = fetch_mentions(
@@ -162,7 +173,7 @@ def run_entity_resolution_live(
                 else:
                     unresolved_rows.append(result_rec)
 
-        write_resolution_results(
+        resolution_write_stats = write_resolution_results(
             driver,
             run_id=run_id,
             source_uri=source_uri,
@@ -171,9 +182,10 @@ def run_entity_resolution_live(
             neo4j_database=neo4j_database,
             entity_resolution_graph=entity_resolution_graph,
         )
+        write_batches.extend(_batch_write_stats(resolution_write_stats))
 
         if resolution_mode == "hybrid":
-            write_alignment_results(
+            alignment_write_stats = write_alignment_results(
                 driver,
                 run_id=run_id,
                 source_uri=source_uri,
@@ -181,6 +193,11 @@ def run_entity_resolution_live(
                 neo4j_database=neo4j_database,
                 entity_resolution_graph=entity_resolution_graph,
             )
+            write_batches.extend(_batch_write_stats(alignment_write_stats))
+
+        # One RunStats recount and generation bump for every write the mode made.
+        if refresh_run_state is not None:
+            refresh_run_state(driver, run_id=run_id, neo4j_database=neo4j_database)
 
         if resolution_mode in ("unstructured_only", "hybrid"):
             graph_coverage = fetch_member_of_coverage(
@@ -219,6 +236,7 @@ def run_entity_resolution_live(
         graph_mentions_in_aligned=graph_mentions_in_aligned,
         graph_alignment_breakdown=dict(graph_alignment_breakdown),
         warnings=list(stage_warnings),
+        write_batches=write_batches,
     )
 
 
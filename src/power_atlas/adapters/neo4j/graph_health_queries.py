@@ -74,9 +74,28 @@ def _records_to_dicts(records: list[Any]) -> list[dict[str, Any]]:
 def build_cluster_type_fragmentation_query(
     *,
     build_entity_type_cypher_case: Callable[[str], str],
+    entity_type_policy_version: str | None = None,
 ) -> str:
+    """Build the per-cluster distinct-type query.
+
+    With *entity_type_policy_version*, mentions stamped with that version are
+    grouped on their stored ``normalized_entity_type``; only unstamped or stale
+    mentions evaluate the policy ``CASE`` expression.
+    """
     _indent = "     "
     case_expr = build_entity_type_cypher_case("m.entity_type")
+    if entity_type_policy_version is not None:
+        if not entity_type_policy_version.isalnum():
+            raise ValueError("entity_type_policy_version must be alphanumeric")
+        case_expr = "\n".join(
+            [
+                "CASE",
+                f"  WHEN m.entity_type_policy_version = '{entity_type_policy_version}'",
+                "       AND m.normalized_entity_type IS NOT NULL THEN m.normalized_entity_type",
+                "  ELSE " + case_expr.replace("\n", "\n       "),
+                "END",
+            ]
+        )
     indented_case = case_expr.replace("\n", "\n" + _indent)
     return "".join(
         [
@@ -164,13 +183,14 @@ def fetch_graph_health_query_rows(
     alignment_version: str | None,
     query_specs: Sequence[GraphHealthQuerySpec],
     logger: logging.Logger,
+    driver_factory: Callable[[Neo4jSettings], Any] = create_neo4j_driver,
 ) -> dict[str, list[dict[str, Any]]]:
     params: dict[str, Any] = {
         "run_id": run_id,
         "alignment_version": alignment_version,
     }
     rows_by_key: dict[str, list[dict[str, Any]]] = {}
-    with create_neo4j_driver(neo4j_settings) as driver:
+    with driver_factory(neo4j_settings) as driver:
         for result_key, log_label, cypher in query_specs:
             logger.info("graph_health: running %s query", log_label)
             records, _, _ = driver.execute_query(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Mapping, Sequence
 from typing import Any
 
@@ -183,6 +184,43 @@ def build_pairwise_query_specs(entity_a: str, entity_b: str) -> list[RetrievalBe
     ]
 
 
+def _sum_profile_db_hits(plan: Mapping[str, Any] | None) -> int | None:
+    if not plan:
+        return None
+    total = int(plan.get("dbHits", 0) or 0)
+    for child in plan.get("children", []) or []:
+        total += _sum_profile_db_hits(child) or 0
+    return total
+
+
+def execute_retrieval_benchmark_query(
+    driver: neo4j.Driver,
+    neo4j_database: str,
+    *,
+    cypher: str,
+    parameters: Mapping[str, Any],
+    profile: bool = False,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Run one benchmark query; return its rows and timing stats.
+
+    With *profile* the query runs under ``PROFILE`` and the stats include the
+    total db hits of the plan.  Profiling adds overhead, so latencies from a
+    profiled run are not comparable with unprofiled ones.
+    """
+    started = time.perf_counter()
+    records, summary, _ = driver.execute_query(
+        f"PROFILE {cypher}" if profile else cypher,
+        parameters_=dict(parameters),
+        database_=neo4j_database,
+        routing_=neo4j.RoutingControl.READ,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    stats: dict[str, Any] = {"elapsed_ms": round(elapsed_ms, 3), "rows": len(records)}
+    if profile:
+        stats["db_hits"] = _sum_profile_db_hits(getattr(summary, "profile", None))
+    return _records_to_dicts(records), stats
+
+
 def fetch_retrieval_benchmark_query_rows(
     neo4j_settings: Neo4jSettings,
     neo4j_database: str,
@@ -190,18 +228,27 @@ def fetch_retrieval_benchmark_query_rows(
     base_params: Mapping[str, Any],
     query_specs: Sequence[RetrievalBenchmarkQuerySpec],
     logger: logging.Logger,
+    driver: neo4j.Driver | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
-    rows_by_key: dict[str, list[dict[str, Any]]] = {}
-    with create_neo4j_driver(neo4j_settings) as driver:
-        for result_key, log_label, cypher, extra_params in query_specs:
-            logger.info("retrieval_benchmark: running %s query", log_label)
-            records, _, _ = driver.execute_query(
-                cypher,
-                parameters_={**base_params, **(extra_params or {})},
-                database_=neo4j_database,
-                routing_=neo4j.RoutingControl.READ,
+    if driver is None:
+        with create_neo4j_driver(neo4j_settings) as owned_driver:
+            return fetch_retrieval_benchmark_query_rows(
+                neo4j_settings,
+                neo4j_database,
+                base_params=base_params,
+                query_specs=query_specs,
+                logger=logger,
+                driver=owned_driver,
             )
-            rows_by_key[result_key] = _records_to_dicts(records)
+    rows_by_key: dict[str, list[dict[str, Any]]] = {}
+    for result_key, log_label, cypher, extra_params in query_specs:
+        logger.info("retrieval_benchmark: running %s query", log_label)
+        rows_by_key[result_key], _ = execute_retrieval_benchmark_query(
+            driver,
+            neo4j_database,
+            cypher=cypher,
+            parameters={**base_params, **(extra_params or {})},
+        )
     return rows_by_key
 
 
@@ -215,5 +262,6 @@ __all__ = [
     "RetrievalBenchmarkQuerySpec",
     "build_pairwise_query_specs",
     "build_single_entity_query_specs",
+    "execute_retrieval_benchmark_query",
     "fetch_retrieval_benchmark_query_rows",
 ]
\ No newline at end of file
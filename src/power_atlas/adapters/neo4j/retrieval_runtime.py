@@ -8,6 +8,7 @@ from typing import Any, TypeVar
 from power_atlas.bootstrap import create_neo4j_driver
 from power_atlas.contracts import resolve_early_return_rule
 from power_atlas.retrieval_live_preflight import prepare_live_retrieval_preflight
+from power_atlas.retrieval_message_history import estimate_text_tokens
 from power_atlas.settings import Neo4jSettings
 
 SessionResultT = TypeVar("SessionResultT")
@@ -19,6 +20,7 @@ class RetrievalSearchResult:
     hits: list[dict[str, object]]
     warnings: list[str]
     citation_warnings: list[str]
+    scoped_search: dict[str, object] | None = None
 
 
 @dataclass(frozen=True)
@@ -27,6 +29,7 @@ class InteractiveRetrievalTurnResult:
     history_answer: str
     citation_fallback_applied: bool
     debug_summary: str | None
+    context_tokens: int = 0
 
 
 def _build_retriever_labels(*, expand_graph: bool, cluster_aware: bool) -> list[str]:
@@ -314,7 +317,18 @@ def execute_retrieval_search(
     warnings: list[str] = []
     citation_warnings: list[str] = []
     hits: list[dict[str, object]] = []
+    scoped_search: dict[str, object] | None = None
     if rag_result and rag_result.retriever_result:
+        retriever_metadata = getattr(rag_result.retriever_result, "metadata", None)
+        if isinstance(retriever_metadata, dict):
+            scoped_search = retriever_metadata.get("scoped_search")
+        if scoped_search and scoped_search.get("underfilled") and scoped_search.get("candidates_discarded"):
+            warnings.append(
+                f"Scoped vector search found {scoped_search['in_scope']} in-scope chunks "
+                f"for top_k={scoped_search['top_k']} "
+                f"({scoped_search['candidates_discarded']} of {scoped_search['candidates_fetched']} "
+                "candidates were outside the run scope)."
+            )
         for item in rag_result.retriever_result.items:
             meta = item.metadata or {}
             citation_obj = meta.get("citation_object") or {}
@@ -340,6 +354,7 @@ def execute_retrieval_search(
         hits=hits,
         warnings=warnings,
         citation_warnings=citation_warnings,
+        scoped_search=scoped_search,
     )
 
 
@@ -385,6 +400,7 @@ def run_interactive_retrieval_turn(
         history_answer=pp["history_answer"],
         citation_fallback_applied=pp["citation_fallback_applied"],
         debug_summary=debug_summary,
+        context_tokens=sum(estimate_text_tokens(str(hit.get("content") or "")) for hit in search_result.hits),
     )
 
 
@@ -3,6 +3,10 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from power_atlas.adapters.neo4j.cached_retriever import ResultCachingRetriever
+from power_atlas.query_embedding_cache import CachedQueryEmbedder, QueryEmbeddingCache
+from power_atlas.retrieval_result_cache import RetrievalResultCache
+
 
 def build_retriever_and_rag(
     driver: Any,
@@ -14,17 +18,27 @@ def build_retriever_and_rag(
     embedder_model_name: str,
     result_formatter: Callable[[Any], Any],
     embedder_factory: type[Any],
-    retriever_factory: type[Any],
+    retriever_factory: Callable[..., Any],
     rag_factory: type[Any],
     build_embedder: Callable[..., Any],
     build_llm: Callable[[str], Any],
     prompt_template: str,
+    query_embedding_cache: QueryEmbeddingCache | None = None,
+    retrieval_result_cache: RetrievalResultCache | None = None,
 ) -> tuple[Any, Any]:
-    """Construct the retriever and GraphRAG pair for a live retrieval session."""
+    """Construct the retriever and GraphRAG pair for a live retrieval session.
+
+    With *query_embedding_cache*, the embedder is wrapped so repeated query
+    texts are served from the cache instead of re-embedded.  With
+    *retrieval_result_cache*, GraphRAG searches through a
+    :class:`ResultCachingRetriever`; the unwrapped retriever is returned.
+    """
     embedder = build_embedder(
         embedder_model_name,
         embedder_factory=embedder_factory,
     )
+    if query_embedding_cache is not None:
+        embedder = CachedQueryEmbedder(embedder, query_embedding_cache, model_name=embedder_model_name)
     retriever = retriever_factory(
         driver=driver,
         index_name=index_name,
@@ -35,7 +49,11 @@ def build_retriever_and_rag(
     )
     llm = build_llm(qa_model)
     rag = rag_factory(
-        retriever=retriever,
+        retriever=(
+            retriever
+            if retrieval_result_cache is None
+            else ResultCachingRetriever(retriever, retrieval_result_cache, driver=driver)
+        ),
         llm=llm,
         prompt_template=prompt_template,
     )
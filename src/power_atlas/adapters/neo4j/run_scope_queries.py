@@ -3,9 +3,51 @@ from __future__ import annotations
 import logging
 
 from power_atlas.bootstrap import create_neo4j_driver
+from power_atlas.run_registry import RUN_STATUS_COMPLETED, lookup_latest_run_id, lookup_run_dataset_id
 from power_atlas.settings import Neo4jSettings
 
 _DATASET_ID_SAMPLE_LIMIT = 10
+_UNSTRUCTURED_INGEST_STAGE_PREFIX = "unstructured_ingest"
+# Shared by both Chunk scans: skip run_ids the registry marks as not completed.
+_LATEST_SCANNED_RUN_TAIL = (
+    "WITH DISTINCT c.run_id AS run_id "
+    "WHERE NOT EXISTS { MATCH (run:Run {run_id: run_id}) WHERE run.status <> $status } "
+    "RETURN run_id ORDER BY run_id DESC LIMIT 1"
+)
+
+
+def _registry_lookup(lookup, *, logger: logging.Logger, **kwargs) -> str | None:
+    """Run a run-registry *lookup*, treating any failure as a miss."""
+    try:
+        return lookup(**kwargs)
+    except Exception as exc:
+        logger.debug("Run registry lookup failed; falling back to a Chunk scan: %s", exc)
+        return None
+
+
+def _warn_if_run_spans_datasets(session, run_id: str, *, logger: logging.Logger) -> None:
+    """Warn when *run_id*'s Chunk nodes carry more than one dataset_id (LIMIT 2 check)."""
+    check_result = session.run(
+        "MATCH (c:Chunk) "
+        "WHERE c.run_id = $run_id AND c.dataset_id IS NOT NULL "
+        "WITH DISTINCT c.dataset_id AS did "
+        "ORDER BY did "
+        "LIMIT 2 "
+        "RETURN collect(did) AS dataset_ids",
+        run_id=run_id,
+    )
+    check_record = check_result.single()
+    detected_ids = check_record["dataset_ids"] if check_record else []
+    if len(detected_ids) > 1:
+        logger.warning(
+            "Latest unstructured run %r has Chunk nodes stamped with "
+            "multiple distinct dataset_ids: %r. "
+            "The run may have been inconsistently ingested. "
+            "Re-ingest to repair, or select a different known-good run_id "
+            "via --run-id.",
+            run_id,
+            detected_ids,
+        )
 
 
 def fetch_latest_unstructured_run_id(
@@ -22,9 +64,13 @@ def fetch_latest_unstructured_run_id(
     multi-dataset repositories. Without *dataset_id*, the query spans all
     datasets (legacy behaviour, single-dataset repos).
 
-    Returns the run_id of the most recently created unstructured ingest run
-    (filtered to *dataset_id* when given), or None if no matching Chunk nodes
-    exist. Only call this in live mode; it opens a real Neo4j connection.
+    Selection rule: the latest run is the newest unstructured ingest run
+    (filtered to *dataset_id* when given) that still has Chunk nodes and is
+    not registered with a status other than ``"completed"``.  Runs that are
+    still running or that failed are therefore never selected, while runs
+    with no ``(:Run)`` node (ingested before the registry existed) count as
+    completed.  Returns None if no run matches. Only call this in live mode;
+    it opens a real Neo4j connection.
 
     Ordering assumption: run_ids are formatted as
     ``unstructured_ingest-<ISO8601_timestamp>-<uuid8>`` (e.g.
@@ -39,47 +85,47 @@ def fetch_latest_unstructured_run_id(
     detected, a WARNING is emitted because the run may have been inconsistently
     ingested. The resolved run_id is always returned so callers can proceed;
     the warning is informational only.
+
+    The ``(:Run)`` registry (:mod:`power_atlas.run_registry`) is consulted
+    first and answers the rule above from an index instead of sorting every
+    Chunk node.  The Chunk scan only runs when no completed registered run
+    matches, e.g. for graphs ingested before the registry existed, and applies
+    the same rule by skipping run_ids registered as running or failed.  The
+    dataset consistency check runs on either path.
     """
     with create_neo4j_driver(neo4j_settings) as driver:
+        registered_run_id = _registry_lookup(
+            lookup_latest_run_id,
+            logger=logger,
+            driver=driver,
+            stage_prefix=_UNSTRUCTURED_INGEST_STAGE_PREFIX,
+            dataset_id=dataset_id,
+            neo4j_database=neo4j_database,
+        )
         with driver.session(database=neo4j_database) as session:
+            if registered_run_id is not None:
+                _warn_if_run_spans_datasets(session, registered_run_id, logger=logger)
+                return registered_run_id
             if dataset_id is not None:
                 result = session.run(
                     "MATCH (c:Chunk) WHERE c.run_id STARTS WITH 'unstructured_ingest' "
                     "AND c.dataset_id = $dataset_id "
-                    "RETURN c.run_id ORDER BY c.run_id DESC LIMIT 1",
+                    + _LATEST_SCANNED_RUN_TAIL,
                     dataset_id=dataset_id,
+                    status=RUN_STATUS_COMPLETED,
                 )
             else:
                 result = session.run(
                     "MATCH (c:Chunk) WHERE c.run_id STARTS WITH 'unstructured_ingest' "
-                    "RETURN c.run_id ORDER BY c.run_id DESC LIMIT 1"
+                    + _LATEST_SCANNED_RUN_TAIL,
+                    status=RUN_STATUS_COMPLETED,
                 )
             record = result.single()
             if record is None:
                 return None
             run_id = record[0]
 
-            check_result = session.run(
-                "MATCH (c:Chunk) "
-                "WHERE c.run_id = $run_id AND c.dataset_id IS NOT NULL "
-                "WITH DISTINCT c.dataset_id AS did "
-                "ORDER BY did "
-                "LIMIT 2 "
-                "RETURN collect(did) AS dataset_ids",
-                run_id=run_id,
-            )
-            check_record = check_result.single()
-            detected_ids = check_record["dataset_ids"] if check_record else []
-            if len(detected_ids) > 1:
-                logger.warning(
-                    "Latest unstructured run %r has Chunk nodes stamped with "
-                    "multiple distinct dataset_ids: %r. "
-                    "The run may have been inconsistently ingested. "
-                    "Re-ingest to repair, or select a different known-good run_id "
-                    "via --run-id.",
-                    run_id,
-                    detected_ids,
-                )
+            _warn_if_run_spans_datasets(session, run_id, logger=logger)
             return run_id
 
 
@@ -115,8 +161,21 @@ def fetch_dataset_id_for_run(
 
     Returns None if no Chunk nodes with a non-null dataset_id exist for the run.
     Only call this in live mode; it opens a real Neo4j connection.
+
+    A run registered in the ``(:Run)`` registry with a dataset_id is answered
+    from its registry node by key; both phases above only run for unregistered
+    runs.
     """
     with create_neo4j_driver(neo4j_settings) as driver:
+        registered_dataset_id = _registry_lookup(
+            lookup_run_dataset_id,
+            logger=logger,
+            driver=driver,
+            run_id=run_id,
+            neo4j_database=neo4j_database,
+        )
+        if registered_dataset_id is not None:
+            return registered_dataset_id
         with driver.session(database=neo4j_database) as session:
             result = session.run(
                 "MATCH (c:Chunk) "
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+import neo4j
+from neo4j_graphrag.types import RawSearchResult
+
+from power_atlas.adapters.graphrag_retrieval import VectorCypherRetriever
+from power_atlas.retrieval_scoped_search import (
+    DEFAULT_MAX_CANDIDATES,
+    DEFAULT_OVER_FETCH_FACTOR,
+    RETRIEVAL_SCOPE_OVER_FETCH,
+    RETRIEVAL_SCOPE_POST_FILTER,
+    build_scoped_expansion_query,
+    select_scoped_candidates,
+    validate_retrieval_scope_strategy,
+)
+
+_logger = logging.getLogger(__name__)
+
+SCOPED_SEARCH_METADATA_KEY = "scoped_search"
+
+
+class RunScopedVectorCypherRetriever(VectorCypherRetriever):
+    """VectorCypherRetriever that selects in-scope candidates before expansion.
+
+    ``scope_strategy`` is one of ``post_filter`` (plain VectorCypherRetriever
+    behaviour), ``over_fetch`` or ``exact``; see
+    :mod:`power_atlas.retrieval_scoped_search`.  Candidate counts are returned
+    in the retriever result metadata under ``scoped_search``.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        scope_strategy: str = RETRIEVAL_SCOPE_OVER_FETCH,
+        over_fetch_factor: int = DEFAULT_OVER_FETCH_FACTOR,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.scope_strategy = validate_retrieval_scope_strategy(scope_strategy)
+        self.over_fetch_factor = over_fetch_factor
+        self.max_candidates = max_candidates
+
+    def get_search_results(
+        self,
+        query_vector: Optional[list[float]] = None,
+        query_text: Optional[str] = None,
+        top_k: int = 5,
+        effective_search_ratio: int = 1,
+        query_params: Optional[dict[str, Any]] = None,
+        filters: Optional[dict[str, Any]] = None,
+    ) -> RawSearchResult:
+        if self.scope_strategy == RETRIEVAL_SCOPE_POST_FILTER or filters:
+            return super().get_search_results(
+                query_vector=query_vector,
+                query_text=query_text,
+                top_k=top_k,
+                effective_search_ratio=effective_search_ratio,
+                query_params=query_params,
+                filters=filters,
+            )
+        if query_vector is None:
+            if not query_text or self.embedder is None:
+                raise ValueError("scoped vector search requires query_vector or query_text with an embedder")
+            query_vector = self.embedder.embed_query(query_text)
+
+        params = dict(query_params or {})
+        hits, stats = select_scoped_candidates(
+            self.driver,
+            strategy=self.scope_strategy,
+            index_name=self.index_name,
+            query_vector=query_vector,
+            top_k=top_k,
+            run_id=params.get("run_id"),
+            source_uri=params.get("source_uri"),
+            neo4j_database=self.neo4j_database,
+            node_label=self._node_label,
+            embedding_property=self._node_embedding_property,
+            over_fetch_factor=self.over_fetch_factor,
+            max_candidates=self.max_candidates,
+        )
+        _logger.info(
+            "Scoped vector search (%s): %d in scope, %d of %d candidates discarded, %d refills",
+            stats.strategy,
+            stats.in_scope,
+            stats.candidates_discarded,
+            stats.candidates_fetched,
+            stats.refills,
+        )
+        records: list[neo4j.Record] = []
+        if hits:
+            records, _, _ = self.driver.execute_query(
+                build_scoped_expansion_query(self.retrieval_query),
+                {**params, "scoped_hits": hits},
+                database_=self.neo4j_database,
+                routing_=neo4j.RoutingControl.READ,
+            )
+        return RawSearchResult(
+            records=records,
+            metadata={SCOPED_SEARCH_METADATA_KEY: stats.to_metadata()},
+        )
+
+
+__all__ = ["RunScopedVectorCypherRetriever", "SCOPED_SEARCH_METADATA_KEY"]
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from power_atlas.bootstrap import create_neo4j_driver
-from power_atlas.contracts import StructuredGraphShapeContract
+from power_atlas.contracts import StructuredGraphShapeContract, StructuredSchemaContract
+from power_atlas.retrieval_result_cache import (
+    RETRIEVAL_GENERATION_BUMP_QUERY,
+    bump_retrieval_generation,
+    retrieval_generation_scopes,
+)
 from power_atlas.settings import Neo4jSettings
 
 
@@ -37,6 +43,40 @@ def run_structured_ingest_live(
                 claims_rows=claims_rows,
                 graph_shape=graph_shape,
             )
+            session.run(RETRIEVAL_GENERATION_BUMP_QUERY, scopes=retrieval_generation_scopes([run_id])).consume()
 
 
-__all__ = ["run_structured_ingest_live"]
\ No newline at end of file
+def run_structured_stream_ingest_live(
+    neo4j_settings: Neo4jSettings,
+    *,
+    run_id: str,
+    source_uri: str,
+    dataset_id: str,
+    ingested_at: str,
+    neo4j_database: str | None,
+    structured_clean_dir: Path,
+    structured_schema: StructuredSchemaContract | None,
+    graph_shape: StructuredGraphShapeContract | None,
+    batch_size: int,
+    progress_interval_seconds: float,
+    write_stream: Callable[..., dict[str, Any]],
+) -> dict[str, Any]:
+    with create_neo4j_driver(neo4j_settings) as driver:
+        stats = write_stream(
+            driver,
+            neo4j_database=neo4j_database,
+            structured_clean_dir=structured_clean_dir,
+            run_id=run_id,
+            source_uri=source_uri,
+            dataset_id=dataset_id,
+            ingested_at=ingested_at,
+            structured_schema=structured_schema,
+            graph_shape=graph_shape,
+            batch_size=batch_size,
+            progress_interval_seconds=progress_interval_seconds,
+        )
+        bump_retrieval_generation(driver, run_ids=[run_id], neo4j_database=neo4j_database)
+        return stats
+
+
+__all__ = ["run_structured_ingest_live", "run_structured_stream_ingest_live"]
\ No newline at end of file
@@ -3,16 +3,18 @@ from __future__ import annotations
 import logging
 from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
-from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi import APIRouter, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+from power_atlas.backend_blocking_calls import BackendBlockingCalls
 from power_atlas.backend_dataset_catalog import resolve_backend_dataset_catalog
 from power_atlas.backend_graph import BackendGraphQueryService, build_backend_graph_query_service
 from power_atlas.backend_graph_router import build_backend_graph_router
+from power_atlas.backend_neo4j_pool import BackendNeo4jPoolSettings, SharedNeo4jDriver
 from power_atlas.backend_run_catalog import (
     resolve_backend_current_run_catalog,
     resolve_backend_current_run_details,
@@ -30,6 +32,8 @@ DEFAULT_API_TITLE = "Power Atlas API"
 DEFAULT_API_DESCRIPTION = "Backend API for Power Atlas"
 DEFAULT_API_VERSION = "0.1.0"
 DEFAULT_CORS_ALLOW_ORIGINS = ("http://localhost:3000",)
+DEFAULT_RUNS_PAGE_LIMIT = 100
+MAX_RUNS_PAGE_LIMIT = 1000
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,9 +42,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class Neo4jPoolHealthResponse(BaseModel):
+    status: str
+    max_connection_pool_size: int
+    connection_acquisition_timeout: float
+    liveness_check_timeout: float | None = None
+    acquisitions_total: int
+    failures_total: int
+    in_use: int
+    peak_in_use: int
+
+
 class HealthResponse(BaseModel):
     status: str
     message: str
+    neo4j_pool: Neo4jPoolHealthResponse | None = None
 
 
 class RootResponse(BaseModel):
@@ -78,6 +94,7 @@ class RunsResponse(BaseModel):
     runs_root: str
     runs: list[RunResponse]
     detail: str | None = None
+    next_cursor: str | None = None
 
 
 class CurrentRunsResponse(RunsResponse):
@@ -136,6 +153,8 @@ class BackendRuntime:
     app_context: AppContext
     graph_queries: BackendGraphQueryService
     app_baseline: AppBaseline | None = None
+    neo4j_pool: SharedNeo4jDriver | None = None
+    blocking_calls: BackendBlockingCalls = field(default_factory=BackendBlockingCalls)
 
 
 def build_backend_runtime(
@@ -144,16 +163,33 @@ def build_backend_runtime(
     environ: Mapping[str, str] | None = None,
     graph_queries: BackendGraphQueryService | None = None,
     app_baseline: AppBaseline | None = None,
+    neo4j_pool_settings: BackendNeo4jPoolSettings | None = None,
 ) -> BackendRuntime:
     resolved_app_context = (
         build_app_context(environ=environ, app_baseline=app_baseline)
         if app_context is None
         else app_context
     )
+    neo4j_pool = SharedNeo4jDriver(
+        resolved_app_context.settings.neo4j,
+        (
+            BackendNeo4jPoolSettings.from_env(environ)
+            if neo4j_pool_settings is None
+            else neo4j_pool_settings
+        ),
+    )
     return BackendRuntime(
         app_context=resolved_app_context,
-        graph_queries=(graph_queries or build_backend_graph_query_service(resolved_app_context)),
+        graph_queries=(
+            graph_queries
+            or build_backend_graph_query_service(
+                resolved_app_context,
+                driver_factory=neo4j_pool.driver_factory,
+            )
+        ),
         app_baseline=app_baseline,
+        neo4j_pool=neo4j_pool,
+        blocking_calls=BackendBlockingCalls.from_env(environ),
     )
 
 
@@ -176,9 +212,22 @@ class BackendAppOptions:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    del app
     logger.info("Power Atlas API starting up")
-    yield
+    runtime = getattr(app.state, "backend_runtime", None)
+    neo4j_pool = runtime.neo4j_pool if isinstance(runtime, BackendRuntime) else None
+    if neo4j_pool is not None and neo4j_pool.configured:
+        # Driver construction is lazy; connections are only opened on first use.
+        neo4j_pool.open()
+        logger.info(
+            "Neo4j driver pool opened (max_connection_pool_size=%d)",
+            neo4j_pool.pool_settings.max_connection_pool_size,
+        )
+    try:
+        yield
+    finally:
+        if neo4j_pool is not None and neo4j_pool.is_open:
+            neo4j_pool.close()
+            logger.info("Neo4j driver pool closed")
 
 
 def build_backend_router(
@@ -189,17 +238,29 @@ def build_backend_router(
     router.include_router(
         build_backend_graph_router(
             get_graph_queries=lambda app: get_backend_runtime(app).graph_queries,
+            get_blocking_calls=lambda app: get_backend_runtime(app).blocking_calls,
         )
     )
 
     @router.get("/health", response_model=HealthResponse)
-    async def health_check() -> HealthResponse:
-        return HealthResponse(status="ok", message="Backend is healthy")
+    async def health_check(request: Request) -> HealthResponse:
+        runtime = getattr(request.app.state, "backend_runtime", None)
+        neo4j_pool = runtime.neo4j_pool if isinstance(runtime, BackendRuntime) else None
+        return HealthResponse(
+            status="ok",
+            message="Backend is healthy",
+            neo4j_pool=(
+                None
+                if neo4j_pool is None
+                else Neo4jPoolHealthResponse(**asdict(neo4j_pool.metrics()))
+            ),
+        )
 
     @router.get("/datasets", response_model=DatasetsResponse)
     async def datasets(request: Request) -> DatasetsResponse:
         runtime = get_backend_runtime(request.app)
-        dataset_catalog = resolve_backend_dataset_catalog(
+        dataset_catalog = await runtime.blocking_calls.run(
+            resolve_backend_dataset_catalog,
             runtime.app_context.settings,
             repo_paths=(None if runtime.app_baseline is None else runtime.app_baseline.repo_paths),
         )
@@ -234,13 +295,22 @@ def build_backend_router(
         dataset_id: str | None = None,
         stage_name: str | None = None,
         latest_per_stage_prefix: bool = False,
+        limit: int = Query(DEFAULT_RUNS_PAGE_LIMIT, ge=1, le=MAX_RUNS_PAGE_LIMIT),
+        cursor: str | None = None,
     ) -> RunsResponse:
-        run_catalog = resolve_backend_run_catalog(
-            get_backend_runtime(request.app).app_context.settings,
-            dataset_id=dataset_id,
-            stage_name=stage_name,
-            latest_per_stage_prefix=latest_per_stage_prefix,
-        )
+        runtime = get_backend_runtime(request.app)
+        try:
+            run_catalog = await runtime.blocking_calls.run(
+                resolve_backend_run_catalog,
+                runtime.app_context.settings,
+                dataset_id=dataset_id,
+                stage_name=stage_name,
+                latest_per_stage_prefix=latest_per_stage_prefix,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
         return RunsResponse(
             output_dir=run_catalog.output_dir,
             runs_root=run_catalog.runs_root,
@@ -256,6 +326,7 @@ def build_backend_router(
                 for run in run_catalog.runs
             ],
             detail=run_catalog.detail,
+            next_cursor=run_catalog.next_cursor,
         )
 
     @router.get("/runs/current", response_model=CurrentRunsResponse)
@@ -263,14 +334,22 @@ def build_backend_router(
         request: Request,
         dataset_id: str | None = None,
         stage_name: str | None = None,
+        limit: int = Query(DEFAULT_RUNS_PAGE_LIMIT, ge=1, le=MAX_RUNS_PAGE_LIMIT),
+        cursor: str | None = None,
     ) -> CurrentRunsResponse:
         runtime = get_backend_runtime(request.app)
-        run_catalog = resolve_backend_current_run_catalog(
-            runtime.app_context.settings,
-            dataset_id=dataset_id,
-            stage_name=stage_name,
-            repo_paths=(None if runtime.app_baseline is None else runtime.app_baseline.repo_paths),
-        )
+        try:
+            run_catalog = await runtime.blocking_calls.run(
+                resolve_backend_current_run_catalog,
+                runtime.app_context.settings,
+                dataset_id=dataset_id,
+                stage_name=stage_name,
+                repo_paths=(None if runtime.app_baseline is None else runtime.app_baseline.repo_paths),
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
         return CurrentRunsResponse(
             output_dir=run_catalog.output_dir,
             runs_root=run_catalog.runs_root,
@@ -287,6 +366,7 @@ def build_backend_router(
             ],
             detail=run_catalog.detail,
             inferred_dataset_id=run_catalog.inferred_dataset_id,
+            next_cursor=run_catalog.next_cursor,
         )
 
     @router.get("/runs/current/{stage_prefix}", response_model=CurrentRunDetailResponse)
@@ -298,7 +378,8 @@ def build_backend_router(
     ) -> CurrentRunDetailResponse:
         runtime = get_backend_runtime(request.app)
         try:
-            run_detail_result = resolve_backend_current_run_details(
+            run_detail_result = await runtime.blocking_calls.run(
+                resolve_backend_current_run_details,
                 runtime.app_context.settings,
                 stage_prefix,
                 dataset_id=dataset_id,
@@ -344,7 +425,8 @@ def build_backend_router(
     ) -> CurrentClaimExtractionDiagnosticsResponse:
         runtime = get_backend_runtime(request.app)
         try:
-            result = resolve_current_claim_extraction_diagnostics_artifact(
+            result = await runtime.blocking_calls.run(
+                resolve_current_claim_extraction_diagnostics_artifact,
                 runtime.app_context.settings,
                 stage_prefix,
                 dataset_id=dataset_id,
@@ -391,9 +473,11 @@ def build_backend_router(
         request: Request,
         stage_name: str | None = None,
     ) -> RunDetailResponse:
+        runtime = get_backend_runtime(request.app)
         try:
-            run_detail_result = resolve_backend_run_details(
-                get_backend_runtime(request.app).app_context.settings,
+            run_detail_result = await runtime.blocking_calls.run(
+                resolve_backend_run_details,
+                runtime.app_context.settings,
                 run_id,
                 stage_name=stage_name,
             )
@@ -432,9 +516,11 @@ def build_backend_router(
         run_id: str,
         request: Request,
     ) -> ClaimExtractionDiagnosticsResponse:
+        runtime = get_backend_runtime(request.app)
         try:
-            result = resolve_claim_extraction_diagnostics_artifact(
-                get_backend_runtime(request.app).app_context.settings,
+            result = await runtime.blocking_calls.run(
+                resolve_claim_extraction_diagnostics_artifact,
+                runtime.app_context.settings,
                 run_id,
             )
         except ValueError as exc:
@@ -539,9 +625,12 @@ __all__ = [
     "DEFAULT_API_TITLE",
     "DEFAULT_API_VERSION",
     "DEFAULT_CORS_ALLOW_ORIGINS",
+    "DEFAULT_RUNS_PAGE_LIMIT",
     "DatasetResponse",
     "DatasetsResponse",
     "HealthResponse",
+    "MAX_RUNS_PAGE_LIMIT",
+    "Neo4jPoolHealthResponse",
     "CurrentRunDetailResponse",
     "CurrentRunsResponse",
     "RunDetailResponse",
@@ -0,0 +1,81 @@
+"""Bounded worker-thread offloading for blocking backend route work.
+
+The backend routes are ``async def`` but the work behind them (synchronous
+Neo4j driver queries, run-catalog filesystem scans) blocks.  Routes hand that
+work to :meth:`BackendBlockingCalls.run`, which executes it on a worker thread
+so the event loop keeps serving other requests.  At most ``max_workers`` calls
+run at once; further calls wait for a free slot rather than growing the
+thread pool, which keeps concurrent graph queries within the shared Neo4j
+driver's connection pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+import anyio
+import anyio.to_thread
+
+DEFAULT_BACKEND_BLOCKING_WORKERS = 16
+BACKEND_BLOCKING_WORKERS_ENV_NAME = "POWER_ATLAS_BACKEND_BLOCKING_WORKERS"
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class BackendBlockingCallStats:
+    max_workers: int
+    in_flight: int
+    waiting: int
+
+
+class BackendBlockingCalls:
+    def __init__(self, max_workers: int = DEFAULT_BACKEND_BLOCKING_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self.max_workers = max_workers
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._limiter_loop: weakref.ReferenceType[asyncio.AbstractEventLoop] | None = None
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "BackendBlockingCalls":
+        env = os.environ if environ is None else environ
+        return cls(int(env.get(BACKEND_BLOCKING_WORKERS_ENV_NAME, DEFAULT_BACKEND_BLOCKING_WORKERS)))
+
+    def _current_limiter(self) -> anyio.CapacityLimiter:
+        # Capacity limiters are bound to the event loop that first uses them.
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._limiter_loop is None or self._limiter_loop() is not loop:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+            self._limiter_loop = weakref.ref(loop)
+        return self._limiter
+
+    async def run(self, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        return await anyio.to_thread.run_sync(
+            partial(func, *args, **kwargs),
+            limiter=self._current_limiter(),
+        )
+
+    def statistics(self) -> BackendBlockingCallStats:
+        if self._limiter is None:
+            return BackendBlockingCallStats(max_workers=self.max_workers, in_flight=0, waiting=0)
+        limiter_stats = self._limiter.statistics()
+        return BackendBlockingCallStats(
+            max_workers=self.max_workers,
+            in_flight=limiter_stats.borrowed_tokens,
+            waiting=limiter_stats.tasks_waiting,
+        )
+
+
+__all__ = [
+    "BACKEND_BLOCKING_WORKERS_ENV_NAME",
+    "BackendBlockingCallStats",
+    "BackendBlockingCalls",
+    "DEFAULT_BACKEND_BLOCKING_WORKERS",
+]
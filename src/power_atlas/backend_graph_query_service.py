@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Protocol
+from functools import partial
+from typing import Any, Protocol
 
+from power_atlas.adapters.neo4j.graph_health_queries import fetch_graph_health_query_rows
 from power_atlas.context import AppContext
 from power_atlas.graph_health_summary import (
     GraphHealthSummaryRequest,
@@ -69,22 +71,52 @@ def build_backend_graph_query_service(
     graph_summary_resolver: Callable[[AppContext], GraphSummaryResult] | None = None,
     run_scoped_graph_counts_resolver: Callable[[AppContext, RunScopedGraphCountsRequest], RunScopedGraphCountsResult] | None = None,
     graph_health_summary_resolver: Callable[[AppContext, GraphHealthSummaryRequest], GraphHealthSummaryResult] | None = None,
+    driver_factory: Callable[[Any], Any] | None = None,
 ) -> DefaultBackendGraphQueryService:
+    """Build the default graph query service.
+
+    *driver_factory*, when given, replaces the per-call driver construction of
+    the default resolvers (for example with a shared, pooled driver).
+    """
+    driver_kwargs: dict[str, Any] = {} if driver_factory is None else {"driver_factory": driver_factory}
     return DefaultBackendGraphQueryService(
         app_context=app_context,
         graph_status_resolver=(
             graph_status_resolver
-            or (lambda runtime_app_context: resolve_graph_status(settings=runtime_app_context.settings))
+            or (
+                lambda runtime_app_context: resolve_graph_status(
+                    settings=runtime_app_context.settings,
+                    **driver_kwargs,
+                )
+            )
         ),
         graph_summary_resolver=(
             graph_summary_resolver
-            or (lambda runtime_app_context: resolve_graph_summary(settings=runtime_app_context.settings))
+            or (
+                lambda runtime_app_context: resolve_graph_summary(
+                    settings=runtime_app_context.settings,
+                    **driver_kwargs,
+                )
+            )
         ),
         run_scoped_graph_counts_resolver=(
-            run_scoped_graph_counts_resolver or resolve_run_scoped_graph_counts
+            run_scoped_graph_counts_resolver
+            or (
+                resolve_run_scoped_graph_counts
+                if driver_factory is None
+                else partial(resolve_run_scoped_graph_counts, driver_factory=driver_factory)
+            )
         ),
         graph_health_summary_resolver=(
-            graph_health_summary_resolver or resolve_graph_health_summary
+            graph_health_summary_resolver
+            or (
+                resolve_graph_health_summary
+                if driver_factory is None
+                else partial(
+                    resolve_graph_health_summary,
+                    query_rows_fetcher=partial(fetch_graph_health_query_rows, driver_factory=driver_factory),
+                )
+            )
         ),
     )
 
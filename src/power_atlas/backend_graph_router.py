@@ -4,6 +4,7 @@ from collections.abc import Callable
 
 from fastapi import APIRouter, FastAPI, Request, Response
 
+from power_atlas.backend_blocking_calls import BackendBlockingCalls
 from power_atlas.backend_graph import (
     BackendGraphQueryService,
     GraphHealthSummaryRequest,
@@ -28,8 +29,13 @@ from power_atlas.backend_graph_response_adapters import (
 def build_backend_graph_router(
     *,
     get_graph_queries: Callable[[FastAPI], BackendGraphQueryService],
+    get_blocking_calls: Callable[[FastAPI], BackendBlockingCalls] | None = None,
 ) -> APIRouter:
     router = APIRouter()
+    default_blocking_calls = BackendBlockingCalls()
+
+    def _blocking_calls(app: FastAPI) -> BackendBlockingCalls:
+        return default_blocking_calls if get_blocking_calls is None else get_blocking_calls(app)
 
     @router.get(
         "/graph/status",
@@ -37,7 +43,7 @@ def build_backend_graph_router(
         responses={503: {"description": "Graph integration is not configured yet"}},
     )
     async def graph_status(request: Request, response: Response) -> GraphStatusResponse:
-        probe = get_graph_queries(request.app).graph_status()
+        probe = await _blocking_calls(request.app).run(get_graph_queries(request.app).graph_status)
         response.status_code = probe.http_status_code
         return GraphStatusResponse(**build_graph_status_response_payload(probe))
 
@@ -47,7 +53,7 @@ def build_backend_graph_router(
         responses={503: {"description": "Graph summary is unavailable"}},
     )
     async def graph_summary(request: Request, response: Response) -> GraphSummaryResponse:
-        probe = get_graph_queries(request.app).graph_summary()
+        probe = await _blocking_calls(request.app).run(get_graph_queries(request.app).graph_summary)
         response.status_code = probe.http_status_code
         return GraphSummaryResponse(**build_graph_summary_response_payload(probe))
 
@@ -61,7 +67,8 @@ def build_backend_graph_router(
         response: Response,
         body: GraphHealthSummaryRequestBody,
     ) -> GraphHealthSummaryResponse:
-        probe = get_graph_queries(request.app).graph_health_summary(
+        probe = await _blocking_calls(request.app).run(
+            get_graph_queries(request.app).graph_health_summary,
             GraphHealthSummaryRequest(
                 run_id=body.run_id,
                 alignment_version=body.alignment_version,
@@ -82,7 +89,8 @@ def build_backend_graph_router(
         response: Response,
         body: RunScopedGraphCountsRequestBody,
     ) -> RunScopedGraphCountsResponse:
-        probe = get_graph_queries(request.app).run_scoped_graph_counts(
+        probe = await _blocking_calls(request.app).run(
+            get_graph_queries(request.app).run_scoped_graph_counts,
             RunScopedGraphCountsRequest(run_id=body.run_id),
         )
         response.status_code = probe.http_status_code
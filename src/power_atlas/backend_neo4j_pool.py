@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from power_atlas.bootstrap import create_neo4j_driver
+from power_atlas.settings import AppSettings, Neo4jSettings
+
+DEFAULT_MAX_CONNECTION_POOL_SIZE = 50
+DEFAULT_CONNECTION_ACQUISITION_TIMEOUT = 30.0
+DEFAULT_LIVENESS_CHECK_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class BackendNeo4jPoolEnvNames:
+    max_connection_pool_size: str = "POWER_ATLAS_NEO4J_MAX_POOL_SIZE"
+    connection_acquisition_timeout: str = "POWER_ATLAS_NEO4J_ACQUISITION_TIMEOUT"
+    liveness_check_timeout: str = "POWER_ATLAS_NEO4J_LIVENESS_CHECK_TIMEOUT"
+
+
+DEFAULT_BACKEND_NEO4J_POOL_ENV_NAMES = BackendNeo4jPoolEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class BackendNeo4jPoolSettings:
+    max_connection_pool_size: int = DEFAULT_MAX_CONNECTION_POOL_SIZE
+    connection_acquisition_timeout: float = DEFAULT_CONNECTION_ACQUISITION_TIMEOUT
+    # Idle connections older than this are pinged before reuse; None disables the check.
+    liveness_check_timeout: float | None = DEFAULT_LIVENESS_CHECK_TIMEOUT
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: BackendNeo4jPoolEnvNames | None = None,
+    ) -> "BackendNeo4jPoolSettings":
+        env = dict(os.environ if environ is None else environ)
+        names = DEFAULT_BACKEND_NEO4J_POOL_ENV_NAMES if env_names is None else env_names
+        liveness_raw = env.get(names.liveness_check_timeout)
+        return cls(
+            max_connection_pool_size=int(
+                env.get(names.max_connection_pool_size, DEFAULT_MAX_CONNECTION_POOL_SIZE)
+            ),
+            connection_acquisition_timeout=float(
+                env.get(names.connection_acquisition_timeout, DEFAULT_CONNECTION_ACQUISITION_TIMEOUT)
+            ),
+            liveness_check_timeout=(
+                DEFAULT_LIVENESS_CHECK_TIMEOUT
+                if liveness_raw is None
+                else (None if liveness_raw.strip().lower() in ("", "none", "off") else float(liveness_raw))
+            ),
+        )
+
+    def driver_config(self) -> dict[str, Any]:
+        return {
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "liveness_check_timeout": self.liveness_check_timeout,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BackendNeo4jPoolMetrics:
+    status: str
+    max_connection_pool_size: int
+    connection_acquisition_timeout: float
+    liveness_check_timeout: float | None
+    acquisitions_total: int
+    failures_total: int
+    in_use: int
+    peak_in_use: int
+
+
+class SharedNeo4jDriver:
+    """One long-lived, pooled Neo4j driver shared by every backend request.
+
+    :meth:`driver_factory` has the ``driver_factory(settings)`` shape the graph
+    resolvers already accept, but yields the shared driver instead of building
+    (and closing) a new one per request.
+    """
+
+    def __init__(
+        self,
+        neo4j_settings: Neo4jSettings,
+        pool_settings: BackendNeo4jPoolSettings | None = None,
+        *,
+        create_driver: Callable[..., Any] = create_neo4j_driver,
+    ) -> None:
+        self.neo4j_settings = neo4j_settings
+        self.pool_settings = BackendNeo4jPoolSettings() if pool_settings is None else pool_settings
+        self._create_driver = create_driver
+        self._driver: Any = None
+        self._lock = threading.Lock()
+        self._acquisitions_total = 0
+        self._failures_total = 0
+        self._in_use = 0
+        self._peak_in_use = 0
+
+    @property
+    def configured(self) -> bool:
+        return self.neo4j_settings.password != Neo4jSettings.password
+
+    @property
+    def is_open(self) -> bool:
+        return self._driver is not None
+
+    def open(self) -> Any:
+        with self._lock:
+            if self._driver is None:
+                self._driver = self._create_driver(
+                    self.neo4j_settings,
+                    **self.pool_settings.driver_config(),
+                )
+            return self._driver
+
+    def close(self) -> None:
+        with self._lock:
+            driver, self._driver = self._driver, None
+        if driver is not None:
+            driver.close()
+
+    @contextmanager
+    def driver_factory(self, settings: AppSettings | Neo4jSettings | None = None) -> Iterator[Any]:
+        del settings
+        driver = self.open()
+        with self._lock:
+            self._acquisitions_total += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        try:
+            yield driver
+        except Exception:
+            with self._lock:
+                self._failures_total += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_use -= 1
+
+    def metrics(self) -> BackendNeo4jPoolMetrics:
+        if not self.configured:
+            status = "not_configured"
+        elif self.is_open:
+            status = "open"
+        else:
+            status = "closed"
+        with self._lock:
+            return BackendNeo4jPoolMetrics(
+                status=status,
+                max_connection_pool_size=self.pool_settings.max_connection_pool_size,
+                connection_acquisition_timeout=self.pool_settings.connection_acquisition_timeout,
+                liveness_check_timeout=self.pool_settings.liveness_check_timeout,
+                acquisitions_total=self._acquisitions_total,
+                failures_total=self._failures_total,
+                in_use=self._in_use,
+                peak_in_use=self._peak_in_use,
+            )
+
+
+__all__ = [
+    "BackendNeo4jPoolEnvNames",
+    "BackendNeo4jPoolMetrics",
+    "BackendNeo4jPoolSettings",
+    "DEFAULT_BACKEND_NEO4J_POOL_ENV_NAMES",
+    "DEFAULT_CONNECTION_ACQUISITION_TIMEOUT",
+    "DEFAULT_LIVENESS_CHECK_TIMEOUT",
+    "DEFAULT_MAX_CONNECTION_POOL_SIZE",
+    "SharedNeo4jDriver",
+]
@@ -7,6 +7,12 @@ from typing import Any
 
 from power_atlas.backend_dataset_catalog import resolve_backend_dataset_catalog
 from power_atlas.contracts import RepoPaths
+from power_atlas.run_catalog_index import (
+    IndexedRun,
+    extract_run_stage_prefix,
+    query_run_catalog,
+    summarize_run_dir,
+)
 from power_atlas.settings import AppSettings
 
 
@@ -27,6 +33,7 @@ class RunCatalogResult:
     runs: list[RunCatalogEntry]
     detail: str | None = None
     inferred_dataset_id: str | None = None
+    next_cursor: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -91,34 +98,19 @@ def _build_run_stage_entry(stage_dir: Path) -> RunStageDetailEntry:
     )
 
 
-def _build_run_entry(run_dir: Path) -> RunCatalogEntry:
-    stage_dirs = sorted(
-        child for child in run_dir.iterdir() if child.is_dir() and not child.name.startswith(".")
-    )
-    manifest_data: dict[str, Any] | None = None
-    for stage_dir in stage_dirs:
-        manifest_path = stage_dir / "manifest.json"
-        if not manifest_path.is_file():
-            continue
-        manifest_data = _read_manifest(manifest_path)
-        if manifest_data is not None:
-            break
-
+def _to_run_entry(run: IndexedRun, runs_root: Path) -> RunCatalogEntry:
     return RunCatalogEntry(
-        run_id=run_dir.name,
-        dataset_id=(None if manifest_data is None else manifest_data.get("dataset_id")),
-        started_at=(None if manifest_data is None else manifest_data.get("started_at")),
-        finished_at=(None if manifest_data is None else manifest_data.get("finished_at")),
-        stage_names=[stage_dir.name for stage_dir in stage_dirs],
-        root_path=str(run_dir),
+        run_id=run.run_id,
+        dataset_id=run.dataset_id,
+        started_at=run.started_at,
+        finished_at=run.finished_at,
+        stage_names=list(run.stage_names),
+        root_path=str(runs_root / run.run_id),
     )
 
 
-def extract_run_stage_prefix(run_id: str) -> str:
-    parts = run_id.rsplit("-", 2)
-    if len(parts) == 3 and all(parts):
-        return parts[0]
-    return run_id
+def _build_run_entry(run_dir: Path) -> RunCatalogEntry:
+    return _to_run_entry(summarize_run_dir(run_dir), run_dir.parent)
 
 
 def _resolve_effective_current_dataset_id(
@@ -172,7 +164,16 @@ def resolve_backend_run_catalog(
     dataset_id: str | None = None,
     stage_name: str | None = None,
     latest_per_stage_prefix: bool = False,
+    stage_prefix: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> RunCatalogResult:
+    """List runs newest-first from the persistent run index.
+
+    Filters and ``latest_per_stage_prefix`` are applied by the index; with
+    *limit*, at most that many runs are returned and ``next_cursor`` is set
+    when more remain (pass it back as *cursor* for the next page).
+    """
     output_dir = settings.output_dir.resolve()
     runs_root = resolve_runs_root(output_dir)
 
@@ -184,30 +185,20 @@ def resolve_backend_run_catalog(
             detail="No run directories were found under the configured output directory.",
         )
 
-    run_dirs = sorted(
-        (child for child in runs_root.iterdir() if child.is_dir() and not child.name.startswith(".")),
-        key=lambda child: child.name,
-        reverse=True,
+    page = query_run_catalog(
+        runs_root,
+        dataset_id=dataset_id,
+        stage_name=stage_name,
+        stage_prefix=stage_prefix,
+        latest_per_stage_prefix=latest_per_stage_prefix,
+        limit=limit,
+        cursor=cursor,
     )
-    runs = [_build_run_entry(run_dir) for run_dir in run_dirs]
-    if dataset_id is not None:
-        runs = [run for run in runs if run.dataset_id == dataset_id]
-    if stage_name is not None:
-        runs = [run for run in runs if stage_name in run.stage_names]
-    if latest_per_stage_prefix:
-        seen_prefixes: set[str] = set()
-        latest_runs: list[RunCatalogEntry] = []
-        for run in runs:
-            prefix = extract_run_stage_prefix(run.run_id)
-            if prefix in seen_prefixes:
-                continue
-            seen_prefixes.add(prefix)
-            latest_runs.append(run)
-        runs = latest_runs
     return RunCatalogResult(
         output_dir=str(output_dir),
         runs_root=str(runs_root),
-        runs=runs,
+        runs=[_to_run_entry(run, runs_root) for run in page.runs],
+        next_cursor=page.next_cursor,
     )
 
 
@@ -217,6 +208,9 @@ def resolve_backend_current_run_catalog(
     dataset_id: str | None = None,
     stage_name: str | None = None,
     repo_paths: RepoPaths | None = None,
+    stage_prefix: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> RunCatalogResult:
     effective_dataset_id, inferred_dataset_id = _resolve_effective_current_dataset_id(
         settings,
@@ -228,6 +222,9 @@ def resolve_backend_current_run_catalog(
         dataset_id=effective_dataset_id,
         stage_name=stage_name,
         latest_per_stage_prefix=True,
+        stage_prefix=stage_prefix,
+        limit=limit,
+        cursor=cursor,
     )
     return RunCatalogResult(
         output_dir=result.output_dir,
@@ -235,6 +232,7 @@ def resolve_backend_current_run_catalog(
         runs=result.runs,
         detail=result.detail,
         inferred_dataset_id=inferred_dataset_id,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -250,11 +248,10 @@ def resolve_backend_current_run_details(
         settings,
         dataset_id=dataset_id,
         repo_paths=repo_paths,
+        stage_prefix=stage_prefix,
+        limit=1,
     )
-    matching_run = next(
-        (run for run in run_catalog.runs if extract_run_stage_prefix(run.run_id) == stage_prefix),
-        None,
-    )
+    matching_run = next(iter(run_catalog.runs), None)
     if matching_run is None:
         raise FileNotFoundError(
             f"Current run for stage_prefix {stage_prefix!r} was not found under {run_catalog.runs_root}."
@@ -0,0 +1,233 @@
+"""Batched, cached chunk embedding for the PDF ingest pipeline.
+
+The vendor ``TextChunkEmbedder`` in ``SimpleKGPipeline`` issues one
+embeddings request per chunk and re-embeds every chunk on every ingest.
+:class:`BatchedTextChunkEmbedder` replaces it in the pipeline's
+``chunk_embedder`` node and instead:
+
+* looks every chunk up in an :class:`~power_atlas.embedding_cache.EmbeddingCache`
+  first, so re-ingesting an unchanged PDF makes no embedding calls;
+* embeds the remaining chunks ``batch_size`` texts per request, with at most
+  ``max_concurrency`` requests in flight;
+* records :class:`ChunkEmbeddingStats` for the ingest summary.
+
+Batches use the embedder's OpenAI client directly (``embeddings.create`` with
+a list input); other embedders fall back to ``embed_query`` per text.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import validate_call
+
+from power_atlas.adapters.graphrag_components import TextChunkEmbedder
+from power_atlas.adapters.graphrag_types import TextChunk, TextChunks
+from power_atlas.embedding_cache import EMBEDDING_CACHE_RELATIVE_DIR, EmbeddingCache
+
+_logger = logging.getLogger(__name__)
+
+CHUNK_EMBEDDER_COMPONENT_NAME = "chunk_embedder"
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+_DISABLED_VALUES = frozenset({"0", "off", "none", "false"})
+
+
+@dataclass(frozen=True)
+class ChunkEmbeddingEnvNames:
+    batch_size: str = "POWER_ATLAS_EMBEDDING_BATCH_SIZE"
+    concurrency: str = "POWER_ATLAS_EMBEDDING_CONCURRENCY"
+    cache: str = "POWER_ATLAS_EMBEDDING_CACHE"
+
+
+DEFAULT_CHUNK_EMBEDDING_ENV_NAMES = ChunkEmbeddingEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkEmbeddingSettings:
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE
+    max_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY
+    cache_enabled: bool = True
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {self.max_concurrency}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: ChunkEmbeddingEnvNames | None = None,
+    ) -> "ChunkEmbeddingSettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_CHUNK_EMBEDDING_ENV_NAMES if env_names is None else env_names
+        return cls(
+            batch_size=int(env.get(names.batch_size, DEFAULT_EMBEDDING_BATCH_SIZE)),
+            max_concurrency=int(env.get(names.concurrency, DEFAULT_EMBEDDING_CONCURRENCY)),
+            cache_enabled=env.get(names.cache, "").strip().lower() not in _DISABLED_VALUES,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkEmbeddingStats:
+    chunks: int
+    cached: int
+    embedded: int
+    requests: int
+    batch_size: int
+    max_concurrency: int
+    elapsed_seconds: float
+    cache_dir: str | None
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "cached": self.cached,
+            "embedded": self.embedded,
+            "requests": self.requests,
+            "batch_size": self.batch_size,
+            "max_concurrency": self.max_concurrency,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "cache_dir": self.cache_dir,
+        }
+
+
+def embed_texts(embedder: Any, texts: Sequence[str]) -> list[list[float]]:
+    """Embed *texts* in one request when the embedder exposes an OpenAI client."""
+    create = getattr(getattr(getattr(embedder, "client", None), "embeddings", None), "create", None)
+    model = getattr(embedder, "model", None)
+    if callable(create) and isinstance(model, str):
+        response = create(input=list(texts), model=model)
+        return [list(item.embedding) for item in sorted(response.data, key=lambda item: item.index)]
+    return [list(embedder.embed_query(text)) for text in texts]
+
+
+class BatchedTextChunkEmbedder(TextChunkEmbedder):
+    def __init__(
+        self,
+        embedder: Any,
+        *,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
+        super().__init__(embedder, max_concurrency=max_concurrency)
+        self.batch_size = batch_size
+        self.cache = cache
+        self.last_stats: ChunkEmbeddingStats | None = None
+        self.run_stats: list[ChunkEmbeddingStats] = []
+
+    @validate_call
+    async def run(self, text_chunks: TextChunks) -> TextChunks:  # type: ignore[override]
+        started = time.monotonic()
+        chunks = text_chunks.chunks
+        texts = [chunk.text for chunk in chunks]
+        vectors: dict[int, list[float]] = {} if self.cache is None else self.cache.get_many(texts)
+        cached_count = len(vectors)
+        missing = [position for position in range(len(texts)) if position not in vectors]
+        batches = [missing[start : start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _embed_batch(batch: list[int]) -> None:
+            async with semaphore:
+                embedded = await asyncio.to_thread(embed_texts, self._embedder, [texts[i] for i in batch])
+            if len(embedded) != len(batch):
+                raise ValueError(f"embedder returned {len(embedded)} vectors for {len(batch)} texts")
+            vectors.update(zip(batch, embedded))
+
+        await asyncio.gather(*(_embed_batch(batch) for batch in batches))
+        if self.cache is not None and missing:
+            self.cache.put_many([texts[i] for i in missing], [vectors[i] for i in missing])
+
+        self.last_stats = ChunkEmbeddingStats(
+            chunks=len(chunks),
+            cached=cached_count,
+            embedded=len(missing),
+            requests=len(batches),
+            batch_size=self.batch_size,
+            max_concurrency=self.max_concurrency,
+            elapsed_seconds=time.monotonic() - started,
+            cache_dir=None if self.cache is None else str(self.cache.directory),
+        )
+        self.run_stats.append(self.last_stats)
+        _logger.info(
+            "chunk embedding: %d chunks, %d from cache, %d embedded in %d request(s)",
+            len(chunks),
+            cached_count,
+            len(missing),
+            len(batches),
+        )
+        return TextChunks(
+            chunks=[
+                TextChunk(
+                    text=chunk.text,
+                    index=chunk.index,
+                    metadata={**(chunk.metadata or {}), "embedding": vectors[position]},
+                    uid=chunk.uid,
+                )
+                for position, chunk in enumerate(chunks)
+            ]
+        )
+
+
+def install_batched_chunk_embedder(
+    pipeline_runner: Any,
+    *,
+    output_dir: Path,
+    settings: ChunkEmbeddingSettings | None = None,
+) -> BatchedTextChunkEmbedder | None:
+    """Swap the pipeline's ``chunk_embedder`` for a batched, cached one.
+
+    Returns the installed component (read ``last_stats`` after the run), or
+    ``None`` when the pipeline has no vendor ``TextChunkEmbedder`` node.
+    """
+    resolved_settings = ChunkEmbeddingSettings.from_env() if settings is None else settings
+    pipeline = getattr(pipeline_runner, "pipeline", None)
+    get_node_by_name = getattr(pipeline, "get_node_by_name", None)
+    if not callable(get_node_by_name):
+        return None
+    try:
+        component = get_node_by_name(CHUNK_EMBEDDER_COMPONENT_NAME).component
+    except KeyError:
+        return None
+    if not isinstance(component, TextChunkEmbedder) or isinstance(component, BatchedTextChunkEmbedder):
+        return None
+    embedder = component._embedder
+    model = getattr(embedder, "model", None)
+    cache = (
+        EmbeddingCache(Path(output_dir) / EMBEDDING_CACHE_RELATIVE_DIR, model=model)
+        if resolved_settings.cache_enabled and isinstance(model, str)
+        else None
+    )
+    batched = BatchedTextChunkEmbedder(
+        embedder,
+        batch_size=resolved_settings.batch_size,
+        max_concurrency=resolved_settings.max_concurrency,
+        cache=cache,
+    )
+    pipeline.set_component(CHUNK_EMBEDDER_COMPONENT_NAME, batched)
+    return batched
+
+
+__all__ = [
+    "BatchedTextChunkEmbedder",
+    "CHUNK_EMBEDDER_COMPONENT_NAME",
+    "ChunkEmbeddingEnvNames",
+    "ChunkEmbeddingSettings",
+    "ChunkEmbeddingStats",
+    "DEFAULT_CHUNK_EMBEDDING_ENV_NAMES",
+    "DEFAULT_EMBEDDING_BATCH_SIZE",
+    "DEFAULT_EMBEDDING_CONCURRENCY",
+    "embed_texts",
+    "install_batched_chunk_embedder",
+]
@@ -322,6 +322,7 @@ def build_runtime_config(
     output_dir: Path | None = None,
     question: str | None = None,
     resolution_mode: str = "unstructured_only",
+    resume_claim_extraction: bool = False,
     pipeline_contract=None,
     pipeline_contract_config_data=None,
     app_baseline: AppBaseline | None = None,
@@ -337,6 +338,7 @@ def build_runtime_config(
         settings=settings,
         question=question,
         resolution_mode=resolution_mode,
+        resume_claim_extraction=resume_claim_extraction,
         dataset_name=settings.dataset_name,
         pipeline_contract=resolved_pipeline_contract,
         pipeline_contract_config_data=resolved_pipeline_contract_config,
@@ -351,6 +353,7 @@ def build_request_context(
     output_dir: Path | None = None,
     question: str | None = None,
     resolution_mode: str = "unstructured_only",
+    resume_claim_extraction: bool = False,
     run_id: str | None = None,
     all_runs: bool = False,
     source_uri: str | None = None,
@@ -364,6 +367,7 @@ def build_request_context(
             output_dir=output_dir,
             question=question,
             resolution_mode=resolution_mode,
+            resume_claim_extraction=resume_claim_extraction,
             pipeline_contract=app_context.pipeline_contract,
             pipeline_contract_config_data=app_context.pipeline_contract_config_data,
             app_baseline=app_baseline,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import neo4j
 from power_atlas.adapters.graphrag_retrieval import OpenAIEmbeddings
 
@@ -17,11 +19,15 @@ def _coerce_neo4j_settings(settings: AppSettings | Neo4jSettings) -> Neo4jSettin
     return settings
 
 
-def create_neo4j_driver(settings: AppSettings | Neo4jSettings) -> neo4j.Driver:
+def create_neo4j_driver(
+    settings: AppSettings | Neo4jSettings,
+    **driver_config: Any,
+) -> neo4j.Driver:
     neo4j_settings = _coerce_neo4j_settings(settings)
     return neo4j.GraphDatabase.driver(
         neo4j_settings.uri,
         auth=(neo4j_settings.username, neo4j_settings.password),
+        **driver_config,
     )
 
 
@@ -0,0 +1,308 @@
+"""Persistent, content-addressed cache of per-chunk claim extraction output.
+
+Re-running claim extraction for a new ``run_id`` over the same PDF used to
+send every chunk back to the LLM even when nothing that affects the output
+had changed.  Entries are keyed by ``sha256`` over the chunk text, the
+extractor model, ``ClaimExtractionPolicy.prompt_id`` and a fingerprint of the
+extraction schema and lexical graph config, so any change to those is a miss.
+
+The extractor prefixes node ids with the chunk uid and links nodes to the
+chunk by uid; both are rewritten to a placeholder before storing and back to
+the current chunk's uid on a hit, so cached graphs are valid for any run.
+
+Entries live in a SQLite database (``<output_dir>/cache/claim_extraction.sqlite``
+by default) holding zlib-compressed graph JSON.  The total payload size is
+bounded by ``max_bytes``; least-recently-used entries are evicted first.  The
+cache never fails an extraction: database errors are logged and treated as
+misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph
+
+_logger = logging.getLogger(__name__)
+
+CLAIM_EXTRACTION_CACHE_RELATIVE_PATH = Path("cache") / "claim_extraction.sqlite"
+CLAIM_EXTRACTION_CACHE_SCHEMA_VERSION = 1
+DEFAULT_CLAIM_EXTRACTION_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_CHUNK_PLACEHOLDER = "{chunk}"
+_CONNECT_TIMEOUT_SECONDS = 5.0
+_DISABLED_VALUES = frozenset({"0", "off", "none", "false"})
+
+
+@dataclass(frozen=True)
+class ClaimExtractionCacheEnvNames:
+    max_bytes: str = "POWER_ATLAS_EXTRACTION_CACHE_MAX_BYTES"
+    path: str = "POWER_ATLAS_EXTRACTION_CACHE_PATH"
+
+
+DEFAULT_CLAIM_EXTRACTION_CACHE_ENV_NAMES = ClaimExtractionCacheEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimExtractionCacheStats:
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+    errors: int
+
+    def to_summary(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+def _fingerprint_part(value: Any) -> Any:
+    model_dump = getattr(value, "model_dump", None)
+    if callable(model_dump):
+        return model_dump(mode="json")
+    return value
+
+
+def extraction_schema_fingerprint(schema: Any, lexical_graph_config: Any) -> str:
+    """Hash the extraction schema and the lexical config that shapes chunk links."""
+    payload = json.dumps(
+        {"schema": _fingerprint_part(schema), "lexical_graph_config": _fingerprint_part(lexical_graph_config)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def claim_extraction_cache_key(*, chunk_text: str, model_name: str, prompt_id: str, schema_fingerprint: str) -> str:
+    payload = json.dumps(
+        [chunk_text, model_name, prompt_id, schema_fingerprint],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _swap_chunk_id(value: str, old: str, new: str) -> str:
+    if value == old:
+        return new
+    if value.startswith(f"{old}:"):
+        return f"{new}{value[len(old):]}"
+    return value
+
+
+def _rebase_graph_payload(payload: dict[str, Any], old: str, new: str) -> dict[str, Any]:
+    for node in payload.get("nodes", []):
+        node["id"] = _swap_chunk_id(node["id"], old, new)
+    for relationship in payload.get("relationships", []):
+        relationship["start_node_id"] = _swap_chunk_id(relationship["start_node_id"], old, new)
+        relationship["end_node_id"] = _swap_chunk_id(relationship["end_node_id"], old, new)
+    return payload
+
+
+class ClaimExtractionCache:
+    def __init__(self, path: Path, *, max_bytes: int = DEFAULT_CLAIM_EXTRACTION_CACHE_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._connection: sqlite3.Connection | None = None
+        self._unavailable = False
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._errors = 0
+
+    @classmethod
+    def from_env(
+        cls,
+        output_dir: Path,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: ClaimExtractionCacheEnvNames | None = None,
+    ) -> "ClaimExtractionCache | None":
+        """Build the cache for *output_dir*, or ``None`` when disabled via ``MAX_BYTES=0``/``off``."""
+        env = os.environ if environ is None else environ
+        names = DEFAULT_CLAIM_EXTRACTION_CACHE_ENV_NAMES if env_names is None else env_names
+        raw_max_bytes = env.get(names.max_bytes, "").strip()
+        if raw_max_bytes.lower() in _DISABLED_VALUES:
+            return None
+        max_bytes = int(raw_max_bytes) if raw_max_bytes else DEFAULT_CLAIM_EXTRACTION_CACHE_MAX_BYTES
+        raw_path = env.get(names.path, "").strip()
+        path = Path(raw_path) if raw_path else Path(output_dir) / CLAIM_EXTRACTION_CACHE_RELATIVE_PATH
+        return cls(path, max_bytes=max_bytes)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        if self._unavailable:
+            raise sqlite3.OperationalError("cache database could not be opened earlier in this run")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=_CONNECT_TIMEOUT_SECONDS, isolation_level=None)
+        except (sqlite3.Error, OSError):
+            self._unavailable = True
+            raise
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != CLAIM_EXTRACTION_CACHE_SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS entries")
+                connection.execute(
+                    "CREATE TABLE entries ("
+                    " key TEXT PRIMARY KEY,"
+                    " graph BLOB NOT NULL,"
+                    " size INTEGER NOT NULL,"
+                    " last_used REAL NOT NULL)"
+                )
+                connection.execute("CREATE INDEX entries_by_last_used ON entries (last_used)")
+                connection.execute(f"PRAGMA user_version = {CLAIM_EXTRACTION_CACHE_SCHEMA_VERSION}")
+            (total_bytes,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        except sqlite3.Error:
+            connection.close()
+            self._unavailable = True
+            raise
+        self._connection = connection
+        self._total_bytes = total_bytes
+        return connection
+
+    def _record_error(self, action: str, exc: Exception) -> None:
+        self._errors += 1
+        _logger.warning("Claim extraction cache %s failed at %s: %s", action, self.path, exc)
+
+    def get(self, key: str, *, chunk_uid: str) -> Neo4jGraph | None:
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT graph FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                connection.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        except (sqlite3.Error, OSError) as exc:
+            self._record_error("lookup", exc)
+            row = None
+        graph = None
+        if row is not None:
+            try:
+                payload = json.loads(zlib.decompress(row[0]))
+                graph = Neo4jGraph.model_validate(_rebase_graph_payload(payload, _CHUNK_PLACEHOLDER, chunk_uid))
+            except (zlib.error, ValueError) as exc:
+                self._record_error("decode", exc)
+        if graph is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return graph
+
+    def put(self, key: str, graph: Neo4jGraph, *, chunk_uid: str) -> None:
+        payload = _rebase_graph_payload(graph.model_dump(mode="json"), chunk_uid, _CHUNK_PLACEHOLDER)
+        blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            previous = connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, graph, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            total_bytes = self._total_bytes + len(blob) - (previous[0] if previous else 0)
+            evicted = 0
+            if total_bytes > self.max_bytes:
+                total_bytes, evicted = self._evict(connection, total_bytes)
+            connection.execute("COMMIT")
+        except (sqlite3.Error, OSError) as exc:
+            if self._connection is not None and self._connection.in_transaction:
+                self._connection.execute("ROLLBACK")
+            self._record_error("write", exc)
+            return
+        self._total_bytes = total_bytes
+        self._evictions += evicted
+        self._writes += 1
+
+    def _evict(self, connection: sqlite3.Connection, total_bytes: int) -> tuple[int, int]:
+        """Delete least-recently-used entries until *total_bytes* fits; return the new total and count."""
+        evicted: list[str] = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            if total_bytes <= self.max_bytes:
+                break
+            evicted.append(key)
+            total_bytes -= size
+        connection.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in evicted])
+        return total_bytes, len(evicted)
+
+    def stats(self) -> ClaimExtractionCacheStats:
+        return ClaimExtractionCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            writes=self._writes,
+            evictions=self._evictions,
+            errors=self._errors,
+        )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class BoundClaimExtractionCache:
+    """A :class:`ClaimExtractionCache` scoped to one model, prompt and schema."""
+
+    def __init__(
+        self,
+        cache: ClaimExtractionCache,
+        *,
+        model_name: str,
+        prompt_id: str,
+        schema: Any,
+        lexical_graph_config: Any,
+    ) -> None:
+        self.cache = cache
+        self.model_name = model_name
+        self.prompt_id = prompt_id
+        self.schema_fingerprint = extraction_schema_fingerprint(schema, lexical_graph_config)
+
+    def _key(self, chunk: Any) -> str:
+        return claim_extraction_cache_key(
+            chunk_text=chunk.text,
+            model_name=self.model_name,
+            prompt_id=self.prompt_id,
+            schema_fingerprint=self.schema_fingerprint,
+        )
+
+    def get(self, chunk: Any) -> Neo4jGraph | None:
+        return self.cache.get(self._key(chunk), chunk_uid=chunk.uid)
+
+    def put(self, chunk: Any, graph: Neo4jGraph) -> None:
+        self.cache.put(self._key(chunk), graph, chunk_uid=chunk.uid)
+
+    def stats(self) -> ClaimExtractionCacheStats:
+        return self.cache.stats()
+
+
+__all__ = [
+    "BoundClaimExtractionCache",
+    "CLAIM_EXTRACTION_CACHE_RELATIVE_PATH",
+    "ClaimExtractionCache",
+    "ClaimExtractionCacheEnvNames",
+    "ClaimExtractionCacheStats",
+    "DEFAULT_CLAIM_EXTRACTION_CACHE_ENV_NAMES",
+    "DEFAULT_CLAIM_EXTRACTION_CACHE_MAX_BYTES",
+    "claim_extraction_cache_key",
+    "extraction_schema_fingerprint",
+]
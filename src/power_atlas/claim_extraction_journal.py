@@ -0,0 +1,192 @@
+"""Per-run checkpoint journal for claim extraction.
+
+Claim extraction used to keep every chunk's extraction in memory until one
+final write transaction, so a late LLM outage or Neo4j timeout lost hours of
+work.  :class:`ClaimExtractionJournal` appends each chunk's extracted graph to
+``<output_dir>/runs/<run_id>/claim_extraction/claim_extraction_journal.jsonl``
+as soon as it is extracted, and records which chunks' rows have been written
+to Neo4j, one line per write batch.
+
+The first line is a header holding a fingerprint of the run, model, prompt
+and extraction schema.  With ``resume=True`` a journal whose header matches
+is replayed: chunks it holds (with unchanged text) are served from it without
+an LLM request, and write batches whose chunks are all marked written are
+skipped.  Otherwise, or when the fingerprint differs, the journal is started
+afresh.  A line torn by a crash is dropped and overwritten on the next append.
+
+Lines are flushed and fsynced as they are written; a journal that cannot be
+written is logged and disabled rather than failing the extraction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, TextIO
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph
+from power_atlas.claim_extraction_cache import extraction_schema_fingerprint
+
+_logger = logging.getLogger(__name__)
+
+CLAIM_EXTRACTION_JOURNAL_FILENAME = "claim_extraction_journal.jsonl"
+CLAIM_EXTRACTION_JOURNAL_VERSION = 1
+
+
+def _text_digest(text: str | None) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class ClaimExtractionJournal:
+    def __init__(self, path: Path, *, resume: bool = False) -> None:
+        self.path = Path(path)
+        self.resume = resume
+        self.fingerprint: str | None = None
+        self._handle: TextIO | None = None
+        self._extracted: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._written: set[str] = set()
+        self._disabled = False
+        self._resumed_chunks = 0
+        self._recorded_chunks = 0
+        self._written_batches = 0
+        self._skipped_batches = 0
+
+    @classmethod
+    def for_run(cls, extraction_dir: Path, *, resume: bool = False) -> "ClaimExtractionJournal":
+        return cls(Path(extraction_dir) / CLAIM_EXTRACTION_JOURNAL_FILENAME, resume=resume)
+
+    def bind(self, *, run_id: str, model_name: str, prompt_id: str, schema: Any, lexical_graph_config: Any) -> None:
+        """Open the journal for this extraction, replaying it when resuming with a matching fingerprint."""
+        self.fingerprint = hashlib.sha256(
+            json.dumps(
+                [
+                    CLAIM_EXTRACTION_JOURNAL_VERSION,
+                    run_id,
+                    model_name,
+                    prompt_id,
+                    extraction_schema_fingerprint(schema, lexical_graph_config),
+                ],
+                separators=(",", ":"),
+            ).encode("utf-8")
+        ).hexdigest()
+        try:
+            valid_bytes = self._replay() if self.resume else 0
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = self.path.open("a+" if valid_bytes else "w", encoding="utf-8")
+            handle.truncate(valid_bytes)
+            handle.seek(valid_bytes)
+            self._handle = handle
+            if not valid_bytes:
+                self._append({"type": "header", "fingerprint": self.fingerprint})
+        except OSError as exc:
+            self._disable("open", exc)
+
+    def _replay(self) -> int:
+        """Load a matching journal; return the byte length of its intact prefix (0 to start afresh)."""
+        if not self.path.exists():
+            return 0
+        valid_bytes = 0
+        with self.path.open("rb") as handle:
+            for line_number, raw_line in enumerate(handle):
+                try:
+                    if not raw_line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    entry = json.loads(raw_line)
+                except ValueError:
+                    _logger.warning(
+                        "Claim extraction journal %s: dropping torn line %d and everything after it",
+                        self.path,
+                        line_number + 1,
+                    )
+                    break
+                if line_number == 0:
+                    if entry.get("type") != "header" or entry.get("fingerprint") != self.fingerprint:
+                        _logger.warning(
+                            "Claim extraction journal %s was written for a different run, model, prompt "
+                            "or schema; starting afresh",
+                            self.path,
+                        )
+                        return 0
+                elif entry.get("type") == "extracted":
+                    self._extracted[entry["chunk_uid"]] = (entry["text_sha256"], entry["graph"])
+                elif entry.get("type") == "written":
+                    self._written.update(entry["chunk_uids"])
+                valid_bytes += len(raw_line)
+        if valid_bytes:
+            _logger.info(
+                "Resuming claim extraction from %s: %d chunk(s) extracted, %d written",
+                self.path,
+                len(self._extracted),
+                len(self._written),
+            )
+        return valid_bytes
+
+    def _disable(self, action: str, exc: Exception) -> None:
+        _logger.warning("Claim extraction journal %s failed at %s; checkpointing is off: %s", action, self.path, exc)
+        self._disabled = True
+        self.close()
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        if self._handle is None or self._disabled:
+            return
+        try:
+            self._handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        except OSError as exc:
+            self._disable("write", exc)
+
+    def get(self, chunk: Any) -> Neo4jGraph | None:
+        """Return the journaled graph for *chunk* when it was extracted from the same text."""
+        entry = self._extracted.get(chunk.uid)
+        if entry is None or entry[0] != _text_digest(chunk.text):
+            return None
+        self._resumed_chunks += 1
+        return Neo4jGraph.model_validate(entry[1])
+
+    def record(self, chunk: Any, graph: Neo4jGraph) -> None:
+        payload = graph.model_dump(mode="json")
+        text_digest = _text_digest(chunk.text)
+        self._recorded_chunks += 1
+        self._append({"type": "extracted", "chunk_uid": chunk.uid, "text_sha256": text_digest, "graph": payload})
+
+    def batch_already_written(self, chunk_uids: Iterable[str]) -> bool:
+        """True (and counted as skipped) when every chunk in *chunk_uids* has had its rows written."""
+        chunk_uids = list(chunk_uids)
+        written = bool(chunk_uids) and all(chunk_uid in self._written for chunk_uid in chunk_uids)
+        if written:
+            self._skipped_batches += 1
+        return written
+
+    def mark_written(self, chunk_uids: Iterable[str]) -> None:
+        chunk_uids = sorted(set(chunk_uids))
+        self._written.update(chunk_uids)
+        self._written_batches += 1
+        self._append({"type": "written", "chunk_uids": chunk_uids})
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "resume": self.resume,
+            "enabled": not self._disabled,
+            "resumed_chunks": self._resumed_chunks,
+            "recorded_chunks": self._recorded_chunks,
+            "written_batches": self._written_batches,
+            "skipped_batches": self._skipped_batches,
+        }
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+__all__ = [
+    "CLAIM_EXTRACTION_JOURNAL_FILENAME",
+    "CLAIM_EXTRACTION_JOURNAL_VERSION",
+    "ClaimExtractionJournal",
+]
@@ -1,18 +1,42 @@
 from __future__ import annotations
 
+import copy
 import json
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any, Callable
 
 from power_atlas.adapters.llm import build_llm as build_openai_llm
 from power_atlas.bootstrap import require_openai_api_key
+from power_atlas.claim_extraction_cache import BoundClaimExtractionCache, ClaimExtractionCache
+from power_atlas.claim_extraction_journal import ClaimExtractionJournal
 from power_atlas.claim_extraction_runtime import run_claim_extraction_live
+from power_atlas.claim_extraction_scheduler import (
+    ExtractionSchedulerPolicy,
+    ExtractionSchedulerStats,
+    UsageRecordingLLM,
+    disable_client_retries,
+    extract_chunks_scheduled,
+)
 from power_atlas.contracts import ClaimExtractionPolicy
 from power_atlas.contracts import claim_extraction_lexical_config, claim_extraction_schema
 from power_atlas.contracts.pipeline import PipelineContractSnapshot
-from power_atlas.neo4j_io import RunScopedNeo4jChunkReader
+from power_atlas.neo4j_io import DEFAULT_CHUNK_PAGE_SIZE, RunScopedNeo4jChunkReader
 from power_atlas.settings import Neo4jSettings
 
 
+async def _collect_streamed_chunks(chunks: AsyncIterable[Any], sink: list[Any]) -> AsyncIterator[Any]:
+    """Yield *chunks*, keeping a text-less copy of each in *sink*.
+
+    Row preparation only needs a chunk's uid, index and metadata, so the text
+    is released once the chunk's extraction has finished.
+    """
+    async for chunk in chunks:
+        reference = copy.copy(chunk)
+        reference.text = ""
+        sink.append(reference)
+        yield chunk
+
+
 async def read_chunks_and_extract(
     driver: Any,
     *,
@@ -24,7 +48,26 @@ async def read_chunks_and_extract(
     claim_extraction_policy: ClaimExtractionPolicy,
     chunk_reader_cls: type[Any] = RunScopedNeo4jChunkReader,
     llm_builder: Callable[[str], Any] = build_openai_llm,
+    scheduler_policy: ExtractionSchedulerPolicy | None = None,
+    on_scheduler_stats: Callable[[ExtractionSchedulerStats], None] | None = None,
+    extraction_cache: ClaimExtractionCache | None = None,
+    chunk_page_size: int = DEFAULT_CHUNK_PAGE_SIZE,
+    journal: ClaimExtractionJournal | None = None,
 ) -> tuple[Any, list[Any], Any]:
+    """Read the run's chunks and extract claims one LLM request per chunk.
+
+    Requests go through :func:`extract_chunks_scheduled`, which adapts
+    concurrency to 429/latency signals and retries per chunk; the resulting
+    stats are passed to *on_scheduler_stats* when given.  Chunks already in
+    *extraction_cache* for this model, prompt and schema skip the LLM.
+
+    When the reader can ``stream``, chunks are read in keyset pages of
+    *chunk_page_size* and each is scheduled as it arrives, so extraction
+    starts with the first page instead of after the whole run is loaded.
+
+    Each chunk's graph is checkpointed to *journal* when given; a resumed
+    journal serves the chunks it already holds without an LLM request.
+    """
     from power_atlas.adapters.graphrag_components import LLMEntityRelationExtractor
 
     lexical_config = claim_extraction_lexical_config(
@@ -38,22 +81,59 @@ async def read_chunks_and_extract(
         fetch_embeddings=False,
         neo4j_database=neo4j_database,
     )
-    text_chunks = await chunk_reader.run(lexical_graph_config=lexical_config)
+    stream = getattr(chunk_reader, "stream", None)
+    text_chunks: list[Any] = []
+    if stream is None:
+        text_chunks.extend((await chunk_reader.run(lexical_graph_config=lexical_config)).chunks)
+        chunk_source: list[Any] | AsyncIterable[Any] = text_chunks
+    else:
+        chunk_source = _collect_streamed_chunks(
+            stream(lexical_graph_config=lexical_config, page_size=chunk_page_size),
+            text_chunks,
+        )
     llm = llm_builder(model_name)
+    async_client = llm.async_client
+    disable_client_retries(llm)
     extractor = LLMEntityRelationExtractor(
-        llm=llm,
+        llm=UsageRecordingLLM(llm),
         create_lexical_graph=False,
         use_structured_output=True,
     )
+    schema = claim_extraction_schema(claim_extraction_policy.ontology)
+    if journal is not None:
+        journal.bind(
+            run_id=run_id,
+            model_name=model_name,
+            prompt_id=claim_extraction_policy.prompt_id,
+            schema=schema,
+            lexical_graph_config=lexical_config,
+        )
+    bound_cache = (
+        None
+        if extraction_cache is None
+        else BoundClaimExtractionCache(
+            extraction_cache,
+            model_name=model_name,
+            prompt_id=claim_extraction_policy.prompt_id,
+            schema=schema,
+            lexical_graph_config=lexical_config,
+        )
+    )
     try:
-        graph = await extractor.run(
-            chunks=text_chunks,
-            schema=claim_extraction_schema(claim_extraction_policy.ontology),
+        graph, scheduler_stats = await extract_chunks_scheduled(
+            extractor,
+            chunk_source,
+            schema=schema,
             lexical_graph_config=lexical_config,
+            policy=scheduler_policy,
+            cache=bound_cache,
+            journal=journal,
         )
     finally:
-        await llm.async_client.close()
-    return graph, text_chunks.chunks, lexical_config
+        await async_client.close()
+    if on_scheduler_stats is not None:
+        on_scheduler_stats(scheduler_stats)
+    return graph, text_chunks, lexical_config
 
 
 def run_claim_extraction_runtime(
@@ -73,6 +153,8 @@ def run_claim_extraction_runtime(
     role_object: str,
     live_runner: Callable[..., Any] = run_claim_extraction_live,
     require_openai_api_key_fn: Callable[..., None] = require_openai_api_key,
+    scheduler_stats: list[ExtractionSchedulerStats] | None = None,
+    journal: ClaimExtractionJournal | None = None,
 ) -> dict[str, Any]:
     run_root = config.output_dir / "runs" / run_id
     extraction_dir = run_root / "claim_extraction"
@@ -146,6 +228,12 @@ def run_claim_extraction_runtime(
         "object_edges": object_edges,
         "warnings": warnings,
     }
+    if scheduler_stats:
+        summary["extraction_scheduler"] = scheduler_stats[-1].to_summary()
+        if scheduler_stats[-1].cache is not None:
+            summary["extraction_cache"] = scheduler_stats[-1].cache.to_summary()
+    if journal is not None:
+        summary["extraction_journal"] = journal.to_summary()
     summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
     return summary
 
@@ -161,37 +249,88 @@ def run_claim_extraction_runtime_default(
     model_name: str,
     chunk_reader_cls: type[Any] = RunScopedNeo4jChunkReader,
     llm_builder: Callable[[str], Any] = build_openai_llm,
+    scheduler_policy: ExtractionSchedulerPolicy | None = None,
+    extraction_cache: ClaimExtractionCache | None = None,
+    resume: bool | None = None,
+    write_batch_chunks: int | None = None,
 ) -> dict[str, Any]:
+    """Run live claim extraction with per-chunk checkpoints and batched writes.
+
+    Extracted graphs are journaled under the run's ``claim_extraction/``
+    directory and rows are written in batches of *write_batch_chunks* chunks.
+    With *resume* (default: ``config.resume_claim_extraction``) chunks and
+    write batches the journal already holds are skipped.
+    """
     from power_atlas.claim_participation_edges import (
         ROLE_OBJECT,
         ROLE_SUBJECT,
         build_participation_edges,
     )
     from power_atlas.extraction_rows import prepare_extracted_rows
-    from power_atlas.extraction_writes import write_all_extraction_data
+    from power_atlas.extraction_writes import (
+        DEFAULT_EXTRACTION_WRITE_BATCH_CHUNKS,
+        write_all_extraction_data_in_batches,
+        write_extraction_rows_batch,
+    )
 
-    return run_claim_extraction_runtime(
-        config=config,
-        run_id=run_id,
-        source_uri=source_uri,
-        pipeline_contract=pipeline_contract,
-        claim_extraction_policy=claim_extraction_policy,
-        neo4j_settings=neo4j_settings,
-        model_name=model_name,
-        read_chunks_and_extract=lambda *args, **kwargs: read_chunks_and_extract(
-            *args,
-            **kwargs,
-            claim_extraction_policy=claim_extraction_policy,
-            chunk_reader_cls=chunk_reader_cls,
-            llm_builder=llm_builder,
-        ),
-        prepare_rows=prepare_extracted_rows,
-        build_edges=build_participation_edges,
-        write_rows=write_all_extraction_data,
-        role_subject=ROLE_SUBJECT,
-        role_object=ROLE_OBJECT,
+    resolved_scheduler_policy = scheduler_policy or ExtractionSchedulerPolicy.from_env()
+    scheduler_stats: list[ExtractionSchedulerStats] = []
+    resolved_extraction_cache = (
+        extraction_cache if extraction_cache is not None else ClaimExtractionCache.from_env(config.output_dir)
+    )
+    resolved_resume = bool(getattr(config, "resume_claim_extraction", False)) if resume is None else resume
+    journal = (
+        None
+        if config.dry_run
+        else ClaimExtractionJournal.for_run(
+            config.output_dir / "runs" / run_id / "claim_extraction",
+            resume=resolved_resume,
+        )
     )
 
+    def _write_rows(driver: Any, **kwargs: Any) -> None:
+        write_all_extraction_data_in_batches(
+            driver,
+            **kwargs,
+            batch_chunks=write_batch_chunks or DEFAULT_EXTRACTION_WRITE_BATCH_CHUNKS,
+            skip_batch=None if journal is None else journal.batch_already_written,
+            on_batch_written=None if journal is None else journal.mark_written,
+            write_batch=write_extraction_rows_batch,
+        )
+
+    try:
+        return run_claim_extraction_runtime(
+            config=config,
+            run_id=run_id,
+            source_uri=source_uri,
+            pipeline_contract=pipeline_contract,
+            claim_extraction_policy=claim_extraction_policy,
+            neo4j_settings=neo4j_settings,
+            model_name=model_name,
+            read_chunks_and_extract=lambda *args, **kwargs: read_chunks_and_extract(
+                *args,
+                **kwargs,
+                claim_extraction_policy=claim_extraction_policy,
+                chunk_reader_cls=chunk_reader_cls,
+                llm_builder=llm_builder,
+                scheduler_policy=resolved_scheduler_policy,
+                on_scheduler_stats=scheduler_stats.append,
+                extraction_cache=resolved_extraction_cache,
+                journal=journal,
+            ),
+            prepare_rows=prepare_extracted_rows,
+            build_edges=build_participation_edges,
+            write_rows=_write_rows,
+            role_subject=ROLE_SUBJECT,
+            role_object=ROLE_OBJECT,
+            scheduler_stats=scheduler_stats,
+            journal=journal,
+        )
+    finally:
+        if journal is not None:
+            journal.close()
+        if extraction_cache is None and resolved_extraction_cache is not None:
+            resolved_extraction_cache.close()
 
 __all__ = [
     "read_chunks_and_extract",
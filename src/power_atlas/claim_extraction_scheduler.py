@@ -0,0 +1,587 @@
+"""Per-chunk LLM claim extraction with adaptive, rate-limit-aware concurrency.
+
+``LLMEntityRelationExtractor.run`` extracts every chunk under a fixed
+semaphore with no retries, so a burst of HTTP 429 responses fails the whole
+run and there is no way to bound token throughput or observe progress.
+
+:func:`extract_chunks_scheduled` instead sends each chunk through the
+extractor on its own and:
+
+* bounds in-flight requests with :class:`AdaptiveConcurrencyLimiter`, which
+  grows the limit by one after a window of fast successes and halves it on a
+  rate-limit response (or trims it when latency exceeds the target);
+* retries rate-limited and transient failures per chunk with full-jitter
+  exponential backoff, honouring ``Retry-After`` when the server sends it;
+* optionally holds requests back to a tokens-per-minute budget;
+* serves chunks from an optional :mod:`power_atlas.claim_extraction_cache`
+  (or, when resuming, :mod:`power_atlas.claim_extraction_journal`) before any
+  request is made;
+* logs live progress (chunks/s, tokens/s, current concurrency) and returns
+  :class:`ExtractionSchedulerStats` for the run summary.
+
+The LLM's own retries (OpenAI SDK and neo4j-graphrag) are disabled so that
+429s reach the scheduler.  Any OpenAI-compatible endpoint works, which is how the tests
+drive it against a local stub server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph, TextChunks
+from power_atlas.claim_extraction_cache import BoundClaimExtractionCache, ClaimExtractionCacheStats
+from power_atlas.claim_extraction_journal import ClaimExtractionJournal
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_EXTRACTION_INITIAL_CONCURRENCY = 4
+DEFAULT_EXTRACTION_MIN_CONCURRENCY = 1
+DEFAULT_EXTRACTION_MAX_CONCURRENCY = 16
+DEFAULT_EXTRACTION_MAX_RETRIES = 5
+DEFAULT_EXTRACTION_BASE_BACKOFF_SECONDS = 1.0
+DEFAULT_EXTRACTION_MAX_BACKOFF_SECONDS = 60.0
+DEFAULT_EXTRACTION_LATENCY_TARGET_SECONDS = 60.0
+DEFAULT_EXTRACTION_PROGRESS_INTERVAL_SECONDS = 10.0
+# Rough prompt size (instructions + schema) added to chunk tokens before any
+# real usage has been observed.
+_PROMPT_OVERHEAD_TOKENS_ESTIMATE = 1_000
+# Streamed chunks read ahead of extraction, per unit of max_concurrency.
+_STREAM_READ_AHEAD_PER_SLOT = 2
+
+ERROR_RATE_LIMITED = "rate_limited"
+ERROR_TRANSIENT = "transient"
+ERROR_FATAL = "fatal"
+_TRANSIENT_STATUS_CODES = frozenset({408, 409, 500, 502, 503, 504})
+_TRANSIENT_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+_chunk_token_usage: ContextVar[list[int] | None] = ContextVar("_chunk_token_usage", default=None)
+
+
+@dataclass(frozen=True)
+class ExtractionSchedulerEnvNames:
+    initial_concurrency: str = "POWER_ATLAS_EXTRACTION_INITIAL_CONCURRENCY"
+    max_concurrency: str = "POWER_ATLAS_EXTRACTION_MAX_CONCURRENCY"
+    max_retries: str = "POWER_ATLAS_EXTRACTION_MAX_RETRIES"
+    tokens_per_minute: str = "POWER_ATLAS_EXTRACTION_TOKENS_PER_MINUTE"
+
+
+DEFAULT_EXTRACTION_SCHEDULER_ENV_NAMES = ExtractionSchedulerEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionSchedulerPolicy:
+    initial_concurrency: int = DEFAULT_EXTRACTION_INITIAL_CONCURRENCY
+    min_concurrency: int = DEFAULT_EXTRACTION_MIN_CONCURRENCY
+    max_concurrency: int = DEFAULT_EXTRACTION_MAX_CONCURRENCY
+    max_retries: int = DEFAULT_EXTRACTION_MAX_RETRIES
+    base_backoff_seconds: float = DEFAULT_EXTRACTION_BASE_BACKOFF_SECONDS
+    max_backoff_seconds: float = DEFAULT_EXTRACTION_MAX_BACKOFF_SECONDS
+    latency_target_seconds: float = DEFAULT_EXTRACTION_LATENCY_TARGET_SECONDS
+    tokens_per_minute: int | None = None
+    progress_interval_seconds: float = DEFAULT_EXTRACTION_PROGRESS_INTERVAL_SECONDS
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_concurrency <= self.initial_concurrency <= self.max_concurrency:
+            raise ValueError(
+                "concurrency bounds must satisfy 1 <= min_concurrency <= initial_concurrency "
+                f"<= max_concurrency, got {self.min_concurrency}/{self.initial_concurrency}/{self.max_concurrency}"
+            )
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {self.max_retries}")
+        if self.tokens_per_minute is not None and self.tokens_per_minute < 1:
+            raise ValueError(f"tokens_per_minute must be >= 1, got {self.tokens_per_minute}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: ExtractionSchedulerEnvNames | None = None,
+    ) -> "ExtractionSchedulerPolicy":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_EXTRACTION_SCHEDULER_ENV_NAMES if env_names is None else env_names
+        max_concurrency = int(env.get(names.max_concurrency, DEFAULT_EXTRACTION_MAX_CONCURRENCY))
+        tokens_per_minute = env.get(names.tokens_per_minute)
+        return cls(
+            initial_concurrency=min(
+                int(env.get(names.initial_concurrency, DEFAULT_EXTRACTION_INITIAL_CONCURRENCY)),
+                max_concurrency,
+            ),
+            max_concurrency=max_concurrency,
+            max_retries=int(env.get(names.max_retries, DEFAULT_EXTRACTION_MAX_RETRIES)),
+            tokens_per_minute=int(tokens_per_minute) if tokens_per_minute else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionProgressSnapshot:
+    completed: int
+    total: int
+    elapsed_seconds: float
+    chunks_per_second: float
+    tokens_per_second: float
+    concurrency: int
+    retries: int
+    rate_limited: int
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionSchedulerStats:
+    chunks: int
+    retries: int
+    rate_limited: int
+    transient_errors: int
+    elapsed_seconds: float
+    tokens: int
+    tokens_estimated: bool
+    initial_concurrency: int
+    final_concurrency: int
+    peak_concurrency: int
+    cache: ClaimExtractionCacheStats | None = None
+
+    def to_summary(self) -> dict[str, Any]:
+        elapsed = self.elapsed_seconds
+        return {
+            "chunks": self.chunks,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "transient_errors": self.transient_errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "chunks_per_second": round(self.chunks / elapsed, 3) if elapsed else 0.0,
+            "tokens": self.tokens,
+            "tokens_estimated": self.tokens_estimated,
+            "tokens_per_second": round(self.tokens / elapsed, 1) if elapsed else 0.0,
+            "initial_concurrency": self.initial_concurrency,
+            "final_concurrency": self.final_concurrency,
+            "peak_concurrency": self.peak_concurrency,
+        }
+
+
+def _iter_error_chain(exc: BaseException) -> Iterator[BaseException]:
+    # neo4j-graphrag wraps SDK errors as LLMGenerationError(sdk_error), so walk
+    # args as well as __cause__/__context__.
+    pending = [exc]
+    seen: set[int] = set()
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        pending.extend(arg for arg in current.args if isinstance(arg, BaseException))
+        pending.extend(error for error in (current.__cause__, current.__context__) if error is not None)
+
+
+def classify_extraction_error(exc: BaseException) -> str:
+    """Return ``rate_limited``, ``transient`` or ``fatal`` for an extraction failure."""
+    classification = ERROR_FATAL
+    for error in _iter_error_chain(exc):
+        status_code = getattr(error, "status_code", None)
+        if status_code == 429:
+            return ERROR_RATE_LIMITED
+        if (
+            status_code in _TRANSIENT_STATUS_CODES
+            or type(error).__name__ in _TRANSIENT_ERROR_NAMES
+            or isinstance(error, (TimeoutError, ConnectionError))
+        ):
+            classification = ERROR_TRANSIENT
+    return classification
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    for error in _iter_error_chain(exc):
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers is None:
+            continue
+        try:
+            return max(0.0, float(headers.get("retry-after")))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def disable_client_retries(llm: Any) -> None:
+    """Turn off the LLM's own 429 retries so rate limits reach the scheduler.
+
+    Both the OpenAI SDK client and neo4j-graphrag's rate-limit handler retry
+    on their own; left in place they hide throttling from the limiter.
+    """
+    with_options = getattr(getattr(llm, "async_client", None), "with_options", None)
+    if callable(with_options):
+        llm.async_client = with_options(max_retries=0)
+    if hasattr(llm, "_rate_limit_handler"):
+        from power_atlas.adapters.graphrag_retrieval import NoOpRateLimitHandler
+
+        llm._rate_limit_handler = NoOpRateLimitHandler()
+
+
+class UsageRecordingLLM:
+    """LLM proxy that records ``usage.total_tokens`` for the chunk being extracted."""
+
+    def __init__(self, llm: Any) -> None:
+        self._llm = llm
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
+
+    async def ainvoke(self, *args: Any, **kwargs: Any) -> Any:
+        response = await self._llm.ainvoke(*args, **kwargs)
+        usage = getattr(response, "usage", None)
+        recorded = _chunk_token_usage.get()
+        total_tokens = getattr(usage, "total_tokens", None)
+        if recorded is not None and isinstance(total_tokens, int):
+            recorded.append(total_tokens)
+        return response
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit: +1 per window of fast successes, halved on 429s."""
+
+    def __init__(self, initial: int, *, minimum: int, maximum: int) -> None:
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.peak_limit = initial
+        self._successes_at_limit = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self, latency_seconds: float, latency_target_seconds: float) -> None:
+        if latency_seconds > latency_target_seconds:
+            self._set_limit(int(self.limit * 0.75))
+            return
+        self._successes_at_limit += 1
+        if self._successes_at_limit >= self.limit:
+            self._set_limit(self.limit + 1)
+
+    def on_rate_limited(self) -> None:
+        self._set_limit(self.limit // 2)
+
+    def _set_limit(self, limit: int) -> None:
+        self.limit = min(self.maximum, max(self.minimum, limit))
+        self.peak_limit = max(self.peak_limit, self.limit)
+        self._successes_at_limit = 0
+
+
+class _TokenBudget:
+    """Sliding 60-second window of reserved tokens."""
+
+    def __init__(
+        self,
+        tokens_per_minute: int,
+        *,
+        clock: Callable[[], float],
+        sleep: Callable[[float], Awaitable[Any]],
+    ) -> None:
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._window: deque[tuple[float, int]] = deque()
+
+    async def reserve(self, tokens: int) -> None:
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            now = self._clock()
+            while self._window and now - self._window[0][0] >= 60.0:
+                self._window.popleft()
+            if sum(reserved for _, reserved in self._window) + tokens <= self.tokens_per_minute:
+                self._window.append((now, tokens))
+                return
+            await self._sleep(max(0.05, self._window[0][0] + 60.0 - now))
+
+    def settle(self, estimated: int, actual: int) -> None:
+        if actual != estimated:
+            self._window.append((self._clock(), actual - estimated))
+
+
+class _ExtractionProgress:
+    def __init__(
+        self,
+        total: int,
+        *,
+        clock: Callable[[], float],
+        interval_seconds: float,
+        callback: Callable[[ExtractionProgressSnapshot], None] | None,
+    ) -> None:
+        self.total = total
+        self.completed = 0
+        self.tokens = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.transient_errors = 0
+        self._clock = clock
+        self._started = clock()
+        self._last_report = self._started
+        self._interval_seconds = interval_seconds
+        self._callback = callback
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def record_chunk(self, tokens: int, concurrency: int) -> None:
+        self.completed += 1
+        self.tokens += tokens
+        now = self._clock()
+        if self.completed < self.total and now - self._last_report < self._interval_seconds:
+            return
+        self._last_report = now
+        elapsed = now - self._started
+        snapshot = ExtractionProgressSnapshot(
+            completed=self.completed,
+            total=self.total,
+            elapsed_seconds=elapsed,
+            chunks_per_second=self.completed / elapsed if elapsed else 0.0,
+            tokens_per_second=self.tokens / elapsed if elapsed else 0.0,
+            concurrency=concurrency,
+            retries=self.retries,
+            rate_limited=self.rate_limited,
+        )
+        _logger.info(
+            "claim extraction: %d/%d chunks (%.2f chunks/s, %.0f tokens/s, concurrency %d, %d retries, %d rate-limited)",
+            snapshot.completed,
+            snapshot.total,
+            snapshot.chunks_per_second,
+            snapshot.tokens_per_second,
+            snapshot.concurrency,
+            snapshot.retries,
+            snapshot.rate_limited,
+        )
+        if self._callback is not None:
+            self._callback(snapshot)
+
+
+async def extract_chunks_scheduled(
+    extractor: Any,
+    chunks: list[Any] | AsyncIterable[Any],
+    *,
+    schema: Any,
+    lexical_graph_config: Any,
+    policy: ExtractionSchedulerPolicy | None = None,
+    cache: BoundClaimExtractionCache | None = None,
+    journal: ClaimExtractionJournal | None = None,
+    progress_callback: Callable[[ExtractionProgressSnapshot], None] | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    jitter: Callable[[float, float], float] = random.uniform,
+) -> tuple[Neo4jGraph, ExtractionSchedulerStats]:
+    """Extract *chunks* one ``extractor.run`` call per chunk and merge the graphs in chunk order.
+
+    Chunks found in *cache* are served from it without an LLM request;
+    fresh extractions are written back.  Chunks already in *journal* (a
+    resumed run) skip both; every other chunk's graph is journaled as soon as
+    it is extracted.  *chunks* may be an async iterable
+    (e.g. :meth:`~power_atlas.neo4j_io.RunScopedNeo4jChunkReader.stream`):
+    each chunk is scheduled as soon as it arrives, so extraction overlaps
+    the remaining reads.  At most ``2 * policy.max_concurrency`` streamed
+    chunks are pending at once; the stream is not read further until one
+    finishes, and a finished chunk is only referenced through its graph.
+
+    The first chunk that fails (a fatal error, or retries exhausted) stops
+    the run: no further chunks are read or scheduled, in-flight extractions
+    are cancelled, and its exception is raised once they have unwound.
+    """
+    resolved_policy = ExtractionSchedulerPolicy() if policy is None else policy
+    limiter = AdaptiveConcurrencyLimiter(
+        resolved_policy.initial_concurrency,
+        minimum=resolved_policy.min_concurrency,
+        maximum=resolved_policy.max_concurrency,
+    )
+    budget = (
+        None
+        if resolved_policy.tokens_per_minute is None
+        else _TokenBudget(resolved_policy.tokens_per_minute, clock=clock, sleep=sleep)
+    )
+    progress = _ExtractionProgress(
+        0 if isinstance(chunks, AsyncIterable) else len(chunks),
+        clock=clock,
+        interval_seconds=resolved_policy.progress_interval_seconds,
+        callback=progress_callback,
+    )
+    observed_tokens: list[int] = []
+    usage_reported = False
+
+    def _estimate_tokens(chunk: Any) -> int:
+        if observed_tokens:
+            return max(1, sum(observed_tokens) // len(observed_tokens))
+        return len(getattr(chunk, "text", "") or "") // 4 + _PROMPT_OVERHEAD_TOKENS_ESTIMATE
+
+    async def _extract(chunk: Any) -> Neo4jGraph:
+        nonlocal usage_reported
+        if journal is not None:
+            journaled_graph = journal.get(chunk)
+            if journaled_graph is not None:
+                progress.record_chunk(0, limiter.limit)
+                return journaled_graph
+        if cache is not None:
+            cached_graph = cache.get(chunk)
+            if cached_graph is not None:
+                if journal is not None:
+                    journal.record(chunk, cached_graph)
+                progress.record_chunk(0, limiter.limit)
+                return cached_graph
+        attempt = 0
+        while True:
+            estimate = _estimate_tokens(chunk)
+            if budget is not None:
+                await budget.reserve(estimate)
+            recorded: list[int] = []
+            async with limiter.slot():
+                started = clock()
+                token = _chunk_token_usage.set(recorded)
+                try:
+                    graph = await extractor.run(
+                        chunks=TextChunks(chunks=[chunk]),
+                        schema=schema,
+                        lexical_graph_config=lexical_graph_config,
+                    )
+                except Exception as exc:
+                    kind = classify_extraction_error(exc)
+                    if kind == ERROR_FATAL or attempt >= resolved_policy.max_retries:
+                        raise
+                    if kind == ERROR_RATE_LIMITED:
+                        limiter.on_rate_limited()
+                        progress.rate_limited += 1
+                    else:
+                        progress.transient_errors += 1
+                    delay = retry_after_seconds(exc)
+                    if delay is None:
+                        delay = jitter(
+                            0.0,
+                            min(
+                                resolved_policy.max_backoff_seconds,
+                                resolved_policy.base_backoff_seconds * 2**attempt,
+                            ),
+                        )
+                    delay = min(delay, resolved_policy.max_backoff_seconds)
+                    _logger.warning(
+                        "claim extraction: chunk %s %s (attempt %d/%d), retrying in %.1fs: %s",
+                        getattr(chunk, "uid", "?"),
+                        kind.replace("_", "-"),
+                        attempt + 1,
+                        resolved_policy.max_retries + 1,
+                        delay,
+                        exc,
+                    )
+                else:
+                    limiter.on_success(clock() - started, resolved_policy.latency_target_seconds)
+                    if recorded:
+                        usage_reported = True
+                        observed_tokens.append(sum(recorded))
+                    used_tokens = sum(recorded) if recorded else estimate
+                    if budget is not None:
+                        budget.settle(estimate, used_tokens)
+                    progress.record_chunk(used_tokens, limiter.limit)
+                    if cache is not None:
+                        cache.put(chunk, graph)
+                    if journal is not None:
+                        journal.record(chunk, graph)
+                    return graph
+                finally:
+                    _chunk_token_usage.reset(token)
+            attempt += 1
+            progress.retries += 1
+            await sleep(delay)
+
+    tasks: list[asyncio.Task[Neo4jGraph]] = []
+    failures: list[BaseException] = []
+
+    def _record_failure(task: asyncio.Task[Neo4jGraph]) -> None:
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            failures.append(exc)
+
+    def _schedule(chunk: Any) -> asyncio.Task[Neo4jGraph]:
+        task = asyncio.create_task(_extract(chunk))
+        task.add_done_callback(_record_failure)
+        tasks.append(task)
+        return task
+
+    async def _schedule_stream(stream: AsyncIterable[Any]) -> None:
+        read_ahead = asyncio.Semaphore(resolved_policy.max_concurrency * _STREAM_READ_AHEAD_PER_SLOT)
+        async for chunk in stream:
+            # Taken before the task exists and given back when it finishes,
+            # so a fast reader cannot queue the whole run in memory.
+            await read_ahead.acquire()
+            if failures:
+                break
+            progress.total += 1
+            _schedule(chunk).add_done_callback(lambda _task: read_ahead.release())
+
+    try:
+        if isinstance(chunks, AsyncIterable):
+            await _schedule_stream(chunks)
+        else:
+            for chunk in chunks:
+                _schedule(chunk)
+        if tasks and not failures:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # After a failure, a reader error or cancellation, no other chunk may
+        # keep calling the LLM once this function has returned.
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    if failures:
+        raise failures[0]
+    chunk_graphs = [task.result() for task in tasks]
+    graph = Neo4jGraph(
+        nodes=[node for chunk_graph in chunk_graphs for node in chunk_graph.nodes],
+        relationships=[
+            relationship for chunk_graph in chunk_graphs for relationship in chunk_graph.relationships
+        ],
+    )
+    stats = ExtractionSchedulerStats(
+        chunks=progress.total,
+        retries=progress.retries,
+        rate_limited=progress.rate_limited,
+        transient_errors=progress.transient_errors,
+        elapsed_seconds=progress.elapsed(),
+        tokens=progress.tokens,
+        tokens_estimated=not usage_reported,
+        initial_concurrency=resolved_policy.initial_concurrency,
+        final_concurrency=limiter.limit,
+        peak_concurrency=limiter.peak_limit,
+        cache=None if cache is None else cache.stats(),
+    )
+    return graph, stats
+
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "DEFAULT_EXTRACTION_SCHEDULER_ENV_NAMES",
+    "ERROR_FATAL",
+    "ERROR_RATE_LIMITED",
+    "ERROR_TRANSIENT",
+    "ExtractionProgressSnapshot",
+    "ExtractionSchedulerEnvNames",
+    "ExtractionSchedulerPolicy",
+    "ExtractionSchedulerStats",
+    "UsageRecordingLLM",
+    "classify_extraction_error",
+    "disable_client_retries",
+    "extract_chunks_scheduled",
+    "retry_after_seconds",
+]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import re
 from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 from power_atlas.text_utils import normalize_mention_text
@@ -34,43 +35,70 @@ def split_slot_text(slot_text: str) -> list[str]:
     return stripped if len(stripped) >= 2 else []
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class MentionMatchIndex:
+    """Raw, casefold and normalized name keys of a set of candidate mentions.
+
+    Built once per group of candidate mentions so that matching a slot (or a
+    list-split part) is three dict lookups instead of re-normalizing every
+    mention name.  A key shared by more than one mention is ambiguous, exactly
+    as in the linear scan it replaces.
+    """
+
+    by_raw: dict[str, list[dict[str, Any]]]
+    by_casefold: dict[str, list[dict[str, Any]]]
+    by_normalized: dict[str, list[dict[str, Any]]]
+
+    @classmethod
+    def build(
+        cls,
+        mentions: list[dict[str, Any]],
+        *,
+        normalize: Callable[[str], str] = normalize_mention_text,
+    ) -> "MentionMatchIndex":
+        by_raw: dict[str, list[dict[str, Any]]] = {}
+        by_casefold: dict[str, list[dict[str, Any]]] = {}
+        by_normalized: dict[str, list[dict[str, Any]]] = {}
+        for mention in mentions:
+            name = mention.get("name")
+            raw = "" if name is None else str(name).strip()
+            by_raw.setdefault(raw, []).append(mention)
+            by_casefold.setdefault(raw.casefold(), []).append(mention)
+            by_normalized.setdefault(normalize(raw), []).append(mention)
+        return cls(by_raw=by_raw, by_casefold=by_casefold, by_normalized=by_normalized)
+
+    def match(
+        self,
+        slot_text: str,
+        *,
+        normalize: Callable[[str], str] = normalize_mention_text,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        if not slot_text or not self.by_raw:
+            return None, None
+        slot_stripped = slot_text.strip()
+        if not slot_stripped:
+            return None, None
+        for keys, slot_key, method in (
+            (self.by_raw, slot_stripped, MATCH_METHOD_RAW_EXACT),
+            (self.by_casefold, slot_stripped.casefold(), MATCH_METHOD_CASEFOLD_EXACT),
+            (self.by_normalized, None, MATCH_METHOD_NORMALIZED_EXACT),
+        ):
+            matches = keys.get(normalize(slot_stripped) if slot_key is None else slot_key)
+            if not matches:
+                continue
+            if len(matches) == 1:
+                return matches[0], method
+            return None, MATCH_OUTCOME_AMBIGUOUS
+        return None, None
+
+
 def match_slot_to_mention(
     slot_text: str,
     mentions: list[dict[str, Any]],
 ) -> tuple[dict[str, Any] | None, str | None]:
     if not slot_text or not mentions:
         return None, None
-
-    slot_stripped = slot_text.strip()
-    if not slot_stripped:
-        return None, None
-
-    raw_forms: list[tuple[dict[str, Any], str]] = []
-    for mention in mentions:
-        name = mention.get("name")
-        raw_forms.append((mention, "" if name is None else str(name).strip()))
-
-    raw_matches = [mention for mention, raw in raw_forms if raw == slot_stripped]
-    if len(raw_matches) == 1:
-        return raw_matches[0], MATCH_METHOD_RAW_EXACT
-    if len(raw_matches) > 1:
-        return None, MATCH_OUTCOME_AMBIGUOUS
-
-    slot_casefold = slot_stripped.casefold()
-    casefold_matches = [mention for mention, raw in raw_forms if raw.casefold() == slot_casefold]
-    if len(casefold_matches) == 1:
-        return casefold_matches[0], MATCH_METHOD_CASEFOLD_EXACT
-    if len(casefold_matches) > 1:
-        return None, MATCH_OUTCOME_AMBIGUOUS
-
-    slot_normalized = normalize_mention_text(slot_stripped)
-    normalized_forms = [(mention, normalize_mention_text(raw)) for mention, raw in raw_forms]
-    normalized_matches = [mention for mention, normalized in normalized_forms if normalized == slot_normalized]
-    if len(normalized_matches) == 1:
-        return normalized_matches[0], MATCH_METHOD_NORMALIZED_EXACT
-    if len(normalized_matches) > 1:
-        return None, MATCH_OUTCOME_AMBIGUOUS
-    return None, None
+    return MentionMatchIndex.build(mentions).match(slot_text)
 
 
 _METRICS_SAMPLE_SIZE = 20
@@ -128,6 +156,18 @@ def build_participation_edges_with_metrics(
             key = (mention_run_id, chunk_id)
             mentions_by_run_chunk.setdefault(key, []).append(mention_row)
 
+    # Claims from the same chunk(s) share one candidate set; index it once and
+    # normalize each distinct name or slot text once per call.
+    normalized_texts: dict[str, str] = {}
+
+    def normalize(text: str) -> str:
+        normalized = normalized_texts.get(text)
+        if normalized is None:
+            normalized = normalized_texts[text] = normalize_mention_text(text)
+        return normalized
+
+    match_indexes: dict[tuple[str, tuple[str, ...]], MentionMatchIndex] = {}
+
     edge_rows: list[dict[str, Any]] = []
 
     edges_by_method: dict[str, int] = defaultdict(int)
@@ -174,26 +214,29 @@ def build_participation_edges_with_metrics(
         source_uri: str | None = claim_row.get("source_uri")
         properties: dict[str, Any] = claim_row.get("properties", {})
 
-        seen_mention_ids: set[str] = set()
-        candidate_mentions: list[dict[str, Any]] = []
-        for chunk_id in claim_chunk_ids:
-            for mention in mentions_by_run_chunk.get((run_id, chunk_id), []):
-                mention_id = mention.get("mention_id", "")
-                if mention_id not in seen_mention_ids:
-                    seen_mention_ids.add(mention_id)
-                    candidate_mentions.append(mention)
+        group_key = (run_id, tuple(claim_chunk_ids))
+        match_index = match_indexes.get(group_key)
+        if match_index is None:
+            seen_mention_ids: set[str] = set()
+            flat_mentions: list[dict[str, Any]] = []
+            for chunk_id in claim_chunk_ids:
+                for mention in mentions_by_run_chunk.get((run_id, chunk_id), []):
+                    mention_id = mention.get("mention_id", "")
+                    if mention_id not in seen_mention_ids:
+                        seen_mention_ids.add(mention_id)
+                        flat_mentions.append(
+                            {
+                                "mention_id": mention_id,
+                                "name": mention.get("properties", {}).get("name", ""),
+                            }
+                        )
+            match_index = match_indexes[group_key] = MentionMatchIndex.build(
+                flat_mentions, normalize=normalize
+            )
 
-        if not candidate_mentions:
+        if not match_index.by_raw:
             continue
 
-        flat_mentions = [
-            {
-                "mention_id": mention.get("mention_id", ""),
-                "name": mention.get("properties", {}).get("name", ""),
-            }
-            for mention in candidate_mentions
-        ]
-
         edges_before_claim = len(edge_rows)
 
         for slot in ("subject", "object"):
@@ -208,7 +251,7 @@ def build_participation_edges_with_metrics(
             role = _SLOT_ROLE[slot]
             slots_processed += 1
 
-            matched, method = match_slot_to_mention(slot_str, flat_mentions)
+            matched, method = match_index.match(slot_str, normalize=normalize)
             if matched is not None:
                 edge_rows.append(
                     {
@@ -242,7 +285,7 @@ def build_participation_edges_with_metrics(
             matched_part_texts: list[str] = []
             unmatched_part_texts: list[str] = []
             for part in list_split_parts:
-                part_matched, _part_method = match_slot_to_mention(part, flat_mentions)
+                part_matched, _part_method = match_index.match(part, normalize=normalize)
                 if part_matched is None:
                     unmatched_part_texts.append(part)
                     continue
@@ -346,6 +389,7 @@ __all__ = [
     "EDGE_TYPE_HAS_PARTICIPANT",
     "ROLE_SUBJECT",
     "ROLE_OBJECT",
+    "MentionMatchIndex",
     "ParticipationMatchMetrics",
     "split_slot_text",
     "match_slot_to_mention",
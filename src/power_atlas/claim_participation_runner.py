@@ -16,6 +16,8 @@ from power_atlas.backend_run_catalog import resolve_run_root
 from power_atlas.claim_participation_runtime import run_claim_participation_live
 from power_atlas.claim_participation_writes import write_claim_participation_edges
 from power_atlas.context import RequestContext
+from power_atlas.retrieval_result_cache import bump_retrieval_generation
+from power_atlas.run_stats import refresh_run_stats
 from power_atlas.runtime_carriers import RequestRuntime
 from power_atlas.settings import Neo4jSettings
 
@@ -67,6 +69,17 @@ def write_participation_edges(
     )
 
 
+def _write_participation_edges_and_refresh_run_state(
+    driver: neo4j.Driver,
+    *,
+    neo4j_database: str,
+    edge_rows: list[dict[str, Any]],
+) -> None:
+    write_participation_edges(driver, neo4j_database=neo4j_database, edge_rows=edge_rows)
+    run_ids = [row.get("run_id") for row in edge_rows]
+    refresh_run_stats(driver, run_ids=run_ids, sections=("extraction",), neo4j_database=neo4j_database)
+    bump_retrieval_generation(driver, run_ids=run_ids, neo4j_database=neo4j_database)
+
 
 def run_claim_participation_request_context(request_context: RequestContext) -> dict[str, Any]:
     return run_claim_participation_runtime(request_context.runtime)
@@ -106,7 +119,7 @@ def run_claim_participation_runtime(request_runtime: RequestRuntime) -> dict[str
         source_uri=source_uri,
         neo4j_database=neo4j_settings.database,
         build_edges_with_metrics=build_participation_edges_with_metrics,
-        write_edges=write_participation_edges,
+        write_edges=_write_participation_edges_and_refresh_run_state,
     )
     claim_rows = live_result.claim_rows
     mention_rows = live_result.mention_rows
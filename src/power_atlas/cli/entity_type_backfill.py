@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from power_atlas.bootstrap import AppBaseline, create_neo4j_driver
+from power_atlas.entity_type_backfill import backfill_normalized_entity_types
+from power_atlas.interfaces.cli.entity_type_backfill_support import (
+    entity_type_backfill_batch_policy_from_args,
+    parse_entity_type_backfill_args,
+)
+from power_atlas.interfaces.cli.reset_demo_support import build_reset_settings_from_args
+
+
+def _parse_args(
+    argv: list[str] | None = None,
+    *,
+    app_baseline: AppBaseline | None = None,
+):
+    return parse_entity_type_backfill_args(argv, app_baseline=app_baseline)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if not args.neo4j_password:
+        print(
+            "ERROR: Neo4j password is required.  Set NEO4J_PASSWORD or pass --neo4j-password.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+    settings = build_reset_settings_from_args(args)
+    with create_neo4j_driver(settings) as driver:
+        report = backfill_normalized_entity_types(
+            driver,
+            neo4j_database=args.neo4j_database,
+            run_ids=args.run_ids or None,
+            batch_policy=entity_type_backfill_batch_policy_from_args(args),
+            dry_run=args.dry_run,
+        )
+    mode = "dry run" if report["dry_run"] else "backfilled"
+    print(f"Mode             : {mode}")
+    print(f"Policy version   : {report['policy_version']}")
+    print(f"Runs checked     : {report['runs_checked']}")
+    print(f"Stale mentions   : {report['stale_mentions']}")
+    for entry in report["runs"]:
+        if entry["stale_mentions"]:
+            print(f"  - {entry['run_id']}: {entry['stale_mentions']}")
+    print("")
+    print(json.dumps({key: report[key] for key in ("policy_version", "runs_checked", "stale_mentions")}))
+
+
+__all__ = ["main"]
+
+
+if __name__ == "__main__":
+    main()
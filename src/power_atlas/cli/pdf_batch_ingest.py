@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from power_atlas.bootstrap import AppBaseline, build_settings
+from power_atlas.interfaces.cli.pdf_batch_ingest_support import (
+    build_pdf_batch_ingest_cli_request_context,
+    parse_pdf_batch_ingest_args,
+    pdf_batch_ingest_settings_from_args,
+)
+from power_atlas.pdf_batch_ingest import run_pdf_batch_ingest_request_context
+
+
+def _parse_args(
+    argv: list[str] | None = None,
+    *,
+    app_baseline: AppBaseline | None = None,
+):
+    return parse_pdf_batch_ingest_args(
+        argv,
+        default_output_dir=build_settings(app_baseline=app_baseline).output_dir,
+        doc_epilog=None,
+        app_baseline=app_baseline,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if args.live and not args.neo4j_password:
+        print(
+            "ERROR: Neo4j password is required.  Set NEO4J_PASSWORD or pass --neo4j-password.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+    result = run_pdf_batch_ingest_request_context(
+        build_pdf_batch_ingest_cli_request_context(args),
+        pdf_dir=args.pdf_dir,
+        pdf_manifest=args.pdf_manifest,
+        dataset_id=args.dataset_id,
+        batch_settings=pdf_batch_ingest_settings_from_args(args),
+    )
+    print(f"Status           : {result['status']}")
+    print(f"Run ID           : {result['run_id']}")
+    print(f"Documents        : {result['document_count']} ({result['failed_document_count']} failed)")
+    print(f"Manifest path    : {result['batch_manifest_path']}")
+    print("")
+    print(json.dumps({key: result[key] for key in ("run_id", "status", "counts", "batch_manifest_path")}))
+    if result["status"] in ("failed", "partial"):
+        raise SystemExit(1)
+
+
+__all__ = ["main"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from power_atlas.bootstrap import AppBaseline, build_settings, create_neo4j_driver
+from power_atlas.interfaces.cli.reset_demo_support import build_reset_settings_from_args
+from power_atlas.interfaces.cli.run_retention_support import (
+    parse_run_retention_args,
+    run_retention_policy_from_args,
+    run_retention_reset_settings_from_args,
+)
+from power_atlas.run_retention import run_run_retention
+
+
+def _parse_args(
+    argv: list[str] | None = None,
+    *,
+    app_baseline: AppBaseline | None = None,
+):
+    return parse_run_retention_args(
+        argv,
+        default_output_dir=build_settings(app_baseline=app_baseline).output_dir,
+        app_baseline=app_baseline,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if not args.neo4j_password:
+        print(
+            "ERROR: Neo4j password is required.  Set NEO4J_PASSWORD or pass --neo4j-password.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+    settings = build_reset_settings_from_args(args)
+    with create_neo4j_driver(settings) as driver:
+        report = run_run_retention(
+            output_dir=args.output_dir,
+            policy=run_retention_policy_from_args(args),
+            driver=driver,
+            database=args.neo4j_database,
+            dry_run=not args.confirm,
+            settings=run_retention_reset_settings_from_args(args),
+        )
+    mode = "dry run" if report["dry_run"] else "pruned"
+    print(f"Mode             : {mode}")
+    print(f"Runs considered  : {report['runs_considered']}")
+    print(f"Runs pruned      : {report['runs_pruned']} (kept {report['runs_kept']})")
+    print(f"Artifact bytes   : {report['reclaimable_artifact_bytes']}")
+    print(f"Graph nodes      : {report['reclaimable_graph_nodes']}")
+    for entry in report["pruned"]:
+        print(f"  - {entry['run_id']} ({', '.join(entry['reasons'])})")
+    print(f"Report path      : {report['report_path']}")
+    print("")
+    print(json.dumps({key: report[key] for key in ("runs_pruned", "deleted_nodes", "deleted_artifact_bytes")}))
+
+
+__all__ = ["main"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from power_atlas.bootstrap import AppBaseline, create_neo4j_driver
+from power_atlas.interfaces.cli.reset_demo_support import build_reset_settings_from_args
+from power_atlas.interfaces.cli.run_stats_support import parse_run_stats_args
+from power_atlas.run_stats import read_run_stats, recompute_run_stats
+
+
+def _parse_args(
+    argv: list[str] | None = None,
+    *,
+    app_baseline: AppBaseline | None = None,
+):
+    return parse_run_stats_args(argv, app_baseline=app_baseline)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if not args.neo4j_password:
+        print(
+            "ERROR: Neo4j password is required.  Set NEO4J_PASSWORD or pass --neo4j-password.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+    settings = build_reset_settings_from_args(args)
+    with create_neo4j_driver(settings) as driver:
+        if not args.recompute:
+            for run_id in args.run_ids:
+                stats = read_run_stats(driver, run_id=run_id, neo4j_database=args.neo4j_database)
+                print(json.dumps(stats.to_summary() if stats is not None else {"run_id": run_id, "stats": None}))
+            return
+        report = recompute_run_stats(
+            driver,
+            neo4j_database=args.neo4j_database,
+            run_ids=args.run_ids or None,
+            dry_run=args.dry_run,
+        )
+    mode = "dry run" if report["dry_run"] else "recomputed"
+    print(f"Mode             : {mode}")
+    print(f"Runs checked     : {report['runs_checked']}")
+    print(f"Runs with drift  : {report['runs_with_drift']}")
+    for entry in report["runs"]:
+        if entry["drift"] and entry["action"] != "none":
+            changes = ", ".join(
+                f"{field_name} {values['stored']} -> {values['actual']}" for field_name, values in entry["drift"].items()
+            )
+            print(f"  - {entry['run_id']} ({entry['action']}): {changes}")
+    print("")
+    print(json.dumps({key: report[key] for key in ("runs_checked", "runs_with_drift")}))
+
+
+__all__ = ["main"]
+
+
+if __name__ == "__main__":
+    main()
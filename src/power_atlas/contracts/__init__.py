@@ -9,6 +9,7 @@ from power_atlas.contracts.entity_type_normalization_policy import (
 	EntityTypeNormalizationPolicy,
 	POWER_ATLAS_ENTITY_TYPE_NORMALIZATION_POLICY,
 	build_entity_type_cypher_case,
+	entity_type_policy_version,
 	get_default_entity_type_normalization_policy,
 	normalize_entity_type,
 )
@@ -172,6 +173,7 @@ __all__ = [
 	"get_default_structured_schema_contract",
 	"get_default_entity_type_normalization_policy",
 	"build_entity_type_cypher_case",
+	"entity_type_policy_version",
 	"list_available_datasets",
 	"make_run_id",
 	"load_pipeline_contract",
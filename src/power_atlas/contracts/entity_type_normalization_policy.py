@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from dataclasses import dataclass, field
 
@@ -43,6 +45,23 @@ def normalize_entity_type(
     return resolved_policy.synonyms.get(stripped_entity_type, stripped_entity_type)
 
 
+def entity_type_policy_version(
+    entity_type_policy: EntityTypeNormalizationPolicy | None = None,
+) -> str:
+    """Return a short stable digest of the policy, stamped on normalized mentions."""
+    resolved_policy = (
+        POWER_ATLAS_ENTITY_TYPE_NORMALIZATION_POLICY
+        if entity_type_policy is None
+        else entity_type_policy
+    )
+    payload = json.dumps(
+        {"synonyms": resolved_policy.synonyms, "null_sentinel": resolved_policy.null_sentinel},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
 def _escape_cypher_string(value: str) -> str:
     return value.replace("'", "''")
 
@@ -81,6 +100,7 @@ __all__ = [
     "EntityTypeNormalizationPolicy",
     "POWER_ATLAS_ENTITY_TYPE_NORMALIZATION_POLICY",
     "build_entity_type_cypher_case",
+    "entity_type_policy_version",
     "get_default_entity_type_normalization_policy",
     "normalize_entity_type",
 ]
\ No newline at end of file
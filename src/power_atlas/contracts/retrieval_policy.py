@@ -27,6 +27,9 @@ class RetrievalPolicy:
     rag_template: RagTemplate
     default_expand_graph: bool = False
     default_cluster_aware: bool = False
+    # How run/source scoping interacts with the vector index; one of
+    # power_atlas.retrieval_scoped_search.RETRIEVAL_SCOPE_STRATEGIES.
+    scope_strategy: str = "post_filter"
 
 
 POWER_ATLAS_RETRIEVAL_ONTOLOGY = RetrievalOntology()
@@ -59,6 +62,7 @@ def get_default_retrieval_policy(
         ),
         default_expand_graph=POWER_ATLAS_RETRIEVAL_POLICY.default_expand_graph,
         default_cluster_aware=POWER_ATLAS_RETRIEVAL_POLICY.default_cluster_aware,
+        scope_strategy=POWER_ATLAS_RETRIEVAL_POLICY.scope_strategy,
     )
 
 
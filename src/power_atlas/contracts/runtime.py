@@ -20,6 +20,7 @@ class Config:
     question: str | None = None
     resolution_mode: str = "unstructured_only"
     dataset_name: str | None = None
+    resume_claim_extraction: bool = False
 
     def __init__(
         self,
@@ -32,6 +33,7 @@ class Config:
         question: str | None = None,
         resolution_mode: str = "unstructured_only",
         dataset_name: str | None = None,
+        resume_claim_extraction: bool = False,
     ) -> None:
         resolved_settings = settings
         resolved_dataset_name = (
@@ -54,6 +56,7 @@ class Config:
         object.__setattr__(self, "question", question)
         object.__setattr__(self, "resolution_mode", resolution_mode)
         object.__setattr__(self, "dataset_name", resolved_dataset_name)
+        object.__setattr__(self, "resume_claim_extraction", resume_claim_extraction)
 
     @property
     def neo4j_uri(self) -> str:
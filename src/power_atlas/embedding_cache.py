@@ -0,0 +1,184 @@
+"""Content-addressed on-disk cache of text embeddings.
+
+Vectors for one embedding model live in a directory holding:
+
+* ``vectors.f32`` - a raw little-endian float32 matrix, one row per entry,
+  read through :class:`numpy.memmap` so lookups never load the whole file;
+* ``keys.txt`` - the key index, one hex ``sha256(model, text)`` per line,
+  where line *n* names row *n* of the matrix;
+* ``meta.json`` - the model name and vector dimensions;
+* ``.lock`` - taken with :func:`fcntl.flock` around every append.
+
+Entries are only ever appended.  Rows are written before their keys, so a
+crash can leave an orphaned trailing row but never a key without a vector;
+orphaned rows are truncated the next time the cache is locked.  Several
+processes may share a directory (concurrent ingests under one output
+directory): each append first reads the keys other writers appended since
+its last look and takes its row numbers from the size of ``vectors.f32``,
+both under the exclusive lock, so a key always names its own row.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import logging
+import re
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_RELATIVE_DIR = Path("cache") / "embeddings"
+EMBEDDING_CACHE_FORMAT_VERSION = 1
+_VECTOR_DTYPE = np.dtype("<f4")
+_UNSAFE_DIRNAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    def __init__(self, root: Path, *, model: str) -> None:
+        self.model = model
+        self.directory = Path(root) / _UNSAFE_DIRNAME_CHARS.sub("_", model)
+        self._vectors_path = self.directory / "vectors.f32"
+        self._keys_path = self.directory / "keys.txt"
+        self._meta_path = self.directory / "meta.json"
+        self._lock_path = self.directory / ".lock"
+        self.dimensions: int | None = None
+        self._rows: dict[str, int] = {}
+        self._keys_offset = 0
+        self._unusable = False
+        if self._meta_path.is_file():
+            with self._locked():
+                self._sync()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock_path.open("a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _sync(self) -> None:
+        """Pick up keys appended since the last sync and drop orphaned rows; the caller holds the lock."""
+        if self.dimensions is None:
+            if self._unusable or not self._meta_path.is_file():
+                return
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            if meta.get("version") != EMBEDDING_CACHE_FORMAT_VERSION or meta.get("model") != self.model:
+                _logger.warning("Ignoring embedding cache at %s with unexpected metadata %r", self.directory, meta)
+                self._unusable = True
+                return
+            self.dimensions = int(meta["dimensions"])
+        new_keys: list[str] = []
+        if self._keys_path.is_file():
+            with self._keys_path.open("rb") as handle:
+                handle.seek(self._keys_offset)
+                appended = handle.read()
+            # A torn final line (crash mid-write) is not a key yet.
+            complete = appended[: appended.rfind(b"\n") + 1]
+            new_keys = complete.decode("utf-8").split()
+            self._keys_offset += len(complete)
+        row_bytes = self.dimensions * _VECTOR_DTYPE.itemsize
+        stored_rows = self._vectors_path.stat().st_size // row_bytes if self._vectors_path.is_file() else 0
+        keys = list(self._rows) + new_keys
+        if stored_rows < len(keys):
+            # Keys are written after rows, so this only happens if files were edited by hand.
+            keys = keys[:stored_rows]
+            self._keys_path.write_text("".join(f"{key}\n" for key in keys), encoding="utf-8")
+            self._keys_offset = self._keys_path.stat().st_size
+            self._rows = {}
+        if self._vectors_path.is_file() and self._vectors_path.stat().st_size != len(keys) * row_bytes:
+            with self._vectors_path.open("r+b") as handle:
+                handle.truncate(len(keys) * row_bytes)
+        for row in range(len(self._rows), len(keys)):
+            self._rows[keys[row]] = row
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, texts: Sequence[str]) -> dict[int, list[float]]:
+        """Return cached vectors keyed by position in *texts*; misses are absent."""
+        if self._meta_path.is_file():
+            with self._locked():
+                self._sync()
+        if not self._rows or self.dimensions is None:
+            return {}
+        positions = {
+            position: row
+            for position, text in enumerate(texts)
+            if (row := self._rows.get(embedding_cache_key(self.model, text))) is not None
+        }
+        if not positions:
+            return {}
+        matrix = np.memmap(
+            self._vectors_path,
+            dtype=_VECTOR_DTYPE,
+            mode="r",
+            shape=(len(self._rows), self.dimensions),
+        )
+        try:
+            return {position: matrix[row].tolist() for position, row in positions.items()}
+        finally:
+            del matrix
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> int:
+        """Append vectors for texts not already cached; return how many were added."""
+        with self._locked():
+            self._sync()
+            if self._unusable:
+                return 0
+            pending: dict[str, Sequence[float]] = {}
+            for text, vector in zip(texts, vectors, strict=True):
+                key = embedding_cache_key(self.model, text)
+                if key not in self._rows:
+                    pending.setdefault(key, vector)
+            if not pending:
+                return 0
+            matrix = np.asarray(list(pending.values()), dtype=_VECTOR_DTYPE)
+            if matrix.ndim != 2:
+                raise ValueError("embedding vectors must all have the same length")
+            if self.dimensions is None:
+                self._meta_path.write_text(
+                    json.dumps(
+                        {
+                            "version": EMBEDDING_CACHE_FORMAT_VERSION,
+                            "model": self.model,
+                            "dimensions": matrix.shape[1],
+                        }
+                    ),
+                    encoding="utf-8",
+                )
+                self.dimensions = matrix.shape[1]
+            elif matrix.shape[1] != self.dimensions:
+                raise ValueError(
+                    f"embedding cache {self.directory} holds {self.dimensions}-dimensional vectors, got {matrix.shape[1]}"
+                )
+            row_bytes = self.dimensions * _VECTOR_DTYPE.itemsize
+            first_row = self._vectors_path.stat().st_size // row_bytes if self._vectors_path.is_file() else 0
+            with self._vectors_path.open("ab") as handle:
+                handle.write(matrix.tobytes())
+            keys_text = "".join(f"{key}\n" for key in pending)
+            with self._keys_path.open("a", encoding="utf-8") as handle:
+                handle.write(keys_text)
+            self._keys_offset += len(keys_text.encode("utf-8"))
+            for offset, key in enumerate(pending):
+                self._rows[key] = first_row + offset
+            return len(pending)
+
+
+__all__ = [
+    "EMBEDDING_CACHE_RELATIVE_DIR",
+    "EmbeddingCache",
+    "embedding_cache_key",
+]
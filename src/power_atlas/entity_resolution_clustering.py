@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from difflib import SequenceMatcher
 from typing import Any
 from urllib.parse import quote as _pct_encode
@@ -63,6 +64,170 @@ def _fuzzy_ratio(a: str, b: str) -> float:
 
 
 
+def _fuzzy_match_bounds(
+    query_length: int,
+    key_length: int,
+    threshold: float,
+) -> tuple[int, int, int] | None:
+    """Return ``(min_shared_bigrams, query_slack, key_slack)`` for a fuzzy match.
+
+    ``SequenceMatcher.ratio()`` is ``2 * M / T`` where ``M`` is the total size of
+    the ordered matching blocks and ``T`` the combined length.  At most
+    ``query_length - M`` query characters and ``key_length - M`` key characters
+    are unmatched, so a bigram matched at query position ``i`` sits at a key
+    position in ``[i - query_slack, i + key_slack]``.  A block of length ``L``
+    contributes ``L - 1`` such bigrams and consecutive blocks are separated by
+    at least one unmatched character, so a pair scoring at least *threshold*
+    shares at least ``3 * M - T - 1`` of them for the smallest admissible
+    ``M``.  A bound of zero or less cannot prune.  Returns ``None`` when no
+    pair of these lengths can reach *threshold*.
+    """
+    total = query_length + key_length
+    limit = min(query_length, key_length)
+    matches = max(0, int(threshold * total / 2) - 1)
+    while matches <= limit and 2.0 * matches / total < threshold:
+        matches += 1
+    if matches > limit:
+        return None
+    return 3 * matches - total - 1, query_length - matches, key_length - matches
+
+
+
+def _bigram_positions(text: str) -> dict[str, list[int]]:
+    positions: dict[str, list[int]] = {}
+    for index in range(len(text) - 1):
+        positions.setdefault(text[index:index + 2], []).append(index)
+    return positions
+
+
+
+class _FuzzyCandidateIndex:
+    """Ranked positional-bigram index over the cluster keys of one entity type.
+
+    Replaces a linear ``SequenceMatcher`` scan over every prior cluster key.
+    Keys keep the rank of their first registration (a promoted long form
+    inherits the rank of the short form it replaces), and
+    :meth:`find_first_match` scores only keys that survive the length filter
+    and a lossless positional bigram-count filter, in rank order, so the first
+    key at or above the threshold is the same one the linear scan would have
+    returned.
+    """
+
+    def __init__(self) -> None:
+        self._rank_by_key: dict[str, int] = {}
+        self._next_rank = 0
+        self._positions_by_key: dict[str, dict[str, list[int]]] = {}
+        self._keys_by_token: dict[tuple[int, str, int], set[str]] = {}
+        self._keys_by_length: dict[int, set[str]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rank_by_key
+
+    def __len__(self) -> int:
+        return len(self._rank_by_key)
+
+    def ranked_keys(self) -> list[str]:
+        return sorted(self._rank_by_key, key=self._rank_by_key.__getitem__)
+
+    def add(self, key: str) -> None:
+        if key in self._rank_by_key:
+            return
+        self._insert(key, self._next_rank)
+        self._next_rank += 1
+
+    def replace(self, old_key: str, new_key: str) -> None:
+        """Put *new_key* in the rank slot of *old_key*, keeping the earlier rank if both exist."""
+        old_rank = self._rank_by_key.get(old_key)
+        if old_rank is None or old_key == new_key:
+            return
+        self._remove(old_key)
+        new_rank = self._rank_by_key.get(new_key)
+        if new_rank is None:
+            self._insert(new_key, old_rank)
+        elif old_rank < new_rank:
+            self._remove(new_key)
+            self._insert(new_key, old_rank)
+
+    def find_first_match(self, query: str, threshold: float) -> tuple[str | None, float]:
+        query_length = len(query)
+        if query_length == 0:
+            return ("", 1.0) if "" in self._rank_by_key else (None, 0.0)
+
+        query_grams = [query[index:index + 2] for index in range(query_length - 1)]
+        candidates: list[str] = []
+        for key_length, keys in self._keys_by_length.items():
+            if key_length == 0:
+                continue
+            min_len = min(query_length, key_length)
+            max_len = max(query_length, key_length)
+            if 2 * min_len / (min_len + max_len) < threshold:
+                continue
+            bounds = _fuzzy_match_bounds(query_length, key_length, threshold)
+            if bounds is None:
+                continue
+            if bounds[0] <= 0:
+                candidates.extend(keys)
+            else:
+                candidates.extend(self._filtered_candidates(query_grams, key_length, *bounds))
+
+        for key in sorted(candidates, key=self._rank_by_key.__getitem__):
+            ratio = _fuzzy_ratio(query, key)
+            if ratio >= threshold:
+                return key, ratio
+        return None, 0.0
+
+    def _filtered_candidates(
+        self,
+        query_grams: list[str],
+        key_length: int,
+        required: int,
+        query_slack: int,
+        key_slack: int,
+    ) -> list[str]:
+        if len(query_grams) < required:
+            return []
+        # Count, per key of this length, the query positions whose bigram the
+        # key holds within the slack window; each position counts once.
+        postings = self._keys_by_token
+        shared: Counter[str] = Counter()
+        for index, gram in enumerate(query_grams):
+            buckets = [
+                bucket
+                for position in range(max(0, index - query_slack), index + key_slack + 1)
+                if (bucket := postings.get((key_length, gram, position)))
+            ]
+            if len(buckets) == 1:
+                shared.update(buckets[0])
+            elif buckets:
+                shared.update(set().union(*buckets))
+        return [key for key, count in shared.items() if count >= required]
+
+    def _insert(self, key: str, rank: int) -> None:
+        self._rank_by_key[key] = rank
+        positions = _bigram_positions(key)
+        self._positions_by_key[key] = positions
+        key_length = len(key)
+        for gram, gram_positions in positions.items():
+            for position in gram_positions:
+                self._keys_by_token.setdefault((key_length, gram, position), set()).add(key)
+        self._keys_by_length.setdefault(key_length, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        del self._rank_by_key[key]
+        key_length = len(key)
+        for gram, gram_positions in self._positions_by_key.pop(key).items():
+            for position in gram_positions:
+                bucket = self._keys_by_token[(key_length, gram, position)]
+                bucket.discard(key)
+                if not bucket:
+                    del self._keys_by_token[(key_length, gram, position)]
+        length_bucket = self._keys_by_length[key_length]
+        length_bucket.discard(key)
+        if not length_bucket:
+            del self._keys_by_length[key_length]
+
+
+
 def _membership_score(method: str, resolution_confidence: float) -> float:
     if method in ("label_cluster", "normalized_exact"):
         return 1.0
@@ -96,11 +261,11 @@ def _cluster_mentions_unstructured_only(
     cluster_to_mentions: dict[str, list[str]] = {}
     initials_to_long_by_type: dict[str | None, dict[str, str]] = {}
     abbrev_alpha_by_type: dict[str | None, dict[str, list[str]]] = {}
-    seen_texts_by_type: dict[str | None, list[str]] = {}
+    seen_texts_by_type: dict[str | None, _FuzzyCandidateIndex] = {}
 
     def _register_new_cluster(cluster_key: str, entity_type: str | None) -> None:
         seen_keys.add(cluster_key)
-        seen_texts_by_type.setdefault(entity_type, []).append(cluster_key)
+        seen_texts_by_type.setdefault(entity_type, _FuzzyCandidateIndex()).add(cluster_key)
         abbrev_alpha_by_type.setdefault(entity_type, {}).setdefault(
             _RE_NON_ALPHA.sub("", cluster_key), []
         ).append(cluster_key)
@@ -109,9 +274,7 @@ def _cluster_mentions_unstructured_only(
             initials_to_long_by_type.setdefault(entity_type, {})[initials] = cluster_key
 
     def _register_cluster_for_type(cluster_key: str, entity_type: str | None) -> None:
-        type_texts = seen_texts_by_type.setdefault(entity_type, [])
-        if cluster_key not in type_texts:
-            type_texts.append(cluster_key)
+        seen_texts_by_type.setdefault(entity_type, _FuzzyCandidateIndex()).add(cluster_key)
         alpha = _RE_NON_ALPHA.sub("", cluster_key)
         bucket = abbrev_alpha_by_type.setdefault(entity_type, {}).setdefault(alpha, [])
         if cluster_key not in bucket:
@@ -123,17 +286,9 @@ def _cluster_mentions_unstructured_only(
     def _promote_long_form(short_key: str, long_key: str, entity_type: str | None) -> None:
         seen_keys.add(long_key)
 
-        type_texts = seen_texts_by_type.get(entity_type, [])
-        if short_key in type_texts:
-            type_texts[type_texts.index(short_key)] = long_key
-            seen_for_type: set[str] = set()
-            deduped_type_texts: list[str] = []
-            for text in type_texts:
-                if text not in seen_for_type:
-                    seen_for_type.add(text)
-                    deduped_type_texts.append(text)
-            if len(deduped_type_texts) != len(type_texts):
-                seen_texts_by_type[entity_type] = deduped_type_texts
+        type_texts = seen_texts_by_type.get(entity_type)
+        if type_texts is not None:
+            type_texts.replace(short_key, long_key)
 
         old_alpha = _RE_NON_ALPHA.sub("", short_key)
         type_abbrev = abbrev_alpha_by_type.get(entity_type, {})
@@ -220,26 +375,11 @@ def _cluster_mentions_unstructured_only(
             cluster_to_mentions.setdefault(normalized, []).append(mention_id)
             continue
 
-        normalized_length = len(normalized)
         fuzzy_target: str | None = None
         fuzzy_score: float = 0.0
-        for existing in seen_texts_by_type.get(entity_type, []):
-            existing_length = len(existing)
-            if existing_length == 0 and normalized_length == 0:
-                fuzzy_target = existing
-                fuzzy_score = 1.0
-                break
-            if existing_length == 0 or normalized_length == 0:
-                continue
-            min_len = min(normalized_length, existing_length)
-            max_len = max(normalized_length, existing_length)
-            if 2 * min_len / (min_len + max_len) < fuzzy_threshold:
-                continue
-            ratio = _fuzzy_ratio(normalized, existing)
-            if ratio >= fuzzy_threshold:
-                fuzzy_target = existing
-                fuzzy_score = ratio
-                break
+        type_texts = seen_texts_by_type.get(entity_type)
+        if type_texts is not None:
+            fuzzy_target, fuzzy_score = type_texts.find_first_match(normalized, fuzzy_threshold)
         if fuzzy_target is not None:
             mention_to_cluster[mention_id] = fuzzy_target
             mention_to_method[mention_id] = ("fuzzy", fuzzy_score)
@@ -270,6 +410,7 @@ def _cluster_mentions_unstructured_only(
 
 __all__ = [
     "_FUZZY_REVIEW_THRESHOLD",
+    "_FuzzyCandidateIndex",
     "_cluster_mentions_unstructured_only",
     "_compute_initials",
     "_fuzzy_ratio",
@@ -20,6 +20,9 @@ from power_atlas.entity_resolution_writes import (
     write_cluster_memberships as _write_cluster_memberships_live,
     write_resolved_mentions as _write_resolved_mentions_live,
 )
+from power_atlas.neo4j_batch_writes import BatchWritePolicy, BatchWriteStats
+from power_atlas.retrieval_result_cache import bump_retrieval_generation
+from power_atlas.run_stats import refresh_run_stats
 from power_atlas.settings import Neo4jSettings
 
 
@@ -40,8 +43,9 @@ def write_cluster_memberships(
     created_at: str,
     cluster_version: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
-    _write_cluster_memberships_live(
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
+    return _write_cluster_memberships_live(
         driver,
         run_id=run_id,
         cluster_rows=cluster_rows,
@@ -49,6 +53,7 @@ def write_cluster_memberships(
         resolver_version=cluster_version,
         created_at=created_at,
         entity_resolution_graph=entity_resolution_graph,
+        batch_policy=batch_policy,
     )
 
 
@@ -61,18 +66,30 @@ def write_resolved_mentions(
     resolved_rows: list[dict[str, Any]],
     neo4j_database: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
-    _write_resolved_mentions_live(
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
+    return _write_resolved_mentions_live(
         driver,
         run_id=run_id,
         source_uri=source_uri,
         resolved_rows=resolved_rows,
         neo4j_database=neo4j_database,
         entity_resolution_graph=entity_resolution_graph,
+        batch_policy=batch_policy,
     )
 
 
 
+def refresh_resolution_run_state(driver: Any, *, run_id: str, neo4j_database: str | None) -> None:
+    """Recount the run's ``RunStats`` resolution section and bump its retrieval generation.
+
+    Called once per stage, after the last resolution or alignment write.
+    """
+    refresh_run_stats(driver, run_ids=[run_id], sections=("resolution",), neo4j_database=neo4j_database)
+    bump_retrieval_generation(driver, run_ids=[run_id], neo4j_database=neo4j_database)
+
+
+
 def write_alignment_results(
     driver: Any,
     *,
@@ -82,8 +99,9 @@ def write_alignment_results(
     neo4j_database: str,
     alignment_version: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
-    _write_alignment_results_live(
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
+    write_stats = _write_alignment_results_live(
         driver,
         run_id=run_id,
         source_uri=source_uri,
@@ -91,7 +109,9 @@ def write_alignment_results(
         neo4j_database=neo4j_database,
         alignment_version=alignment_version,
         entity_resolution_graph=entity_resolution_graph,
+        batch_policy=batch_policy,
     )
+    return write_stats
 
 
 
@@ -108,14 +128,16 @@ def write_resolution_results(
     membership_status: Callable[[str, float], str],
     cluster_version: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
-    write_resolved_mentions(
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
+    write_stats = write_resolved_mentions(
         driver,
         run_id=run_id,
         source_uri=source_uri,
         resolved_rows=resolved_rows,
         neo4j_database=neo4j_database,
         entity_resolution_graph=entity_resolution_graph,
+        batch_policy=batch_policy,
     )
 
     if unresolved_rows:
@@ -139,15 +161,19 @@ def write_resolution_results(
                     "status": membership_status(method, score),
                 }
             )
-        write_cluster_memberships(
-            driver,
-            run_id=run_id,
-            cluster_rows=cluster_rows,
-            neo4j_database=neo4j_database,
-            cluster_version=cluster_version,
-            created_at=created_at,
-            entity_resolution_graph=entity_resolution_graph,
+        write_stats.extend(
+            write_cluster_memberships(
+                driver,
+                run_id=run_id,
+                cluster_rows=cluster_rows,
+                neo4j_database=neo4j_database,
+                cluster_version=cluster_version,
+                created_at=created_at,
+                entity_resolution_graph=entity_resolution_graph,
+                batch_policy=batch_policy,
+            )
         )
+    return write_stats
 
 
 
@@ -175,14 +201,15 @@ def run_entity_resolution_runtime(
     make_cluster_id: Callable[[str, str | None, str], str],
     align_clusters_to_canonical: Callable[[list[dict[str, Any]], dict[str, dict[str, Any]], dict[str, dict[str, Any]]], list[dict[str, Any]]],
     resolve_mention: Callable[[dict[str, Any], dict[str, dict[str, Any]], dict[str, dict[str, Any]], dict[str, dict[str, Any]]], dict[str, Any]],
-    write_resolution_results: Callable[..., None],
-    write_alignment_results: Callable[..., None],
+    write_resolution_results: Callable[..., list[BatchWriteStats] | None],
+    write_alignment_results: Callable[..., list[BatchWriteStats] | None],
     fetch_member_of_coverage: Callable[..., Any],
     fetch_alignment_coverage: Callable[..., Any],
     resolution_mode_structured_anchor: str,
     resolution_mode_unstructured_only: str,
     resolution_mode_hybrid: str,
     live_runner: Callable[..., Any] = run_entity_resolution_live,
+    refresh_run_state: Callable[..., None] = refresh_resolution_run_state,
 ) -> dict[str, Any]:
     resolved_entity_resolution_alignment = (
         get_default_entity_resolution_alignment_contract()
@@ -279,6 +306,7 @@ def run_entity_resolution_runtime(
         write_alignment_results=write_alignment_results,
         fetch_member_of_coverage=fetch_member_of_coverage,
         fetch_alignment_coverage=fetch_alignment_coverage,
+        refresh_run_state=refresh_run_state,
     )
 
     mentions = live_result.mentions
@@ -293,6 +321,7 @@ def run_entity_resolution_runtime(
     graph_mentions_in_aligned = live_result.graph_mentions_in_aligned
     graph_alignment_breakdown = live_result.graph_alignment_breakdown
     stage_warnings = live_result.warnings
+    write_batches = getattr(live_result, "write_batches", [])
 
     unresolved_list = [
         {
@@ -343,6 +372,7 @@ def run_entity_resolution_runtime(
         "entity_resolution_summary_path": str(summary_path),
         "unresolved_mentions_path": str(unresolved_path),
         "warnings": list(stage_warnings),
+        "write_batches": [stats.to_summary() for stats in write_batches],
     }
     if resolution_mode in (resolution_mode_unstructured_only, resolution_mode_hybrid):
         summary["mentions_clustered"] = graph_mentions_clustered
@@ -377,6 +407,7 @@ def run_entity_resolution_runtime_default(
     entity_resolution_alignment: EntityResolutionAlignmentContract | None = None,
     entity_resolution_canonical_lookup: EntityResolutionCanonicalLookupContract | None = None,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
+    batch_policy: BatchWritePolicy | None = None,
 ) -> dict[str, Any]:
     from power_atlas.contracts.resolution import ALIGNMENT_VERSION
     from power_atlas.entity_resolution_alignment import align_clusters_to_canonical
@@ -413,6 +444,7 @@ def run_entity_resolution_runtime_default(
         if entity_resolution_alignment is None
         else entity_resolution_alignment
     )
+    resolved_batch_policy = BatchWritePolicy.from_env() if batch_policy is None else batch_policy
 
     def _default_make_cluster_id(
         current_run_id: str,
@@ -435,8 +467,8 @@ def run_entity_resolution_runtime_default(
         unresolved_rows: list[dict[str, Any]],
         neo4j_database: str,
             entity_resolution_graph: EntityResolutionGraphContract | None = None,
-    ) -> None:
-        write_resolution_results(
+    ) -> list[BatchWriteStats]:
+        return write_resolution_results(
             driver,
             run_id=run_id,
             source_uri=source_uri,
@@ -448,6 +480,7 @@ def run_entity_resolution_runtime_default(
             membership_status=_membership_status,
             cluster_version=DEFAULT_CLUSTER_VERSION,
             entity_resolution_graph=entity_resolution_graph,
+            batch_policy=resolved_batch_policy,
         )
 
     def _default_write_alignment_results(
@@ -458,8 +491,8 @@ def run_entity_resolution_runtime_default(
         alignment_rows: list[dict[str, Any]],
         neo4j_database: str,
             entity_resolution_graph: EntityResolutionGraphContract | None = None,
-    ) -> None:
-        write_alignment_results(
+    ) -> list[BatchWriteStats]:
+        return write_alignment_results(
             driver,
             run_id=run_id,
             source_uri=source_uri,
@@ -467,6 +500,7 @@ def run_entity_resolution_runtime_default(
             neo4j_database=neo4j_database,
             alignment_version=ALIGNMENT_VERSION,
             entity_resolution_graph=entity_resolution_graph,
+            batch_policy=resolved_batch_policy,
         )
 
     return run_entity_resolution_runtime(
@@ -524,6 +558,7 @@ def run_entity_resolution_runtime_default(
 __all__ = [
     "DEFAULT_CLUSTER_VERSION",
     "DEFAULT_RESOLVER_VERSION",
+    "refresh_resolution_run_state",
     "run_entity_resolution_runtime",
     "write_alignment_results",
     "write_cluster_memberships",
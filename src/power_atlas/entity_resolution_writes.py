@@ -6,6 +6,11 @@ from power_atlas.contracts import (
     EntityResolutionGraphContract,
     get_default_entity_resolution_graph_contract,
 )
+from power_atlas.neo4j_batch_writes import (
+    BatchWritePolicy,
+    BatchWriteStats,
+    run_batched_write,
+)
 
 
 def _escape_cypher_identifier(value: str) -> str:
@@ -14,6 +19,16 @@ def _escape_cypher_identifier(value: str) -> str:
     return f"`{value}`"
 
 
+# Concurrent batches must not MERGE relationships onto the same node, otherwise
+# they serialize on its lock (or deadlock); keep such rows in one batch.
+def _cluster_conflict_key(row: dict[str, Any]) -> Any:
+    return row["cluster_id"]
+
+
+def _canonical_conflict_key(row: dict[str, Any]) -> Any:
+    return (row.get("canonical_entity_id"), row.get("canonical_run_id"))
+
+
 def write_resolved_mentions(
     driver: Any,
     *,
@@ -22,15 +37,17 @@ def write_resolved_mentions(
     resolved_rows: list[dict[str, Any]],
     neo4j_database: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
     if not resolved_rows:
-        return
+        return []
     resolved_graph = (
         get_default_entity_resolution_graph_contract()
         if entity_resolution_graph is None
         else entity_resolution_graph
     )
-    driver.execute_query(
+    stats = run_batched_write(
+        driver,
         """
         UNWIND $rows AS row
         MATCH (mention:{mention_label} {{mention_id: row.mention_id, run_id: $run_id}})
@@ -48,13 +65,17 @@ def write_resolved_mentions(
                 resolved_graph.resolves_to_relationship
             ),
         ),
-        parameters_={
-            "rows": resolved_rows,
+        name="resolves_to",
+        rows=resolved_rows,
+        parameters={
             "run_id": run_id,
             "source_uri": source_uri or None,
         },
-        database_=neo4j_database,
+        neo4j_database=neo4j_database,
+        policy=batch_policy,
+        conflict_key=_canonical_conflict_key,
     )
+    return [stats]
 
 
 def write_cluster_memberships(
@@ -66,15 +87,17 @@ def write_cluster_memberships(
     resolver_version: str,
     created_at: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
     if not cluster_rows:
-        return
+        return []
     resolved_graph = (
         get_default_entity_resolution_graph_contract()
         if entity_resolution_graph is None
         else entity_resolution_graph
     )
-    driver.execute_query(
+    membership_stats = run_batched_write(
+        driver,
         """
         UNWIND $rows AS row
         MERGE (cluster:{cluster_label} {{cluster_id: row.cluster_id}})
@@ -101,21 +124,25 @@ def write_cluster_memberships(
                 resolved_graph.member_of_relationship
             ),
         ),
-        parameters_={
-            "rows": cluster_rows,
+        name="member_of",
+        rows=cluster_rows,
+        parameters={
             "run_id": run_id,
             "resolver_version": resolver_version,
             "created_at": created_at,
         },
-        database_=neo4j_database,
+        neo4j_database=neo4j_database,
+        policy=batch_policy,
+        conflict_key=_cluster_conflict_key,
     )
 
     candidate_rows = [
         row for row in cluster_rows if row["status"] in ("candidate", "review_required")
     ]
     if not candidate_rows:
-        return
-    driver.execute_query(
+        return [membership_stats]
+    candidate_stats = run_batched_write(
+        driver,
         """
         UNWIND $rows AS row
         MATCH (mention:{mention_label} {{mention_id: row.mention_id, run_id: $run_id}})
@@ -134,13 +161,17 @@ def write_cluster_memberships(
                 resolved_graph.candidate_match_relationship
             ),
         ),
-        parameters_={
-            "rows": candidate_rows,
+        name="candidate_match",
+        rows=candidate_rows,
+        parameters={
             "run_id": run_id,
             "resolver_version": resolver_version,
         },
-        database_=neo4j_database,
+        neo4j_database=neo4j_database,
+        policy=batch_policy,
+        conflict_key=_cluster_conflict_key,
     )
+    return [membership_stats, candidate_stats]
 
 
 def write_alignment_results(
@@ -152,15 +183,17 @@ def write_alignment_results(
     neo4j_database: str,
     alignment_version: str,
     entity_resolution_graph: EntityResolutionGraphContract | None = None,
-) -> None:
+    batch_policy: BatchWritePolicy | None = None,
+) -> list[BatchWriteStats]:
     if not alignment_rows:
-        return
+        return []
     resolved_graph = (
         get_default_entity_resolution_graph_contract()
         if entity_resolution_graph is None
         else entity_resolution_graph
     )
-    driver.execute_query(
+    stats = run_batched_write(
+        driver,
         """
         UNWIND $rows AS row
         MATCH (cluster:{cluster_label} {{cluster_id: row.cluster_id}})
@@ -180,14 +213,18 @@ def write_alignment_results(
                 resolved_graph.aligned_with_relationship
             ),
         ),
-        parameters_={
-            "rows": alignment_rows,
+        name="aligned_with",
+        rows=alignment_rows,
+        parameters={
             "run_id": run_id,
             "source_uri": source_uri or None,
             "alignment_version": alignment_version,
         },
-        database_=neo4j_database,
+        neo4j_database=neo4j_database,
+        policy=batch_policy,
+        conflict_key=_canonical_conflict_key,
     )
+    return [stats]
 
 
 __all__ = [
@@ -0,0 +1,126 @@
+"""Backfill of the stored ``normalized_entity_type`` on ``EntityMention`` nodes.
+
+Claim extraction writes each mention's policy-normalized entity type together
+with the policy version (:func:`~power_atlas.contracts.entity_type_policy_version`)
+that produced it.  Mentions written before that, or under an older synonym
+policy, carry no stamp or a stale one; graph-health queries fall back to the
+policy ``CASE`` expression for them.
+
+:func:`backfill_normalized_entity_types` restamps those mentions run by run:
+it reads each run's stale mentions through the ``run_id`` index, normalizes
+them in Python with the same function the write path uses, and writes them
+back with :func:`~power_atlas.neo4j_batch_writes.run_batched_write`.  Runs that
+are already current cost one index lookup, so the backfill is safe to re-run
+after every policy change.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from power_atlas.contracts import (
+    EntityTypeNormalizationPolicy,
+    entity_type_policy_version,
+    normalize_entity_type,
+)
+from power_atlas.neo4j_batch_writes import BatchWritePolicy, run_batched_write
+
+_logger = logging.getLogger(__name__)
+
+STALE_ENTITY_TYPE_RUN_IDS_QUERY = """
+MATCH (mention:EntityMention)
+WHERE mention.run_id IS NOT NULL
+  AND (mention.entity_type_policy_version IS NULL
+       OR mention.entity_type_policy_version <> $policy_version)
+RETURN DISTINCT mention.run_id AS run_id
+ORDER BY run_id
+"""
+
+STALE_ENTITY_TYPE_MENTIONS_QUERY = """
+MATCH (mention:EntityMention {run_id: $run_id})
+WHERE mention.entity_type_policy_version IS NULL
+   OR mention.entity_type_policy_version <> $policy_version
+RETURN mention.mention_id AS mention_id, mention.entity_type AS entity_type
+"""
+
+NORMALIZED_ENTITY_TYPE_WRITE_QUERY = """
+UNWIND $rows AS row
+MATCH (mention:EntityMention {mention_id: row.mention_id, run_id: $run_id})
+SET mention.normalized_entity_type = row.normalized_entity_type,
+    mention.entity_type_policy_version = $policy_version
+"""
+
+
+def _record_mapping(record: Any) -> Mapping[str, Any]:
+    return record if isinstance(record, Mapping) else dict(record)
+
+
+def backfill_normalized_entity_types(
+    driver: Any,
+    *,
+    neo4j_database: str,
+    entity_type_policy: EntityTypeNormalizationPolicy | None = None,
+    run_ids: Sequence[str] | None = None,
+    batch_policy: BatchWritePolicy | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Stamp every mention whose stored entity type predates the current policy.
+
+    Without *run_ids* the runs holding stale mentions are discovered with one
+    label scan.  With ``dry_run=True`` stale mentions are counted, not written.
+    """
+    policy_version = entity_type_policy_version(entity_type_policy)
+    if run_ids is None:
+        records, _, _ = driver.execute_query(
+            STALE_ENTITY_TYPE_RUN_IDS_QUERY,
+            parameters_={"policy_version": policy_version},
+            database_=neo4j_database,
+        )
+        run_ids = [_record_mapping(record)["run_id"] for record in records]
+
+    runs: list[dict[str, Any]] = []
+    for run_id in run_ids:
+        records, _, _ = driver.execute_query(
+            STALE_ENTITY_TYPE_MENTIONS_QUERY,
+            parameters_={"run_id": run_id, "policy_version": policy_version},
+            database_=neo4j_database,
+        )
+        rows = [
+            {
+                "mention_id": mapping["mention_id"],
+                "normalized_entity_type": normalize_entity_type(mapping.get("entity_type"), entity_type_policy),
+            }
+            for mapping in map(_record_mapping, records)
+        ]
+        entry: dict[str, Any] = {"run_id": run_id, "stale_mentions": len(rows)}
+        if rows and not dry_run:
+            stats = run_batched_write(
+                driver,
+                NORMALIZED_ENTITY_TYPE_WRITE_QUERY,
+                name="normalized_entity_type_backfill",
+                rows=rows,
+                parameters={"run_id": run_id, "policy_version": policy_version},
+                neo4j_database=neo4j_database,
+                policy=batch_policy,
+            )
+            entry["write"] = stats.to_summary()
+            _logger.info("Backfilled normalized_entity_type on %d mention(s) of run_id=%s", len(rows), run_id)
+        runs.append(entry)
+
+    return {
+        "dry_run": dry_run,
+        "policy_version": policy_version,
+        "runs_checked": len(runs),
+        "stale_mentions": sum(entry["stale_mentions"] for entry in runs),
+        "runs": runs,
+    }
+
+
+__all__ = [
+    "NORMALIZED_ENTITY_TYPE_WRITE_QUERY",
+    "STALE_ENTITY_TYPE_MENTIONS_QUERY",
+    "STALE_ENTITY_TYPE_RUN_IDS_QUERY",
+    "backfill_normalized_entity_types",
+]
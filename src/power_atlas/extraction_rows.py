@@ -3,6 +3,11 @@ from __future__ import annotations
 from typing import Any
 
 from power_atlas.adapters.graphrag_types import LexicalGraphConfig, Neo4jGraph, TextChunk
+from power_atlas.contracts import (
+    EntityTypeNormalizationPolicy,
+    entity_type_policy_version,
+    normalize_entity_type,
+)
 
 
 def coerce_confidence(value: Any) -> float | None:
@@ -45,6 +50,7 @@ def prepare_extracted_rows(
     run_id: str,
     source_uri: str | None,
     lexical_graph_config: LexicalGraphConfig,
+    entity_type_policy: EntityTypeNormalizationPolicy | None = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[str]]:
     """
     Map extracted graph nodes to claim/mention rows with graph-level provenance.
@@ -54,10 +60,15 @@ def prepare_extracted_rows(
     (extractor model, extraction timestamps, prompt versions) belongs in the
     manifest/artifact outputs of the calling stage, not on graph node properties.
 
+    Mentions also carry ``normalized_entity_type`` under *entity_type_policy*
+    and the policy's version stamp, so graph queries can group on the stored
+    type instead of re-normalizing ``entity_type``.
+
     Returns:
         claim_rows, mention_rows, warnings
     """
 
+    policy_version = entity_type_policy_version(entity_type_policy)
     chunk_meta: dict[str, dict[str, Any]] = {}
     for chunk in text_chunks:
         metadata = dict(chunk.metadata or {})
@@ -196,6 +207,11 @@ def prepare_extracted_rows(
         properties["name"] = name or f"mention_for_{fallback_id}"
         if "entity_type" in node.properties:
             properties["entity_type"] = node.properties["entity_type"]
+        properties["normalized_entity_type"] = normalize_entity_type(
+            properties.get("entity_type"),
+            entity_type_policy,
+        )
+        properties["entity_type_policy_version"] = policy_version
         mention_rows.append(
             {
                 "mention_id": node.id,
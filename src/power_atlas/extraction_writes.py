@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import neo4j
 
 from power_atlas.adapters.graphrag_types import LexicalGraphConfig
 from power_atlas.neo4j_io import validate_cypher_identifier
+from power_atlas.retrieval_result_cache import (
+    RETRIEVAL_GENERATION_BUMP_QUERY,
+    bump_retrieval_generation,
+    retrieval_generation_scopes,
+)
+from power_atlas.run_stats import RUN_STATS_EXTRACTION_REFRESH_QUERY, refresh_run_stats
 
 
 EDGE_TYPE_HAS_PARTICIPANT = "HAS_PARTICIPANT"
+DEFAULT_EXTRACTION_WRITE_BATCH_CHUNKS = 50
 def _claim_write_query(chunk_label: str, chunk_id_property: str) -> str:
     return f"""
             UNWIND $rows AS row
@@ -88,7 +96,34 @@ def write_extracted_rows(
         )
 
 
-def write_all_extraction_data(
+def _validate_edge_rows(edge_rows: list[dict[str, Any]], *, caller: str) -> None:
+    invalid = [i for i, row in enumerate(edge_rows) if not str(row.get("role") or "").strip()]
+    if invalid:
+        raise ValueError(
+            f"{caller}: {len(invalid)} edge row(s) have a missing or "
+            f"empty 'role' field (row indices: {invalid}).  Each row must carry a "
+            f"non-empty role (e.g. ROLE_SUBJECT or ROLE_OBJECT) before the transaction "
+            f"is executed."
+        )
+
+    invalid_type = [
+        i
+        for i, row in enumerate(edge_rows)
+        if "edge_type" in row and row["edge_type"] != EDGE_TYPE_HAS_PARTICIPANT
+    ]
+    if invalid_type:
+        raise ValueError(
+            f"{caller}: {len(invalid_type)} edge row(s) have an "
+            f"unexpected 'edge_type' value; expected {EDGE_TYPE_HAS_PARTICIPANT!r} "
+            f"(row indices: {invalid_type})."
+        )
+
+
+def _written_run_ids(*row_lists: list[dict[str, Any]]) -> list[str]:
+    return sorted({str(row["run_id"]) for rows in row_lists for row in rows if row.get("run_id")})
+
+
+def _write_extraction_transaction(
     driver: neo4j.Driver,
     *,
     neo4j_database: str,
@@ -96,34 +131,20 @@ def write_all_extraction_data(
     claim_rows: list[dict[str, Any]],
     mention_rows: list[dict[str, Any]],
     edge_rows: list[dict[str, Any]],
+    refresh_run_state: bool,
+    caller: str,
 ) -> None:
     chunk_label, chunk_id_property = _validated_chunk_identifiers(lexical_graph_config)
 
     claim_query = _claim_write_query(chunk_label, chunk_id_property)
     mention_query = _mention_write_query(chunk_label, chunk_id_property)
     participant_query = _edge_write_query()
+    written_run_ids = _written_run_ids(claim_rows, mention_rows, edge_rows) if refresh_run_state else []
+    # Cached retrieval results for the written runs go stale with this write.
+    generation_scopes = retrieval_generation_scopes(written_run_ids)
 
     if edge_rows:
-        invalid = [i for i, row in enumerate(edge_rows) if not str(row.get("role") or "").strip()]
-        if invalid:
-            raise ValueError(
-                f"write_all_extraction_data: {len(invalid)} edge row(s) have a missing or "
-                f"empty 'role' field (row indices: {invalid}).  Each row must carry a "
-                f"non-empty role (e.g. ROLE_SUBJECT or ROLE_OBJECT) before the transaction "
-                f"is executed."
-            )
-
-        invalid_type = [
-            i
-            for i, row in enumerate(edge_rows)
-            if "edge_type" in row and row["edge_type"] != EDGE_TYPE_HAS_PARTICIPANT
-        ]
-        if invalid_type:
-            raise ValueError(
-                f"write_all_extraction_data: {len(invalid_type)} edge row(s) have an "
-                f"unexpected 'edge_type' value; expected {EDGE_TYPE_HAS_PARTICIPANT!r} "
-                f"(row indices: {invalid_type})."
-            )
+        _validate_edge_rows(edge_rows, caller=caller)
 
     def _write_all(tx: neo4j.ManagedTransaction) -> None:
         if claim_rows:
@@ -132,14 +153,158 @@ def write_all_extraction_data(
             tx.run(mention_query, rows=mention_rows).consume()
         if edge_rows:
             tx.run(participant_query, rows=edge_rows).consume()
+        for run_id in written_run_ids:
+            tx.run(RUN_STATS_EXTRACTION_REFRESH_QUERY, run_id=run_id).consume()
+        if generation_scopes:
+            tx.run(RETRIEVAL_GENERATION_BUMP_QUERY, scopes=generation_scopes).consume()
 
     with driver.session(database=neo4j_database) as session:
         session.execute_write(_write_all)
 
 
+def write_all_extraction_data(
+    driver: neo4j.Driver,
+    *,
+    neo4j_database: str,
+    lexical_graph_config: LexicalGraphConfig,
+    claim_rows: list[dict[str, Any]],
+    mention_rows: list[dict[str, Any]],
+    edge_rows: list[dict[str, Any]],
+) -> None:
+    """Write the rows, refresh the runs' ``RunStats`` extraction section and bump their
+    retrieval generation, all in one transaction."""
+    _write_extraction_transaction(
+        driver,
+        neo4j_database=neo4j_database,
+        lexical_graph_config=lexical_graph_config,
+        claim_rows=claim_rows,
+        mention_rows=mention_rows,
+        edge_rows=edge_rows,
+        refresh_run_state=True,
+        caller="write_all_extraction_data",
+    )
+
+
+def write_extraction_rows_batch(
+    driver: neo4j.Driver,
+    *,
+    neo4j_database: str,
+    lexical_graph_config: LexicalGraphConfig,
+    claim_rows: list[dict[str, Any]],
+    mention_rows: list[dict[str, Any]],
+    edge_rows: list[dict[str, Any]],
+) -> None:
+    """Write one batch of rows in one transaction, leaving run state to :func:`refresh_extraction_run_state`."""
+    _write_extraction_transaction(
+        driver,
+        neo4j_database=neo4j_database,
+        lexical_graph_config=lexical_graph_config,
+        claim_rows=claim_rows,
+        mention_rows=mention_rows,
+        edge_rows=edge_rows,
+        refresh_run_state=False,
+        caller="write_extraction_rows_batch",
+    )
+
+
+def refresh_extraction_run_state(driver: neo4j.Driver, *, run_ids: list[str], neo4j_database: str) -> None:
+    """Recount the runs' ``RunStats`` extraction section and bump their retrieval generation."""
+    refresh_run_stats(driver, run_ids=run_ids, sections=("extraction",), neo4j_database=neo4j_database)
+    bump_retrieval_generation(driver, run_ids=run_ids, neo4j_database=neo4j_database)
+
+
+def write_all_extraction_data_in_batches(
+    driver: neo4j.Driver,
+    *,
+    neo4j_database: str,
+    lexical_graph_config: LexicalGraphConfig,
+    claim_rows: list[dict[str, Any]],
+    mention_rows: list[dict[str, Any]],
+    edge_rows: list[dict[str, Any]],
+    batch_chunks: int = DEFAULT_EXTRACTION_WRITE_BATCH_CHUNKS,
+    skip_batch: Callable[[list[str]], bool] | None = None,
+    on_batch_written: Callable[[list[str]], None] | None = None,
+    write_batch: Callable[..., None] = write_extraction_rows_batch,
+    refresh_run_state: Callable[..., None] = refresh_extraction_run_state,
+) -> dict[str, int]:
+    """Write extraction rows in one transaction per *batch_chunks* source chunks.
+
+    Rows are grouped by their first chunk id in order of appearance; a
+    participant edge goes with the later of its claim's and mention's batch,
+    so both endpoints exist when it is merged.  Batches for which *skip_batch*
+    returns true (already written by an interrupted run) are not sent, and
+    *on_batch_written* is called with each written batch's chunk ids.
+
+    The ``RunStats`` recount and retrieval generation bump run once, after
+    the last batch, rather than in every batch's transaction.  They run even
+    when every batch was skipped: the recount reads the graph, so it also
+    covers rows an interrupted run wrote before it could refresh.
+    """
+    if batch_chunks < 1:
+        raise ValueError(f"batch_chunks must be >= 1, got {batch_chunks}")
+    caller = "write_all_extraction_data_in_batches"
+    # Validate every edge before the first batch commits.
+    _validate_edge_rows(edge_rows, caller=caller)
+
+    chunk_order: dict[str, int] = {}
+
+    def _batch_of(row: dict[str, Any]) -> int:
+        chunk_ids = row.get("chunk_ids") or [row.get("chunk_id")]
+        return chunk_order.setdefault(str(chunk_ids[0]), len(chunk_order)) // batch_chunks
+
+    claim_batches = {row["claim_id"]: _batch_of(row) for row in claim_rows}
+    mention_batches = {row["mention_id"]: _batch_of(row) for row in mention_rows}
+    batch_count = (len(chunk_order) + batch_chunks - 1) // batch_chunks
+    batches: list[dict[str, list[dict[str, Any]]]] = [
+        {"claim_rows": [], "mention_rows": [], "edge_rows": []} for _ in range(batch_count)
+    ]
+    for row in claim_rows:
+        batches[claim_batches[row["claim_id"]]]["claim_rows"].append(row)
+    for row in mention_rows:
+        batches[mention_batches[row["mention_id"]]]["mention_rows"].append(row)
+    dangling = [
+        i
+        for i, row in enumerate(edge_rows)
+        if row["claim_id"] not in claim_batches or row["mention_id"] not in mention_batches
+    ]
+    if dangling:
+        raise ValueError(
+            f"{caller}: {len(dangling)} edge row(s) reference a claim_id or mention_id "
+            f"that is not among the claim/mention rows being written (row indices: {dangling})."
+        )
+    for row in edge_rows:
+        batch_position = max(claim_batches[row["claim_id"]], mention_batches[row["mention_id"]])
+        batches[batch_position]["edge_rows"].append(row)
+    chunk_ids_by_batch: list[list[str]] = [[] for _ in range(batch_count)]
+    for chunk_id, position in chunk_order.items():
+        chunk_ids_by_batch[position // batch_chunks].append(chunk_id)
+
+    if not batches:
+        # An extraction without rows still makes its (empty) write, as the single-transaction path did.
+        batches, chunk_ids_by_batch = [{"claim_rows": [], "mention_rows": [], "edge_rows": []}], [[]]
+
+    written = skipped = 0
+    for batch, chunk_ids in zip(batches, chunk_ids_by_batch):
+        if skip_batch is not None and skip_batch(chunk_ids):
+            skipped += 1
+            continue
+        write_batch(driver, neo4j_database=neo4j_database, lexical_graph_config=lexical_graph_config, **batch)
+        written += 1
+        if on_batch_written is not None and chunk_ids:
+            on_batch_written(chunk_ids)
+    run_ids = _written_run_ids(claim_rows, mention_rows, edge_rows)
+    if run_ids:
+        refresh_run_state(driver, run_ids=run_ids, neo4j_database=neo4j_database)
+    return {"batches": len(batches), "written_batches": written, "skipped_batches": skipped}
+
+
 __all__ = [
+    "DEFAULT_EXTRACTION_WRITE_BATCH_CHUNKS",
     "EDGE_TYPE_HAS_PARTICIPANT",
+    "refresh_extraction_run_state",
     "validate_cypher_identifier",
     "write_all_extraction_data",
+    "write_all_extraction_data_in_batches",
     "write_extracted_rows",
+    "write_extraction_rows_batch",
 ]
\ No newline at end of file
@@ -51,6 +51,7 @@ from typing import Any
 from power_atlas.context import RequestContext
 from power_atlas.contracts import EntityTypeNormalizationPolicy
 from power_atlas.contracts import build_entity_type_cypher_case as _build_entity_type_cypher_case
+from power_atlas.contracts import entity_type_policy_version
 from power_atlas.graph_health_queries import CANONICAL_CHAIN_HEALTH_LIMIT as _CANONICAL_CHAIN_HEALTH_LIMIT
 from power_atlas.graph_health_queries import PER_CANONICAL_ALIGNMENT_LIMIT as _PER_CANONICAL_ALIGNMENT_LIMIT
 from power_atlas.graph_health_queries import build_cluster_type_fragmentation_query
@@ -94,6 +95,7 @@ def _get_cluster_type_fragmentation_query(
             var,
             entity_type_policy=entity_type_policy,
         ),
+        entity_type_policy_version=entity_type_policy_version(entity_type_policy),
     )
 
 
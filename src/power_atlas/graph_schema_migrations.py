@@ -0,0 +1,370 @@
+"""Versioned, idempotent bootstrap of the lookup indexes and key constraints.
+
+Every write stage ``MERGE``s its nodes on run-scoped keys such as
+``(:EntityMention {mention_id, run_id})``.  Without a backing index Neo4j
+resolves each ``MERGE`` with a label scan, so write cost grows with the size of
+the graph rather than the size of the batch.  This module owns the schema
+objects that back those lookups and applies them as ordered migrations.
+
+Each :class:`SchemaMigration` is applied once per database and recorded as a
+``(:SchemaMigration {version})`` node together with a checksum of its
+statements.  Statements use ``IF NOT EXISTS``, so re-applying a migration (for
+example after the tracking nodes were removed by hand) is harmless.
+
+Key constraints degrade gracefully: ``IS NODE KEY`` requires Enterprise
+Edition, so on Community servers the composite ``IS UNIQUE`` form is used
+instead, and when existing duplicate rows prevent either constraint the lookup
+is still backed by a plain range index and a warning is recorded.
+
+Live stages call :func:`ensure_graph_schema_request_context` before they start.
+It runs at most once per process and database, never fails the stage, and is
+skipped entirely when ``POWER_ATLAS_SCHEMA_MIGRATIONS`` is ``off``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+import neo4j
+
+from power_atlas.bootstrap.clients import create_neo4j_driver
+from power_atlas.neo4j_io import validate_cypher_identifier
+from power_atlas.settings import Neo4jSettings
+
+_logger = logging.getLogger(__name__)
+
+SCHEMA_MIGRATION_LABEL = "SchemaMigration"
+_DISABLED_VALUES = frozenset({"0", "off", "none", "false"})
+
+SchemaObjectKind = Literal["key", "index"]
+
+
+@dataclass(frozen=True)
+class GraphSchemaMigrationEnvNames:
+    enabled: str = "POWER_ATLAS_SCHEMA_MIGRATIONS"
+
+
+DEFAULT_GRAPH_SCHEMA_MIGRATION_ENV_NAMES = GraphSchemaMigrationEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaObject:
+    """One index or key constraint on a node label.
+
+    ``kind="key"`` objects are created as node-key constraints where the server
+    supports them, falling back to uniqueness constraints and finally to a range
+    index; ``kind="index"`` objects are always plain range indexes.
+    """
+
+    name: str
+    label: str
+    properties: tuple[str, ...]
+    kind: SchemaObjectKind = "key"
+
+    def __post_init__(self) -> None:
+        validate_cypher_identifier(self.name, "schema object name")
+        validate_cypher_identifier(self.label, "node label")
+        if not self.properties:
+            raise ValueError(f"Schema object {self.name!r} needs at least one property")
+        for property_name in self.properties:
+            validate_cypher_identifier(property_name, "property name")
+
+    def _property_list(self) -> str:
+        return ", ".join(f"n.{property_name}" for property_name in self.properties)
+
+    def node_key_cypher(self) -> str:
+        return (
+            f"CREATE CONSTRAINT {self.name} IF NOT EXISTS "
+            f"FOR (n:{self.label}) REQUIRE ({self._property_list()}) IS NODE KEY"
+        )
+
+    def unique_cypher(self) -> str:
+        return (
+            f"CREATE CONSTRAINT {self.name} IF NOT EXISTS "
+            f"FOR (n:{self.label}) REQUIRE ({self._property_list()}) IS UNIQUE"
+        )
+
+    def range_index_cypher(self) -> str:
+        return (
+            f"CREATE INDEX {self.name} IF NOT EXISTS "
+            f"FOR (n:{self.label}) ON ({self._property_list()})"
+        )
+
+    def candidate_statements(self) -> tuple[tuple[str, str], ...]:
+        """Return ``(strategy, cypher)`` pairs in the order they are attempted."""
+        if self.kind == "index":
+            return (("range_index", self.range_index_cypher()),)
+        return (
+            ("node_key", self.node_key_cypher()),
+            ("unique", self.unique_cypher()),
+            ("range_index", self.range_index_cypher()),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaMigration:
+    version: int
+    name: str
+    objects: tuple[SchemaObject, ...]
+
+    @property
+    def checksum(self) -> str:
+        digest = hashlib.sha256()
+        for schema_object in self.objects:
+            for strategy, cypher in schema_object.candidate_statements():
+                digest.update(f"{strategy}\x1f{cypher}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+
+SCHEMA_MIGRATIONS: tuple[SchemaMigration, ...] = (
+    SchemaMigration(
+        version=1,
+        name="schema_migration_registry",
+        objects=(SchemaObject("schema_migration_version", SCHEMA_MIGRATION_LABEL, ("version",)),),
+    ),
+    SchemaMigration(
+        version=2,
+        name="run_scoped_merge_keys",
+        objects=(
+            SchemaObject("entity_mention_run_key", "EntityMention", ("mention_id", "run_id")),
+            SchemaObject("extracted_claim_run_key", "ExtractedClaim", ("claim_id", "run_id")),
+            SchemaObject("resolved_entity_cluster_key", "ResolvedEntityCluster", ("cluster_id",)),
+            SchemaObject("canonical_entity_run_key", "CanonicalEntity", ("entity_id", "run_id")),
+        ),
+    ),
+    SchemaMigration(
+        version=3,
+        name="chunk_scope_indexes",
+        objects=(
+            SchemaObject("chunk_run_id", "Chunk", ("run_id",), kind="index"),
+            SchemaObject("chunk_dataset_id", "Chunk", ("dataset_id",), kind="index"),
+        ),
+    ),
+    SchemaMigration(
+        version=4,
+        name="retrieval_generation_scope_key",
+        objects=(SchemaObject("retrieval_generation_scope", "RetrievalGeneration", ("scope",)),),
+    ),
+    SchemaMigration(
+        version=5,
+        name="run_stats_and_run_id_indexes",
+        objects=(
+            SchemaObject("run_stats_run_id", "RunStats", ("run_id",)),
+            SchemaObject("extracted_claim_run_id", "ExtractedClaim", ("run_id",), kind="index"),
+            SchemaObject("entity_mention_run_id", "EntityMention", ("run_id",), kind="index"),
+            SchemaObject("resolved_entity_cluster_run_id", "ResolvedEntityCluster", ("run_id",), kind="index"),
+        ),
+    ),
+    SchemaMigration(
+        version=6,
+        name="entity_mention_normalized_type_index",
+        objects=(
+            SchemaObject("entity_mention_normalized_type", "EntityMention", ("normalized_entity_type",), kind="index"),
+        ),
+    ),
+    SchemaMigration(
+        version=7,
+        name="run_registry",
+        objects=(
+            SchemaObject("run_registry_run_id", "Run", ("run_id",)),
+            SchemaObject("run_registry_scope", "Run", ("stage_prefix", "dataset_id"), kind="index"),
+        ),
+    ),
+    SchemaMigration(
+        version=8,
+        name="chunk_keyset_index",
+        objects=(SchemaObject("chunk_run_index", "Chunk", ("run_id", "chunk_index"), kind="index"),),
+    ),
+    SchemaMigration(
+        version=9,
+        name="run_registry_latest_lookup",
+        objects=(
+            SchemaObject("run_registry_latest", "Run", ("stage_prefix", "status", "run_id"), kind="index"),
+            SchemaObject(
+                "run_registry_dataset_latest",
+                "Run",
+                ("stage_prefix", "dataset_id", "status", "run_id"),
+                kind="index",
+            ),
+        ),
+    ),
+)
+
+
+@dataclass(slots=True)
+class SchemaMigrationReport:
+    applied: list[dict[str, Any]] = field(default_factory=list)
+    already_applied: list[int] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "applied": list(self.applied),
+            "already_applied": list(self.already_applied),
+            "warnings": list(self.warnings),
+        }
+
+
+def apply_schema_object(session: Any, schema_object: SchemaObject) -> tuple[str, list[str]]:
+    """Create *schema_object* using the strongest form the server accepts.
+
+    Returns the strategy that succeeded and the server messages of the
+    strategies that were rejected on the way.  Connection failures are not
+    caught; a rejected final fallback raises.
+    """
+    rejections: list[str] = []
+    *preferred, (last_strategy, last_cypher) = schema_object.candidate_statements()
+    for strategy, cypher in preferred:
+        try:
+            session.run(cypher).consume()
+        except neo4j.exceptions.Neo4jError as exc:
+            rejections.append(f"{strategy}: {exc.message or exc}")
+            continue
+        return strategy, rejections
+    session.run(last_cypher).consume()
+    return last_strategy, rejections
+
+
+def _applied_versions(session: Any) -> dict[int, str | None]:
+    result = session.run(
+        f"MATCH (m:{SCHEMA_MIGRATION_LABEL}) RETURN m.version AS version, m.checksum AS checksum"
+    )
+    return {int(record["version"]): record["checksum"] for record in result}
+
+
+def apply_schema_migrations(
+    driver: neo4j.Driver,
+    *,
+    database: str,
+    migrations: tuple[SchemaMigration, ...] = SCHEMA_MIGRATIONS,
+    now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+) -> SchemaMigrationReport:
+    """Apply the migrations in *migrations* that *database* has not recorded yet."""
+    report = SchemaMigrationReport()
+    with driver.session(database=database) as session:
+        recorded = _applied_versions(session)
+        for migration in sorted(migrations, key=lambda item: item.version):
+            if migration.version in recorded:
+                report.already_applied.append(migration.version)
+                recorded_checksum = recorded[migration.version]
+                if recorded_checksum not in (None, migration.checksum):
+                    report.warnings.append(
+                        f"Schema migration {migration.version} ({migration.name}) was applied with "
+                        "different statements; it is not re-applied automatically."
+                    )
+                continue
+            outcomes: dict[str, str] = {}
+            for schema_object in migration.objects:
+                strategy, rejections = apply_schema_object(session, schema_object)
+                outcomes[schema_object.name] = strategy
+                if strategy == "range_index" and schema_object.kind == "key":
+                    report.warnings.append(
+                        f"{schema_object.name}: could not create a key constraint on "
+                        f":{schema_object.label}({', '.join(schema_object.properties)}); "
+                        f"created a range index instead ({'; '.join(rejections)})"
+                    )
+            session.run(
+                f"MERGE (m:{SCHEMA_MIGRATION_LABEL} {{version: $version}}) "
+                "SET m.name = $name, m.checksum = $checksum, m.applied_at = $applied_at, "
+                "m.strategies = $strategies",
+                version=migration.version,
+                name=migration.name,
+                checksum=migration.checksum,
+                applied_at=now().isoformat(),
+                strategies=[f"{name}={strategy}" for name, strategy in outcomes.items()],
+            ).consume()
+            report.applied.append(
+                {"version": migration.version, "name": migration.name, "strategies": outcomes}
+            )
+    for warning in report.warnings:
+        _logger.warning("Graph schema: %s", warning)
+    return report
+
+
+def schema_migrations_enabled(
+    environ: Mapping[str, str] | None = None,
+    *,
+    env_names: GraphSchemaMigrationEnvNames | None = None,
+) -> bool:
+    env = os.environ if environ is None else environ
+    names = DEFAULT_GRAPH_SCHEMA_MIGRATION_ENV_NAMES if env_names is None else env_names
+    return env.get(names.enabled, "").strip().lower() not in _DISABLED_VALUES
+
+
+_ensured_databases: set[tuple[str, str]] = set()
+_ensured_lock = threading.Lock()
+
+
+def ensure_graph_schema(
+    neo4j_settings: Neo4jSettings,
+    *,
+    environ: Mapping[str, str] | None = None,
+    create_driver_fn: Callable[[Neo4jSettings], Any] = create_neo4j_driver,
+    apply_migrations_fn: Callable[..., SchemaMigrationReport] = apply_schema_migrations,
+) -> SchemaMigrationReport | None:
+    """Apply pending schema migrations once per process for this database.
+
+    Returns ``None`` when migrations are disabled, were already ensured in this
+    process, or could not be applied; failures are logged rather than raised so
+    that the stage itself reports any real connectivity problem.
+    """
+    if not schema_migrations_enabled(environ):
+        return None
+    cache_key = (neo4j_settings.uri, neo4j_settings.database)
+    with _ensured_lock:
+        if cache_key in _ensured_databases:
+            return None
+        try:
+            with create_driver_fn(neo4j_settings) as driver:
+                report = apply_migrations_fn(driver, database=neo4j_settings.database)
+        except (neo4j.exceptions.Neo4jError, neo4j.exceptions.DriverError) as exc:
+            _logger.warning(
+                "Graph schema migrations could not be applied to %s/%s: %s",
+                neo4j_settings.uri,
+                neo4j_settings.database,
+                exc,
+            )
+            return None
+        _ensured_databases.add(cache_key)
+    if report.applied:
+        _logger.info(
+            "Applied graph schema migrations %s to %s",
+            [entry["version"] for entry in report.applied],
+            neo4j_settings.database,
+        )
+    return report
+
+
+def ensure_graph_schema_request_context(request_context: Any) -> SchemaMigrationReport | None:
+    if request_context.config.dry_run:
+        return None
+    return ensure_graph_schema(request_context.settings.neo4j)
+
+
+def reset_ensured_graph_schema_cache() -> None:
+    with _ensured_lock:
+        _ensured_databases.clear()
+
+
+__all__ = [
+    "DEFAULT_GRAPH_SCHEMA_MIGRATION_ENV_NAMES",
+    "GraphSchemaMigrationEnvNames",
+    "SCHEMA_MIGRATIONS",
+    "SCHEMA_MIGRATION_LABEL",
+    "SchemaMigration",
+    "SchemaMigrationReport",
+    "SchemaObject",
+    "apply_schema_migrations",
+    "apply_schema_object",
+    "ensure_graph_schema",
+    "ensure_graph_schema_request_context",
+    "reset_ensured_graph_schema_cache",
+    "schema_migrations_enabled",
+]
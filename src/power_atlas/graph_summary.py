@@ -8,24 +8,21 @@ from power_atlas.bootstrap import build_settings, create_neo4j_driver
 from power_atlas.graph_status import DEFAULT_UNCONFIGURED_DETAIL
 from power_atlas.settings import AppSettings, Neo4jSettings
 
+# One label count per subquery so each is answered from the count store
+# instead of scanning the label.
 DEFAULT_GRAPH_SUMMARY_QUERY = """\
-OPTIONAL MATCH (document:Document)
-WITH count(document) AS document_count
-OPTIONAL MATCH (chunk:Chunk)
-WITH document_count, count(chunk) AS chunk_count
-OPTIONAL MATCH (claim:ExtractedClaim)
-WITH document_count, chunk_count, count(claim) AS claim_count
-OPTIONAL MATCH (mention:EntityMention)
-WITH document_count, chunk_count, claim_count, count(mention) AS mention_count
-OPTIONAL MATCH (cluster:ResolvedEntityCluster)
-WITH document_count, chunk_count, claim_count, mention_count, count(cluster) AS cluster_count
-OPTIONAL MATCH (canonical:CanonicalEntity)
+CALL { MATCH (document:Document) RETURN count(document) AS document_count }
+CALL { MATCH (chunk:Chunk) RETURN count(chunk) AS chunk_count }
+CALL { MATCH (claim:ExtractedClaim) RETURN count(claim) AS claim_count }
+CALL { MATCH (mention:EntityMention) RETURN count(mention) AS mention_count }
+CALL { MATCH (cluster:ResolvedEntityCluster) RETURN count(cluster) AS cluster_count }
+CALL { MATCH (canonical:CanonicalEntity) RETURN count(canonical) AS canonical_entity_count }
 RETURN document_count,
        chunk_count,
        claim_count,
        mention_count,
        cluster_count,
-       count(canonical) AS canonical_entity_count
+       canonical_entity_count
 """
 
 
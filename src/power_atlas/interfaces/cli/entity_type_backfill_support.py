@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+import os
+
+from power_atlas.bootstrap import AppBaseline
+from power_atlas.bootstrap import resolve_app_baseline
+from power_atlas.interfaces.cli.reset_demo_support import default_reset_cli_settings
+from power_atlas.neo4j_batch_writes import BatchWritePolicy
+
+
+def parse_entity_type_backfill_args(
+    argv: list[str] | None = None,
+    *,
+    app_baseline: AppBaseline | None = None,
+) -> argparse.Namespace:
+    resolved_baseline = resolve_app_baseline() if app_baseline is None else app_baseline
+    settings = default_reset_cli_settings(app_baseline=resolved_baseline)
+    parser = argparse.ArgumentParser(
+        description="Restamp EntityMention.normalized_entity_type under the current entity-type policy.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "Mentions without a policy-version stamp, or stamped by an older synonym\n"
+            "policy, are renormalized run by run and written back in batches.\n"
+            "Re-run after every change to the entity-type normalization policy."
+        ),
+    )
+    parser.add_argument(
+        "--run-id",
+        action="append",
+        default=[],
+        dest="run_ids",
+        help="only backfill this run (repeatable; default: every run with stale mentions)",
+    )
+    parser.add_argument("--batch-size", type=int, default=None, help="mentions written per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="count stale mentions without writing")
+    parser.add_argument("--neo4j-uri", default=settings.neo4j.uri)
+    parser.add_argument("--neo4j-username", default=settings.neo4j.username)
+    parser.add_argument(
+        "--neo4j-password",
+        default=os.getenv(resolved_baseline.env_names.neo4j_password),
+    )
+    parser.add_argument("--neo4j-database", default=settings.neo4j.database)
+    return parser.parse_args(argv)
+
+
+def entity_type_backfill_batch_policy_from_args(args: argparse.Namespace) -> BatchWritePolicy | None:
+    return None if args.batch_size is None else BatchWritePolicy(batch_size=args.batch_size)
+
+
+__all__ = [
+    "entity_type_backfill_batch_policy_from_args",
+    "parse_entity_type_backfill_args",
+]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+import os
+from pathlib import Path
+
+from power_atlas.bootstrap import AppBaseline
+from power_atlas.bootstrap import build_runtime_config, build_settings
+from power_atlas.bootstrap import resolve_app_baseline
+from power_atlas.orchestration.context_builder import (
+    build_request_context_from_config,
+)
+from power_atlas.pdf_batch_ingest import PdfBatchIngestSettings
+
+
+def default_pdf_batch_ingest_cli_settings(
+    *,
+    app_baseline: AppBaseline | None = None,
+):
+    resolved_baseline = resolve_app_baseline() if app_baseline is None else app_baseline
+    return build_settings(app_baseline=resolved_baseline)
+
+
+def build_pdf_batch_ingest_cli_request_context(
+    args: argparse.Namespace,
+    *,
+    app_baseline: AppBaseline | None = None,
+):
+    base_settings = default_pdf_batch_ingest_cli_settings(app_baseline=app_baseline)
+    settings = replace(
+        base_settings,
+        neo4j=replace(
+            base_settings.neo4j,
+            uri=args.neo4j_uri,
+            username=args.neo4j_username,
+            password=args.neo4j_password,
+            database=args.neo4j_database,
+        ),
+        output_dir=args.output_dir,
+    )
+    config = build_runtime_config(settings, dry_run=not args.live, output_dir=args.output_dir)
+    return build_request_context_from_config(
+        config,
+        command="ingest-pdf-batch",
+        run_id=args.run_id,
+    )
+
+
+def pdf_batch_ingest_settings_from_args(args: argparse.Namespace) -> PdfBatchIngestSettings:
+    env_settings = PdfBatchIngestSettings.from_env()
+    return PdfBatchIngestSettings(
+        parse_workers=args.workers if args.workers is not None else env_settings.parse_workers,
+        max_concurrency=(
+            args.max_concurrency if args.max_concurrency is not None else env_settings.max_concurrency
+        ),
+    )
+
+
+def parse_pdf_batch_ingest_args(
+    argv: list[str] | None = None,
+    *,
+    default_output_dir: Path,
+    doc_epilog: str | None,
+    app_baseline: AppBaseline | None = None,
+) -> argparse.Namespace:
+    resolved_baseline = resolve_app_baseline() if app_baseline is None else app_baseline
+    package_settings = default_pdf_batch_ingest_cli_settings(app_baseline=resolved_baseline)
+    parser = argparse.ArgumentParser(
+        description=(
+            "Ingest a directory or manifest of PDFs in one run: parse in a process pool, "
+            "embed and write with bounded concurrency, and write a single batch manifest."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=doc_epilog,
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pdf-dir", type=Path, default=None, help="Directory whose *.pdf files are ingested.")
+    source.add_argument(
+        "--pdf-manifest",
+        type=Path,
+        default=None,
+        help=(
+            "Dataset manifest.json (provenance entries of kind 'pdf') or a text file "
+            "with one PDF path per line; relative paths resolve against the manifest."
+        ),
+    )
+    parser.add_argument(
+        "--dataset-id",
+        default=None,
+        help="Dataset id stamped on documents and chunks (default: the manifest's dataset, else the directory name).",
+    )
+    parser.add_argument("--run-id", default=None, help="Run id shared by every document in the batch.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="PDF parse worker processes (default: $POWER_ATLAS_PDF_BATCH_PARSE_WORKERS or min(4, CPUs)).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Documents embedded and written at once (default: $POWER_ATLAS_PDF_BATCH_CONCURRENCY or 2).",
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Ingest into Neo4j.  Without it, only resolve the batch and write a dry-run manifest.",
+    )
+    parser.add_argument(
+        "--neo4j-uri",
+        default=package_settings.neo4j.uri,
+        help="Neo4j bolt URI (default: $NEO4J_URI or bolt://localhost:7687).",
+    )
+    parser.add_argument(
+        "--neo4j-username",
+        default=package_settings.neo4j.username,
+        help="Neo4j username (default: $NEO4J_USERNAME or 'neo4j').",
+    )
+    parser.add_argument(
+        "--neo4j-password",
+        default=os.getenv(resolved_baseline.env_names.neo4j_password, ""),
+        help="Neo4j password (default: $NEO4J_PASSWORD).",
+    )
+    parser.add_argument(
+        "--neo4j-database",
+        default=package_settings.neo4j.database,
+        help="Neo4j database name (default: $NEO4J_DATABASE or 'neo4j').",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=default_output_dir,
+        help=(
+            "Base output directory (default: pipelines/).  The manifest is written to "
+            "<output_dir>/runs/<run_id>/pdf_ingest/batch_manifest.json."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+__all__ = [
+    "build_pdf_batch_ingest_cli_request_context",
+    "default_pdf_batch_ingest_cli_settings",
+    "parse_pdf_batch_ingest_args",
+    "pdf_batch_ingest_settings_from_args",
+]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from power_atlas.orchestration.cli_dispatch import reset_scope_kwargs, reset_throughput_text
+
 
 def run_reset_demo_main(
     *,
@@ -28,6 +30,7 @@ def run_reset_demo_main(
             database=args.neo4j_database,
             output_dir=args.output_dir,
             pipeline_contract=app_context.pipeline_contract,
+            **reset_scope_kwargs(args),
         )
 
     emit(
@@ -37,6 +40,8 @@ def run_reset_demo_main(
         f"relationships_deleted={report['deleted_relationships']} "
         f"indexes_dropped={report['indexes_dropped']}"
     )
+    if report.get("batches") is not None:
+        emit(reset_throughput_text(report))
     if report.get("warnings"):
         for warning in report["warnings"]:
             emit(f"  warning: {warning}")
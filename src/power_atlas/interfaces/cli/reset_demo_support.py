@@ -52,6 +52,7 @@ def parse_reset_demo_args(
         epilog=(
             f"Deletes all nodes with demo-owned labels ({', '.join(demo_node_labels)})\n"
             f"and drops the following indexes: {', '.join(demo_owned_indexes_resolver(app_context.pipeline_contract))}.\n"
+            "Pass --run-id or --dataset-id to delete a single scope instead.\n"
             "Run only against a dedicated demo database to avoid data loss."
         ),
     )
@@ -69,6 +70,26 @@ def parse_reset_demo_args(
         default=default_output_dir,
         help="Directory for the reset report JSON (default: demo/artifacts)",
     )
+    scope_group = parser.add_mutually_exclusive_group()
+    scope_group.add_argument(
+        "--run-id",
+        default=None,
+        dest="reset_run_id",
+        help="Delete only nodes written by this run; indexes are kept",
+    )
+    scope_group.add_argument(
+        "--dataset-id",
+        default=None,
+        dest="reset_dataset_id",
+        help="Delete only this dataset and the runs that wrote it; indexes are kept",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        dest="reset_batch_size",
+        help="Nodes deleted per transaction (default: POWER_ATLAS_RESET_BATCH_SIZE or 10000)",
+    )
     return parser.parse_args(argv)
 
 
@@ -8,6 +8,7 @@ from typing import Any
 
 from power_atlas.context import RequestContext
 from power_atlas.orchestration.ask_scope import (
+    apply_ask_scope_strategy,
     resolve_ask_request_context as resolve_ask_request_context_impl,
     resolve_ask_scope as resolve_ask_scope_impl,
     resolve_ask_source_uri as resolve_ask_source_uri_impl,
@@ -21,6 +22,7 @@ from power_atlas.orchestration.ask_scope import (
 )
 from power_atlas.orchestration.run_scope_bridge import prepare_ask_request_context_from_scope
 from power_atlas.reset_demo_runtime import run_reset as run_reset_demo
+from power_atlas.retrieval_scoped_search import resolve_retrieval_scope_strategy
 
 
 def load_demo_reset_runner() -> Callable[..., Any]:
@@ -213,6 +215,10 @@ def prepare_run_demo_ask_request_context(
     resolve_ask_source_uri: Callable[[RequestContext], str | None],
 ) -> RequestContext:
     resolved_run_id, all_runs = resolve_ask_scope(args, request_context)
+    request_context = apply_ask_scope_strategy(
+        request_context,
+        resolve_retrieval_scope_strategy(getattr(args, "scope_strategy", None)),
+    )
     return prepare_ask_request_context_from_scope(
         request_context,
         resolved_run_id=resolved_run_id,
@@ -364,7 +370,14 @@ def build_run_demo_main_dispatch_kwargs(
     format_scope_label: Callable[..., str],
     resolve_create_driver: Callable[[], Callable[..., Any]],
     resolve_load_reset_runner: Callable[[], Callable[..., Any]],
+    resolve_ensure_graph_schema: Callable[[], Callable[..., Any]] | None = None,
+    resolve_run_batch_qa_request_context: Callable[[], Callable[..., Any]] | None = None,
 ) -> dict[str, Any]:
+    optional_kwargs: dict[str, Any] = {}
+    if resolve_ensure_graph_schema is not None:
+        optional_kwargs["resolve_ensure_graph_schema"] = resolve_ensure_graph_schema
+    if resolve_run_batch_qa_request_context is not None:
+        optional_kwargs["resolve_run_batch_qa_request_context"] = resolve_run_batch_qa_request_context
     return build_demo_cli_dispatch_kwargs(
         build_request_context_from_args=build_request_context_from_args,
         lint_and_clean_structured_csvs=lint_and_clean_structured_csvs,
@@ -377,6 +390,7 @@ def build_run_demo_main_dispatch_kwargs(
         format_scope_label=format_scope_label,
         resolve_create_driver=resolve_create_driver,
         resolve_load_reset_runner=resolve_load_reset_runner,
+        **optional_kwargs,
     )
 
 
@@ -396,6 +410,8 @@ def run_demo_main(
     format_scope_label: Callable[..., str],
     resolve_create_driver: Callable[[], Callable[..., Any]],
     resolve_load_reset_runner: Callable[[], Callable[..., Any]],
+    resolve_ensure_graph_schema: Callable[[], Callable[..., Any]] | None = None,
+    resolve_run_batch_qa_request_context: Callable[[], Callable[..., Any]] | None = None,
     emit: Callable[[str], None] = print,
 ) -> None:
     args = parse_args()
@@ -416,6 +432,8 @@ def run_demo_main(
                 format_scope_label=format_scope_label,
                 resolve_create_driver=resolve_create_driver,
                 resolve_load_reset_runner=resolve_load_reset_runner,
+                resolve_ensure_graph_schema=resolve_ensure_graph_schema,
+                resolve_run_batch_qa_request_context=resolve_run_batch_qa_request_context,
             ),
         )
     except SystemExit:
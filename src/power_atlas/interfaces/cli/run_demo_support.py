@@ -15,6 +15,7 @@ from power_atlas.context import RequestContext
 from power_atlas.orchestration.context_builder import (
     build_request_context_from_config as _build_request_context_from_config,
 )
+from power_atlas.retrieval_scoped_search import RETRIEVAL_SCOPE_STRATEGIES
 
 from power_atlas.contracts import ARTIFACTS_DIR, Config
 
@@ -101,6 +102,7 @@ def build_config_from_args(
         output_dir=args.output_dir,
         question=getattr(args, "question", None),
         resolution_mode=getattr(args, "resolution_mode", None) or "unstructured_only",
+        resume_claim_extraction=getattr(args, "resume", False),
     )
     if not args.dry_run and config.settings.neo4j.password in ("", "CHANGE_ME_BEFORE_USE"):
         raise SystemExit("Set NEO4J_PASSWORD or pass --neo4j-password when using --live")
@@ -126,6 +128,7 @@ def build_request_context_from_args(
         output_dir=args.output_dir,
         question=getattr(args, "question", None),
         resolution_mode=getattr(args, "resolution_mode", None) or "unstructured_only",
+        resume_claim_extraction=getattr(args, "resume", False),
         run_id=run_id,
         all_runs=all_runs,
         source_uri=source_uri,
@@ -182,6 +185,31 @@ def parse_args(
                 default=False,
                 help="Start an interactive REPL-style Q&A session with message history",
             )
+            subparsers.choices[command].add_argument(
+                "--questions-file",
+                type=Path,
+                default=None,
+                dest="questions_file",
+                metavar="JSONL",
+                help=(
+                    "Answer every question in a JSONL file ({\"question\": ..., \"id\": ...} per line) "
+                    "over one shared retrieval session; requires --live"
+                ),
+            )
+            subparsers.choices[command].add_argument(
+                "--batch-output",
+                type=Path,
+                default=None,
+                dest="batch_output",
+                help="JSONL path for batch answers (default: <output-dir>/batch_qa/batch_qa_<timestamp>.jsonl)",
+            )
+            subparsers.choices[command].add_argument(
+                "--batch-concurrency",
+                type=int,
+                default=None,
+                dest="batch_concurrency",
+                help="Questions answered concurrently (default: POWER_ATLAS_BATCH_QA_CONCURRENCY or 4)",
+            )
             scope_group = subparsers.choices[command].add_mutually_exclusive_group()
             scope_group.add_argument(
                 "--run-id",
@@ -227,6 +255,18 @@ def parse_args(
                     "chunk. Use --cluster-aware for the full post-hybrid enrichment path."
                 ),
             )
+            subparsers.choices[command].add_argument(
+                "--scope-strategy",
+                default=None,
+                dest="scope_strategy",
+                choices=list(RETRIEVAL_SCOPE_STRATEGIES),
+                help=(
+                    "How run/source scoping meets the vector index: 'post_filter' filters the "
+                    "global top-k, 'over_fetch' widens the ANN candidate pool until top-k in-scope "
+                    "chunks survive, 'exact' ranks only the in-scope chunks "
+                    "(default: POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY or the retrieval policy's)"
+                ),
+            )
             subparsers.choices[command].add_argument(
                 "--debug",
                 action="store_true",
@@ -257,6 +297,39 @@ def parse_args(
                 default=False,
                 help="Required safety flag; without it the command prints instructions only",
             )
+            reset_scope_group = subparsers.choices[command].add_mutually_exclusive_group()
+            reset_scope_group.add_argument(
+                "--run-id",
+                default=None,
+                dest="reset_run_id",
+                metavar="RUN_ID",
+                help="Delete only nodes written by this run; indexes are kept",
+            )
+            reset_scope_group.add_argument(
+                "--dataset-id",
+                default=None,
+                dest="reset_dataset_id",
+                metavar="DATASET_ID",
+                help="Delete only this dataset and the runs that wrote it; indexes are kept",
+            )
+            subparsers.choices[command].add_argument(
+                "--batch-size",
+                type=int,
+                default=None,
+                dest="reset_batch_size",
+                help="Nodes deleted per transaction (default: POWER_ATLAS_RESET_BATCH_SIZE or 10000)",
+            )
+        if command == "extract-claims":
+            subparsers.choices[command].add_argument(
+                "--resume",
+                action="store_true",
+                default=False,
+                dest="resume",
+                help=(
+                    "Resume an interrupted extraction of the same run: chunks and write batches "
+                    "recorded in runs/<run_id>/claim_extraction/claim_extraction_journal.jsonl are skipped"
+                ),
+            )
         if command == "resolve-entities":
             subparsers.choices[command].add_argument(
                 "--resolution-mode",
@@ -281,9 +354,16 @@ def parse_args(
         "--neo4j-password",
         "--neo4j-database",
         "--openai-model",
+        "--dataset",
         "--question",
+        "--questions-file",
+        "--batch-output",
+        "--batch-concurrency",
         "--run-id",
+        "--dataset-id",
+        "--batch-size",
         "--resolution-mode",
+        "--scope-strategy",
     }
     saw_dry_run_flag = False
     saw_live_flag = False
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from power_atlas.bootstrap import AppBaseline
+from power_atlas.bootstrap import resolve_app_baseline
+from power_atlas.interfaces.cli.reset_demo_support import default_reset_cli_settings
+from power_atlas.reset_demo_runtime import DemoResetSettings
+from power_atlas.run_retention import RunRetentionPolicy
+
+
+def parse_run_retention_args(
+    argv: list[str] | None = None,
+    *,
+    default_output_dir: Path,
+    app_baseline: AppBaseline | None = None,
+) -> argparse.Namespace:
+    resolved_baseline = resolve_app_baseline() if app_baseline is None else app_baseline
+    settings = default_reset_cli_settings(app_baseline=resolved_baseline)
+    parser = argparse.ArgumentParser(
+        description="Prune superseded pipeline runs from Neo4j and the run artifacts directory.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "Runs are grouped by dataset and run-id stage prefix (e.g. unstructured_ingest).\n"
+            "A run is kept if any of --keep-latest / --max-age-days keeps it.\n"
+            "Without --confirm nothing is deleted; a dry-run report of the bytes and\n"
+            "nodes that would be reclaimed is written to <output-dir>/retention_reports."
+        ),
+    )
+    parser.add_argument("--keep-latest", type=int, default=None, help="keep the newest N runs per group")
+    parser.add_argument("--max-age-days", type=float, default=None, help="keep runs younger than this")
+    parser.add_argument("--dataset-id", default=None, help="only consider runs of this dataset")
+    parser.add_argument("--stage-prefix", default=None, help="only consider runs with this stage prefix")
+    parser.add_argument(
+        "--protect-run-id",
+        action="append",
+        default=[],
+        dest="protected_run_ids",
+        help="never prune this run (repeatable)",
+    )
+    parser.add_argument("--confirm", action="store_true", help="delete the pruned runs (default: dry run)")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Nodes deleted per transaction (default: POWER_ATLAS_RESET_BATCH_SIZE or 10000)",
+    )
+    parser.add_argument("--neo4j-uri", default=settings.neo4j.uri)
+    parser.add_argument("--neo4j-username", default=settings.neo4j.username)
+    parser.add_argument(
+        "--neo4j-password",
+        default=os.getenv(resolved_baseline.env_names.neo4j_password),
+    )
+    parser.add_argument("--neo4j-database", default=settings.neo4j.database)
+    parser.add_argument("--output-dir", type=Path, default=default_output_dir)
+    args = parser.parse_args(argv)
+    if args.keep_latest is None and args.max_age_days is None:
+        parser.error("pass --keep-latest and/or --max-age-days")
+    return args
+
+
+def run_retention_policy_from_args(args: argparse.Namespace) -> RunRetentionPolicy:
+    return RunRetentionPolicy(
+        keep_latest=args.keep_latest,
+        max_age_days=args.max_age_days,
+        dataset_id=args.dataset_id,
+        stage_prefix=args.stage_prefix,
+        protected_run_ids=frozenset(args.protected_run_ids),
+    )
+
+
+def run_retention_reset_settings_from_args(args: argparse.Namespace) -> DemoResetSettings | None:
+    return None if args.batch_size is None else DemoResetSettings(batch_size=args.batch_size)
+
+
+__all__ = [
+    "parse_run_retention_args",
+    "run_retention_policy_from_args",
+    "run_retention_reset_settings_from_args",
+]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import os
+
+from power_atlas.bootstrap import AppBaseline
+from power_atlas.bootstrap import resolve_app_baseline
+from power_atlas.interfaces.cli.reset_demo_support import default_reset_cli_settings
+
+
+def parse_run_stats_args(
+    argv: list[str] | None = None,
+    *,
+    app_baseline: AppBaseline | None = None,
+) -> argparse.Namespace:
+    resolved_baseline = resolve_app_baseline() if app_baseline is None else app_baseline
+    settings = default_reset_cli_settings(app_baseline=resolved_baseline)
+    parser = argparse.ArgumentParser(
+        description="Show or rebuild the materialized per-run RunStats nodes.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "Without --recompute the stored RunStats of each --run-id are printed.\n"
+            "With --recompute every section is recounted from the run's nodes, drift\n"
+            "from the stored figures is reported and the nodes are rewritten\n"
+            "(all runs unless --run-id is given; nothing is written with --dry-run)."
+        ),
+    )
+    parser.add_argument(
+        "--run-id",
+        action="append",
+        default=[],
+        dest="run_ids",
+        help="run to show or recompute (repeatable)",
+    )
+    parser.add_argument("--recompute", action="store_true", help="rebuild RunStats from full scans")
+    parser.add_argument("--dry-run", action="store_true", help="with --recompute, report drift without writing")
+    parser.add_argument("--neo4j-uri", default=settings.neo4j.uri)
+    parser.add_argument("--neo4j-username", default=settings.neo4j.username)
+    parser.add_argument(
+        "--neo4j-password",
+        default=os.getenv(resolved_baseline.env_names.neo4j_password),
+    )
+    parser.add_argument("--neo4j-database", default=settings.neo4j.database)
+    args = parser.parse_args(argv)
+    if not args.recompute and not args.run_ids:
+        parser.error("pass --run-id and/or --recompute")
+    if args.dry_run and not args.recompute:
+        parser.error("--dry-run only applies to --recompute")
+    return args
+
+
+__all__ = ["parse_run_stats_args"]
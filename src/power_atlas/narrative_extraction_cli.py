@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from power_atlas.bootstrap import AppBaseline
 from power_atlas.bootstrap import build_app_context
@@ -23,6 +24,8 @@ from power_atlas.narrative_extraction_readers import (
 )
 from power_atlas.narrative_extraction_runtime import run_narrative_extraction_live
 from power_atlas.narrative_extraction_service import run_narrative_extraction_stage
+from power_atlas.retrieval_result_cache import bump_retrieval_generation
+from power_atlas.run_stats import refresh_run_stats
 from power_atlas.settings import AppSettings
 from power_atlas.adapters.graphrag_types import LexicalGraphConfig
 
@@ -35,6 +38,26 @@ def resolve_narrative_prompt_version(
     return resolved_baseline.prompt_defaults.prompt_ids["narrative_extraction"]
 
 
+def _write_extracted_rows_and_refresh_run_state(
+    driver: Any,
+    *,
+    neo4j_database: str,
+    lexical_graph_config: LexicalGraphConfig,
+    claim_rows: list[dict[str, Any]],
+    mention_rows: list[dict[str, Any]],
+) -> None:
+    write_extracted_rows(
+        driver,
+        neo4j_database=neo4j_database,
+        lexical_graph_config=lexical_graph_config,
+        claim_rows=claim_rows,
+        mention_rows=mention_rows,
+    )
+    run_ids = [row.get("run_id") for row in (*claim_rows, *mention_rows)]
+    refresh_run_stats(driver, run_ids=run_ids, sections=("extraction",), neo4j_database=neo4j_database)
+    bump_retrieval_generation(driver, run_ids=run_ids, neo4j_database=neo4j_database)
+
+
 PROMPT_VERSION = resolve_narrative_prompt_version()
 DEFAULT_OUTPUT_ROOT = Path(__file__).resolve().parents[2] / "demo" / "runs"
 DEFAULT_NEO4J_PASSWORD = "CHANGE_ME_BEFORE_USE"
@@ -89,7 +112,7 @@ def run_narrative_extraction(
         run_narrative_extraction_live=run_narrative_extraction_live,
         read_chunks_and_extract=_read_chunks_and_extract,
         prepare_rows=prepare_extracted_rows,
-        write_rows=write_extracted_rows,
+        write_rows=_write_extracted_rows_and_refresh_run_state,
     )
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from power_atlas.adapters.graphrag_components import LLMEntityRelationExtractor
@@ -12,7 +13,7 @@ from power_atlas.adapters.graphrag_types import (
 
 from power_atlas.adapters.llm import build_llm as build_openai_llm
 from power_atlas.contracts import claim_extraction_schema
-from power_atlas.neo4j_io import RunScopedNeo4jChunkReader
+from power_atlas.neo4j_io import DEFAULT_CHUNK_PAGE_SIZE, RunScopedNeo4jChunkReader
 
 
 async def read_chunks_and_extract_narrative_graph(
@@ -23,7 +24,13 @@ async def read_chunks_and_extract_narrative_graph(
     neo4j_database: str | None,
     model_name: str,
     lexical_graph_config: LexicalGraphConfig,
+    chunk_page_size: int = DEFAULT_CHUNK_PAGE_SIZE,
 ) -> tuple[Neo4jGraph, list[TextChunk]]:
+    """Extract the run's chunks page by page, reading the next page while the current one is extracted.
+
+    At most one page is in the extractor at a time, so its own concurrency
+    limit still bounds the LLM requests in flight.
+    """
     chunk_reader = RunScopedNeo4jChunkReader(
         driver,
         run_id=run_id,
@@ -31,24 +38,41 @@ async def read_chunks_and_extract_narrative_graph(
         fetch_embeddings=False,
         neo4j_database=neo4j_database,
     )
-    text_chunks: TextChunks = await chunk_reader.run(
-        lexical_graph_config=lexical_graph_config
-    )
     llm = build_openai_llm(model_name)
     extractor = LLMEntityRelationExtractor(
         llm=llm,
         create_lexical_graph=False,
         use_structured_output=True,
     )
+    schema = claim_extraction_schema()
+    chunks: list[TextChunk] = []
+    page_graphs: list[Neo4jGraph] = []
+    pending: asyncio.Task[Neo4jGraph] | None = None
     try:
-        graph = await extractor.run(
-            chunks=text_chunks,
-            schema=claim_extraction_schema(),
-            lexical_graph_config=lexical_graph_config,
-        )
+        async for page in chunk_reader.iter_pages(lexical_graph_config, page_size=chunk_page_size):
+            if pending is not None:
+                page_graphs.append(await pending)
+            pending = asyncio.ensure_future(
+                extractor.run(
+                    chunks=TextChunks(chunks=page),
+                    schema=schema,
+                    lexical_graph_config=lexical_graph_config,
+                )
+            )
+            chunks.extend(page)
+        if pending is not None:
+            page_graphs.append(await pending)
+            pending = None
     finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
         await llm.async_client.close()
-    return graph, text_chunks.chunks
+    graph = Neo4jGraph(
+        nodes=[node for page_graph in page_graphs for node in page_graph.nodes],
+        relationships=[relationship for page_graph in page_graphs for relationship in page_graph.relationships],
+    )
+    return graph, chunks
 
 
 __all__ = ["read_chunks_and_extract_narrative_graph"]
\ No newline at end of file
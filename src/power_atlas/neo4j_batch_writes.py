@@ -0,0 +1,192 @@
+"""Chunked, concurrent ``UNWIND $rows`` writes with per-batch timing.
+
+Graph writes that previously sent every row in a single ``UNWIND $rows``
+transaction go through :func:`run_batched_write` instead.  Rows are split into
+batches of ``BatchWritePolicy.batch_size``; batches are written by a bounded
+thread pool sharing the caller's driver.  Each batch is one
+``driver.execute_query`` call, which runs in a managed write transaction that
+the driver itself retries on transient failures (deadlocks, leader switches,
+dropped connections) for up to its ``max_transaction_retry_time``.  There is
+deliberately no second retry loop on top of that.
+
+The stage defaults come from :meth:`BatchWritePolicy.from_env`
+(``POWER_ATLAS_GRAPH_WRITE_BATCH_SIZE`` and
+``POWER_ATLAS_GRAPH_WRITE_MAX_WORKERS``).
+
+Rows that would contend for the same node locks (for example all members of one
+cluster, which ``MERGE`` the same cluster node) can be kept in a single batch by
+passing ``conflict_key``; batches never share a key value, so concurrently
+running batches never ``MERGE`` the same node.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_WRITE_BATCH_SIZE = 5_000
+DEFAULT_WRITE_MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class BatchWriteEnvNames:
+    batch_size: str = "POWER_ATLAS_GRAPH_WRITE_BATCH_SIZE"
+    max_workers: str = "POWER_ATLAS_GRAPH_WRITE_MAX_WORKERS"
+
+
+DEFAULT_BATCH_WRITE_ENV_NAMES = BatchWriteEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class BatchWritePolicy:
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE
+    max_workers: int = DEFAULT_WRITE_MAX_WORKERS
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: BatchWriteEnvNames | None = None,
+    ) -> "BatchWritePolicy":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_BATCH_WRITE_ENV_NAMES if env_names is None else env_names
+        return cls(
+            batch_size=int(env.get(names.batch_size, DEFAULT_WRITE_BATCH_SIZE)),
+            max_workers=int(env.get(names.max_workers, DEFAULT_WRITE_MAX_WORKERS)),
+        )
+
+
+DEFAULT_BATCH_WRITE_POLICY = BatchWritePolicy()
+
+
+@dataclass(frozen=True, slots=True)
+class BatchWriteStats:
+    """Timing counters for one batched write, as recorded in run summaries."""
+
+    name: str
+    rows: int
+    batches: int
+    batch_size: int
+    max_workers: int
+    elapsed_seconds: float
+    batch_seconds: tuple[float, ...]
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "batches": self.batches,
+            "batch_size": self.batch_size,
+            "max_workers": self.max_workers,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "max_batch_seconds": round(max(self.batch_seconds, default=0.0), 4),
+            "batch_seconds": [round(seconds, 4) for seconds in self.batch_seconds],
+        }
+
+
+def partition_rows(
+    rows: list[dict[str, Any]],
+    *,
+    batch_size: int,
+    conflict_key: Callable[[dict[str, Any]], Hashable] | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Split *rows* into batches of at most *batch_size* rows, preserving order.
+
+    With *conflict_key*, rows sharing a key are kept together in one batch (a
+    group larger than *batch_size* becomes a single oversized batch), so no two
+    batches touch the same key.
+    """
+    if conflict_key is None:
+        return [rows[start:start + batch_size] for start in range(0, len(rows), batch_size)]
+
+    groups: dict[Hashable, list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(conflict_key(row), []).append(row)
+
+    batches: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    for group in groups.values():
+        if current and len(current) + len(group) > batch_size:
+            batches.append(current)
+            current = []
+        current.extend(group)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def run_batched_write(
+    driver: Any,
+    query: str,
+    *,
+    name: str,
+    rows: list[dict[str, Any]],
+    parameters: dict[str, Any],
+    neo4j_database: str | None,
+    policy: BatchWritePolicy | None = None,
+    conflict_key: Callable[[dict[str, Any]], Hashable] | None = None,
+) -> BatchWriteStats:
+    """Write *rows* through *query* (which must ``UNWIND $rows``) in batches.
+
+    *parameters* holds the query parameters shared by every batch; ``rows`` is
+    filled in per batch.  A batch that still fails once the driver has given up
+    retrying re-raises its error after in-flight batches have finished.
+    """
+    resolved_policy = DEFAULT_BATCH_WRITE_POLICY if policy is None else policy
+    batches = partition_rows(
+        rows,
+        batch_size=resolved_policy.batch_size,
+        conflict_key=conflict_key,
+    )
+
+    def _write_batch(batch: list[dict[str, Any]]) -> float:
+        started = time.perf_counter()
+        driver.execute_query(
+            query,
+            parameters_={**parameters, "rows": batch},
+            database_=neo4j_database,
+        )
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    workers = min(resolved_policy.max_workers, len(batches))
+    if workers <= 1:
+        batch_seconds = [_write_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch_seconds = list(executor.map(_write_batch, batches))
+    elapsed = time.perf_counter() - started
+
+    return BatchWriteStats(
+        name=name,
+        rows=len(rows),
+        batches=len(batches),
+        batch_size=resolved_policy.batch_size,
+        max_workers=max(workers, 1),
+        elapsed_seconds=elapsed,
+        batch_seconds=tuple(batch_seconds),
+    )
+
+
+__all__ = [
+    "BatchWriteEnvNames",
+    "BatchWritePolicy",
+    "BatchWriteStats",
+    "DEFAULT_BATCH_WRITE_ENV_NAMES",
+    "DEFAULT_BATCH_WRITE_POLICY",
+    "DEFAULT_WRITE_BATCH_SIZE",
+    "DEFAULT_WRITE_MAX_WORKERS",
+    "partition_rows",
+    "run_batched_write",
+]
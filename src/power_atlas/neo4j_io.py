@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 from power_atlas.adapters.graphrag_components import (
@@ -21,6 +23,8 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     import neo4j
 
+DEFAULT_CHUNK_PAGE_SIZE = 200
+
 
 def validate_cypher_identifier(value: str, kind: str) -> str:
     if not isinstance(value, str):
@@ -60,30 +64,96 @@ class RunScopedNeo4jChunkReader(Neo4jChunkReader):
     def validate_identifier(value: str, kind: str) -> str:
         return validate_cypher_identifier(value, kind)
 
-    def _get_query(
-        self,
-        chunk_label: str,
-        index_property: str,
-        embedding_property: str,
-    ) -> str:
-        safe_chunk_label = validate_cypher_identifier(chunk_label, "chunk_label")
+    def _filters(self) -> list[str]:
         filters = ["c.run_id = $run_id"]
         if self.source_uri is not None:
             filters.append("c.source_uri = $source_uri")
         if self.corpus is not None:
             filters.append("c.corpus = $corpus")
+        return filters
 
+    def _params(self) -> dict[str, Any]:
+        params: dict[str, Any] = {"run_id": self.run_id}
+        if self.source_uri is not None:
+            params["source_uri"] = self.source_uri
+        if self.corpus is not None:
+            params["corpus"] = self.corpus
+        return params
+
+    def _return_clause(self, embedding_property: str) -> str:
         return_properties = [".*"]
         if not self.fetch_embeddings:
             safe_embedding_property = validate_cypher_identifier(embedding_property, "embedding_property")
             return_properties.append(f"{safe_embedding_property}: null")
+        return f"RETURN c {{ {', '.join(return_properties)} }} as chunk "
 
-        query = f"MATCH (c:`{safe_chunk_label}`)\nWHERE {' AND '.join(filters)}\nRETURN c {{ {', '.join(return_properties)} }} as chunk "
+    def _get_query(
+        self,
+        chunk_label: str,
+        index_property: str,
+        embedding_property: str,
+    ) -> str:
+        safe_chunk_label = validate_cypher_identifier(chunk_label, "chunk_label")
+        query = (
+            f"MATCH (c:`{safe_chunk_label}`)\nWHERE {' AND '.join(self._filters())}\n"
+            f"{self._return_clause(embedding_property)}"
+        )
         if index_property:
             safe_index_property = validate_cypher_identifier(index_property, "index_property")
             query += f"ORDER BY c.{safe_index_property}"
         return query
 
+    def _get_page_query(
+        self,
+        chunk_label: str,
+        index_property: str,
+        embedding_property: str,
+        *,
+        position: str,
+    ) -> str:
+        """Return a keyset-page query; *position* is ``first``, ``after``, ``at`` or ``unindexed``.
+
+        ``unindexed`` reads, in one query, the chunks without an index value,
+        which keyset pagination cannot reach.
+        """
+        safe_chunk_label = validate_cypher_identifier(chunk_label, "chunk_label")
+        safe_index_property = validate_cypher_identifier(index_property, "index_property")
+        index_filter = {
+            "first": f"c.{safe_index_property} IS NOT NULL",
+            "after": f"c.{safe_index_property} > $after_index",
+            "at": f"c.{safe_index_property} = $at_index",
+            "unindexed": f"c.{safe_index_property} IS NULL",
+        }[position]
+        query = (
+            f"MATCH (c:`{safe_chunk_label}`)\nWHERE {' AND '.join([*self._filters(), index_filter])}\n"
+            f"{self._return_clause(embedding_property)}"
+        )
+        if position in ("first", "after"):
+            query += f"ORDER BY c.{safe_index_property} LIMIT $page_size"
+        return query
+
+    @staticmethod
+    def _record_to_chunk(record: Any, lexical_graph_config: LexicalGraphConfig) -> TextChunk:
+        chunk = record.get("chunk")
+        input_data = {
+            "text": chunk.pop(lexical_graph_config.chunk_text_property, ""),
+            "index": chunk.pop(lexical_graph_config.chunk_index_property, -1),
+        }
+        if (uid := chunk.pop(lexical_graph_config.chunk_id_property, None)) is not None:
+            input_data["uid"] = uid
+        input_data["metadata"] = chunk
+        return TextChunk(**input_data)
+
+    def _raise_no_chunks(self) -> None:
+        message = "No chunks returned for run-scoped query"
+        details = {
+            "run_id": self.run_id,
+            "source_uri": self.source_uri,
+            "corpus": self.corpus,
+        }
+        logger.warning("%s: %r", message, details)
+        raise ValueError(f"{message}: {details}")
+
     @validate_call
     async def run(
         self,
@@ -96,42 +166,93 @@ class RunScopedNeo4jChunkReader(Neo4jChunkReader):
             lexical_graph_config.chunk_index_property,
             lexical_graph_config.chunk_embedding_property,
         )
-        params = {"run_id": self.run_id}
-        if self.source_uri is not None:
-            params["source_uri"] = self.source_uri
-        if self.corpus is not None:
-            params["corpus"] = self.corpus
-
         result, _, _ = self.driver.execute_query(
             query,
-            parameters_=params,
+            parameters_=self._params(),
             database_=self.neo4j_database,
             routing_=neo4j.RoutingControl.READ,
         )
-        chunks = []
-        for record in result:
-            chunk = record.get("chunk")
-            input_data = {
-                "text": chunk.pop(lexical_graph_config.chunk_text_property, ""),
-                "index": chunk.pop(lexical_graph_config.chunk_index_property, -1),
-            }
-            if (uid := chunk.pop(lexical_graph_config.chunk_id_property, None)) is not None:
-                input_data["uid"] = uid
-            input_data["metadata"] = chunk
-            chunks.append(TextChunk(**input_data))
-
+        chunks = [self._record_to_chunk(record, lexical_graph_config) for record in result]
         if not chunks:
-            message = "No chunks returned for run-scoped query"
-            details = {
-                "run_id": self.run_id,
-                "source_uri": self.source_uri,
-                "corpus": self.corpus,
-            }
-            logger.warning("%s: %r", message, details)
-            raise ValueError(f"{message}: {details}")
+            self._raise_no_chunks()
 
         return TextChunks(chunks=chunks)
 
+    async def iter_pages(
+        self,
+        lexical_graph_config: LexicalGraphConfig = LexicalGraphConfig(),
+        *,
+        page_size: int = DEFAULT_CHUNK_PAGE_SIZE,
+    ) -> AsyncIterator[list[TextChunk]]:
+        """Yield the run's chunks in pages of about *page_size*, keyset-paginated on the chunk index.
+
+        Each page is read in a worker thread, so a consumer extracting one
+        page overlaps the read of the next.  Chunks of different documents in
+        one run share index values, so a page never splits an index value:
+        every chunk at the boundary index is read with the page that reaches
+        it.  Chunks without an index value come last, in one page, as they do
+        in :meth:`run`'s ordering.  Without an index property the whole run is
+        read as one page, as :meth:`run` does.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+        if not lexical_graph_config.chunk_index_property:
+            yield (await self.run(lexical_graph_config=lexical_graph_config)).chunks
+            return
+
+        import neo4j
+
+        def _query(position: str) -> str:
+            return self._get_page_query(
+                lexical_graph_config.chunk_node_label,
+                lexical_graph_config.chunk_index_property,
+                lexical_graph_config.chunk_embedding_property,
+                position=position,
+            )
+
+        async def _fetch(query: str, **extra_params: Any) -> list[TextChunk]:
+            result, _, _ = await asyncio.to_thread(
+                self.driver.execute_query,
+                query,
+                parameters_={**self._params(), **extra_params},
+                database_=self.neo4j_database,
+                routing_=neo4j.RoutingControl.READ,
+            )
+            return [self._record_to_chunk(record, lexical_graph_config) for record in result]
+
+        chunk_count = 0
+        page = await _fetch(_query("first"), page_size=page_size)
+        while page:
+            full_page = len(page) >= page_size
+            if full_page:
+                boundary_index = page[-1].index
+                page = [chunk for chunk in page if chunk.index != boundary_index]
+                page += await _fetch(_query("at"), at_index=boundary_index)
+            chunk_count += len(page)
+            yield page
+            if not full_page:
+                break
+            page = await _fetch(_query("after"), after_index=page[-1].index, page_size=page_size)
+
+        unindexed = await _fetch(_query("unindexed"))
+        if unindexed:
+            chunk_count += len(unindexed)
+            yield unindexed
+
+        if not chunk_count:
+            self._raise_no_chunks()
+
+    async def stream(
+        self,
+        lexical_graph_config: LexicalGraphConfig = LexicalGraphConfig(),
+        *,
+        page_size: int = DEFAULT_CHUNK_PAGE_SIZE,
+    ) -> AsyncIterator[TextChunk]:
+        """Yield the run's chunks one at a time as the pages of :meth:`iter_pages` arrive."""
+        async for page in self.iter_pages(lexical_graph_config, page_size=page_size):
+            for chunk in page:
+                yield chunk
+
 
 class ProvenanceNeo4jWriter(Neo4jWriter):
     """Neo4j writer that applies run_id/dataset_id/source_uri to Document and Chunk nodes before ingest."""
@@ -216,6 +337,7 @@ class ProvenanceNeo4jWriter(Neo4jWriter):
 
 
 __all__ = [
+    "DEFAULT_CHUNK_PAGE_SIZE",
     "ProvenanceNeo4jWriter",
     "RunScopedNeo4jChunkReader",
     "validate_cypher_identifier",
@@ -17,6 +17,7 @@ from power_atlas.orchestration.cli_dispatch import (
     reset_instructions_text,
 )
 from power_atlas.orchestration.ask_scope import (
+    apply_ask_scope_strategy,
     format_dataset_label,
     prepare_ask_request_context,
     resolve_ask_request_context,
@@ -70,6 +71,7 @@ __all__ = [
     "execute_config_command",
     "execute_lint_structured_command",
     "execute_reset_command",
+    "apply_ask_scope_strategy",
     "format_dataset_label",
     "prepare_ask_request_context",
     "reset_instructions_text",
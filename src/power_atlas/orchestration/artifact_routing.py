@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from power_atlas.contracts import write_manifest, write_manifest_md
+from power_atlas.run_catalog_index import record_run_catalog_manifest
 
 
 def compute_stage_manifest_path(output_dir: Path, *, run_id: str, stage_name: str) -> Path:
@@ -24,6 +25,7 @@ def write_stage_manifest_artifacts(
     manifest_path = compute_stage_manifest_path(output_dir, run_id=run_id, stage_name=stage_name)
     write_manifest(manifest_path, manifest)
     write_manifest_md(manifest_path, manifest)
+    record_run_catalog_manifest(output_dir, run_id=run_id)
     return manifest_path
 
 
@@ -5,6 +5,7 @@ import logging
 from typing import Callable
 
 from power_atlas.context import RequestContext
+from power_atlas.retrieval_scoped_search import resolve_retrieval_scope_strategy
 
 
 def format_dataset_label(
@@ -336,6 +337,10 @@ def prepare_ask_request_context(
         resolve_dataset_root=resolve_dataset_root,
         logger=logger,
     )
+    request_context = apply_ask_scope_strategy(
+        request_context,
+        resolve_retrieval_scope_strategy(getattr(args, "scope_strategy", None)),
+    )
     return replace(
         request_context,
         source_uri=resolve_ask_source_uri(
@@ -345,7 +350,18 @@ def prepare_ask_request_context(
     )
 
 
+def apply_ask_scope_strategy(request_context: RequestContext, scope_strategy: str | None) -> RequestContext:
+    """Return *request_context* with its retrieval policy's ``scope_strategy`` set to *scope_strategy*."""
+    retrieval_policy = request_context.policies.retrieval
+    if scope_strategy is None or scope_strategy == retrieval_policy.scope_strategy:
+        return request_context
+    app = request_context.app
+    policies = replace(app.policies, retrieval=replace(retrieval_policy, scope_strategy=scope_strategy))
+    return replace(request_context, app=replace(app, policies=policies))
+
+
 __all__ = [
+    "apply_ask_scope_strategy",
     "format_dataset_label",
     "prepare_ask_request_context",
     "resolve_ask_request_context",
@@ -45,12 +45,39 @@ def execute_config_command(
     run_interactive_qa_request_context: Callable[..., None],
     run_independent_stage: Callable[..., Any],
     format_scope_label: Callable[[str | None, bool], str],
+    ensure_graph_schema: Callable[[Any], Any] | None = None,
+    run_batch_qa_request_context: Callable[..., dict[str, Any]] | None = None,
 ) -> None:
     request_context = build_request_context_from_args(args)
+    if ensure_graph_schema is not None and not request_context.config.dry_run:
+        ensure_graph_schema(request_context)
     if args.command == "ingest":
         manifest_path = run_demo(request_context)
         emit(f"Demo manifest written to: {manifest_path}")
         return
+    if args.command == "ask" and getattr(args, "questions_file", None) is not None:
+        if getattr(args, "interactive", False):
+            raise SystemExit("'ask --questions-file' cannot be combined with --interactive.")
+        if request_context.config.dry_run:
+            raise SystemExit(
+                "Batch 'ask' is not supported in dry-run mode. "
+                "Re-run the command with --live to enable live Neo4j/OpenAI calls."
+            )
+        if run_batch_qa_request_context is None:
+            raise SystemExit("Batch 'ask' is not available in this entrypoint.")
+        request_context = prepare_ask_request_context(args, request_context)
+        emit(f"Using retrieval scope: {format_scope_label(request_context.run_id, request_context.all_runs)}")
+        summary = run_batch_qa_request_context(
+            request_context,
+            questions_path=args.questions_file,
+            output_path=getattr(args, "batch_output", None),
+            cluster_aware=getattr(args, "cluster_aware", False),
+            expand_graph=getattr(args, "expand_graph", False),
+            settings=batch_qa_settings_from_args(args),
+        )
+        emit(batch_qa_summary_text(summary))
+        emit(f"Batch answers written to: {summary['output_path']}")
+        return
     if args.command == "ask" and getattr(args, "interactive", False):
         if request_context.config.dry_run:
             raise SystemExit(
@@ -89,6 +116,27 @@ def execute_config_command(
     emit(f"Independent run manifest written to: {manifest_path}")
 
 
+def batch_qa_settings_from_args(args):
+    """Batch ``ask`` settings from env, with ``--batch-concurrency`` taking precedence."""
+    from dataclasses import replace
+
+    from power_atlas.retrieval_batch_session import BatchQaSettings
+
+    settings = BatchQaSettings.from_env()
+    concurrency = getattr(args, "batch_concurrency", None)
+    return settings if concurrency is None else replace(settings, concurrency=concurrency)
+
+
+def batch_qa_summary_text(summary: dict[str, Any]) -> str:
+    latency = summary.get("latency_ms") or {}
+    return (
+        f"Batch ask complete: questions={summary['questions']} failed={summary['failed']} "
+        f"concurrency={summary['concurrency']} seconds={summary['elapsed_seconds']} "
+        f"questions/s={summary['questions_per_second']} "
+        f"p50_ms={latency.get('p50')} p95_ms={latency.get('p95')}"
+    )
+
+
 def reset_instructions_text() -> str:
     return (
         "To reset the demo graph, run:\n"
@@ -99,6 +147,26 @@ def reset_instructions_text() -> str:
     )
 
 
+def reset_scope_kwargs(args) -> dict[str, Any]:
+    """Scope and batching kwargs for ``run_reset`` from reset CLI args."""
+    from power_atlas.reset_demo_runtime import DemoResetSettings
+
+    batch_size = getattr(args, "reset_batch_size", None)
+    return {
+        "run_id": getattr(args, "reset_run_id", None),
+        "dataset_id": getattr(args, "reset_dataset_id", None),
+        "settings": None if batch_size is None else DemoResetSettings(batch_size=batch_size),
+    }
+
+
+def reset_throughput_text(report: dict[str, Any]) -> str:
+    return (
+        f"  mode={report.get('reset_mode')} batches={report['batches']} "
+        f"batch_size={report.get('batch_size')} "
+        f"seconds={report.get('elapsed_seconds')} nodes/s={report.get('nodes_per_second')}"
+    )
+
+
 def execute_reset_command(
     args,
     *,
@@ -129,6 +197,7 @@ def execute_reset_command(
             database=request_context.settings.neo4j.database,
             output_dir=config.output_dir,
             pipeline_contract=request_context.pipeline_contract,
+            **reset_scope_kwargs(args),
         )
     emit(
         f"Demo graph reset complete: database={report['target_database']} "
@@ -136,6 +205,8 @@ def execute_reset_command(
         f"relationships_deleted={report['deleted_relationships']} "
         f"indexes_dropped={report['indexes_dropped']}"
     )
+    if report.get("batches") is not None:
+        emit(reset_throughput_text(report))
     for warning in report.get("warnings") or []:
         emit(f"  warning: {warning}")
     if report.get("report_path"):
@@ -176,9 +247,13 @@ def dispatch_cli_command(
 
 __all__ = [
     "CONFIG_COMMANDS",
+    "batch_qa_settings_from_args",
+    "batch_qa_summary_text",
     "dispatch_cli_command",
     "execute_config_command",
     "execute_lint_structured_command",
     "execute_reset_command",
     "reset_instructions_text",
+    "reset_scope_kwargs",
+    "reset_throughput_text",
 ]
\ No newline at end of file
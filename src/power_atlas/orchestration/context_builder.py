@@ -63,6 +63,7 @@ def build_request_context_from_config(
         output_dir=config.output_dir,
         question=config.question,
         resolution_mode=config.resolution_mode,
+        resume_claim_extraction=getattr(config, "resume_claim_extraction", False),
         run_id=run_id,
         all_runs=all_runs,
         source_uri=source_uri,
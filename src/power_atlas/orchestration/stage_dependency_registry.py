@@ -139,7 +139,21 @@ def build_demo_cli_dispatch_kwargs(
     format_scope_label: Callable[[str | None, bool], str],
     resolve_create_driver: Callable[[], Callable[[Any], Any]],
     resolve_load_reset_runner: Callable[[], Callable[[], Callable[..., dict[str, Any]]]],
+    resolve_ensure_graph_schema: Callable[[], Callable[[RequestContext], Any]] | None = None,
+    resolve_run_batch_qa_request_context: Callable[[], Callable[..., dict[str, Any]]] | None = None,
 ) -> dict[str, Any]:
+    config_command_kwargs: dict[str, Any] = {
+        "build_request_context_from_args": build_request_context_from_args,
+        "run_demo": run_demo,
+        "prepare_ask_request_context": prepare_ask_request_context,
+        "run_interactive_qa_request_context": resolve_run_interactive_qa_request_context(),
+        "run_independent_stage": run_independent_stage,
+        "format_scope_label": format_scope_label,
+    }
+    if resolve_ensure_graph_schema is not None:
+        config_command_kwargs["ensure_graph_schema"] = resolve_ensure_graph_schema()
+    if resolve_run_batch_qa_request_context is not None:
+        config_command_kwargs["run_batch_qa_request_context"] = resolve_run_batch_qa_request_context()
     return {
         "lint_structured_command_kwargs": {
             "build_request_context_from_args": build_request_context_from_args,
@@ -147,14 +161,7 @@ def build_demo_cli_dispatch_kwargs(
             "make_run_id": make_run_id,
             "resolve_dataset_root": resolve_dataset_root,
         },
-        "config_command_kwargs": {
-            "build_request_context_from_args": build_request_context_from_args,
-            "run_demo": run_demo,
-            "prepare_ask_request_context": prepare_ask_request_context,
-            "run_interactive_qa_request_context": resolve_run_interactive_qa_request_context(),
-            "run_independent_stage": run_independent_stage,
-            "format_scope_label": format_scope_label,
-        },
+        "config_command_kwargs": config_command_kwargs,
         "reset_command_kwargs": {
             "build_request_context_from_args": build_request_context_from_args,
             "create_driver": resolve_create_driver(),
@@ -0,0 +1,606 @@
+"""Multi-document PDF ingest: parse in a process pool, embed and write concurrently.
+
+:func:`run_pdf_ingest_runtime` ingests one PDF per run and pays for a driver,
+a vector-index check and a freshly built pipeline every time.  The batch mode
+takes a directory of PDFs or a manifest listing them and:
+
+* loads and chunks every PDF in a :class:`~concurrent.futures.ProcessPoolExecutor`
+  using the pipeline's own loader and splitter components, so pypdf text
+  extraction runs on all cores instead of on the event loop;
+* installs :class:`PrecomputedPdfLoader` / :class:`PrecomputedTextSplitter`
+  in place of those components so the pipeline reuses the parsed output;
+* runs every document through one shared pipeline runner, one Neo4j driver
+  and one index check, with at most ``max_concurrency`` documents embedding
+  and writing at a time;
+* writes a single ``batch_manifest.json`` with per-document counts, timings
+  and status.  A document that fails is recorded and does not stop the rest.
+
+Manifests are either a dataset ``manifest.json`` (every ``provenance`` entry
+of ``kind: pdf``) or a text file with one PDF path per line; relative paths
+resolve against the manifest's directory and listed files that do not exist
+are skipped with a warning.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from power_atlas.adapters.graphrag_components import PdfLoader, TextSplitter
+from power_atlas.adapters.graphrag_types import LoadedDocument, TextChunk, TextChunks
+from power_atlas.batched_chunk_embedder import (
+    BatchedTextChunkEmbedder,
+    ChunkEmbeddingSettings,
+    install_batched_chunk_embedder,
+)
+from power_atlas.bootstrap import require_openai_api_key
+from power_atlas.contracts import PDF_PIPELINE_CONFIG_PATH, make_run_id
+from power_atlas.context import RequestContext
+from power_atlas.contracts.pipeline import PipelineContractSnapshot
+from power_atlas.graph_schema_migrations import ensure_graph_schema_request_context
+from power_atlas.neo4j_io import validate_cypher_identifier
+from power_atlas.pdf_ingest_runner import (
+    close_pipeline_clients,
+    normalize_pipeline_result,
+    record_as_mapping,
+    require_positive_int,
+    sha256_file,
+)
+from power_atlas.pdf_ingest_runtime import run_pdf_ingest_batch_live
+from power_atlas.settings import Neo4jSettings
+
+_logger = logging.getLogger(__name__)
+
+FILE_LOADER_COMPONENT_NAME = "file_loader"
+SPLITTER_COMPONENT_NAME = "splitter"
+BATCH_MANIFEST_FILENAME = "batch_manifest.json"
+DEFAULT_PDF_BATCH_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_PDF_BATCH_CONCURRENCY = 2
+
+
+@dataclass(frozen=True)
+class PdfBatchIngestEnvNames:
+    parse_workers: str = "POWER_ATLAS_PDF_BATCH_PARSE_WORKERS"
+    max_concurrency: str = "POWER_ATLAS_PDF_BATCH_CONCURRENCY"
+
+
+DEFAULT_PDF_BATCH_INGEST_ENV_NAMES = PdfBatchIngestEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class PdfBatchIngestSettings:
+    parse_workers: int = DEFAULT_PDF_BATCH_PARSE_WORKERS
+    max_concurrency: int = DEFAULT_PDF_BATCH_CONCURRENCY
+
+    def __post_init__(self) -> None:
+        if self.parse_workers < 1:
+            raise ValueError(f"parse_workers must be >= 1, got {self.parse_workers}")
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {self.max_concurrency}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: PdfBatchIngestEnvNames | None = None,
+    ) -> "PdfBatchIngestSettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_PDF_BATCH_INGEST_ENV_NAMES if env_names is None else env_names
+        return cls(
+            parse_workers=int(env.get(names.parse_workers, DEFAULT_PDF_BATCH_PARSE_WORKERS)),
+            max_concurrency=int(env.get(names.max_concurrency, DEFAULT_PDF_BATCH_CONCURRENCY)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedPdfDocument:
+    file_path: str
+    document: LoadedDocument
+    chunks: TextChunks
+    parse_seconds: float
+
+
+def _manifest_pdf_entries(manifest_path: Path) -> tuple[list[str], str | None]:
+    text = manifest_path.read_text(encoding="utf-8")
+    if manifest_path.suffix.lower() != ".json":
+        entries = [line.strip() for line in text.splitlines()]
+        return [entry for entry in entries if entry and not entry.startswith("#")], None
+    manifest = json.loads(text)
+    if isinstance(manifest, list):
+        return [str(entry) for entry in manifest], None
+    if not isinstance(manifest, dict):
+        raise ValueError(f"PDF manifest {manifest_path} must be a JSON object or list")
+    dataset_id = manifest.get("dataset") if isinstance(manifest.get("dataset"), str) else None
+    entries = [
+        str(entry["path"])
+        for entry in manifest.get("provenance", [])
+        if isinstance(entry, dict) and entry.get("kind") == "pdf" and entry.get("path")
+    ]
+    return entries, dataset_id or None
+
+
+def resolve_batch_pdf_paths(
+    *,
+    pdf_dir: Path | None,
+    pdf_manifest: Path | None,
+) -> tuple[list[Path], str | None]:
+    """Return the PDFs to ingest and the dataset id named by the manifest, if any."""
+    if (pdf_dir is None) == (pdf_manifest is None):
+        raise ValueError("Batch PDF ingest requires exactly one of pdf_dir or pdf_manifest")
+    dataset_id: str | None = None
+    if pdf_dir is not None:
+        if not pdf_dir.is_dir():
+            raise FileNotFoundError(f"PDF directory not found: {pdf_dir}")
+        candidates = sorted(path for path in pdf_dir.iterdir() if path.suffix.lower() == ".pdf")
+    else:
+        assert pdf_manifest is not None
+        if not pdf_manifest.is_file():
+            raise FileNotFoundError(f"PDF manifest not found: {pdf_manifest}")
+        entries, dataset_id = _manifest_pdf_entries(pdf_manifest)
+        candidates = [pdf_manifest.parent / entry for entry in entries]
+    pdf_paths: list[Path] = []
+    seen: set[Path] = set()
+    for candidate in candidates:
+        resolved = candidate.resolve()
+        if resolved in seen:
+            continue
+        if not resolved.is_file():
+            # Dataset manifests list supplementary PDFs that are not always checked in.
+            _logger.warning("Skipping PDF listed for batch ingest but not found: %s", resolved)
+            continue
+        if resolved.suffix.lower() != ".pdf":
+            raise ValueError(f"Batch PDF ingest only accepts .pdf files, got {resolved}")
+        seen.add(resolved)
+        pdf_paths.append(resolved)
+    if not pdf_paths:
+        raise ValueError(f"No PDFs found in {pdf_dir if pdf_dir is not None else pdf_manifest}")
+    return pdf_paths, dataset_id
+
+
+async def _load_and_split(loader: Any, splitter: Any, file_path: str, metadata: dict[str, str]) -> tuple[Any, Any]:
+    # One task so the page offsets the loader records are visible to the splitter.
+    document = await loader.run(filepath=file_path, metadata=metadata)
+    return document, await splitter.run(document.text)
+
+
+def prepare_pdf_document(
+    loader: Any,
+    splitter: Any,
+    file_path: str,
+    metadata: dict[str, str],
+) -> PreparedPdfDocument:
+    """Load and chunk one PDF with the pipeline's components; runs in a worker process."""
+    started = time.monotonic()
+    document, chunks = asyncio.run(_load_and_split(loader, splitter, file_path, metadata))
+    return PreparedPdfDocument(
+        file_path=file_path,
+        document=document,
+        chunks=chunks,
+        parse_seconds=time.monotonic() - started,
+    )
+
+
+def prepare_pdf_documents(
+    loader: Any,
+    splitter: Any,
+    requests: Sequence[tuple[str, dict[str, str]]],
+    *,
+    max_workers: int,
+    executor_factory: Callable[[int], Executor] = ProcessPoolExecutor,
+) -> dict[str, PreparedPdfDocument | BaseException]:
+    """Parse ``(file_path, metadata)`` requests in parallel, keyed by file path.
+
+    A PDF that fails to parse maps to its exception; the pipeline then parses
+    it again in-process through the original components, which either recovers
+    or reports the error against that document alone.
+    """
+    if max_workers <= 1 or len(requests) <= 1:
+        prepared: dict[str, PreparedPdfDocument | BaseException] = {}
+        for file_path, metadata in requests:
+            try:
+                prepared[file_path] = prepare_pdf_document(loader, splitter, file_path, metadata)
+            except Exception as exc:
+                prepared[file_path] = exc
+        return prepared
+    with executor_factory(min(max_workers, len(requests))) as executor:
+        futures = {
+            file_path: executor.submit(prepare_pdf_document, loader, splitter, file_path, metadata)
+            for file_path, metadata in requests
+        }
+        results: dict[str, PreparedPdfDocument | BaseException] = {}
+        for file_path, future in futures.items():
+            try:
+                results[file_path] = future.result()
+            except Exception as exc:
+                results[file_path] = exc
+        return results
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PrecomputedPdfLoader(PdfLoader):
+    """Serve documents parsed ahead of time; parse anything else with *loader*."""
+
+    def __init__(self, loader: Any, documents: Mapping[str, LoadedDocument]) -> None:
+        super().__init__()
+        self._loader = loader
+        self._documents = dict(documents)
+
+    async def run(  # type: ignore[override]
+        self,
+        filepath: Union[str, Path],
+        metadata: Optional[Dict[str, str]] = None,
+        fs: Optional[Any] = None,
+    ) -> LoadedDocument:
+        document = self._documents.get(str(filepath))
+        if document is not None:
+            return document
+        return await self._loader.run(filepath=filepath, metadata=metadata, fs=fs)
+
+
+class PrecomputedTextSplitter(TextSplitter):
+    """Serve chunks computed ahead of time for known texts; split anything else with *splitter*."""
+
+    def __init__(self, splitter: Any, chunks_by_text: Mapping[str, TextChunks]) -> None:
+        self._splitter = splitter
+        self._chunks = {_text_key(text): chunks for text, chunks in chunks_by_text.items()}
+
+    def iter_chunks(self, text: str):  # type: ignore[override]
+        chunks = self._chunks.get(_text_key(text))
+        if chunks is not None:
+            return iter(chunks.chunks)
+        return self._splitter.iter_chunks(text)
+
+    async def run(self, text: str) -> TextChunks:  # type: ignore[override]
+        chunks = self._chunks.get(_text_key(text))
+        if chunks is not None:
+            # Fresh uids per run, as the vendor splitter would assign.
+            return TextChunks(
+                chunks=[
+                    TextChunk(text=chunk.text, index=chunk.index, metadata=chunk.metadata)
+                    for chunk in chunks.chunks
+                ]
+            )
+        return await self._splitter.run(text)
+
+
+def install_precomputed_pdf_components(
+    pipeline_runner: Any,
+    requests: Sequence[tuple[str, dict[str, str]]],
+    *,
+    max_workers: int,
+    prepare_documents_fn: Callable[..., dict[str, PreparedPdfDocument | BaseException]] = prepare_pdf_documents,
+) -> dict[str, PreparedPdfDocument | BaseException] | None:
+    """Parse *requests* in a process pool and swap in components that reuse the output.
+
+    Returns the per-file preparation results, or ``None`` when the pipeline
+    has no ``file_loader``/``splitter`` nodes to replace.
+    """
+    pipeline = getattr(pipeline_runner, "pipeline", None)
+    get_node_by_name = getattr(pipeline, "get_node_by_name", None)
+    if pipeline is None or not callable(get_node_by_name):
+        return None
+    try:
+        loader = get_node_by_name(FILE_LOADER_COMPONENT_NAME).component
+        splitter = get_node_by_name(SPLITTER_COMPONENT_NAME).component
+    except KeyError:
+        return None
+    prepared = prepare_documents_fn(loader, splitter, requests, max_workers=max_workers)
+    ready = [item for item in prepared.values() if isinstance(item, PreparedPdfDocument)]
+    pipeline.set_component(
+        FILE_LOADER_COMPONENT_NAME,
+        PrecomputedPdfLoader(loader, {item.file_path: item.document for item in ready}),
+    )
+    pipeline.set_component(
+        SPLITTER_COMPONENT_NAME,
+        PrecomputedTextSplitter(splitter, {item.document.text: item.chunks for item in ready}),
+    )
+    return prepared
+
+
+async def run_pipeline_and_discard_results(pipeline_runner: Any, run_params: dict[str, Any]) -> Any:
+    """Run one batch document and drop its intermediate results from the shared store.
+
+    The vendor pipeline keeps every component's output per run id; a long
+    batch would otherwise hold every document's chunks and embeddings.
+    """
+    result = await pipeline_runner.run(run_params)
+    run_id = getattr(result, "run_id", None)
+    pipeline = getattr(pipeline_runner, "pipeline", None)
+    if isinstance(run_id, str) and pipeline is not None:
+        for store in (getattr(pipeline, "store", None), getattr(pipeline, "final_results", None)):
+            all_results = getattr(store, "all", None)
+            if not callable(all_results):
+                continue
+            data = all_results()
+            for key in [key for key in data if key == run_id or key.startswith(f"{run_id}:")]:
+                del data[key]
+    return result
+
+
+async def close_batch_pipeline(pipeline_runner: Any) -> None:
+    await close_pipeline_clients(pipeline_runner)
+    close = getattr(pipeline_runner, "close", None)
+    if callable(close):
+        await close()
+
+
+def _combined_chunk_embedding_summary(embedders: Sequence[BatchedTextChunkEmbedder]) -> dict[str, Any] | None:
+    stats = [item for embedder in embedders for item in embedder.run_stats]
+    if not stats:
+        return None
+    return {
+        "chunks": sum(item.chunks for item in stats),
+        "cached": sum(item.cached for item in stats),
+        "embedded": sum(item.embedded for item in stats),
+        "requests": sum(item.requests for item in stats),
+        "batch_size": stats[0].batch_size,
+        "max_concurrency": stats[0].max_concurrency,
+        "elapsed_seconds": round(sum(item.elapsed_seconds for item in stats), 3),
+        "cache_dir": stats[0].cache_dir,
+    }
+
+
+def run_pdf_batch_ingest_runtime(
+    *,
+    config: Any,
+    run_id: str | None,
+    pdf_dir: Path | None,
+    pdf_manifest: Path | None,
+    dataset_id: str | None,
+    pipeline_contract: PipelineContractSnapshot,
+    neo4j_settings: Neo4jSettings,
+    openai_model: str,
+    chunk_stride: int | None = None,
+    batch_settings: PdfBatchIngestSettings | None = None,
+    chunk_embedding_settings: ChunkEmbeddingSettings | None = None,
+    require_openai_api_key_fn: Callable[..., None] = require_openai_api_key,
+    validate_cypher_identifier_fn: Callable[[str, str], Any] = validate_cypher_identifier,
+    live_runner: Callable[..., Any] = run_pdf_ingest_batch_live,
+    install_precomputed_components_fn: Callable[..., Any] = install_precomputed_pdf_components,
+    install_chunk_embedder_fn: Callable[..., BatchedTextChunkEmbedder | None] = install_batched_chunk_embedder,
+    record_as_mapping_fn: Callable[[Any], dict[str, Any]] = record_as_mapping,
+    normalize_pipeline_result_fn: Callable[[Any], Any] = normalize_pipeline_result,
+    clock: Callable[[], float] = time.monotonic,
+) -> dict[str, Any]:
+    started = clock()
+    resolved_settings = PdfBatchIngestSettings.from_env() if batch_settings is None else batch_settings
+    pdf_paths, manifest_dataset_id = resolve_batch_pdf_paths(pdf_dir=pdf_dir, pdf_manifest=pdf_manifest)
+    source_root = pdf_dir if pdf_dir is not None else pdf_manifest.parent  # type: ignore[union-attr]
+    effective_dataset_id = dataset_id or manifest_dataset_id or source_root.name
+    effective_chunk_stride = (
+        require_positive_int(chunk_stride, "chunk_stride")
+        if chunk_stride is not None
+        else pipeline_contract.chunk_fallback_stride
+    )
+    stage_run_id = run_id or make_run_id("unstructured_ingest")
+    pdf_ingest_dir = config.output_dir / "runs" / stage_run_id / "pdf_ingest"
+    pdf_ingest_dir.mkdir(parents=True, exist_ok=True)
+    batch_manifest_path = pdf_ingest_dir / BATCH_MANIFEST_FILENAME
+    if PDF_PIPELINE_CONFIG_PATH.is_file():
+        pipeline_config_sha256 = sha256_file(PDF_PIPELINE_CONFIG_PATH)
+    elif config.dry_run:
+        pipeline_config_sha256 = None
+    else:
+        raise FileNotFoundError(f"Required PDF pipeline config not found: {PDF_PIPELINE_CONFIG_PATH}")
+    sources = {str(path): path.as_uri() for path in pdf_paths}
+    fingerprints = {str(path): sha256_file(path) for path in pdf_paths}
+    vector_index: dict[str, Any] = {
+        "index_name": pipeline_contract.chunk_embedding_index_name,
+        "label": pipeline_contract.chunk_embedding_label,
+        "embedding_property": pipeline_contract.chunk_embedding_property,
+        "dimensions": pipeline_contract.chunk_embedding_dimensions,
+        "creation_strategy": "dry_run",
+    }
+    prepared: dict[str, PreparedPdfDocument | BaseException] = {}
+    installed_chunk_embedders: list[BatchedTextChunkEmbedder] = []
+    parse_seconds = 0.0
+
+    if config.dry_run:
+        documents: list[dict[str, Any]] = [
+            {
+                "source_uri": sources[file_path],
+                "file_path": file_path,
+                "pdf_fingerprint_sha256": fingerprints[file_path],
+                "status": "dry_run",
+                "counts": {"documents": 0, "pages": 0, "chunks": 0},
+                "warnings": [],
+                "error": None,
+                "timings": {},
+            }
+            for file_path in sources
+        ]
+        status = "dry_run"
+    else:
+        require_openai_api_key_fn("Set OPENAI_API_KEY when using live batch PDF ingest")
+
+        from power_atlas.adapters.graphrag_components import PipelineRunner
+
+        validate_cypher_identifier_fn(vector_index["index_name"], "index name")
+        validate_cypher_identifier_fn(vector_index["label"], "label")
+        validate_cypher_identifier_fn(vector_index["embedding_property"], "property")
+
+        def _configure_pipeline(pipeline_runner: Any) -> None:
+            nonlocal parse_seconds
+            parse_started = clock()
+            metadata = {"run_id": stage_run_id, "dataset_id": effective_dataset_id}
+            results = install_precomputed_components_fn(
+                pipeline_runner,
+                [
+                    (file_path, {**metadata, "source_uri": source_uri})
+                    for file_path, source_uri in sources.items()
+                ],
+                max_workers=resolved_settings.parse_workers,
+            )
+            parse_seconds = clock() - parse_started
+            prepared.update(results or {})
+            chunk_embedder = install_chunk_embedder_fn(
+                pipeline_runner,
+                output_dir=config.output_dir,
+                settings=chunk_embedding_settings,
+            )
+            if chunk_embedder is not None:
+                installed_chunk_embedders.append(chunk_embedder)
+
+        live_result = live_runner(
+            neo4j_settings,
+            stage_run_id=stage_run_id,
+            pdf_documents=list(sources.items()),
+            openai_model=openai_model,
+            effective_dataset_id=effective_dataset_id,
+            effective_index_name=vector_index["index_name"],
+            effective_chunk_label=vector_index["label"],
+            effective_embedding_property=vector_index["embedding_property"],
+            effective_embedding_dimensions=vector_index["dimensions"],
+            effective_chunk_stride=effective_chunk_stride,
+            pipeline_config_path=PDF_PIPELINE_CONFIG_PATH,
+            pipeline_runner_cls=PipelineRunner,
+            run_pipeline=run_pipeline_and_discard_results,
+            close_pipeline=close_batch_pipeline,
+            record_as_mapping=record_as_mapping_fn,
+            configure_pipeline=_configure_pipeline,
+            max_concurrency=resolved_settings.max_concurrency,
+        )
+        vector_index["creation_strategy"] = live_result.index_creation_strategy or "unknown"
+        documents = []
+        for outcome in live_result.documents:
+            preparation = prepared.get(outcome.pdf_file_path)
+            warnings = list(outcome.extraction_warnings)
+            if isinstance(preparation, BaseException):
+                warnings.append(f"parallel parse failed ({preparation}); parsed in-process instead")
+            documents.append(
+                {
+                    "source_uri": outcome.pdf_source_uri,
+                    "file_path": outcome.pdf_file_path,
+                    "pdf_fingerprint_sha256": fingerprints[outcome.pdf_file_path],
+                    "status": outcome.status,
+                    "counts": outcome.summary_counts,
+                    "warnings": warnings,
+                    "error": outcome.error,
+                    "timings": {
+                        "parse_seconds": (
+                            round(preparation.parse_seconds, 3)
+                            if isinstance(preparation, PreparedPdfDocument)
+                            else None
+                        ),
+                        "pipeline_seconds": round(outcome.pipeline_seconds, 3),
+                        "finalize_seconds": round(outcome.finalize_seconds, 3),
+                    },
+                    "pipeline_result": normalize_pipeline_result_fn(outcome.pipeline_result),
+                }
+            )
+        failed = sum(1 for document in documents if document["status"] != "ingested")
+        status = "live" if not failed else ("failed" if failed == len(documents) else "partial")
+
+    totals = {
+        key: sum(document["counts"][key] for document in documents) for key in ("documents", "pages", "chunks")
+    }
+    batch_manifest: dict[str, Any] = {
+        "run_id": stage_run_id,
+        "dataset_id": effective_dataset_id,
+        "status": status,
+        "document_count": len(documents),
+        "failed_document_count": sum(1 for document in documents if document["status"] == "failed"),
+        "counts": totals,
+        "documents": documents,
+        "embedding_model": pipeline_contract.embedder_model_name,
+        "vector_index": vector_index,
+        "pipeline_config": str(PDF_PIPELINE_CONFIG_PATH),
+        "pipeline_config_sha256": pipeline_config_sha256,
+        "parse_workers": resolved_settings.parse_workers,
+        "max_concurrency": resolved_settings.max_concurrency,
+        "timings": {
+            "parse_seconds": round(parse_seconds, 3),
+            "total_seconds": round(clock() - started, 3),
+        },
+    }
+    chunk_embedding_summary = _combined_chunk_embedding_summary(installed_chunk_embedders)
+    if chunk_embedding_summary is not None:
+        batch_manifest["chunk_embedding"] = chunk_embedding_summary
+    batch_manifest_path.write_text(json.dumps(batch_manifest, indent=2), encoding="utf-8")
+    return {**batch_manifest, "pdf_ingest_dir": str(pdf_ingest_dir), "batch_manifest_path": str(batch_manifest_path)}
+
+
+def run_pdf_batch_ingest_runtime_default(
+    *,
+    config: Any,
+    run_id: str | None,
+    pdf_dir: Path | None,
+    pdf_manifest: Path | None,
+    dataset_id: str | None,
+    pipeline_contract: PipelineContractSnapshot,
+    neo4j_settings: Neo4jSettings,
+    openai_model: str,
+    batch_settings: PdfBatchIngestSettings | None = None,
+) -> dict[str, Any]:
+    return run_pdf_batch_ingest_runtime(
+        config=config,
+        run_id=run_id,
+        pdf_dir=pdf_dir,
+        pdf_manifest=pdf_manifest,
+        dataset_id=dataset_id,
+        pipeline_contract=pipeline_contract,
+        neo4j_settings=neo4j_settings,
+        openai_model=openai_model,
+        batch_settings=batch_settings,
+    )
+
+
+def run_pdf_batch_ingest_request_context(
+    request_context: RequestContext,
+    *,
+    pdf_dir: Path | None = None,
+    pdf_manifest: Path | None = None,
+    dataset_id: str | None = None,
+    batch_settings: PdfBatchIngestSettings | None = None,
+    runtime_runner: Callable[..., dict[str, Any]] | None = None,
+    ensure_graph_schema_fn: Callable[[RequestContext], Any] = ensure_graph_schema_request_context,
+) -> dict[str, Any]:
+    request_runtime = request_context.runtime
+    resolved_runtime_runner = runtime_runner or run_pdf_batch_ingest_runtime_default
+    ensure_graph_schema_fn(request_context)
+    return resolved_runtime_runner(
+        config=request_runtime.config,
+        run_id=request_runtime.run_id,
+        pdf_dir=pdf_dir,
+        pdf_manifest=pdf_manifest,
+        dataset_id=dataset_id,
+        pipeline_contract=request_runtime.pipeline_contract,
+        neo4j_settings=request_runtime.settings.neo4j,
+        openai_model=request_runtime.settings.openai_model,
+        batch_settings=batch_settings,
+    )
+
+
+__all__ = [
+    "BATCH_MANIFEST_FILENAME",
+    "DEFAULT_PDF_BATCH_CONCURRENCY",
+    "DEFAULT_PDF_BATCH_INGEST_ENV_NAMES",
+    "DEFAULT_PDF_BATCH_PARSE_WORKERS",
+    "PdfBatchIngestEnvNames",
+    "PdfBatchIngestSettings",
+    "PrecomputedPdfLoader",
+    "PrecomputedTextSplitter",
+    "PreparedPdfDocument",
+    "close_batch_pipeline",
+    "install_precomputed_pdf_components",
+    "prepare_pdf_document",
+    "prepare_pdf_documents",
+    "resolve_batch_pdf_paths",
+    "run_pdf_batch_ingest_request_context",
+    "run_pdf_batch_ingest_runtime",
+    "run_pdf_batch_ingest_runtime_default",
+    "run_pipeline_and_discard_results",
+]
@@ -6,6 +6,11 @@ import logging
 from pathlib import Path
 from typing import Any, Callable
 
+from power_atlas.batched_chunk_embedder import (
+    BatchedTextChunkEmbedder,
+    ChunkEmbeddingSettings,
+    install_batched_chunk_embedder,
+)
 from power_atlas.bootstrap import require_openai_api_key
 from power_atlas.contracts import DatasetRoot, PDF_PIPELINE_CONFIG_PATH, make_run_id, resolve_dataset_root
 from power_atlas.contracts.pipeline import PipelineContractSnapshot
@@ -108,31 +113,37 @@ def require_positive_int(value: int, param_name: str) -> int:
     return value
 
 
+async def close_pipeline_clients(pipeline: Any, *, logger: Any | None = None) -> None:
+    """Close the async clients of every LLM the pipeline config instantiated."""
+    active_logger = _logger if logger is None else logger
+    config = getattr(pipeline, "config", None)
+    if config is None:
+        return
+    global_data = getattr(config, "_global_data", None) or {}
+    llm_config: dict[str, Any] = global_data.get("llm_config", {})
+    for llm in llm_config.values():
+        async_client = getattr(llm, "async_client", None)
+        if async_client is not None and callable(getattr(async_client, "close", None)):
+            try:
+                await async_client.close()
+            except Exception:
+                active_logger.warning(
+                    "Failed to close async_client for LLM %r during pipeline cleanup",
+                    llm,
+                    exc_info=True,
+                )
+
+
 async def run_pipeline_with_cleanup(
     pipeline: Any,
     run_params: dict[str, Any],
     *,
     logger: Any | None = None,
 ) -> Any:
-    active_logger = _logger if logger is None else logger
     try:
         return await pipeline.run(run_params)
     finally:
-        config = getattr(pipeline, "config", None)
-        if config is not None:
-            global_data = getattr(config, "_global_data", None) or {}
-            llm_config: dict[str, Any] = global_data.get("llm_config", {})
-            for llm in llm_config.values():
-                async_client = getattr(llm, "async_client", None)
-                if async_client is not None and callable(getattr(async_client, "close", None)):
-                    try:
-                        await async_client.close()
-                    except Exception:
-                        active_logger.warning(
-                            "Failed to close async_client for LLM %r during pipeline cleanup",
-                            llm,
-                            exc_info=True,
-                        )
+        await close_pipeline_clients(pipeline, logger=logger)
 
 
 def run_pdf_ingest_runtime(
@@ -158,6 +169,8 @@ def run_pdf_ingest_runtime(
     run_pipeline_with_cleanup_fn: Callable[..., Any] = run_pipeline_with_cleanup,
     record_as_mapping_fn: Callable[[Any], dict[str, Any]] = record_as_mapping,
     normalize_pipeline_result_fn: Callable[[Any], Any] = normalize_pipeline_result,
+    chunk_embedding_settings: ChunkEmbeddingSettings | None = None,
+    install_chunk_embedder_fn: Callable[..., BatchedTextChunkEmbedder | None] = install_batched_chunk_embedder,
 ) -> dict[str, Any]:
     resolved_pdf_filename = pdf_filename or DEFAULT_PDF_FILENAME
     if (
@@ -267,6 +280,17 @@ def run_pdf_ingest_runtime(
     validate_cypher_identifier_fn(effective_chunk_label, "label")
     validate_cypher_identifier_fn(effective_embedding_property, "property")
 
+    installed_chunk_embedders: list[BatchedTextChunkEmbedder] = []
+
+    def _configure_pipeline(pipeline_runner: Any) -> None:
+        chunk_embedder = install_chunk_embedder_fn(
+            pipeline_runner,
+            output_dir=config.output_dir,
+            settings=chunk_embedding_settings,
+        )
+        if chunk_embedder is not None:
+            installed_chunk_embedders.append(chunk_embedder)
+
     live_result = live_runner(
         neo4j_settings,
         stage_run_id=stage_run_id,
@@ -283,11 +307,16 @@ def run_pdf_ingest_runtime(
         pipeline_runner_cls=PipelineRunner,
         run_pipeline_with_cleanup=run_pipeline_with_cleanup_fn,
         record_as_mapping=record_as_mapping_fn,
+        configure_pipeline=_configure_pipeline,
     )
     index_creation_strategy = live_result.index_creation_strategy
     pipeline_result = live_result.pipeline_result
     summary_counts = live_result.summary_counts
     extraction_warnings = live_result.extraction_warnings
+    chunk_embedding_stats = next(
+        (embedder.last_stats for embedder in installed_chunk_embedders if embedder.last_stats is not None),
+        None,
+    )
 
     ingest_summary = {
         "run_id": stage_run_id,
@@ -308,6 +337,8 @@ def run_pdf_ingest_runtime(
         "pipeline_config": str(PDF_PIPELINE_CONFIG_PATH),
         "pipeline_config_sha256": pipeline_config_sha256,
     }
+    if chunk_embedding_stats is not None:
+        ingest_summary["chunk_embedding"] = chunk_embedding_stats.to_summary()
     ingest_summary_path.write_text(json.dumps(ingest_summary, indent=2), encoding="utf-8")
 
     return {
@@ -382,6 +413,7 @@ def run_pdf_ingest_runtime_default(
 
 __all__ = [
     "DEFAULT_PDF_FILENAME",
+    "close_pipeline_clients",
     "dataset_metadata_from_fixtures_root",
     "normalize_pipeline_result",
     "record_as_mapping",
@@ -1,5 +1,14 @@
+from power_atlas.adapters.neo4j.pdf_ingest_runtime import PdfIngestBatchLiveResult
+from power_atlas.adapters.neo4j.pdf_ingest_runtime import PdfIngestDocumentOutcome
 from power_atlas.adapters.neo4j.pdf_ingest_runtime import PdfIngestLiveResult
+from power_atlas.adapters.neo4j.pdf_ingest_runtime import run_pdf_ingest_batch_live
 from power_atlas.adapters.neo4j.pdf_ingest_runtime import run_pdf_ingest_live
 
 
-__all__ = ["PdfIngestLiveResult", "run_pdf_ingest_live"]
\ No newline at end of file
+__all__ = [
+    "PdfIngestBatchLiveResult",
+    "PdfIngestDocumentOutcome",
+    "PdfIngestLiveResult",
+    "run_pdf_ingest_batch_live",
+    "run_pdf_ingest_live",
+]
\ No newline at end of file
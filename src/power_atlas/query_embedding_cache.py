@@ -0,0 +1,300 @@
+"""Two-tier cache of retrieval query embeddings.
+
+Every ``rag.search`` call embeds its query text through the configured
+embedder, so a repeated question in the interactive loop, a benchmark rerun
+or backend traffic pays the embeddings round-trip again.
+:class:`CachedQueryEmbedder` wraps the embedder built for a retrieval
+session and looks query vectors up first in:
+
+* an in-memory LRU of ``max_entries`` vectors shared by every retrieval
+  session in the process (:func:`shared_query_embedding_cache`);
+* optionally, a SQLite database under ``directory`` keyed by the cache key,
+  which survives process restarts and can be shared by several processes
+  (benchmark workers, backend replicas) writing at once.
+
+Keys combine the embedder model name with the normalized query text
+(whitespace collapsed, case folded, trailing ``?``/``!``/``.`` dropped), so
+questions that differ only in those respects share one vector.  The cache
+never fails a query: persistent-tier errors are logged and treated as misses.
+Disk lookups and writes run outside the in-memory LRU's lock, so a slow disk
+never stalls memory hits in other threads.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from power_atlas.embedding_cache import embedding_cache_key
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 1024
+_DISABLED_VALUES = frozenset({"0", "off", "none", "false"})
+_TRAILING_PUNCTUATION = "?!. "
+QUERY_EMBEDDING_CACHE_FILENAME = "query_embeddings.sqlite"
+QUERY_EMBEDDING_CACHE_SCHEMA_VERSION = 1
+_CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class QueryEmbeddingCacheEnvNames:
+    max_entries: str = "POWER_ATLAS_QUERY_EMBEDDING_CACHE_MAX_ENTRIES"
+    directory: str = "POWER_ATLAS_QUERY_EMBEDDING_CACHE_DIR"
+
+
+DEFAULT_QUERY_EMBEDDING_CACHE_ENV_NAMES = QueryEmbeddingCacheEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class QueryEmbeddingCacheSettings:
+    max_entries: int = DEFAULT_QUERY_EMBEDDING_CACHE_MAX_ENTRIES
+    directory: Path | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0, got {self.max_entries}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: QueryEmbeddingCacheEnvNames | None = None,
+    ) -> "QueryEmbeddingCacheSettings":
+        """Read settings; ``MAX_ENTRIES=0``/``off`` disables the cache, ``DIR`` enables the disk tier."""
+        env = os.environ if environ is None else environ
+        names = DEFAULT_QUERY_EMBEDDING_CACHE_ENV_NAMES if env_names is None else env_names
+        raw_max_entries = env.get(names.max_entries, "").strip()
+        if raw_max_entries.lower() in _DISABLED_VALUES:
+            max_entries = 0
+        else:
+            max_entries = int(raw_max_entries) if raw_max_entries else DEFAULT_QUERY_EMBEDDING_CACHE_MAX_ENTRIES
+        raw_directory = env.get(names.directory, "").strip()
+        return cls(max_entries=max_entries, directory=Path(raw_directory) if raw_directory else None)
+
+
+@dataclass(frozen=True, slots=True)
+class QueryEmbeddingCacheStats:
+    memory_hits: int
+    persistent_hits: int
+    misses: int
+    evictions: int
+    errors: int
+
+    def to_summary(self) -> dict[str, Any]:
+        hits = self.memory_hits + self.persistent_hits
+        lookups = hits + self.misses
+        return {
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+def normalize_query_text(text: str) -> str:
+    return " ".join(text.split()).casefold().rstrip(_TRAILING_PUNCTUATION)
+
+
+class _QueryEmbeddingStore:
+    """On-disk tier: one SQLite row per cache key, safe for concurrent writers.
+
+    Each call opens its own connection, so the store can be used from any
+    thread and by several processes; a key is written at most once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=_CONNECT_TIMEOUT_SECONDS, isolation_level=None)) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != QUERY_EMBEDDING_CACHE_SCHEMA_VERSION:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DROP TABLE IF EXISTS vectors")
+                connection.execute("CREATE TABLE vectors (key TEXT PRIMARY KEY, model TEXT NOT NULL, vector BLOB NOT NULL)")
+                connection.execute(f"PRAGMA user_version = {QUERY_EMBEDDING_CACHE_SCHEMA_VERSION}")
+                connection.execute("COMMIT")
+            yield connection
+
+    def get(self, key: str) -> list[float] | None:
+        with self._connect() as connection:
+            row = connection.execute("SELECT vector FROM vectors WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        vector = array("d")
+        vector.frombytes(row[0])
+        return vector.tolist()
+
+    def put(self, key: str, model: str, vector: Sequence[float]) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO vectors (key, model, vector) VALUES (?, ?, ?)",
+                (key, model, array("d", vector).tobytes()),
+            )
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU of query vectors with an optional on-disk tier."""
+
+    def __init__(self, settings: QueryEmbeddingCacheSettings | None = None) -> None:
+        self.settings = QueryEmbeddingCacheSettings() if settings is None else settings
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._persistent = (
+            None
+            if self.settings.directory is None
+            else _QueryEmbeddingStore(self.settings.directory / QUERY_EMBEDDING_CACHE_FILENAME)
+        )
+        self._memory_hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._errors = 0
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.settings.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, model: str, text: str) -> list[float] | None:
+        key = embedding_cache_key(model, normalize_query_text(text))
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+                return list(vector)
+        stored = None
+        failed = False
+        if self._persistent is not None:
+            try:
+                stored = self._persistent.get(key)
+            except (sqlite3.Error, OSError, ValueError) as exc:
+                failed = True
+                _logger.warning("Query embedding cache lookup failed at %s: %s", self._persistent.path, exc)
+        with self._lock:
+            if failed:
+                self._errors += 1
+            if stored is None:
+                self._misses += 1
+                return None
+            self._persistent_hits += 1
+            self._remember(key, stored)
+        return list(stored)
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        key = embedding_cache_key(model, normalize_query_text(text))
+        stored = [float(value) for value in vector]
+        with self._lock:
+            self._remember(key, stored)
+        if self._persistent is None:
+            return
+        try:
+            self._persistent.put(key, model, stored)
+        except (sqlite3.Error, OSError) as exc:
+            with self._lock:
+                self._errors += 1
+            _logger.warning("Query embedding cache write failed at %s: %s", self._persistent.path, exc)
+
+    def stats(self) -> QueryEmbeddingCacheStats:
+        with self._lock:
+            return QueryEmbeddingCacheStats(
+                memory_hits=self._memory_hits,
+                persistent_hits=self._persistent_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                errors=self._errors,
+            )
+
+
+class CachedQueryEmbedder:
+    """Embedder wrapper that serves ``embed_query`` from a :class:`QueryEmbeddingCache`.
+
+    Other attributes (``client``, ``model``, ...) are delegated to the wrapped
+    embedder, so batch helpers that call the OpenAI client directly keep working.
+    """
+
+    def __init__(self, embedder: Any, cache: QueryEmbeddingCache, *, model_name: str) -> None:
+        self.embedder = embedder
+        self.cache = cache
+        self.model_name = model_name
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.embedder, name)
+
+    def embed_query(self, text: str) -> list[float]:
+        cached = self.cache.get(self.model_name, text)
+        if cached is not None:
+            return cached
+        vector = self.embedder.embed_query(text)
+        if isinstance(vector, Sequence):
+            self.cache.put(self.model_name, text, vector)
+        return vector
+
+
+_shared_cache: QueryEmbeddingCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_query_embedding_cache() -> QueryEmbeddingCache | None:
+    """Return the process-wide cache built from the environment, or ``None`` when disabled."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            settings = QueryEmbeddingCacheSettings.from_env()
+            if not settings.enabled:
+                return None
+            _shared_cache = QueryEmbeddingCache(settings)
+        return _shared_cache
+
+
+def reset_shared_query_embedding_cache() -> None:
+    """Drop the process-wide cache so the next use re-reads the environment."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
+
+
+def query_embedding_cache_stats(embedder: Any) -> QueryEmbeddingCacheStats | None:
+    """Return cache stats when *embedder* is a :class:`CachedQueryEmbedder`."""
+    cache = embedder.cache if isinstance(embedder, CachedQueryEmbedder) else None
+    return None if cache is None else cache.stats()
+
+
+__all__ = [
+    "CachedQueryEmbedder",
+    "DEFAULT_QUERY_EMBEDDING_CACHE_ENV_NAMES",
+    "DEFAULT_QUERY_EMBEDDING_CACHE_MAX_ENTRIES",
+    "QUERY_EMBEDDING_CACHE_FILENAME",
+    "QueryEmbeddingCache",
+    "QueryEmbeddingCacheEnvNames",
+    "QueryEmbeddingCacheSettings",
+    "QueryEmbeddingCacheStats",
+    "normalize_query_text",
+    "query_embedding_cache_stats",
+    "reset_shared_query_embedding_cache",
+    "shared_query_embedding_cache",
+]
@@ -3,6 +3,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -11,6 +15,12 @@ import neo4j
 
 from power_atlas.contracts.pipeline import PipelineContractSnapshot
 from power_atlas.neo4j_io import validate_cypher_identifier
+from power_atlas.retrieval_result_cache import (
+    ALL_RUNS_GENERATION_SCOPE,
+    RETRIEVAL_GENERATION_BUMP_ALL_QUERY,
+    RETRIEVAL_GENERATION_BUMP_QUERY,
+    retrieval_generation_scopes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +43,52 @@ DEMO_NODE_LABELS: tuple[str, ...] = (
     "ResolvedEntityCluster",
 )
 
+# Per-run bookkeeping nodes keyed by ``run_id`` (see power_atlas.run_stats and
+# power_atlas.run_registry).  They hold no demo content, but must go with the
+# run's data so readers never trust figures for, or resolve scope to, a run
+# that no longer exists.  Deleted after the data.
+RUN_METADATA_NODE_LABELS: tuple[str, ...] = ("RunStats", "Run")
+
+
+DEFAULT_RESET_BATCH_SIZE = 10_000
+DEFAULT_RESET_PROGRESS_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class DemoResetEnvNames:
+    batch_size: str = "POWER_ATLAS_RESET_BATCH_SIZE"
+
+
+DEFAULT_DEMO_RESET_ENV_NAMES = DemoResetEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class DemoResetSettings:
+    """Batching for the demo reset.
+
+    Each batch deletes at most ``batch_size`` nodes (plus their relationships)
+    in its own transaction, so an interrupted reset keeps the batches already
+    committed and simply continues when re-run.
+    """
+
+    batch_size: int = DEFAULT_RESET_BATCH_SIZE
+    progress_interval_seconds: float = DEFAULT_RESET_PROGRESS_SECONDS
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: DemoResetEnvNames | None = None,
+    ) -> "DemoResetSettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_DEMO_RESET_ENV_NAMES if env_names is None else env_names
+        return cls(batch_size=int(env.get(names.batch_size, DEFAULT_RESET_BATCH_SIZE)))
+
 
 def demo_owned_indexes(
     pipeline_contract: PipelineContractSnapshot,
@@ -52,76 +108,283 @@ def _index_exists(driver: neo4j.Driver, index_name: str, database: str) -> bool:
     return bool(record and record["cnt"] > 0)
 
 
+def _delete_in_batches(
+    session: Any,
+    *,
+    labels: tuple[str, ...],
+    where: str,
+    parameters: Mapping[str, Any],
+    settings: DemoResetSettings,
+    phase: str,
+) -> tuple[int, int, int]:
+    """Delete matching demo nodes batch by batch; return (nodes, relationships, batches).
+
+    Stops after the first batch that deletes fewer than ``batch_size`` nodes.
+    """
+    label_conditions = " OR ".join(f"n:{label}" for label in labels)
+    scope_condition = f" AND ({where})" if where else ""
+    query = (
+        f"MATCH (n) WHERE ({label_conditions}){scope_condition} "
+        "WITH n LIMIT $batch_size DETACH DELETE n"
+    )
+    nodes_total = relationships_total = batches = 0
+    started = last_progress = time.monotonic()
+    while True:
+        counters = session.run(query, batch_size=settings.batch_size, **parameters).consume().counters
+        batches += 1
+        nodes_total += counters.nodes_deleted
+        relationships_total += counters.relationships_deleted
+        now = time.monotonic()
+        if now - last_progress >= settings.progress_interval_seconds:
+            last_progress = now
+            logger.info(
+                "Demo reset progress: phase=%s batches=%d nodes_deleted=%d relationships_deleted=%d nodes/s=%.1f",
+                phase,
+                batches,
+                nodes_total,
+                relationships_total,
+                nodes_total / (now - started) if now > started else 0.0,
+            )
+        if counters.nodes_deleted < settings.batch_size:
+            return nodes_total, relationships_total, batches
+
+
+def delete_run_nodes(
+    session: Any,
+    run_id: str,
+    *,
+    settings: DemoResetSettings | None = None,
+) -> tuple[int, int, int]:
+    """Delete every demo-owned node stamped with *run_id*, label by label, in batches.
+
+    Returns ``(nodes, relationships, batches)``.  Used by run retention to
+    prune one superseded run without touching indexes or other runs.
+    """
+    if not run_id:
+        raise ValueError("run_id must be a non-empty string.")
+    resolved_settings = DemoResetSettings.from_env() if settings is None else settings
+    nodes_total = relationships_total = batches_total = 0
+    for label in (*DEMO_NODE_LABELS, *RUN_METADATA_NODE_LABELS):
+        nodes, relationships, batches = _delete_in_batches(
+            session,
+            labels=(label,),
+            where="n.run_id = $run_id",
+            parameters={"run_id": run_id},
+            settings=resolved_settings,
+            phase=f"{label}:{run_id}",
+        )
+        nodes_total += nodes
+        relationships_total += relationships
+        batches_total += batches
+    return nodes_total, relationships_total, batches_total
+
+
+def _write_report(report: dict[str, Any], output_dir: Path | None, ts_for_filename: str) -> None:
+    if output_dir is None:
+        return
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = output_dir / f"reset_report_{ts_for_filename}.json"
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    report["report_path"] = str(report_path)
+    logger.info("Reset report written to: %s", report_path)
+
+
+def _dataset_run_ids(session: Any, dataset_id: str) -> list[str]:
+    label_conditions = " OR ".join(f"n:{label}" for label in DEMO_NODE_LABELS)
+    result = session.run(
+        f"MATCH (n) WHERE ({label_conditions}) AND n.dataset_id = $dataset_id AND n.run_id IS NOT NULL "
+        "RETURN DISTINCT n.run_id AS run_id",
+        dataset_id=dataset_id,
+    )
+    return sorted(record["run_id"] for record in result)
+
+
 def run_reset(
     *,
     driver: neo4j.Driver,
     database: str,
     output_dir: Path | None = None,
     pipeline_contract: PipelineContractSnapshot,
+    run_id: str | None = None,
+    dataset_id: str | None = None,
+    settings: DemoResetSettings | None = None,
 ) -> dict[str, Any]:
-    """Reset demo-owned graph content and indexes in *database*."""
+    """Reset demo-owned graph content and indexes in *database*.
+
+    Nodes are deleted in batches of ``settings.batch_size``, each in its own
+    transaction.  With *run_id* or *dataset_id* only that scope is deleted and
+    the shared stale-edge cleanup and index drops are skipped.  A dataset scope
+    also covers nodes without ``dataset_id`` (claims, mentions, clusters) from
+    any run that wrote nodes tagged with the dataset.
+    """
+    if run_id is not None and dataset_id is not None:
+        raise ValueError("run_reset accepts run_id or dataset_id, not both.")
+    if run_id == "" or dataset_id == "":
+        raise ValueError("run_id and dataset_id must be None or non-empty strings.")
+    resolved_settings = DemoResetSettings.from_env() if settings is None else settings
+    scoped = run_id is not None or dataset_id is not None
     now = datetime.now(timezone.utc)
     created_at = now.isoformat()
     ts_for_filename = now.strftime("%Y%m%dT%H%M%S%fZ")
     warnings_list: list[str] = []
     indexes_dropped: list[str] = []
     indexes_not_found: list[str] = []
+    if run_id is not None:
+        reset_mode = "demo_run_scoped_delete"
+    elif dataset_id is not None:
+        reset_mode = "demo_dataset_scoped_delete"
+    else:
+        reset_mode = "demo_full_graph_wipe"
 
-    label_conditions = " OR ".join(f"n:{label}" for label in DEMO_NODE_LABELS)
-    delete_query = f"MATCH (n) WHERE {label_conditions} DETACH DELETE n"
-    with driver.session(database=database) as session:
-        result = session.run(delete_query)
-        counters = result.consume().counters
-        deleted_nodes: int = counters.nodes_deleted
-        deleted_relationships: int = counters.relationships_deleted
+    report: dict[str, Any] = {
+        "created_at": created_at,
+        "target_database": database,
+        "reset_mode": reset_mode,
+        "scope": {"run_id": run_id, "dataset_id": dataset_id, "run_ids": [run_id] if run_id else []},
+        "demo_labels_deleted": list(DEMO_NODE_LABELS),
+        "deleted_nodes": 0,
+        "deleted_relationships": 0,
+        "batch_size": resolved_settings.batch_size,
+        "batches": 0,
+        "completed": False,
+    }
+
+    # Deleted counts accumulate in the report as phases finish, so an
+    # interrupted reset still records what it removed before re-raising.
+    # A full wipe deletes every matched node, so one multi-label query never
+    # rescans survivors.  Scoped deletes go label by label so each batch is a
+    # label scan (or index seek) rather than a scan over every demo node.
+    started = time.monotonic()
+    phases: list[tuple[str, tuple[str, ...], str, dict[str, Any]]]
+    if run_id is not None:
+        phases = [
+            (label, (label,), "n.run_id = $run_id", {"run_id": run_id})
+            for label in (*DEMO_NODE_LABELS, *RUN_METADATA_NODE_LABELS)
+        ]
+    elif dataset_id is not None:
+        with driver.session(database=database) as session:
+            run_ids = _dataset_run_ids(session, dataset_id)
+        report["scope"]["run_ids"] = run_ids
+        # Run-only nodes go first: the dataset-tagged nodes are what identify
+        # the runs, so they must survive until the rest is gone for a re-run to
+        # resume correctly.
+        phases = [
+            (
+                f"{label}:runs",
+                (label,),
+                "n.dataset_id IS NULL AND n.run_id IN $run_ids",
+                {"run_ids": run_ids},
+            )
+            for label in DEMO_NODE_LABELS
+        ] + [
+            (label, (label,), "n.dataset_id = $dataset_id", {"dataset_id": dataset_id})
+            for label in DEMO_NODE_LABELS
+        ] + [
+            (
+                f"{label}:runs",
+                (label,),
+                "n.run_id IN $run_ids OR n.dataset_id = $dataset_id",
+                {"run_ids": run_ids, "dataset_id": dataset_id},
+            )
+            for label in RUN_METADATA_NODE_LABELS
+        ]
+    else:
+        phases = [("all", (*DEMO_NODE_LABELS, *RUN_METADATA_NODE_LABELS), "", {})]
+    try:
+        with driver.session(database=database) as session:
+            for phase, labels, where, parameters in phases:
+                nodes, relationships, batches = _delete_in_batches(
+                    session,
+                    labels=labels,
+                    where=where,
+                    parameters=parameters,
+                    settings=resolved_settings,
+                    phase=phase,
+                )
+                report["deleted_nodes"] += nodes
+                report["deleted_relationships"] += relationships
+                report["batches"] += batches
+        # Cached retrieval results may cite the deleted chunks.  Bumped even
+        # when nothing was deleted, since a previous interrupted reset may
+        # have deleted the data without getting this far.
+        with driver.session(database=database) as bump_session:
+            if scoped:
+                bump_session.run(
+                    RETRIEVAL_GENERATION_BUMP_QUERY,
+                    scopes=retrieval_generation_scopes(report["scope"]["run_ids"]),
+                ).consume()
+            else:
+                bump_session.run(
+                    RETRIEVAL_GENERATION_BUMP_ALL_QUERY, all_runs_scope=ALL_RUNS_GENERATION_SCOPE
+                ).consume()
+    except Exception as exc:
+        report["error"] = f"{type(exc).__name__}: {exc}"
+        report["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        _write_report(report, output_dir, ts_for_filename)
+        logger.error(
+            "Demo reset interrupted after %d node(s); re-run the same reset to continue.",
+            report["deleted_nodes"],
+        )
+        raise
+    elapsed = time.monotonic() - started
+    deleted_nodes: int = report["deleted_nodes"]
+    deleted_relationships: int = report["deleted_relationships"]
 
     if deleted_nodes == 0:
         label_list = ", ".join(DEMO_NODE_LABELS)
+        scope_text = f" in scope run_id={run_id!r}" if run_id else (
+            f" in scope dataset_id={dataset_id!r}" if dataset_id else ""
+        )
         warnings_list.append(
-            f"No demo-owned nodes found for labels ({label_list}); nothing deleted (idempotent no-op)."
+            f"No demo-owned nodes found for labels ({label_list}){scope_text}; nothing deleted (idempotent no-op)."
         )
     logger.info(
-        "Demo node deletion: database=%s nodes_deleted=%d relationships_deleted=%d",
+        "Demo node deletion: database=%s mode=%s nodes_deleted=%d relationships_deleted=%d batches=%d seconds=%.2f",
         database,
+        reset_mode,
         deleted_nodes,
         deleted_relationships,
+        report["batches"],
+        elapsed,
     )
 
-    stale_query = (
-        "MATCH (c:ExtractedClaim)-[r:HAS_SUBJECT|HAS_OBJECT|HAS_SUBJECT_MENTION|HAS_OBJECT_MENTION]->(m:EntityMention) DELETE r"
-    )
-    with driver.session(database=database) as stale_session:
-        stale_result = stale_session.run(stale_query)
-        stale_counters = stale_result.consume().counters
-        stale_participation_edges_deleted: int = stale_counters.relationships_deleted
-
-    if stale_participation_edges_deleted > 0:
-        warnings_list.append(
-            f"Removed {stale_participation_edges_deleted} stale pre-v0.3 participation "
-            "edge(s) (:HAS_SUBJECT, :HAS_OBJECT, :HAS_SUBJECT_MENTION, or "
-            ":HAS_OBJECT_MENTION).  These relationship types were retired prior to v0.3 and "
-            "replaced by :HAS_PARTICIPANT {role}.  Old demo graphs are non-migratable — "
-            "a full reset followed by a fresh pipeline run is required."
+    stale_participation_edges_deleted = 0
+    if not scoped:
+        stale_query = (
+            "MATCH (c:ExtractedClaim)-[r:HAS_SUBJECT|HAS_OBJECT|HAS_SUBJECT_MENTION|HAS_OBJECT_MENTION]->(m:EntityMention) DELETE r"
         )
+        with driver.session(database=database) as stale_session:
+            stale_result = stale_session.run(stale_query)
+            stale_counters = stale_result.consume().counters
+            stale_participation_edges_deleted = stale_counters.relationships_deleted
 
-    logger.info(
-        "Stale pre-v0.3 participation edge cleanup: stale_deleted=%d",
-        stale_participation_edges_deleted,
-    )
-
-    for index_name in demo_owned_indexes(pipeline_contract):
-        if _index_exists(driver, index_name, database):
-            validate_cypher_identifier(index_name, "index name")
-            with driver.session(database=database) as drop_session:
-                drop_session.run(f"DROP INDEX {index_name} IF EXISTS")
-            indexes_dropped.append(index_name)
-            logger.info("Dropped demo index: %s", index_name)
-        else:
-            indexes_not_found.append(index_name)
+        if stale_participation_edges_deleted > 0:
             warnings_list.append(
-                f"Index '{index_name}' not found; skipped (idempotent no-op)."
+                f"Removed {stale_participation_edges_deleted} stale pre-v0.3 participation "
+                "edge(s) (:HAS_SUBJECT, :HAS_OBJECT, :HAS_SUBJECT_MENTION, or "
+                ":HAS_OBJECT_MENTION).  These relationship types were retired prior to v0.3 and "
+                "replaced by :HAS_PARTICIPANT {role}.  Old demo graphs are non-migratable — "
+                "a full reset followed by a fresh pipeline run is required."
             )
-            logger.info("Demo index not found (already absent): %s", index_name)
+
+        logger.info(
+            "Stale pre-v0.3 participation edge cleanup: stale_deleted=%d",
+            stale_participation_edges_deleted,
+        )
+
+        for index_name in demo_owned_indexes(pipeline_contract):
+            if _index_exists(driver, index_name, database):
+                validate_cypher_identifier(index_name, "index name")
+                with driver.session(database=database) as drop_session:
+                    drop_session.run(f"DROP INDEX {index_name} IF EXISTS")
+                indexes_dropped.append(index_name)
+                logger.info("Dropped demo index: %s", index_name)
+            else:
+                indexes_not_found.append(index_name)
+                warnings_list.append(
+                    f"Index '{index_name}' not found; skipped (idempotent no-op)."
+                )
+                logger.info("Demo index not found (already absent): %s", index_name)
 
     idempotent = (
         deleted_nodes == 0
@@ -129,28 +392,31 @@ def run_reset(
         and stale_participation_edges_deleted == 0
     )
 
-    report: dict[str, Any] = {
-        "created_at": created_at,
-        "target_database": database,
-        "reset_mode": "demo_full_graph_wipe",
-        "demo_labels_deleted": list(DEMO_NODE_LABELS),
-        "deleted_nodes": deleted_nodes,
-        "deleted_relationships": deleted_relationships,
-        "stale_participation_edges_deleted": stale_participation_edges_deleted,
-        "indexes_dropped": indexes_dropped,
-        "indexes_not_found": indexes_not_found,
-        "warnings": warnings_list,
-        "idempotent": idempotent,
-    }
-
-    if output_dir is not None:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = output_dir / f"reset_report_{ts_for_filename}.json"
-        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
-        report["report_path"] = str(report_path)
-        logger.info("Reset report written to: %s", report_path)
-
+    report.update(
+        {
+            "stale_participation_edges_deleted": stale_participation_edges_deleted,
+            "indexes_dropped": indexes_dropped,
+            "indexes_not_found": indexes_not_found,
+            "elapsed_seconds": round(elapsed, 3),
+            "nodes_per_second": round(deleted_nodes / elapsed, 1) if elapsed > 0 else None,
+            "relationships_per_second": round(deleted_relationships / elapsed, 1) if elapsed > 0 else None,
+            "completed": True,
+            "warnings": warnings_list,
+            "idempotent": idempotent,
+        }
+    )
+    _write_report(report, output_dir, ts_for_filename)
     return report
 
 
-__all__ = ["DEMO_NODE_LABELS", "demo_owned_indexes", "run_reset"]
\ No newline at end of file
+__all__ = [
+    "DEFAULT_DEMO_RESET_ENV_NAMES",
+    "DEFAULT_RESET_BATCH_SIZE",
+    "DEMO_NODE_LABELS",
+    "DemoResetEnvNames",
+    "DemoResetSettings",
+    "RUN_METADATA_NODE_LABELS",
+    "delete_run_nodes",
+    "demo_owned_indexes",
+    "run_reset",
+]
\ No newline at end of file
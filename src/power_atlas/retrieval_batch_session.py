@@ -0,0 +1,274 @@
+"""Batch question answering over one shared retrieval session.
+
+Single-shot ``ask`` builds the Neo4j driver, embedder, retriever and GraphRAG
+pair for every question.  :func:`run_batch_qa_session` takes a session that
+is already built and answers a whole question file with it:
+
+* question texts are embedded up front, ``embedding_batch_size`` per
+  embeddings request, and served to the retriever through
+  :class:`PrecomputedQueryEmbedder`, so retrieval makes no per-question
+  embedding call;
+* at most ``concurrency`` questions are retrieved and answered at once;
+* each result is appended to a JSONL artifact as soon as it (and every
+  question before it) is done, so the file is in input order and a crash
+  keeps every line already written.
+
+A failing question is recorded with ``status="error"`` and does not stop the
+batch.  The returned summary carries throughput, latency percentiles and the
+evidence-level breakdown.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from power_atlas.batched_chunk_embedder import embed_texts
+from power_atlas.query_embedding_cache import CachedQueryEmbedder, query_embedding_cache_stats
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_QA_CONCURRENCY = 4
+DEFAULT_BATCH_QA_EMBEDDING_BATCH_SIZE = 64
+
+
+@dataclass(frozen=True)
+class BatchQaEnvNames:
+    concurrency: str = "POWER_ATLAS_BATCH_QA_CONCURRENCY"
+    embedding_batch_size: str = "POWER_ATLAS_BATCH_QA_EMBEDDING_BATCH_SIZE"
+
+
+DEFAULT_BATCH_QA_ENV_NAMES = BatchQaEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class BatchQaSettings:
+    concurrency: int = DEFAULT_BATCH_QA_CONCURRENCY
+    embedding_batch_size: int = DEFAULT_BATCH_QA_EMBEDDING_BATCH_SIZE
+
+    def __post_init__(self) -> None:
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {self.concurrency}")
+        if self.embedding_batch_size < 1:
+            raise ValueError(f"embedding_batch_size must be >= 1, got {self.embedding_batch_size}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: BatchQaEnvNames | None = None,
+    ) -> "BatchQaSettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_BATCH_QA_ENV_NAMES if env_names is None else env_names
+        return cls(
+            concurrency=int(env.get(names.concurrency, DEFAULT_BATCH_QA_CONCURRENCY)),
+            embedding_batch_size=int(
+                env.get(names.embedding_batch_size, DEFAULT_BATCH_QA_EMBEDDING_BATCH_SIZE)
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BatchQuestion:
+    question_id: str
+    question: str
+
+
+def read_batch_questions(path: Path) -> list[BatchQuestion]:
+    """Read ``{"question": ..., "id": ...}`` lines; ``id`` defaults to ``q<line>``."""
+    questions: list[BatchQuestion] = []
+    with Path(path).open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({exc.msg})") from exc
+            question = payload.get("question") if isinstance(payload, dict) else None
+            if not isinstance(question, str) or not question.strip():
+                raise ValueError(f"{path}:{line_number}: expected an object with a non-empty 'question'")
+            question_id = payload.get("id", payload.get("question_id", f"q{line_number}"))
+            questions.append(BatchQuestion(question_id=str(question_id), question=question.strip()))
+    return questions
+
+
+class PrecomputedQueryEmbedder:
+    """Serve precomputed query vectors; embed anything else with the wrapped embedder."""
+
+    def __init__(self, embedder: Any, vectors: Mapping[str, Sequence[float]]) -> None:
+        self.embedder = embedder
+        self.vectors = dict(vectors)
+        self.misses = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        vector = self.vectors.get(text)
+        if vector is not None:
+            return list(vector)
+        self.misses += 1
+        return self.embedder.embed_query(text)
+
+
+def precompute_query_embeddings(
+    embedder: Any,
+    texts: Sequence[str],
+    *,
+    batch_size: int,
+    embed_batch: Callable[[Any, Sequence[str]], list[list[float]]] = embed_texts,
+) -> tuple[dict[str, list[float]], int]:
+    """Embed the unique *texts* ``batch_size`` per request; return (vectors, requests).
+
+    A :class:`CachedQueryEmbedder` is consulted first and fed the new vectors.
+    """
+    vectors: dict[str, list[float]] = {}
+    cached_embedder = embedder if isinstance(embedder, CachedQueryEmbedder) else None
+    if cached_embedder is not None:
+        for text in dict.fromkeys(texts):
+            cached = cached_embedder.cache.get(cached_embedder.model_name, text)
+            if cached is not None:
+                vectors[text] = cached
+    unique = [text for text in dict.fromkeys(texts) if text not in vectors]
+    requests = 0
+    for start in range(0, len(unique), batch_size):
+        batch = unique[start : start + batch_size]
+        embedded = embed_batch(embedder, batch)
+        vectors.update(zip(batch, embedded))
+        if cached_embedder is not None:
+            for text, vector in zip(batch, embedded):
+                cached_embedder.cache.put(cached_embedder.model_name, text, vector)
+        requests += 1
+    return vectors, requests
+
+
+def _latency_percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_batch_qa_session(
+    *,
+    retriever: Any,
+    questions: Sequence[BatchQuestion],
+    output_path: Path,
+    answer_question: Callable[[str], dict[str, Any]],
+    settings: BatchQaSettings | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[str, Any]:
+    """Answer *questions* over a shared session and stream results to *output_path*.
+
+    *answer_question* runs retrieval plus generation for one question and
+    returns the record fields (answer, citation-quality fields, hit count).
+    """
+    resolved_settings = BatchQaSettings.from_env() if settings is None else settings
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    started = clock()
+
+    embedding: dict[str, Any] = {"requests": 0, "seconds": 0.0, "batch_size": resolved_settings.embedding_batch_size}
+    original_embedder = getattr(retriever, "embedder", None)
+    precomputed: PrecomputedQueryEmbedder | None = None
+    if original_embedder is not None and questions:
+        embed_started = clock()
+        vectors, embedding["requests"] = precompute_query_embeddings(
+            original_embedder,
+            [question.question for question in questions],
+            batch_size=resolved_settings.embedding_batch_size,
+        )
+        embedding["seconds"] = round(clock() - embed_started, 3)
+        precomputed = PrecomputedQueryEmbedder(original_embedder, vectors)
+        retriever.embedder = precomputed
+
+    def _answer(question: BatchQuestion) -> dict[str, Any]:
+        question_started = clock()
+        record: dict[str, Any] = {"question_id": question.question_id, "question": question.question}
+        try:
+            record.update(answer_question(question.question))
+            record["status"] = "ok"
+        except Exception as exc:  # one bad question must not abort the batch
+            _logger.warning("Batch question %s failed: %s", question.question_id, exc)
+            record["status"] = "error"
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        record["latency_ms"] = round((clock() - question_started) * 1000, 3)
+        return record
+
+    latencies: list[float] = []
+    evidence_levels: Counter[str] = Counter()
+    failed = 0
+    window = resolved_settings.concurrency * 2
+    try:
+        with output_path.open("w", encoding="utf-8") as handle, ThreadPoolExecutor(
+            max_workers=resolved_settings.concurrency, thread_name_prefix="batch-qa"
+        ) as executor:
+            pending: deque[Future[dict[str, Any]]] = deque()
+
+            def _write_next() -> None:
+                nonlocal failed
+                record = pending.popleft().result()
+                handle.write(json.dumps(record, default=str) + "\n")
+                handle.flush()
+                latencies.append(record["latency_ms"])
+                if record["status"] == "ok":
+                    evidence_levels[str(record.get("evidence_level"))] += 1
+                else:
+                    failed += 1
+
+            for question in questions:
+                pending.append(executor.submit(_answer, question))
+                if len(pending) >= window:
+                    _write_next()
+            while pending:
+                _write_next()
+    finally:
+        if precomputed is not None:
+            retriever.embedder = original_embedder
+
+    elapsed = clock() - started
+    ordered = sorted(latencies)
+    embedding["misses"] = 0 if precomputed is None else precomputed.misses
+    cache_stats = query_embedding_cache_stats(original_embedder)
+    if cache_stats is not None:
+        embedding["query_cache"] = cache_stats.to_summary()
+    return {
+        "output_path": str(output_path),
+        "questions": len(questions),
+        "succeeded": len(questions) - failed,
+        "failed": failed,
+        "concurrency": resolved_settings.concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "questions_per_second": round(len(questions) / elapsed, 3) if elapsed > 0 else None,
+        "latency_ms": (
+            {
+                "p50": _latency_percentile(ordered, 0.50),
+                "p95": _latency_percentile(ordered, 0.95),
+                "max": ordered[-1],
+            }
+            if ordered
+            else None
+        ),
+        "evidence_levels": dict(sorted(evidence_levels.items())),
+        "embedding": embedding,
+    }
+
+
+__all__ = [
+    "BatchQaEnvNames",
+    "BatchQaSettings",
+    "BatchQuestion",
+    "DEFAULT_BATCH_QA_CONCURRENCY",
+    "DEFAULT_BATCH_QA_EMBEDDING_BATCH_SIZE",
+    "DEFAULT_BATCH_QA_ENV_NAMES",
+    "PrecomputedQueryEmbedder",
+    "precompute_query_embeddings",
+    "read_batch_questions",
+    "run_batch_qa_session",
+]
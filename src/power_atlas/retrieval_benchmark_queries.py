@@ -7,6 +7,7 @@ from power_atlas.adapters.neo4j.retrieval_benchmark_queries import Q_PAIRWISE_CA
 from power_atlas.adapters.neo4j.retrieval_benchmark_queries import RetrievalBenchmarkQuerySpec
 from power_atlas.adapters.neo4j.retrieval_benchmark_queries import build_pairwise_query_specs
 from power_atlas.adapters.neo4j.retrieval_benchmark_queries import build_single_entity_query_specs
+from power_atlas.adapters.neo4j.retrieval_benchmark_queries import execute_retrieval_benchmark_query
 from power_atlas.adapters.neo4j.retrieval_benchmark_queries import fetch_retrieval_benchmark_query_rows
 
 
@@ -20,5 +21,6 @@ __all__ = [
     "RetrievalBenchmarkQuerySpec",
     "build_pairwise_query_specs",
     "build_single_entity_query_specs",
+    "execute_retrieval_benchmark_query",
     "fetch_retrieval_benchmark_query_rows",
 ]
\ No newline at end of file
@@ -3,22 +3,77 @@ from __future__ import annotations
 import dataclasses
 import json
 import logging
+import math
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timezone, datetime
 from pathlib import Path
 from typing import Any
 
 from power_atlas.backend_run_catalog import resolve_run_root, resolve_runs_root
+from power_atlas.bootstrap import create_neo4j_driver
 from power_atlas.retrieval_benchmark_queries import Q_CANONICAL_SINGLE as _Q_CANONICAL_SINGLE
 from power_atlas.retrieval_benchmark_queries import Q_CATALOG_EXISTENCE_CHECK as _Q_CATALOG_EXISTENCE_CHECK
 from power_atlas.retrieval_benchmark_queries import Q_LOWER_LAYER_CHAIN as _Q_LOWER_LAYER_CHAIN
 from power_atlas.retrieval_benchmark_queries import Q_PAIRWISE_CANONICAL as _Q_PAIRWISE_CANONICAL
 from power_atlas.retrieval_benchmark_queries import build_pairwise_query_specs
+from power_atlas.retrieval_benchmark_queries import RetrievalBenchmarkQuerySpec
 from power_atlas.retrieval_benchmark_queries import build_single_entity_query_specs
-from power_atlas.retrieval_benchmark_queries import fetch_retrieval_benchmark_query_rows
+from power_atlas.retrieval_benchmark_queries import execute_retrieval_benchmark_query
 from power_atlas.settings import Neo4jSettings
 
 _logger = logging.getLogger(__name__)
 
+_ENABLED_VALUES = frozenset({"1", "on", "true", "yes"})
+
+
+@dataclasses.dataclass(frozen=True)
+class RetrievalBenchmarkExecutionEnvNames:
+    workers: str = "POWER_ATLAS_RETRIEVAL_BENCHMARK_WORKERS"
+    profile: str = "POWER_ATLAS_RETRIEVAL_BENCHMARK_PROFILE"
+    repeats: str = "POWER_ATLAS_RETRIEVAL_BENCHMARK_REPEATS"
+
+
+DEFAULT_RETRIEVAL_BENCHMARK_EXECUTION_ENV_NAMES = RetrievalBenchmarkExecutionEnvNames()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RetrievalBenchmarkExecutionSettings:
+    """How the live benchmark queries are executed.
+
+    ``workers`` queries run concurrently over one pooled driver; ``1`` keeps
+    the original one-at-a-time order.  ``repeats`` re-runs every query to get
+    stable latency percentiles (rows are taken from the first pass), and
+    ``profile`` runs each query under ``PROFILE`` to record db hits.
+    """
+
+    workers: int = 1
+    profile: bool = False
+    repeats: int = 1
+
+    def __post_init__(self) -> None:
+        if self.workers < 1:
+            raise ValueError(f"workers must be >= 1, got {self.workers}")
+        if self.repeats < 1:
+            raise ValueError(f"repeats must be >= 1, got {self.repeats}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: RetrievalBenchmarkExecutionEnvNames | None = None,
+    ) -> "RetrievalBenchmarkExecutionSettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_RETRIEVAL_BENCHMARK_EXECUTION_ENV_NAMES if env_names is None else env_names
+        return cls(
+            workers=int(env.get(names.workers, 1)),
+            profile=env.get(names.profile, "").strip().lower() in _ENABLED_VALUES,
+            repeats=int(env.get(names.repeats, 1)),
+        )
+
 
 @dataclasses.dataclass(frozen=True)
 class BenchmarkCaseDefinition:
@@ -358,6 +413,7 @@ class RetrievalBenchmarkArtifact:
     case_results: list[dict[str, Any]]
     pairwise_results: list[dict[str, Any]]
     benchmark_summary: dict[str, Any]
+    query_performance: dict[str, Any] = dataclasses.field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return dataclasses.asdict(self)
@@ -448,6 +504,7 @@ def build_benchmark_artifact(
     case_results: list[BenchmarkCaseResult],
     pairwise_results: list[PairwiseCaseResult],
     generated_at: str | None = None,
+    query_performance: dict[str, Any] | None = None,
 ) -> RetrievalBenchmarkArtifact:
     timestamp = generated_at or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     summary = _compute_benchmark_summary(case_results, pairwise_results)
@@ -459,9 +516,53 @@ def build_benchmark_artifact(
         case_results=[result.to_dict() for result in case_results],
         pairwise_results=[result.to_dict() for result in pairwise_results],
         benchmark_summary=summary,
+        query_performance=query_performance or {},
     )
 
 
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_query_timings(
+    timings: list[dict[str, Any]],
+    *,
+    execution: RetrievalBenchmarkExecutionSettings,
+    wall_ms: float,
+) -> dict[str, Any]:
+    """Per-query latency percentiles (and db hits when profiled) for the artifact."""
+    by_query: dict[str, list[dict[str, Any]]] = {}
+    for timing in timings:
+        by_query.setdefault(timing["query"], []).append(timing)
+    queries: dict[str, dict[str, Any]] = {}
+    for query, entries in by_query.items():
+        latencies = [entry["elapsed_ms"] for entry in entries]
+        stats: dict[str, Any] = {
+            "count": len(entries),
+            "p50_ms": round(_percentile(latencies, 0.5), 3),
+            "p95_ms": round(_percentile(latencies, 0.95), 3),
+            "max_ms": round(max(latencies), 3),
+        }
+        if execution.profile:
+            db_hits = [entry["db_hits"] for entry in entries if entry.get("db_hits") is not None]
+            stats["db_hits_total"] = sum(db_hits) if db_hits else None
+            stats["db_hits_max"] = max(db_hits) if db_hits else None
+        queries[query] = stats
+    return {
+        "workers": execution.workers,
+        "repeats": execution.repeats,
+        "profile": execution.profile,
+        "wall_ms": round(wall_ms, 3),
+        "query_count": len(timings),
+        "queries": queries,
+        "timings": timings,
+    }
+
+
 def run_retrieval_benchmark_runtime(
     *,
     dry_run: bool,
@@ -473,6 +574,7 @@ def run_retrieval_benchmark_runtime(
     benchmark_cases: list[BenchmarkCaseDefinition] | None = None,
     suppress_alignment_version_warning: bool = False,
     logger: logging.Logger | None = None,
+    execution_settings: RetrievalBenchmarkExecutionSettings | None = None,
 ) -> dict[str, Any]:
     active_logger = _logger if logger is None else logger
     cases = benchmark_cases if benchmark_cases is not None else BENCHMARK_CASES
@@ -537,8 +639,10 @@ def run_retrieval_benchmark_runtime(
         "dataset_id": dataset_id,
         "alignment_version": alignment_version,
     }
-    case_results: list[BenchmarkCaseResult] = []
-    pairwise_results: list[PairwiseCaseResult] = []
+    execution = (
+        RetrievalBenchmarkExecutionSettings.from_env() if execution_settings is None else execution_settings
+    )
+    planned: list[tuple[BenchmarkCaseDefinition, list[RetrievalBenchmarkQuerySpec]]] = []
 
     for case_def in cases:
         if not case_def.entity_names:
@@ -562,13 +666,66 @@ def run_retrieval_benchmark_runtime(
                 entity_a,
                 entity_b,
             )
-            query_rows = fetch_retrieval_benchmark_query_rows(
-                neo4j_settings,
-                neo4j_settings.database,
-                base_params=params,
-                query_specs=build_pairwise_query_specs(entity_a, entity_b),
-                logger=active_logger,
+            planned.append((case_def, build_pairwise_query_specs(entity_a, entity_b)))
+        else:
+            active_logger.info(
+                "retrieval_benchmark: running case %r (entity=%r)",
+                case_def.case_id,
+                entity_name,
             )
+            planned.append((case_def, build_single_entity_query_specs(entity_name)))
+
+    # Every (case, query) pair is independent: run them over one pooled driver,
+    # concurrently when more than one worker is configured.
+    tasks = [
+        (repeat, case_index, spec)
+        for repeat in range(execution.repeats)
+        for case_index, (_case_def, specs) in enumerate(planned)
+        for spec in specs
+    ]
+
+    def _run_task(
+        task: tuple[int, int, RetrievalBenchmarkQuerySpec],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        repeat, case_index, (result_key, log_label, cypher, extra_params) = task
+        active_logger.info(
+            "retrieval_benchmark: running %s query for case %r",
+            log_label,
+            planned[case_index][0].case_id,
+        )
+        rows, stats = execute_retrieval_benchmark_query(
+            driver,
+            neo4j_settings.database,
+            cypher=cypher,
+            parameters={**params, **(extra_params or {})},
+            profile=execution.profile,
+        )
+        return rows, {"case_id": planned[case_index][0].case_id, "query": result_key, "repeat": repeat, **stats}
+
+    started = time.perf_counter()
+    with create_neo4j_driver(neo4j_settings) as driver:
+        if execution.workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(execution.workers, len(tasks)),
+                thread_name_prefix="retrieval_benchmark",
+            ) as executor:
+                outcomes = list(executor.map(_run_task, tasks))
+        else:
+            outcomes = [_run_task(task) for task in tasks]
+    wall_ms = (time.perf_counter() - started) * 1000.0
+
+    rows_by_case: list[dict[str, list[dict[str, Any]]]] = [{} for _ in planned]
+    timings: list[dict[str, Any]] = []
+    for (repeat, case_index, spec), (rows, timing) in zip(tasks, outcomes):
+        if repeat == 0:
+            rows_by_case[case_index][spec[0]] = rows
+        timings.append(timing)
+    query_performance = summarize_query_timings(timings, execution=execution, wall_ms=wall_ms)
+
+    case_results: list[BenchmarkCaseResult] = []
+    pairwise_results: list[PairwiseCaseResult] = []
+    for (case_def, _specs), query_rows in zip(planned, rows_by_case):
+        if case_def.case_type == "pairwise_entity":
             pairwise_rows = query_rows["pairwise_rows"]
             pairwise_results.append(
                 PairwiseCaseResult(
@@ -582,18 +739,6 @@ def run_retrieval_benchmark_runtime(
                 )
             )
         else:
-            active_logger.info(
-                "retrieval_benchmark: running case %r (entity=%r)",
-                case_def.case_id,
-                entity_name,
-            )
-            query_rows = fetch_retrieval_benchmark_query_rows(
-                neo4j_settings,
-                neo4j_settings.database,
-                base_params=params,
-                query_specs=build_single_entity_query_specs(entity_name),
-                logger=active_logger,
-            )
             case_results.append(
                 build_benchmark_case_result(
                     case_def=case_def,
@@ -611,6 +756,7 @@ def run_retrieval_benchmark_runtime(
         alignment_version=alignment_version,
         case_results=case_results,
         pairwise_results=pairwise_results,
+        query_performance=query_performance,
     )
     artifact_path.write_text(artifact.to_json(), encoding="utf-8")
     active_logger.info("retrieval_benchmark: artifact written to %s", artifact_path)
@@ -634,8 +780,11 @@ __all__ = [
     "BENCHMARK_CASES",
     "BenchmarkCaseDefinition",
     "BenchmarkCaseResult",
+    "DEFAULT_RETRIEVAL_BENCHMARK_EXECUTION_ENV_NAMES",
     "PairwiseCaseResult",
     "RetrievalBenchmarkArtifact",
+    "RetrievalBenchmarkExecutionEnvNames",
+    "RetrievalBenchmarkExecutionSettings",
     "_Q_CANONICAL_SINGLE",
     "_Q_CATALOG_EXISTENCE_CHECK",
     "_Q_LOWER_LAYER_CHAIN",
@@ -651,4 +800,5 @@ __all__ = [
     "build_benchmark_case_result",
     "run_retrieval_benchmark_runtime",
     "run_retrieval_benchmark_runtime_default",
+    "summarize_query_timings",
 ]
\ No newline at end of file
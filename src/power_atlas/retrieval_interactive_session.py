@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
 from typing import Any
 
+from power_atlas.query_embedding_cache import QueryEmbeddingCacheStats, query_embedding_cache_stats
+from power_atlas.retrieval_message_history import estimate_messages_tokens, estimate_text_tokens
+
 
 def initialize_interactive_session(
     *,
@@ -21,6 +25,38 @@ def initialize_interactive_session(
     return history
 
 
+def format_turn_budget_summary(
+    *,
+    turn: int,
+    question: str,
+    history: Any,
+    context_tokens: int,
+    latency_seconds: float,
+    query_embedding_cache: QueryEmbeddingCacheStats | None = None,
+) -> str:
+    """Return the per-turn prompt-size and latency line shown in debug mode.
+
+    Token counts are estimates; the history is counted as it was sent to the
+    model (before this turn's messages were added).  *query_embedding_cache*
+    adds the session's cumulative query-embedding cache hit rate.
+    """
+    history_tokens = getattr(history, "token_count", None)
+    if history_tokens is None:
+        history_tokens = estimate_messages_tokens(list(history.messages))
+    prompt_tokens = estimate_text_tokens(question) + context_tokens + history_tokens
+    summary = (
+        f"[debug] turn={turn} prompt_tokens~{prompt_tokens} "
+        f"(history={history_tokens} context={context_tokens}) latency_ms={latency_seconds * 1000:.0f}"
+    )
+    condensed = getattr(history, "condensed_turns", None)
+    if condensed is not None:
+        summary += f" history_condensed={condensed} history_dropped={history.dropped_turns}"
+    if query_embedding_cache is not None:
+        cache_summary = query_embedding_cache.to_summary()
+        summary += f" embed_cache_hit_rate={cache_summary['hit_rate']} (lookups={cache_summary['lookups']})"
+    return summary
+
+
 def run_interactive_session_loop(
     *,
     rag: Any,
@@ -45,6 +81,7 @@ def run_interactive_session_loop(
         input_fn = input
     if print_fn is None:
         print_fn = print
+    turn = 0
     try:
         while True:
             try:
@@ -56,6 +93,8 @@ def run_interactive_session_loop(
                 continue
             if question.lower() in ("exit", "quit"):
                 break
+            turn += 1
+            started = time.perf_counter()
             turn_result = run_interactive_turn(
                 rag,
                 question=question,
@@ -71,6 +110,7 @@ def run_interactive_session_loop(
                 format_postprocess_debug_summary=format_postprocess_debug_summary,
                 count_malformed_diagnostics=count_malformed_diagnostics,
             )
+            latency_seconds = time.perf_counter() - started
             print_fn(f"\nAnswer:\n{turn_result.display_answer}\n")
             if turn_result.citation_fallback_applied:
                 print_fn(
@@ -78,6 +118,18 @@ def run_interactive_session_loop(
                 )
             if turn_result.debug_summary is not None:
                 print_fn(turn_result.debug_summary)
+                print_fn(
+                    format_turn_budget_summary(
+                        turn=turn,
+                        question=question,
+                        history=history,
+                        context_tokens=getattr(turn_result, "context_tokens", 0),
+                        latency_seconds=latency_seconds,
+                        query_embedding_cache=query_embedding_cache_stats(
+                            getattr(getattr(rag, "retriever", None), "embedder", None)
+                        ),
+                    )
+                )
             history.add_messages(
                 [
                     llm_message_factory(role="user", content=question),
@@ -88,4 +140,8 @@ def run_interactive_session_loop(
         print_fn()
 
 
-__all__ = ["initialize_interactive_session", "run_interactive_session_loop"]
\ No newline at end of file
+__all__ = [
+    "format_turn_budget_summary",
+    "initialize_interactive_session",
+    "run_interactive_session_loop",
+]
\ No newline at end of file
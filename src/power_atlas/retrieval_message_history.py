@@ -0,0 +1,183 @@
+"""Token-budgeted message history for interactive Q&A sessions.
+
+GraphRAG sends the whole message history twice per turn: once to summarize
+the conversation into the retrieval query and once alongside the answer
+prompt.  An unbounded ``InMemoryMessageHistory`` therefore makes every turn
+slower and more expensive than the last.
+
+:class:`TokenBudgetMessageHistory` keeps the last ``keep_turns`` turns
+verbatim, condenses older turns into one short "earlier turns" system
+message, and drops the oldest condensed (then verbatim) turns while the
+estimated size exceeds ``max_tokens``.  ``[CITATION|...]`` tokens are
+stripped from assistant answers before they are stored: history is
+conversational context only, never evidence, so the tokens only cost prompt
+space.  Token counts are estimated at four characters per token, the same
+heuristic the claim-extraction scheduler uses before usage is reported.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import textwrap
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from power_atlas.adapters.graphrag_retrieval import InMemoryMessageHistory, LLMMessage
+
+DEFAULT_HISTORY_MAX_TOKENS = 2000
+DEFAULT_HISTORY_KEEP_TURNS = 3
+DEFAULT_HISTORY_SUMMARY_CHARS = 200
+
+_CHARS_PER_TOKEN = 4
+_MESSAGE_OVERHEAD_TOKENS = 4
+_CITATION_TOKEN_RE = re.compile(r"[ \t]*\[CITATION\|[^\]]*\]")
+_CONDENSED_HEADER = "Earlier turns (condensed; conversational context only):"
+
+
+@dataclass(frozen=True)
+class InteractiveHistoryEnvNames:
+    max_tokens: str = "POWER_ATLAS_QA_HISTORY_MAX_TOKENS"
+    keep_turns: str = "POWER_ATLAS_QA_HISTORY_KEEP_TURNS"
+
+
+DEFAULT_INTERACTIVE_HISTORY_ENV_NAMES = InteractiveHistoryEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class InteractiveHistorySettings:
+    max_tokens: int = DEFAULT_HISTORY_MAX_TOKENS
+    keep_turns: int = DEFAULT_HISTORY_KEEP_TURNS
+    summary_chars: int = DEFAULT_HISTORY_SUMMARY_CHARS
+
+    def __post_init__(self) -> None:
+        if self.max_tokens < 1:
+            raise ValueError(f"max_tokens must be >= 1, got {self.max_tokens}")
+        if self.keep_turns < 1:
+            raise ValueError(f"keep_turns must be >= 1, got {self.keep_turns}")
+        if self.summary_chars < 20:
+            raise ValueError(f"summary_chars must be >= 20, got {self.summary_chars}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: InteractiveHistoryEnvNames | None = None,
+    ) -> "InteractiveHistorySettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_INTERACTIVE_HISTORY_ENV_NAMES if env_names is None else env_names
+        return cls(
+            max_tokens=int(env.get(names.max_tokens, DEFAULT_HISTORY_MAX_TOKENS)),
+            keep_turns=int(env.get(names.keep_turns, DEFAULT_HISTORY_KEEP_TURNS)),
+        )
+
+
+def estimate_text_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def estimate_messages_tokens(messages: list[Any]) -> int:
+    return sum(
+        estimate_text_tokens(str(message.get("content") or "")) + _MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+def strip_citation_tokens(text: str) -> str:
+    return _CITATION_TOKEN_RE.sub("", text).strip()
+
+
+class TokenBudgetMessageHistory(InMemoryMessageHistory):
+    """In-memory history bounded by turn count and an estimated token budget."""
+
+    def __init__(self, settings: InteractiveHistorySettings | None = None) -> None:
+        super().__init__()
+        self.settings = InteractiveHistorySettings.from_env() if settings is None else settings
+        self._condensed: list[str] = []
+        self.condensed_turns = 0
+        self.dropped_turns = 0
+
+    @staticmethod
+    def _clean(message: LLMMessage) -> LLMMessage:
+        if message.get("role") != "assistant":
+            return message
+        return LLMMessage(role="assistant", content=strip_citation_tokens(str(message.get("content") or "")))
+
+    @property
+    def messages(self) -> list[LLMMessage]:
+        with self._lock:
+            return self._snapshot()
+
+    @property
+    def token_count(self) -> int:
+        return estimate_messages_tokens(self.messages)
+
+    def _snapshot(self) -> list[LLMMessage]:
+        if not self._condensed:
+            return self._messages.copy()
+        condensed = "\n".join([_CONDENSED_HEADER, *self._condensed])
+        return [LLMMessage(role="system", content=condensed), *self._messages]
+
+    def _turns(self) -> list[list[LLMMessage]]:
+        turns: list[list[LLMMessage]] = []
+        for message in self._messages:
+            if message.get("role") == "user" or not turns:
+                turns.append([])
+            turns[-1].append(message)
+        return turns
+
+    def _condense(self, turn: list[LLMMessage]) -> str:
+        width = self.settings.summary_chars
+        parts = []
+        for message in turn:
+            prefix = "Q" if message.get("role") == "user" else "A"
+            text = textwrap.shorten(str(message.get("content") or ""), width=width, placeholder=" ...")
+            parts.append(f"{prefix}: {text}")
+        return "- " + " ".join(parts)
+
+    def _compact(self) -> None:
+        with self._lock:
+            turns = self._turns()
+            while len(turns) > self.settings.keep_turns:
+                self._condensed.append(self._condense(turns.pop(0)))
+                self.condensed_turns += 1
+            self._messages = [message for turn in turns for message in turn]
+            # Over budget: forget condensed turns first, then the oldest verbatim
+            # turns.  The latest turn is always kept.
+            while estimate_messages_tokens(self._snapshot()) > self.settings.max_tokens:
+                if self._condensed:
+                    self._condensed.pop(0)
+                elif len(turns) > 1:
+                    turns.pop(0)
+                    self._messages = [message for turn in turns for message in turn]
+                else:
+                    break
+                self.dropped_turns += 1
+
+    def add_message(self, message: LLMMessage) -> None:
+        super().add_message(self._clean(message))
+        self._compact()
+
+    def add_messages(self, messages: list[LLMMessage]) -> None:
+        super().add_messages([self._clean(message) for message in messages])
+        self._compact()
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._condensed = []
+
+
+__all__ = [
+    "DEFAULT_HISTORY_KEEP_TURNS",
+    "DEFAULT_HISTORY_MAX_TOKENS",
+    "DEFAULT_INTERACTIVE_HISTORY_ENV_NAMES",
+    "InteractiveHistoryEnvNames",
+    "InteractiveHistorySettings",
+    "TokenBudgetMessageHistory",
+    "estimate_messages_tokens",
+    "estimate_text_tokens",
+    "strip_citation_tokens",
+]
@@ -0,0 +1,280 @@
+"""In-process cache of formatted retrieval results, invalidated by run generation.
+
+For a fixed query vector, vector index, retrieval query variant (the Cypher
+chosen by ``_select_runtime_retrieval_query`` for the ``expand_graph`` /
+``cluster_aware`` / ``all_runs`` flags), ``top_k`` and query parameters
+(``run_id``, ``source_uri``, ...), the graph-expanded retrieval result only
+changes when the run it reads is written again.  :class:`RetrievalResultCache`
+stores the formatted retriever result (the ``format_chunk_citation_record``
+items plus metadata) under a key over those parameters and the run's current
+*generation stamp*.
+
+Generation stamps live in the graph as ``(:RetrievalGeneration {scope})``
+nodes so that every process sees them: every stage that writes or deletes
+run data (PDF and structured ingest, claim extraction, participation edges,
+narrative extraction, entity resolution, reset and run retention) replaces
+the stamp of the runs it touched and of the all-runs scope
+(:data:`ALL_RUNS_GENERATION_SCOPE`), which turns every cached entry for those
+scopes into a miss.  A full reset bumps every stamp
+(:data:`RETRIEVAL_GENERATION_BUMP_ALL_QUERY`).  Entries also expire after
+``ttl_seconds`` as a backstop for writes made outside the pipeline.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+RETRIEVAL_GENERATION_LABEL = "RetrievalGeneration"
+ALL_RUNS_GENERATION_SCOPE = "*"
+DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES = 256
+DEFAULT_RETRIEVAL_CACHE_TTL_SECONDS = 900.0
+_DISABLED_VALUES = frozenset({"0", "off", "none", "false"})
+
+RETRIEVAL_GENERATION_BUMP_QUERY = f"""
+UNWIND $scopes AS scope
+MERGE (generation:{RETRIEVAL_GENERATION_LABEL} {{scope: scope}})
+SET generation.stamp = randomUUID(), generation.updated_at = datetime()
+"""
+
+# Every scope ever stamped, plus all runs (which may not have been stamped yet).
+RETRIEVAL_GENERATION_BUMP_ALL_QUERY = f"""
+MERGE (:{RETRIEVAL_GENERATION_LABEL} {{scope: $all_runs_scope}})
+WITH count(*) AS _
+MATCH (generation:{RETRIEVAL_GENERATION_LABEL})
+SET generation.stamp = randomUUID(), generation.updated_at = datetime()
+"""
+
+RETRIEVAL_GENERATION_READ_QUERY = f"""
+OPTIONAL MATCH (generation:{RETRIEVAL_GENERATION_LABEL} {{scope: $scope}})
+RETURN generation.stamp AS stamp
+"""
+
+
+@dataclass(frozen=True)
+class RetrievalResultCacheEnvNames:
+    max_entries: str = "POWER_ATLAS_RETRIEVAL_CACHE_MAX_ENTRIES"
+    ttl_seconds: str = "POWER_ATLAS_RETRIEVAL_CACHE_TTL_SECONDS"
+
+
+DEFAULT_RETRIEVAL_RESULT_CACHE_ENV_NAMES = RetrievalResultCacheEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class RetrievalResultCacheSettings:
+    max_entries: int = DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES
+    ttl_seconds: float = DEFAULT_RETRIEVAL_CACHE_TTL_SECONDS
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 0:
+            raise ValueError(f"max_entries must be >= 0, got {self.max_entries}")
+        if self.ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0, got {self.ttl_seconds}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: RetrievalResultCacheEnvNames | None = None,
+    ) -> "RetrievalResultCacheSettings":
+        """Read settings; ``MAX_ENTRIES=0``/``off`` disables the cache."""
+        env = os.environ if environ is None else environ
+        names = DEFAULT_RETRIEVAL_RESULT_CACHE_ENV_NAMES if env_names is None else env_names
+        raw_max_entries = env.get(names.max_entries, "").strip()
+        if raw_max_entries.lower() in _DISABLED_VALUES:
+            max_entries = 0
+        else:
+            max_entries = int(raw_max_entries) if raw_max_entries else DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES
+        return cls(
+            max_entries=max_entries,
+            ttl_seconds=float(env.get(names.ttl_seconds, DEFAULT_RETRIEVAL_CACHE_TTL_SECONDS)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RetrievalResultCacheStats:
+    hits: int
+    misses: int
+    expired: int
+    evictions: int
+    bypassed: int
+
+    def to_summary(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+        }
+
+
+def retrieval_generation_scope(query_params: Mapping[str, Any] | None) -> str:
+    """Return the generation scope a search reads: its ``run_id``, or all runs."""
+    run_id = (query_params or {}).get("run_id")
+    return str(run_id) if run_id else ALL_RUNS_GENERATION_SCOPE
+
+
+def retrieval_generation_scopes(run_ids: Iterable[Any]) -> list[str]:
+    """Return the scopes a write to *run_ids* invalidates (each run plus all runs)."""
+    scopes = sorted({str(run_id) for run_id in run_ids if run_id})
+    return [*scopes, ALL_RUNS_GENERATION_SCOPE] if scopes else []
+
+
+def bump_retrieval_generation(driver: Any, *, run_ids: Iterable[Any], neo4j_database: str | None) -> None:
+    """Give each written run (and the all-runs scope) a new generation stamp."""
+    scopes = retrieval_generation_scopes(run_ids)
+    if scopes:
+        driver.execute_query(
+            RETRIEVAL_GENERATION_BUMP_QUERY,
+            parameters_={"scopes": scopes},
+            database_=neo4j_database,
+        )
+
+
+def read_retrieval_generation(driver: Any, *, scope: str, neo4j_database: str | None) -> str | None:
+    records, _, _ = driver.execute_query(
+        RETRIEVAL_GENERATION_READ_QUERY,
+        parameters_={"scope": scope},
+        database_=neo4j_database,
+    )
+    return records[0]["stamp"] if records else None
+
+
+def retrieval_result_cache_key(
+    *,
+    query_vector: Sequence[float],
+    index_name: str,
+    retrieval_query: str,
+    top_k: int,
+    query_params: Mapping[str, Any] | None,
+    variant: str,
+    generation: str | None,
+) -> str:
+    vector_digest = hashlib.sha256(
+        json.dumps([round(float(value), 7) for value in query_vector], separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    payload = json.dumps(
+        [vector_digest, index_name, retrieval_query, top_k, dict(query_params or {}), variant, generation],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RetrievalResultCache:
+    """Thread-safe LRU of retriever results with a time-to-live."""
+
+    def __init__(
+        self,
+        settings: RetrievalResultCacheSettings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = RetrievalResultCacheSettings() if settings is None else settings
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._bypassed = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] > self.settings.ttl_seconds:
+                del self._entries[key]
+                self._expired += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.settings.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self._bypassed += 1
+
+    def stats(self) -> RetrievalResultCacheStats:
+        with self._lock:
+            return RetrievalResultCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                evictions=self._evictions,
+                bypassed=self._bypassed,
+            )
+
+
+_shared_cache: RetrievalResultCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_retrieval_result_cache() -> RetrievalResultCache | None:
+    """Return the process-wide cache built from the environment, or ``None`` when disabled."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            settings = RetrievalResultCacheSettings.from_env()
+            if not settings.enabled:
+                return None
+            _shared_cache = RetrievalResultCache(settings)
+        return _shared_cache
+
+
+def reset_shared_retrieval_result_cache() -> None:
+    """Drop the process-wide cache so the next use re-reads the environment."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
+
+
+__all__ = [
+    "ALL_RUNS_GENERATION_SCOPE",
+    "DEFAULT_RETRIEVAL_CACHE_MAX_ENTRIES",
+    "DEFAULT_RETRIEVAL_CACHE_TTL_SECONDS",
+    "DEFAULT_RETRIEVAL_RESULT_CACHE_ENV_NAMES",
+    "RETRIEVAL_GENERATION_BUMP_ALL_QUERY",
+    "RETRIEVAL_GENERATION_BUMP_QUERY",
+    "RETRIEVAL_GENERATION_LABEL",
+    "RETRIEVAL_GENERATION_READ_QUERY",
+    "RetrievalResultCache",
+    "RetrievalResultCacheEnvNames",
+    "RetrievalResultCacheSettings",
+    "RetrievalResultCacheStats",
+    "bump_retrieval_generation",
+    "read_retrieval_generation",
+    "reset_shared_retrieval_result_cache",
+    "retrieval_generation_scope",
+    "retrieval_generation_scopes",
+    "retrieval_result_cache_key",
+    "shared_retrieval_result_cache",
+]
@@ -0,0 +1,232 @@
+"""Run-scoped candidate selection for chunk vector search.
+
+The default ``post_filter`` retrieval path asks the vector index for the global
+top-k chunks and only then drops chunks outside ``$run_id``/``$source_uri``.
+With many runs in one database most of those k candidates belong to other runs,
+so run-scoped questions come back with few or no chunks.
+
+The strategies here select in-scope candidates *before* the retrieval query
+runs:
+
+``over_fetch``
+    Query the ANN index for ``top_k * over_fetch_factor`` candidates, keep the
+    in-scope ones, and refill with a geometrically larger candidate pool while
+    fewer than ``top_k`` survive (bounded by ``max_candidates``).
+``exact``
+    Scan only the in-scope chunks and rank them by exact cosine similarity.
+    Perfect recall; cost grows with the size of the run rather than the index.
+
+Both strategies report how many candidates were fetched and discarded via
+:class:`ScopedSearchStats`.  The selected ``(elementId, score)`` pairs are then
+fed through the unchanged retrieval query by :func:`build_scoped_expansion_query`.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+RETRIEVAL_SCOPE_POST_FILTER = "post_filter"
+RETRIEVAL_SCOPE_OVER_FETCH = "over_fetch"
+RETRIEVAL_SCOPE_EXACT = "exact"
+RETRIEVAL_SCOPE_STRATEGIES = (
+    RETRIEVAL_SCOPE_POST_FILTER,
+    RETRIEVAL_SCOPE_OVER_FETCH,
+    RETRIEVAL_SCOPE_EXACT,
+)
+
+RETRIEVAL_SCOPE_STRATEGY_ENV = "POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY"
+
+DEFAULT_OVER_FETCH_FACTOR = 4
+DEFAULT_MAX_CANDIDATES = 2_000
+
+# Scope predicate shared by both strategies.  $run_id is NULL in all-runs mode.
+_SCOPE_PREDICATE = (
+    "($run_id IS NULL OR {alias}.run_id = $run_id)\n"
+    "  AND ($source_uri IS NULL OR {alias}.source_uri = $source_uri)"
+)
+
+_OVER_FETCH_CANDIDATE_QUERY = (
+    "CALL db.index.vector.queryNodes($vector_index_name, $candidate_k, $query_vector)\n"
+    "YIELD node, score\n"
+    "WITH collect({node: node, score: score}) AS candidates\n"
+    "WITH size(candidates) AS candidates_fetched,\n"
+    "     [candidate IN candidates WHERE "
+    + _SCOPE_PREDICATE.format(alias="candidate.node").replace("\n", "\n     ")
+    + "] AS in_scope\n"
+    "RETURN candidates_fetched,\n"
+    "       size(in_scope) AS in_scope_count,\n"
+    "       [candidate IN in_scope[..$top_k] |"
+    " {element_id: elementId(candidate.node), score: candidate.score}] AS hits"
+)
+
+
+def _escape_cypher_identifier(value: str) -> str:
+    if not value or "`" in value:
+        raise ValueError(f"Invalid Cypher identifier {value!r}")
+    return f"`{value}`"
+
+
+def validate_retrieval_scope_strategy(strategy: str) -> str:
+    if strategy not in RETRIEVAL_SCOPE_STRATEGIES:
+        raise ValueError(
+            f"Unknown retrieval scope strategy {strategy!r}; "
+            f"expected one of {', '.join(RETRIEVAL_SCOPE_STRATEGIES)}"
+        )
+    return strategy
+
+
+def resolve_retrieval_scope_strategy(
+    explicit: str | None = None,
+    environ: Mapping[str, str] | None = None,
+) -> str | None:
+    """Return *explicit*, else ``POWER_ATLAS_RETRIEVAL_SCOPE_STRATEGY``, else ``None`` (keep the policy's)."""
+    if explicit is not None:
+        return validate_retrieval_scope_strategy(explicit)
+    env = os.environ if environ is None else environ
+    configured = env.get(RETRIEVAL_SCOPE_STRATEGY_ENV, "").strip().lower()
+    return validate_retrieval_scope_strategy(configured) if configured else None
+
+
+def build_over_fetch_candidate_query() -> str:
+    return _OVER_FETCH_CANDIDATE_QUERY
+
+
+def build_exact_candidate_query(*, node_label: str, embedding_property: str) -> str:
+    node_label_expr = _escape_cypher_identifier(node_label)
+    embedding_expr = _escape_cypher_identifier(embedding_property)
+    return (
+        f"MATCH (node:{node_label_expr})\n"
+        "WHERE " + _SCOPE_PREDICATE.format(alias="node") + "\n"
+        f"  AND node.{embedding_expr} IS NOT NULL\n"
+        f"WITH node, vector.similarity.cosine(node.{embedding_expr}, $query_vector) AS score\n"
+        "ORDER BY score DESC\n"
+        "WITH collect({element_id: elementId(node), score: score}) AS candidates\n"
+        "RETURN size(candidates) AS candidates_fetched,\n"
+        "       size(candidates) AS in_scope_count,\n"
+        "       candidates[..$top_k] AS hits"
+    )
+
+
+def build_scoped_expansion_query(retrieval_query: str) -> str:
+    """Feed pre-selected ``$scoped_hits`` through *retrieval_query* in score order."""
+    return (
+        "UNWIND $scoped_hits AS hit\n"
+        "MATCH (node) WHERE elementId(node) = hit.element_id\n"
+        "WITH node, hit.score AS score\n"
+        + retrieval_query
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ScopedSearchStats:
+    strategy: str
+    top_k: int
+    candidates_fetched: int
+    candidates_discarded: int
+    in_scope: int
+    refills: int
+    underfilled: bool
+
+    def to_metadata(self) -> dict[str, object]:
+        return {
+            "strategy": self.strategy,
+            "top_k": self.top_k,
+            "candidates_fetched": self.candidates_fetched,
+            "candidates_discarded": self.candidates_discarded,
+            "in_scope": self.in_scope,
+            "refills": self.refills,
+            "underfilled": self.underfilled,
+        }
+
+
+def select_scoped_candidates(
+    driver: Any,
+    *,
+    strategy: str,
+    index_name: str,
+    query_vector: Sequence[float],
+    top_k: int,
+    run_id: str | None,
+    source_uri: str | None,
+    neo4j_database: str | None,
+    node_label: str | None = None,
+    embedding_property: str | None = None,
+    over_fetch_factor: int = DEFAULT_OVER_FETCH_FACTOR,
+    max_candidates: int = DEFAULT_MAX_CANDIDATES,
+) -> tuple[list[dict[str, Any]], ScopedSearchStats]:
+    """Return up to *top_k* in-scope ``{element_id, score}`` hits, best first."""
+    if strategy == RETRIEVAL_SCOPE_EXACT:
+        if not node_label or not embedding_property:
+            raise ValueError("exact scoped search requires node_label and embedding_property")
+        query = build_exact_candidate_query(
+            node_label=node_label,
+            embedding_property=embedding_property,
+        )
+    elif strategy == RETRIEVAL_SCOPE_OVER_FETCH:
+        if over_fetch_factor < 2:
+            raise ValueError(f"over_fetch_factor must be >= 2, got {over_fetch_factor}")
+        query = build_over_fetch_candidate_query()
+    else:
+        raise ValueError(f"Strategy {strategy!r} does not pre-select candidates")
+
+    max_candidates = max(max_candidates, top_k)
+    candidate_k = min(top_k * over_fetch_factor, max_candidates)
+    refills = 0
+    while True:
+        records, _, _ = driver.execute_query(
+            query,
+            parameters_={
+                "vector_index_name": index_name,
+                "candidate_k": candidate_k,
+                "query_vector": list(query_vector),
+                "top_k": top_k,
+                "run_id": run_id,
+                "source_uri": source_uri,
+            },
+            database_=neo4j_database,
+        )
+        row = records[0] if records else {"candidates_fetched": 0, "in_scope_count": 0, "hits": []}
+        candidates_fetched = int(row["candidates_fetched"])
+        in_scope_count = int(row["in_scope_count"])
+        index_exhausted = candidates_fetched < candidate_k
+        if (
+            strategy == RETRIEVAL_SCOPE_EXACT
+            or in_scope_count >= top_k
+            or index_exhausted
+            or candidate_k >= max_candidates
+        ):
+            break
+        candidate_k = min(candidate_k * over_fetch_factor, max_candidates)
+        refills += 1
+
+    hits = [dict(hit) for hit in row["hits"]]
+    return hits, ScopedSearchStats(
+        strategy=strategy,
+        top_k=top_k,
+        candidates_fetched=candidates_fetched,
+        candidates_discarded=candidates_fetched - in_scope_count,
+        in_scope=in_scope_count,
+        refills=refills,
+        underfilled=len(hits) < top_k,
+    )
+
+
+__all__ = [
+    "DEFAULT_MAX_CANDIDATES",
+    "DEFAULT_OVER_FETCH_FACTOR",
+    "RETRIEVAL_SCOPE_EXACT",
+    "RETRIEVAL_SCOPE_OVER_FETCH",
+    "RETRIEVAL_SCOPE_POST_FILTER",
+    "RETRIEVAL_SCOPE_STRATEGIES",
+    "RETRIEVAL_SCOPE_STRATEGY_ENV",
+    "ScopedSearchStats",
+    "build_exact_candidate_query",
+    "build_over_fetch_candidate_query",
+    "build_scoped_expansion_query",
+    "resolve_retrieval_scope_strategy",
+    "select_scoped_candidates",
+    "validate_retrieval_scope_strategy",
+]
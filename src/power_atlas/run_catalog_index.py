@@ -0,0 +1,451 @@
+"""Persistent SQLite index over ``<output_dir>/runs`` backing the run catalog.
+
+Listing runs used to ``iterdir()`` every run directory and re-parse a
+``manifest.json`` per run on every request, filtering only afterwards.  The
+index keeps one row per run (dataset id, timestamps, stage names, stage
+prefix) in a sidecar database at ``runs/.run_catalog/index.sqlite`` so filters,
+``latest_per_stage_prefix`` and cursor pagination run as SQL.  The database
+lives in its own hidden directory so that SQLite's WAL files never touch the
+mtime of ``runs/`` itself; an index left at its former location,
+``runs/.run_catalog.sqlite``, is deleted when the index is next opened.
+
+The index is a cache, never the source of truth:
+
+* :func:`record_run_catalog_manifest` refreshes a run's row whenever the
+  pipeline writes a stage manifest.
+* :meth:`RunCatalogIndex.sync` revalidates every row against an mtime
+  signature (run directory mtime plus each stage's ``manifest.json`` mtime),
+  so runs added, edited or deleted outside the pipeline are picked up.  Only
+  runs whose signature changed have their manifests re-read.  That walk is
+  O(runs x stages), so queries only run it through
+  :meth:`RunCatalogIndex.sync_if_stale`: when the mtime of ``runs/`` changed
+  (a run directory was added or removed) or the last sync is older than
+  ``sync_interval_seconds``.  Otherwise a query costs one ``stat`` plus SQL.
+* :func:`query_run_catalog` falls back to a plain directory scan when the
+  database cannot be used (read-only output directory, corrupt file).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+RUN_CATALOG_INDEX_DIRNAME = ".run_catalog"
+RUN_CATALOG_INDEX_FILENAME = "index.sqlite"
+RUN_CATALOG_INDEX_SCHEMA_VERSION = 2
+# Where the index used to live, directly in ``runs/``; removed on first open.
+_LEGACY_INDEX_FILENAME = ".run_catalog.sqlite"
+DEFAULT_RUN_CATALOG_SYNC_INTERVAL_SECONDS = 60.0
+_CONNECT_TIMEOUT_SECONDS = 5.0
+
+_SCHEMA_STATEMENTS = (
+    "CREATE TABLE runs ("
+    " run_id TEXT PRIMARY KEY,"
+    " dataset_id TEXT,"
+    " started_at TEXT,"
+    " finished_at TEXT,"
+    " stage_prefix TEXT NOT NULL,"
+    " signature TEXT NOT NULL)",
+    "CREATE TABLE run_stages ("
+    " run_id TEXT NOT NULL,"
+    " stage_name TEXT NOT NULL,"
+    " PRIMARY KEY (run_id, stage_name)) WITHOUT ROWID",
+    "CREATE TABLE sync_state ("
+    " id INTEGER PRIMARY KEY CHECK (id = 1),"
+    " runs_root_mtime_ns INTEGER NOT NULL,"
+    " synced_at REAL NOT NULL)",
+    "CREATE INDEX runs_by_dataset ON runs (dataset_id, run_id)",
+    "CREATE INDEX runs_by_stage_prefix ON runs (stage_prefix, run_id)",
+    "CREATE INDEX run_stages_by_stage ON run_stages (stage_name, run_id)",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedRun:
+    run_id: str
+    dataset_id: str | None
+    started_at: str | None
+    finished_at: str | None
+    stage_names: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RunIndexPage:
+    runs: list[IndexedRun]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RunIndexSyncStats:
+    scanned: int
+    reindexed: int
+    removed: int
+
+
+def extract_run_stage_prefix(run_id: str) -> str:
+    parts = run_id.rsplit("-", 2)
+    if len(parts) == 3 and all(parts):
+        return parts[0]
+    return run_id
+
+
+def encode_run_cursor(run_id: str) -> str:
+    return base64.urlsafe_b64encode(run_id.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_run_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid run catalog cursor {cursor!r}.") from exc
+
+
+def _read_manifest(manifest_path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _list_child_dirs(parent: Path) -> list[str]:
+    with os.scandir(parent) as entries:
+        return sorted(
+            entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")
+        )
+
+
+def summarize_run_dir(run_dir: Path) -> IndexedRun:
+    """Summarize *run_dir* from the first stage manifest that parses."""
+    stage_names = _list_child_dirs(run_dir)
+    manifest_data: dict[str, Any] | None = None
+    for stage_name in stage_names:
+        manifest_path = run_dir / stage_name / "manifest.json"
+        if not manifest_path.is_file():
+            continue
+        manifest_data = _read_manifest(manifest_path)
+        if manifest_data is not None:
+            break
+    return IndexedRun(
+        run_id=run_dir.name,
+        dataset_id=(None if manifest_data is None else manifest_data.get("dataset_id")),
+        started_at=(None if manifest_data is None else manifest_data.get("started_at")),
+        finished_at=(None if manifest_data is None else manifest_data.get("finished_at")),
+        stage_names=tuple(stage_names),
+    )
+
+
+def run_dir_signature(run_dir: Path) -> str:
+    parts = [str(run_dir.stat().st_mtime_ns)]
+    for stage_name in _list_child_dirs(run_dir):
+        try:
+            manifest_mtime = (run_dir / stage_name / "manifest.json").stat().st_mtime_ns
+        except OSError:
+            manifest_mtime = -1
+        parts.append(f"{stage_name}:{manifest_mtime}")
+    return "|".join(parts)
+
+
+def _filter_runs(
+    runs: list[IndexedRun],
+    *,
+    dataset_id: str | None,
+    stage_name: str | None,
+    stage_prefix: str | None,
+    latest_per_stage_prefix: bool,
+    limit: int | None,
+    cursor: str | None,
+) -> RunIndexPage:
+    after = None if cursor is None else decode_run_cursor(cursor)
+    runs = sorted(runs, key=lambda run: run.run_id, reverse=True)
+    if dataset_id is not None:
+        runs = [run for run in runs if run.dataset_id == dataset_id]
+    if stage_name is not None:
+        runs = [run for run in runs if stage_name in run.stage_names]
+    if stage_prefix is not None:
+        runs = [run for run in runs if extract_run_stage_prefix(run.run_id) == stage_prefix]
+    if latest_per_stage_prefix:
+        seen_prefixes: set[str] = set()
+        latest_runs: list[IndexedRun] = []
+        for run in runs:
+            prefix = extract_run_stage_prefix(run.run_id)
+            if prefix in seen_prefixes:
+                continue
+            seen_prefixes.add(prefix)
+            latest_runs.append(run)
+        runs = latest_runs
+    if after is not None:
+        runs = [run for run in runs if run.run_id < after]
+    if limit is not None and len(runs) > limit:
+        return RunIndexPage(runs=runs[:limit], next_cursor=encode_run_cursor(runs[limit - 1].run_id))
+    return RunIndexPage(runs=runs)
+
+
+class RunCatalogIndex:
+    def __init__(self, runs_root: Path, *, index_path: Path | None = None) -> None:
+        self.runs_root = Path(runs_root)
+        self.index_path = (
+            self.runs_root / RUN_CATALOG_INDEX_DIRNAME / RUN_CATALOG_INDEX_FILENAME
+            if index_path is None
+            else Path(index_path)
+        )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_legacy_index()
+        with closing(
+            sqlite3.connect(self.index_path, timeout=_CONNECT_TIMEOUT_SECONDS, isolation_level=None)
+        ) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != RUN_CATALOG_INDEX_SCHEMA_VERSION:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DROP TABLE IF EXISTS sync_state")
+                connection.execute("DROP TABLE IF EXISTS run_stages")
+                connection.execute("DROP TABLE IF EXISTS runs")
+                for statement in _SCHEMA_STATEMENTS:
+                    connection.execute(statement)
+                connection.execute(f"PRAGMA user_version = {RUN_CATALOG_INDEX_SCHEMA_VERSION}")
+                connection.execute("COMMIT")
+            yield connection
+
+    def _remove_legacy_index(self) -> None:
+        if not (self.runs_root / _LEGACY_INDEX_FILENAME).exists():
+            return
+        for suffix in ("", "-wal", "-shm"):
+            legacy_path = self.runs_root / f"{_LEGACY_INDEX_FILENAME}{suffix}"
+            try:
+                legacy_path.unlink(missing_ok=True)
+            except OSError as exc:
+                _logger.warning("Could not remove legacy run catalog index %s: %s", legacy_path, exc)
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, run: IndexedRun, signature: str) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO runs"
+            " (run_id, dataset_id, started_at, finished_at, stage_prefix, signature)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                run.run_id,
+                run.dataset_id if isinstance(run.dataset_id, str) else None,
+                run.started_at if isinstance(run.started_at, str) else None,
+                run.finished_at if isinstance(run.finished_at, str) else None,
+                extract_run_stage_prefix(run.run_id),
+                signature,
+            ),
+        )
+        connection.execute("DELETE FROM run_stages WHERE run_id = ?", (run.run_id,))
+        connection.executemany(
+            "INSERT INTO run_stages (run_id, stage_name) VALUES (?, ?)",
+            [(run.run_id, stage_name) for stage_name in run.stage_names],
+        )
+
+    def record_run(self, run_id: str) -> None:
+        run_dir = self.runs_root / run_id
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._upsert(connection, summarize_run_dir(run_dir), run_dir_signature(run_dir))
+            connection.execute("COMMIT")
+
+    def sync(self, *, clock: Callable[[], float] = time.time) -> RunIndexSyncStats:
+        # Taken before the scan, so a run added while scanning triggers another sync.
+        runs_root_mtime_ns = self.runs_root.stat().st_mtime_ns
+        run_ids = _list_child_dirs(self.runs_root)
+        signatures: dict[str, str] = {}
+        for run_id in run_ids:
+            try:
+                signatures[run_id] = run_dir_signature(self.runs_root / run_id)
+            except OSError:
+                continue  # Removed while scanning.
+
+        with self._connect() as connection:
+            indexed = dict(connection.execute("SELECT run_id, signature FROM runs"))
+            stale = [run_id for run_id, signature in signatures.items() if indexed.get(run_id) != signature]
+            removed = [run_id for run_id in indexed if run_id not in signatures]
+            connection.execute("BEGIN IMMEDIATE")
+            for run_id in stale:
+                self._upsert(connection, summarize_run_dir(self.runs_root / run_id), signatures[run_id])
+            connection.executemany("DELETE FROM runs WHERE run_id = ?", [(run_id,) for run_id in removed])
+            connection.executemany(
+                "DELETE FROM run_stages WHERE run_id = ?",
+                [(run_id,) for run_id in removed],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_state (id, runs_root_mtime_ns, synced_at) VALUES (1, ?, ?)",
+                (runs_root_mtime_ns, clock()),
+            )
+            connection.execute("COMMIT")
+        return RunIndexSyncStats(scanned=len(signatures), reindexed=len(stale), removed=len(removed))
+
+    def sync_if_stale(
+        self,
+        max_age_seconds: float = DEFAULT_RUN_CATALOG_SYNC_INTERVAL_SECONDS,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> RunIndexSyncStats | None:
+        """Run :meth:`sync` when ``runs/`` changed or the last sync is older than *max_age_seconds*.
+
+        Returns ``None`` when the index was fresh and no directory was walked.
+        """
+        runs_root_mtime_ns = self.runs_root.stat().st_mtime_ns
+        with self._connect() as connection:
+            state = connection.execute("SELECT runs_root_mtime_ns, synced_at FROM sync_state").fetchone()
+        if (
+            state is not None
+            and state[0] == runs_root_mtime_ns
+            and 0 <= clock() - state[1] < max_age_seconds
+        ):
+            return None
+        return self.sync(clock=clock)
+
+    def query(
+        self,
+        *,
+        dataset_id: str | None = None,
+        stage_name: str | None = None,
+        stage_prefix: str | None = None,
+        latest_per_stage_prefix: bool = False,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> RunIndexPage:
+        """Return runs newest-first (by ``run_id``), filtered and paginated in SQL."""
+        params: dict[str, Any] = {
+            "dataset_id": dataset_id,
+            "stage_name": stage_name,
+            "stage_prefix": stage_prefix,
+            "after": None if cursor is None else decode_run_cursor(cursor),
+        }
+        predicates = ["1 = 1"]
+        if dataset_id is not None:
+            predicates.append("r.dataset_id = :dataset_id")
+        if stage_name is not None:
+            predicates.append(
+                "EXISTS (SELECT 1 FROM run_stages s WHERE s.run_id = r.run_id AND s.stage_name = :stage_name)"
+            )
+        if stage_prefix is not None:
+            predicates.append("r.stage_prefix = :stage_prefix")
+        filtered = "SELECT r.* FROM runs r WHERE " + " AND ".join(predicates)
+        if latest_per_stage_prefix:
+            filtered = (
+                "SELECT * FROM (SELECT f.*, ROW_NUMBER() OVER"
+                " (PARTITION BY f.stage_prefix ORDER BY f.run_id DESC) AS prefix_rank"
+                f" FROM ({filtered}) f) WHERE prefix_rank = 1"
+            )
+        query = (
+            f"SELECT run_id, dataset_id, started_at, finished_at FROM ({filtered})"
+            " WHERE (:after IS NULL OR run_id < :after) ORDER BY run_id DESC"
+        )
+        if limit is not None:
+            query += " LIMIT :limit"
+            params["limit"] = limit + 1
+
+        with self._connect() as connection:
+            rows = connection.execute(query, params).fetchall()
+            page_rows = rows if limit is None else rows[:limit]
+            stage_names: dict[str, list[str]] = {}
+            for run_id, name in connection.execute(
+                "SELECT run_id, stage_name FROM run_stages"
+                " WHERE run_id IN (SELECT value FROM json_each(:run_ids))"
+                " ORDER BY run_id, stage_name",
+                {"run_ids": json.dumps([row[0] for row in page_rows])},
+            ):
+                stage_names.setdefault(run_id, []).append(name)
+
+        runs = [
+            IndexedRun(
+                run_id=run_id,
+                dataset_id=row_dataset_id,
+                started_at=started_at,
+                finished_at=finished_at,
+                stage_names=tuple(stage_names.get(run_id, ())),
+            )
+            for run_id, row_dataset_id, started_at, finished_at in page_rows
+        ]
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            next_cursor = encode_run_cursor(runs[-1].run_id)
+        return RunIndexPage(runs=runs, next_cursor=next_cursor)
+
+
+def query_run_catalog(
+    runs_root: Path,
+    *,
+    dataset_id: str | None = None,
+    stage_name: str | None = None,
+    stage_prefix: str | None = None,
+    latest_per_stage_prefix: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sync_interval_seconds: float = DEFAULT_RUN_CATALOG_SYNC_INTERVAL_SECONDS,
+) -> RunIndexPage:
+    """Query the index under *runs_root*; scan directly if SQLite is unusable.
+
+    The index is resynced first only when it is stale (see
+    :meth:`RunCatalogIndex.sync_if_stale`); pass ``sync_interval_seconds=0``
+    to always resync.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be >= 1, got {limit}")
+    index = RunCatalogIndex(runs_root)
+    try:
+        index.sync_if_stale(sync_interval_seconds)
+        return index.query(
+            dataset_id=dataset_id,
+            stage_name=stage_name,
+            stage_prefix=stage_prefix,
+            latest_per_stage_prefix=latest_per_stage_prefix,
+            limit=limit,
+            cursor=cursor,
+        )
+    except (sqlite3.Error, OSError) as exc:
+        _logger.warning("Run catalog index %s is unavailable (%s); scanning run directories", index.index_path, exc)
+    return _filter_runs(
+        [summarize_run_dir(runs_root / run_id) for run_id in _list_child_dirs(runs_root)],
+        dataset_id=dataset_id,
+        stage_name=stage_name,
+        stage_prefix=stage_prefix,
+        latest_per_stage_prefix=latest_per_stage_prefix,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+def record_run_catalog_manifest(output_dir: Path, *, run_id: str) -> None:
+    """Refresh *run_id*'s index row after a stage manifest write; never raises."""
+    runs_root = Path(output_dir).resolve() / "runs"
+    try:
+        RunCatalogIndex(runs_root).record_run(run_id)
+    except (sqlite3.Error, OSError) as exc:
+        _logger.warning("Could not update run catalog index for %s: %s", run_id, exc)
+
+
+__all__ = [
+    "DEFAULT_RUN_CATALOG_SYNC_INTERVAL_SECONDS",
+    "IndexedRun",
+    "RUN_CATALOG_INDEX_DIRNAME",
+    "RUN_CATALOG_INDEX_FILENAME",
+    "RUN_CATALOG_INDEX_SCHEMA_VERSION",
+    "RunCatalogIndex",
+    "RunIndexPage",
+    "RunIndexSyncStats",
+    "decode_run_cursor",
+    "encode_run_cursor",
+    "extract_run_stage_prefix",
+    "query_run_catalog",
+    "record_run_catalog_manifest",
+    "run_dir_signature",
+    "summarize_run_dir",
+]
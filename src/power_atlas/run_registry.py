@@ -0,0 +1,210 @@
+"""First-class ``(:Run {run_id})`` registry nodes.
+
+Resolving the latest unstructured ingest used to sort every ``Chunk`` by
+``run_id`` and resolving a run's dataset scanned the run's chunks.  Instead the
+ingest stage registers its run when it starts (``status="running"``) and
+updates the node when it finishes (``"completed"`` or ``"failed"``).  Each node
+holds the ``run_id``, its ``stage_prefix`` (the run_id without the timestamp
+and suffix, see :func:`~power_atlas.run_catalog_index.extract_run_stage_prefix`),
+the ``dataset_id``, ``started_at``/``finished_at`` timestamps and the status.
+
+``Run`` nodes are keyed on ``run_id``, and the schema migrations index
+``(stage_prefix, status, run_id)`` and ``(stage_prefix, dataset_id, status,
+run_id)``, the exact predicates of :data:`LATEST_RUN_QUERY` and
+:data:`LATEST_DATASET_RUN_QUERY`.  Their ``ORDER BY run.run_id DESC LIMIT 1``
+is therefore read off the index in descending order and the ``Chunk``
+existence probe only runs for the candidates walked, normally just the
+newest one, instead of sorting every registered run of the prefix.
+
+The registry is an accelerator, not the source of truth: writes never fail the
+stage that makes them, and a lookup that finds no registered run returns
+``None`` so callers fall back to the chunk scans (graphs ingested before the
+registry existed have no ``Run`` nodes).  ``reset`` and run retention delete a
+run's ``Run`` node with its data, and :func:`lookup_latest_run_id` still skips
+registered runs that have no ``Chunk`` left (e.g. chunks deleted by hand), so
+it never resolves scope to an empty run.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from typing import Any, Literal
+
+from power_atlas.run_catalog_index import extract_run_stage_prefix
+
+_logger = logging.getLogger(__name__)
+
+RUN_REGISTRY_LABEL = "Run"
+
+RunStatus = Literal["running", "completed", "failed"]
+
+RUN_STATUS_RUNNING: RunStatus = "running"
+RUN_STATUS_COMPLETED: RunStatus = "completed"
+RUN_STATUS_FAILED: RunStatus = "failed"
+
+RUN_STARTED_QUERY = """
+MERGE (run:Run {run_id: $run_id})
+ON CREATE SET run.started_at = toString(datetime())
+SET run.stage_prefix = $stage_prefix,
+    run.dataset_id = coalesce($dataset_id, run.dataset_id),
+    run.status = $status,
+    run.finished_at = null,
+    run.error = null
+"""
+
+RUN_FINISHED_QUERY = """
+MERGE (run:Run {run_id: $run_id})
+ON CREATE SET run.started_at = toString(datetime())
+SET run.stage_prefix = $stage_prefix,
+    run.dataset_id = coalesce($dataset_id, run.dataset_id),
+    run.status = $status,
+    run.finished_at = toString(datetime()),
+    run.error = $error
+"""
+
+LATEST_RUN_QUERY = """
+MATCH (run:Run)
+WHERE run.stage_prefix = $stage_prefix
+  AND run.status = $status
+  AND run.run_id IS NOT NULL
+  AND EXISTS { MATCH (:Chunk {run_id: run.run_id}) }
+RETURN run.run_id AS run_id
+ORDER BY run.run_id DESC
+LIMIT 1
+"""
+
+LATEST_DATASET_RUN_QUERY = """
+MATCH (run:Run)
+WHERE run.stage_prefix = $stage_prefix
+  AND run.dataset_id = $dataset_id
+  AND run.status = $status
+  AND run.run_id IS NOT NULL
+  AND EXISTS { MATCH (:Chunk {run_id: run.run_id}) }
+RETURN run.run_id AS run_id
+ORDER BY run.run_id DESC
+LIMIT 1
+"""
+
+RUN_DATASET_QUERY = """
+MATCH (run:Run {run_id: $run_id})
+RETURN run.dataset_id AS dataset_id
+"""
+
+
+def _record_mapping(record: Any) -> Mapping[str, Any]:
+    return record if isinstance(record, Mapping) else dict(record)
+
+
+def _write_run(
+    driver: Any,
+    query: str,
+    *,
+    run_id: str,
+    dataset_id: str | None,
+    status: RunStatus,
+    neo4j_database: str | None,
+    error: str | None = None,
+) -> bool:
+    try:
+        driver.execute_query(
+            query,
+            parameters_={
+                "run_id": run_id,
+                "stage_prefix": extract_run_stage_prefix(run_id),
+                "dataset_id": dataset_id,
+                "status": status,
+                "error": error,
+            },
+            database_=neo4j_database,
+        )
+    except Exception as exc:
+        _logger.warning("Could not record run_id=%s as %s in the run registry: %s", run_id, status, exc)
+        return False
+    return True
+
+
+def record_run_started(
+    driver: Any,
+    *,
+    run_id: str,
+    dataset_id: str | None,
+    neo4j_database: str | None,
+) -> bool:
+    """Register *run_id* as running; returns ``False`` (after logging) if the write failed."""
+    return _write_run(
+        driver,
+        RUN_STARTED_QUERY,
+        run_id=run_id,
+        dataset_id=dataset_id,
+        status=RUN_STATUS_RUNNING,
+        neo4j_database=neo4j_database,
+    )
+
+
+def record_run_finished(
+    driver: Any,
+    *,
+    run_id: str,
+    dataset_id: str | None,
+    status: RunStatus,
+    neo4j_database: str | None,
+    error: str | None = None,
+) -> bool:
+    """Mark *run_id* as finished with *status*; returns ``False`` (after logging) if the write failed."""
+    return _write_run(
+        driver,
+        RUN_FINISHED_QUERY,
+        run_id=run_id,
+        dataset_id=dataset_id,
+        status=status,
+        neo4j_database=neo4j_database,
+        error=error,
+    )
+
+
+def lookup_latest_run_id(
+    driver: Any,
+    *,
+    stage_prefix: str,
+    dataset_id: str | None,
+    neo4j_database: str | None,
+) -> str | None:
+    """Return the newest completed run of *stage_prefix* (in *dataset_id*) that still has chunks, or ``None``."""
+    parameters: dict[str, Any] = {"stage_prefix": stage_prefix, "status": RUN_STATUS_COMPLETED}
+    if dataset_id is not None:
+        parameters["dataset_id"] = dataset_id
+    records, _, _ = driver.execute_query(
+        LATEST_RUN_QUERY if dataset_id is None else LATEST_DATASET_RUN_QUERY,
+        parameters_=parameters,
+        database_=neo4j_database,
+    )
+    return _record_mapping(records[0])["run_id"] if records else None
+
+
+def lookup_run_dataset_id(driver: Any, *, run_id: str, neo4j_database: str | None) -> str | None:
+    """Return the dataset_id registered for *run_id*, or ``None`` when it is unknown."""
+    records, _, _ = driver.execute_query(
+        RUN_DATASET_QUERY,
+        parameters_={"run_id": run_id},
+        database_=neo4j_database,
+    )
+    return _record_mapping(records[0])["dataset_id"] if records else None
+
+
+__all__ = [
+    "LATEST_DATASET_RUN_QUERY",
+    "LATEST_RUN_QUERY",
+    "RUN_DATASET_QUERY",
+    "RUN_FINISHED_QUERY",
+    "RUN_REGISTRY_LABEL",
+    "RUN_STARTED_QUERY",
+    "RUN_STATUS_COMPLETED",
+    "RUN_STATUS_FAILED",
+    "RUN_STATUS_RUNNING",
+    "RunStatus",
+    "lookup_latest_run_id",
+    "lookup_run_dataset_id",
+    "record_run_finished",
+    "record_run_started",
+]
@@ -0,0 +1,346 @@
+"""Retention for superseded pipeline runs: graph nodes and run artifacts together.
+
+Every ``ingest-pdf`` / ``extract-claims`` / ``resolve-entities`` run stamps new
+``Chunk``, ``ExtractedClaim``, ``EntityMention`` and ``ResolvedEntityCluster``
+nodes with a fresh ``run_id`` and writes ``<output_dir>/runs/<run_id>``.
+Nothing else ever removes them, so both the graph and the artifacts directory
+grow with every re-run.
+
+A :class:`RunRetentionPolicy` decides which runs are superseded:
+
+* ``keep_latest`` keeps the newest N runs per ``(dataset_id, stage prefix)``
+  group, where the stage prefix comes from
+  :func:`~power_atlas.run_catalog_index.extract_run_stage_prefix`.
+* ``max_age_days`` keeps runs younger than the cutoff.
+
+When both are set a run is kept if either rule keeps it.  Runs are collected
+from the run catalog and from the graph, so runs whose artifacts were already
+removed by hand are still pruned from Neo4j.
+
+:func:`run_run_retention` is a dry run by default: it reports the artifact
+bytes and per-label node counts that would be reclaimed.  With
+``dry_run=False`` each pruned run has its graph nodes, then its ``RunStats``
+and ``Run`` nodes, deleted in batches
+(:func:`~power_atlas.reset_demo_runtime.delete_run_nodes`) before its artifact
+directory is removed, so an interrupted prune is finished by re-running it.
+The pruned runs' retrieval generations are bumped at the end so cached
+search results stop citing their chunks.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from power_atlas.backend_run_catalog import resolve_run_root, resolve_runs_root
+from power_atlas.reset_demo_runtime import DEMO_NODE_LABELS, DemoResetSettings, delete_run_nodes
+from power_atlas.retrieval_result_cache import RETRIEVAL_GENERATION_BUMP_QUERY, retrieval_generation_scopes
+from power_atlas.run_catalog_index import extract_run_stage_prefix, query_run_catalog
+
+_logger = logging.getLogger(__name__)
+
+RETENTION_REPORTS_DIRNAME = "retention_reports"
+RETENTION_REASON_KEEP_LATEST = "beyond_keep_latest"
+RETENTION_REASON_MAX_AGE = "older_than_max_age"
+
+_RUN_ID_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+
+@dataclass(frozen=True, slots=True)
+class RunRetentionPolicy:
+    keep_latest: int | None = None
+    max_age_days: float | None = None
+    dataset_id: str | None = None
+    stage_prefix: str | None = None
+    protected_run_ids: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        if self.keep_latest is None and self.max_age_days is None:
+            raise ValueError("RunRetentionPolicy needs keep_latest and/or max_age_days.")
+        if self.keep_latest is not None and self.keep_latest < 1:
+            raise ValueError(f"keep_latest must be >= 1, got {self.keep_latest}")
+        if self.max_age_days is not None and self.max_age_days < 0:
+            raise ValueError(f"max_age_days must be >= 0, got {self.max_age_days}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "keep_latest": self.keep_latest,
+            "max_age_days": self.max_age_days,
+            "dataset_id": self.dataset_id,
+            "stage_prefix": self.stage_prefix,
+            "protected_run_ids": sorted(self.protected_run_ids),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionRun:
+    run_id: str
+    dataset_id: str | None
+    run_at: datetime | None
+    artifact_path: Path | None = None
+    artifact_bytes: int = 0
+    graph_nodes: Mapping[str, int] = field(default_factory=dict)
+
+    @property
+    def stage_prefix(self) -> str:
+        return extract_run_stage_prefix(self.run_id)
+
+    @property
+    def graph_node_total(self) -> int:
+        return sum(self.graph_nodes.values())
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionDecision:
+    run: RetentionRun
+    reasons: tuple[str, ...]
+
+
+def run_timestamp(run_id: str, started_at: str | None = None) -> datetime | None:
+    """Return when *run_id* ran: manifest ``started_at``, else the timestamp in the id."""
+    if started_at:
+        try:
+            parsed = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    parts = run_id.rsplit("-", 2)
+    if len(parts) == 3:
+        try:
+            return datetime.strptime(parts[1], _RUN_ID_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+    return None
+
+
+def plan_run_retention(
+    runs: Iterable[RetentionRun],
+    policy: RunRetentionPolicy,
+    *,
+    now: datetime,
+) -> list[RetentionDecision]:
+    """Return the runs *policy* prunes, newest first within each group.
+
+    Runs outside the policy's dataset/stage-prefix filter and protected runs
+    are never pruned.  Under ``max_age_days`` alone, runs of unknown age are
+    kept.
+    """
+    groups: dict[tuple[str | None, str], list[RetentionRun]] = {}
+    for run in runs:
+        if policy.dataset_id is not None and run.dataset_id != policy.dataset_id:
+            continue
+        if policy.stage_prefix is not None and run.stage_prefix != policy.stage_prefix:
+            continue
+        groups.setdefault((run.dataset_id, run.stage_prefix), []).append(run)
+
+    cutoff = None if policy.max_age_days is None else now - timedelta(days=policy.max_age_days)
+    decisions: list[RetentionDecision] = []
+    for key in sorted(groups, key=lambda item: (item[0] or "", item[1])):
+        group = sorted(groups[key], key=lambda run: run.run_id, reverse=True)
+        for position, run in enumerate(group):
+            if run.run_id in policy.protected_run_ids:
+                continue
+            reasons: list[str] = []
+            if policy.keep_latest is not None:
+                if position < policy.keep_latest:
+                    continue
+                reasons.append(RETENTION_REASON_KEEP_LATEST)
+            if cutoff is not None:
+                if run.run_at is None or run.run_at >= cutoff:
+                    continue
+                reasons.append(RETENTION_REASON_MAX_AGE)
+            decisions.append(RetentionDecision(run=run, reasons=tuple(reasons)))
+    return decisions
+
+
+def _directory_bytes(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _graph_run_counts(driver: Any, database: str) -> dict[str, tuple[str | None, dict[str, int]]]:
+    runs: dict[str, tuple[str | None, dict[str, int]]] = {}
+    for label in DEMO_NODE_LABELS:
+        records, _, _ = driver.execute_query(
+            f"MATCH (n:{label}) WHERE n.run_id IS NOT NULL "
+            "RETURN n.run_id AS run_id, max(n.dataset_id) AS dataset_id, count(n) AS nodes",
+            database_=database,
+        )
+        for record in records:
+            dataset_id, counts = runs.get(record["run_id"], (None, {}))
+            counts[label] = int(record["nodes"])
+            runs[record["run_id"]] = (dataset_id or record["dataset_id"], counts)
+    return runs
+
+
+def collect_retention_runs(output_dir: Path, *, driver: Any, database: str) -> list[RetentionRun]:
+    """Union the run catalog under *output_dir* with the run ids found in the graph."""
+    runs_root = resolve_runs_root(output_dir)
+    # Pruning decisions must not rely on a stale index, so always resync here.
+    indexed = query_run_catalog(runs_root, sync_interval_seconds=0).runs if runs_root.is_dir() else []
+    graph_runs = _graph_run_counts(driver, database)
+    collected: list[RetentionRun] = []
+    for run in indexed:
+        run_dir = runs_root / run.run_id
+        graph_dataset_id, graph_nodes = graph_runs.pop(run.run_id, (None, {}))
+        run_at = run_timestamp(run.run_id, run.started_at)
+        if run_at is None:
+            try:
+                run_at = datetime.fromtimestamp(run_dir.stat().st_mtime, tz=timezone.utc)
+            except OSError:
+                run_at = None
+        collected.append(
+            RetentionRun(
+                run_id=run.run_id,
+                dataset_id=run.dataset_id or graph_dataset_id,
+                run_at=run_at,
+                artifact_path=run_dir,
+                artifact_bytes=_directory_bytes(run_dir),
+                graph_nodes=graph_nodes,
+            )
+        )
+    for run_id, (dataset_id, graph_nodes) in graph_runs.items():
+        collected.append(
+            RetentionRun(
+                run_id=run_id,
+                dataset_id=dataset_id,
+                run_at=run_timestamp(run_id),
+                graph_nodes=graph_nodes,
+            )
+        )
+    return collected
+
+
+def _decision_entry(decision: RetentionDecision) -> dict[str, Any]:
+    run = decision.run
+    return {
+        "run_id": run.run_id,
+        "dataset_id": run.dataset_id,
+        "stage_prefix": run.stage_prefix,
+        "run_at": None if run.run_at is None else run.run_at.isoformat(),
+        "reasons": list(decision.reasons),
+        "artifact_path": None if run.artifact_path is None else str(run.artifact_path),
+        "artifact_bytes": run.artifact_bytes,
+        "graph_nodes": dict(run.graph_nodes),
+        "graph_node_total": run.graph_node_total,
+    }
+
+
+def _write_report(report: dict[str, Any], output_dir: Path, ts_for_filename: str) -> None:
+    reports_dir = Path(output_dir) / RETENTION_REPORTS_DIRNAME
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    report_path = reports_dir / f"retention_report_{ts_for_filename}.json"
+    report["report_path"] = str(report_path)
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _logger.info("Retention report written to: %s", report_path)
+
+
+def run_run_retention(
+    *,
+    output_dir: Path,
+    policy: RunRetentionPolicy,
+    driver: Any,
+    database: str,
+    dry_run: bool = True,
+    settings: DemoResetSettings | None = None,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Plan (and unless *dry_run*, apply) *policy*; return and write the report.
+
+    Reports go to ``<output_dir>/retention_reports`` so they never count as a
+    run.  A failure mid-prune writes a partial report and re-raises.
+    """
+    resolved_settings = DemoResetSettings.from_env() if settings is None else settings
+    current = datetime.now(timezone.utc) if now is None else now
+    ts_for_filename = current.strftime(_RUN_ID_TIMESTAMP_FORMAT)
+    runs = collect_retention_runs(output_dir, driver=driver, database=database)
+    decisions = plan_run_retention(runs, policy, now=current)
+    entries = [_decision_entry(decision) for decision in decisions]
+    report: dict[str, Any] = {
+        "created_at": current.isoformat(),
+        "target_database": database,
+        "dry_run": dry_run,
+        "policy": policy.to_dict(),
+        "runs_considered": len(runs),
+        "runs_pruned": len(decisions),
+        "runs_kept": len(runs) - len(decisions),
+        "reclaimable_artifact_bytes": sum(entry["artifact_bytes"] for entry in entries),
+        "reclaimable_graph_nodes": sum(entry["graph_node_total"] for entry in entries),
+        "pruned": entries,
+        "deleted_nodes": 0,
+        "deleted_relationships": 0,
+        "deleted_artifact_bytes": 0,
+        "completed": dry_run,
+    }
+    if dry_run:
+        _write_report(report, output_dir, ts_for_filename)
+        return report
+
+    started = time.monotonic()
+    try:
+        with driver.session(database=database) as session:
+            for decision, entry in zip(decisions, entries):
+                run = decision.run
+                nodes, relationships, _batches = delete_run_nodes(
+                    session, run.run_id, settings=resolved_settings
+                )
+                entry["deleted_nodes"] = nodes
+                entry["deleted_relationships"] = relationships
+                report["deleted_nodes"] += nodes
+                report["deleted_relationships"] += relationships
+                if run.artifact_path is not None:
+                    shutil.rmtree(resolve_run_root(output_dir, run.run_id))
+                    report["deleted_artifact_bytes"] += run.artifact_bytes
+                entry["deleted"] = True
+                _logger.info(
+                    "Pruned run %s: nodes=%d relationships=%d artifact_bytes=%d",
+                    run.run_id,
+                    nodes,
+                    relationships,
+                    run.artifact_bytes,
+                )
+            pruned_run_ids = [decision.run.run_id for decision in decisions]
+            if pruned_run_ids:
+                # Cached retrieval results may cite the pruned runs' chunks.
+                session.run(
+                    RETRIEVAL_GENERATION_BUMP_QUERY, scopes=retrieval_generation_scopes(pruned_run_ids)
+                ).consume()
+    except Exception as exc:
+        report["error"] = f"{type(exc).__name__}: {exc}"
+        report["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        _write_report(report, output_dir, ts_for_filename)
+        _logger.error("Run retention interrupted; re-run the same command to finish pruning.")
+        raise
+    report["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    report["completed"] = True
+    _write_report(report, output_dir, ts_for_filename)
+    return report
+
+
+__all__ = [
+    "RETENTION_REASON_KEEP_LATEST",
+    "RETENTION_REASON_MAX_AGE",
+    "RETENTION_REPORTS_DIRNAME",
+    "RetentionDecision",
+    "RetentionRun",
+    "RunRetentionPolicy",
+    "collect_retention_runs",
+    "plan_run_retention",
+    "run_run_retention",
+    "run_timestamp",
+]
@@ -7,9 +7,20 @@ from typing import Any
 from power_atlas.bootstrap import create_neo4j_driver
 from power_atlas.context import AppContext
 from power_atlas.graph_status import DEFAULT_UNCONFIGURED_DETAIL
+from power_atlas.run_stats import RUN_STATS_LABEL
 from power_atlas.settings import Neo4jSettings
 
-DEFAULT_RUN_SCOPED_GRAPH_COUNTS_QUERY = """\
+# Reads the run's materialized ``RunStats`` node (see power_atlas.run_stats).
+DEFAULT_RUN_SCOPED_GRAPH_COUNTS_QUERY = f"""\
+MATCH (stats:{RUN_STATS_LABEL} {{run_id: $run_id}})
+RETURN stats.chunk_count AS chunk_count,
+       stats.claim_count AS claim_count,
+       stats.mention_count AS mention_count,
+       stats.cluster_count AS cluster_count
+"""
+
+# Fallback for runs whose RunStats node is missing or incomplete.
+RUN_SCOPED_GRAPH_COUNTS_SCAN_QUERY = """\
 OPTIONAL MATCH (chunk:Chunk {run_id: $run_id})
 WITH count(chunk) AS chunk_count
 OPTIONAL MATCH (claim:ExtractedClaim {run_id: $run_id})
@@ -23,6 +34,8 @@ RETURN chunk_count,
        count(cluster) AS cluster_count
 """
 
+_COUNT_FIELDS = ("chunk_count", "claim_count", "mention_count", "cluster_count")
+
 
 @dataclass(frozen=True, slots=True)
 class RunScopedGraphCountsRequest:
@@ -100,6 +113,12 @@ def resolve_run_scoped_graph_counts(
                 parameters_={"run_id": request.run_id},
                 database_=neo4j_settings.database,
             )
+            if not records or any(_record_value(records[0], key) is None for key in _COUNT_FIELDS):
+                records, _, _ = driver.execute_query(
+                    RUN_SCOPED_GRAPH_COUNTS_SCAN_QUERY,
+                    parameters_={"run_id": request.run_id},
+                    database_=neo4j_settings.database,
+                )
     except Exception as exc:
         return RunScopedGraphCountsResult(
             http_status_code=503,
@@ -149,6 +168,7 @@ def resolve_run_scoped_graph_counts(
 
 __all__ = [
     "DEFAULT_RUN_SCOPED_GRAPH_COUNTS_QUERY",
+    "RUN_SCOPED_GRAPH_COUNTS_SCAN_QUERY",
     "RunScopedGraphCounts",
     "RunScopedGraphCountsRequest",
     "RunScopedGraphCountsResult",
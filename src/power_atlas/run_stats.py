@@ -0,0 +1,338 @@
+"""Materialized per-run statistics kept on ``(:RunStats {run_id})`` nodes.
+
+Counting a run's ``Chunk``, ``ExtractedClaim``, ``EntityMention`` and
+``ResolvedEntityCluster`` nodes on every request costs time proportional to the
+graph.  Instead each live stage refreshes its *section* of the run's
+``RunStats`` node once, after its last write (inside the same transaction
+where the stage writes in a single transaction):
+
+* ``ingest`` — ``chunk_count`` and ``embedded_chunk_count``;
+* ``extraction`` — ``claim_count``, ``mention_count``, ``chunks_with_claims``
+  and ``claims_with_participants``;
+* ``resolution`` — ``cluster_count`` and ``clustered_mention_count``.
+
+A refresh recounts the section from the run-scoped nodes (``run_id`` lookups
+are index-backed), so it costs time proportional to the run rather than the
+graph, is idempotent and cannot accumulate drift the way increments would.
+Because it is a full recount of the section, stages that write in several
+transactions (per document, per batch) refresh once at the end of the stage
+rather than after each write; until then the section trails the graph.  The
+refresh locks the ``RunStats`` node before counting, so concurrent writers of
+the same run are serialized and the last refresh sees every committed write.
+
+``reset`` and run retention delete a run's ``RunStats`` node along with its
+data.  Readers (:func:`read_run_stats`) fetch the node by key.  A section that was
+never refreshed (runs written before this node existed) reads as ``None``;
+:func:`recompute_run_stats` rebuilds every section from full scans and reports
+where the stored figures had drifted.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+_logger = logging.getLogger(__name__)
+
+RUN_STATS_LABEL = "RunStats"
+
+RunStatsSection = Literal["ingest", "extraction", "resolution"]
+
+_SECTION_SUBQUERIES: dict[str, tuple[tuple[str, tuple[str, ...]], ...]] = {
+    "ingest": (
+        (
+            """
+CALL {
+  MATCH (chunk:Chunk {run_id: $run_id})
+  RETURN count(chunk) AS chunk_count, count(chunk.embedding) AS embedded_chunk_count
+}""",
+            ("chunk_count", "embedded_chunk_count"),
+        ),
+    ),
+    "extraction": (
+        (
+            """
+CALL {
+  MATCH (claim:ExtractedClaim {run_id: $run_id})
+  OPTIONAL MATCH (claim)-[:HAS_PARTICIPANT]->(participant:EntityMention)
+  WITH claim, count(participant) AS participants
+  RETURN count(claim) AS claim_count,
+         sum(CASE WHEN participants > 0 THEN 1 ELSE 0 END) AS claims_with_participants
+}""",
+            ("claim_count", "claims_with_participants"),
+        ),
+        (
+            """
+CALL {
+  MATCH (mention:EntityMention {run_id: $run_id})
+  RETURN count(mention) AS mention_count
+}""",
+            ("mention_count",),
+        ),
+        (
+            """
+CALL {
+  MATCH (:ExtractedClaim {run_id: $run_id})-[:SUPPORTED_BY]->(supported:Chunk)
+  RETURN count(DISTINCT supported) AS chunks_with_claims
+}""",
+            ("chunks_with_claims",),
+        ),
+    ),
+    "resolution": (
+        (
+            """
+CALL {
+  MATCH (cluster:ResolvedEntityCluster {run_id: $run_id})
+  RETURN count(cluster) AS cluster_count
+}""",
+            ("cluster_count",),
+        ),
+        (
+            """
+CALL {
+  MATCH (member:EntityMention {run_id: $run_id})
+  OPTIONAL MATCH (member)-[:MEMBER_OF]->(membership:ResolvedEntityCluster)
+  WITH member, count(membership) AS memberships
+  RETURN sum(CASE WHEN memberships > 0 THEN 1 ELSE 0 END) AS clustered_mention_count
+}""",
+            ("clustered_mention_count",),
+        ),
+    ),
+}
+
+RUN_STATS_SECTIONS: tuple[RunStatsSection, ...] = ("ingest", "extraction", "resolution")
+RUN_STATS_FIELDS: tuple[str, ...] = tuple(
+    field_name
+    for section in RUN_STATS_SECTIONS
+    for _, field_names in _SECTION_SUBQUERIES[section]
+    for field_name in field_names
+)
+
+
+def _section_fields(sections: Sequence[str]) -> tuple[str, ...]:
+    return tuple(
+        field_name for section in sections for _, field_names in _SECTION_SUBQUERIES[section] for field_name in field_names
+    )
+
+
+def _section_subqueries(sections: Sequence[str]) -> str:
+    return "".join(subquery for section in sections for subquery, _ in _SECTION_SUBQUERIES[section])
+
+
+def run_stats_refresh_query(*sections: RunStatsSection) -> str:
+    """Return the Cypher that recounts *sections* of ``$run_id`` onto its ``RunStats`` node."""
+    unknown = [section for section in sections if section not in _SECTION_SUBQUERIES]
+    if not sections or unknown:
+        raise ValueError(f"Unknown run stats sections {unknown or list(sections)!r}; expected {RUN_STATS_SECTIONS!r}")
+    fields = _section_fields(sections)
+    assignments = ",\n    ".join(f"stats.{field_name} = {field_name}" for field_name in fields)
+    # Setting a property first takes the node's write lock, so the counts below
+    # are taken after any concurrent refresh of the same run has committed.
+    return f"""
+MERGE (stats:{RUN_STATS_LABEL} {{run_id: $run_id}})
+SET stats.updated_at = datetime()
+WITH stats{_section_subqueries(sections)}
+SET {assignments}
+"""
+
+
+RUN_STATS_INGEST_REFRESH_QUERY = run_stats_refresh_query("ingest")
+RUN_STATS_EXTRACTION_REFRESH_QUERY = run_stats_refresh_query("extraction")
+RUN_STATS_RESOLUTION_REFRESH_QUERY = run_stats_refresh_query("resolution")
+
+RUN_STATS_SCAN_QUERY = (
+    _section_subqueries(RUN_STATS_SECTIONS)
+    + "\nRETURN "
+    + ", ".join(RUN_STATS_FIELDS)
+    + "\n"
+)
+
+RUN_STATS_READ_QUERY = f"""
+MATCH (stats:{RUN_STATS_LABEL} {{run_id: $run_id}})
+RETURN {", ".join(f"stats.{field_name} AS {field_name}" for field_name in RUN_STATS_FIELDS)},
+       toString(stats.updated_at) AS updated_at
+"""
+
+RUN_STATS_WRITE_QUERY = f"""
+MERGE (stats:{RUN_STATS_LABEL} {{run_id: $run_id}})
+SET stats += $counts, stats.updated_at = datetime()
+"""
+
+RUN_STATS_DELETE_QUERY = f"""
+MATCH (stats:{RUN_STATS_LABEL} {{run_id: $run_id}})
+DELETE stats
+"""
+
+RUN_STATS_RUN_IDS_QUERY = f"""
+CALL {{
+  MATCH (node:Chunk) RETURN DISTINCT node.run_id AS run_id
+  UNION
+  MATCH (node:ExtractedClaim) RETURN DISTINCT node.run_id AS run_id
+  UNION
+  MATCH (node:EntityMention) RETURN DISTINCT node.run_id AS run_id
+  UNION
+  MATCH (node:ResolvedEntityCluster) RETURN DISTINCT node.run_id AS run_id
+  UNION
+  MATCH (node:{RUN_STATS_LABEL}) RETURN DISTINCT node.run_id AS run_id
+}}
+WITH run_id WHERE run_id IS NOT NULL
+RETURN run_id ORDER BY run_id
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RunStats:
+    run_id: str
+    chunk_count: int | None = None
+    embedded_chunk_count: int | None = None
+    claim_count: int | None = None
+    mention_count: int | None = None
+    chunks_with_claims: int | None = None
+    claims_with_participants: int | None = None
+    cluster_count: int | None = None
+    clustered_mention_count: int | None = None
+    updated_at: str | None = None
+
+    @classmethod
+    def from_record(cls, run_id: str, record: Mapping[str, Any]) -> "RunStats":
+        values = {
+            field_name: None if record.get(field_name) is None else int(record[field_name])
+            for field_name in RUN_STATS_FIELDS
+        }
+        return cls(run_id=run_id, updated_at=record.get("updated_at"), **values)
+
+    def counts(self) -> dict[str, int | None]:
+        return {field_name: getattr(self, field_name) for field_name in RUN_STATS_FIELDS}
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(self.counts().values())
+
+    def to_summary(self) -> dict[str, Any]:
+        def _ratio(numerator: int | None, denominator: int | None) -> float | None:
+            if numerator is None or not denominator:
+                return None
+            return round(numerator / denominator, 4)
+
+        return {
+            "run_id": self.run_id,
+            **self.counts(),
+            "coverage": {
+                "embedded_chunks": _ratio(self.embedded_chunk_count, self.chunk_count),
+                "chunks_with_claims": _ratio(self.chunks_with_claims, self.chunk_count),
+                "claims_with_participants": _ratio(self.claims_with_participants, self.claim_count),
+                "clustered_mentions": _ratio(self.clustered_mention_count, self.mention_count),
+            },
+            "updated_at": self.updated_at,
+        }
+
+
+def _record_mapping(record: Any) -> Mapping[str, Any]:
+    return record if isinstance(record, Mapping) else dict(record)
+
+
+def refresh_run_stats(
+    driver: Any,
+    *,
+    run_ids: Iterable[Any],
+    sections: Sequence[RunStatsSection],
+    neo4j_database: str | None,
+) -> None:
+    """Recount *sections* for each run in *run_ids* (for stages that write in several transactions)."""
+    query = run_stats_refresh_query(*sections)
+    for run_id in sorted({str(run_id) for run_id in run_ids if run_id}):
+        driver.execute_query(query, parameters_={"run_id": run_id}, database_=neo4j_database)
+
+
+def read_run_stats(driver: Any, *, run_id: str, neo4j_database: str | None) -> RunStats | None:
+    records, _, _ = driver.execute_query(
+        RUN_STATS_READ_QUERY,
+        parameters_={"run_id": run_id},
+        database_=neo4j_database,
+    )
+    return RunStats.from_record(run_id, _record_mapping(records[0])) if records else None
+
+
+def scan_run_stats(driver: Any, *, run_id: str, neo4j_database: str | None) -> RunStats:
+    """Count every section of *run_id* from the run-scoped nodes without writing."""
+    records, _, _ = driver.execute_query(
+        RUN_STATS_SCAN_QUERY,
+        parameters_={"run_id": run_id},
+        database_=neo4j_database,
+    )
+    return RunStats.from_record(run_id, _record_mapping(records[0]) if records else {})
+
+
+def recompute_run_stats(
+    driver: Any,
+    *,
+    neo4j_database: str | None,
+    run_ids: Sequence[str] | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Rebuild ``RunStats`` nodes from full scans and report the drift that was corrected.
+
+    Without *run_ids* every run found on a run-scoped label or an existing
+    ``RunStats`` node is recomputed.  Stats nodes of runs that no longer have
+    any data are deleted.  With ``dry_run=True`` nothing is written.
+    """
+    if run_ids is None:
+        records, _, _ = driver.execute_query(RUN_STATS_RUN_IDS_QUERY, database_=neo4j_database)
+        run_ids = [_record_mapping(record)["run_id"] for record in records]
+
+    runs: list[dict[str, Any]] = []
+    for run_id in run_ids:
+        stored = read_run_stats(driver, run_id=run_id, neo4j_database=neo4j_database)
+        actual = scan_run_stats(driver, run_id=run_id, neo4j_database=neo4j_database)
+        stored_counts = stored.counts() if stored is not None else dict.fromkeys(RUN_STATS_FIELDS)
+        drift = {
+            field_name: {"stored": stored_counts[field_name], "actual": value}
+            for field_name, value in actual.counts().items()
+            if stored_counts[field_name] != value
+        }
+        if actual.is_empty:
+            action = "none" if stored is None else "deleted"
+            if stored is not None and not dry_run:
+                driver.execute_query(RUN_STATS_DELETE_QUERY, parameters_={"run_id": run_id}, database_=neo4j_database)
+        else:
+            action = "unchanged" if not drift else "rebuilt"
+            if drift and not dry_run:
+                driver.execute_query(
+                    RUN_STATS_WRITE_QUERY,
+                    parameters_={"run_id": run_id, "counts": actual.counts()},
+                    database_=neo4j_database,
+                )
+        if drift:
+            _logger.info("RunStats drift for run_id=%s: %s", run_id, drift)
+        runs.append({"run_id": run_id, "action": action, "drift": drift, "stats": actual.to_summary()})
+
+    return {
+        "dry_run": dry_run,
+        "runs_checked": len(runs),
+        "runs_with_drift": sum(1 for run in runs if run["drift"] and run["action"] != "none"),
+        "runs": runs,
+    }
+
+
+__all__ = [
+    "RUN_STATS_DELETE_QUERY",
+    "RUN_STATS_EXTRACTION_REFRESH_QUERY",
+    "RUN_STATS_FIELDS",
+    "RUN_STATS_INGEST_REFRESH_QUERY",
+    "RUN_STATS_LABEL",
+    "RUN_STATS_READ_QUERY",
+    "RUN_STATS_RESOLUTION_REFRESH_QUERY",
+    "RUN_STATS_RUN_IDS_QUERY",
+    "RUN_STATS_SCAN_QUERY",
+    "RUN_STATS_SECTIONS",
+    "RUN_STATS_WRITE_QUERY",
+    "RunStats",
+    "RunStatsSection",
+    "read_run_stats",
+    "recompute_run_stats",
+    "refresh_run_stats",
+    "run_stats_refresh_query",
+    "scan_run_stats",
+]
@@ -5,7 +5,8 @@ import json
 import re
 from datetime import timezone, datetime
 from pathlib import Path
-from typing import Any, Callable
+from collections.abc import Container
+from typing import TYPE_CHECKING, Any, Callable
 
 from power_atlas.contracts import (
     COMMON_PREDICATE_LABELS,
@@ -21,9 +22,15 @@ from power_atlas.contracts import (
     resolve_dataset_root,
 )
 from power_atlas.settings import Neo4jSettings
-from power_atlas.structured_ingest_runtime import run_structured_ingest_live
+from power_atlas.structured_ingest_runtime import (
+    run_structured_ingest_live,
+    run_structured_stream_ingest_live,
+)
 from power_atlas.structured_ingest_writes import write_structured_ingest_graph
 
+if TYPE_CHECKING:
+    from power_atlas.structured_stream_ingest import StructuredStreamIngestSettings
+
 
 def load_csv_rows(path: Path) -> list[dict[str, str]]:
     with path.open("r", encoding="utf-8", newline="") as handle:
@@ -108,6 +115,171 @@ def is_blank_csv_row(row: dict[str | None, str | list[str] | None]) -> bool:
     return True
 
 
+def lint_structured_row(
+    file_name: str,
+    row_number: int,
+    row: dict[str, str],
+    *,
+    structured_schema: StructuredSchemaContract,
+    add_issue: Callable[[str, int, str, str, str], None],
+) -> None:
+    """Report field-level issues for one cleaned row of *file_name*."""
+    id_field = structured_schema.id_field_by_file_name[file_name]
+    id_pattern = structured_schema.id_patterns[id_field]
+    id_value = (row.get(id_field) or "").strip()
+    if not id_pattern.fullmatch(id_value):
+        add_issue(
+            file_name,
+            row_number,
+            id_field,
+            "INVALID_ID",
+            f"Invalid {id_field}: {id_value!r}",
+        )
+
+    predicate_pid = (row.get("predicate_pid") or "").strip()
+    if "predicate_pid" in row and not structured_schema.id_patterns["predicate_pid"].fullmatch(
+        predicate_pid
+    ):
+        add_issue(
+            file_name,
+            row_number,
+            "predicate_pid",
+            "INVALID_PID",
+            f"Invalid PID: {predicate_pid!r}",
+        )
+    if predicate_pid in structured_schema.common_predicate_labels:
+        expected_label = structured_schema.common_predicate_labels[predicate_pid]
+        actual_label = (row.get("predicate_label") or "").strip()
+        if actual_label and actual_label != expected_label:
+            add_issue(
+                file_name,
+                row_number,
+                "predicate_label",
+                "PID_LABEL_MISMATCH",
+                f"Expected label {expected_label!r} for {predicate_pid}, got {actual_label!r}",
+            )
+
+    if "value_type" in row:
+        value_type = (row.get("value_type") or "").strip()
+        if value_type not in structured_schema.value_types:
+            add_issue(
+                file_name,
+                row_number,
+                "value_type",
+                "INVALID_VALUE_TYPE",
+                f"Unsupported value_type {value_type!r}",
+            )
+        if value_type == "date" and not is_parseable_date((row.get("value") or "").strip()):
+            add_issue(
+                file_name,
+                row_number,
+                "value",
+                "INVALID_DATE_VALUE",
+                "Expected parseable date value",
+            )
+
+    retrieved_at = (row.get("retrieved_at") or "").strip()
+    if "retrieved_at" in row and not is_parseable_date(retrieved_at):
+        add_issue(
+            file_name,
+            row_number,
+            "retrieved_at",
+            "INVALID_RETRIEVED_AT",
+            f"Expected parseable date, got {retrieved_at!r}",
+        )
+
+    if "subject_id" in row:
+        subject_id = (row.get("subject_id") or "").strip()
+        if subject_id and not structured_schema.id_patterns["entity_id"].fullmatch(subject_id):
+            add_issue(
+                file_name,
+                row_number,
+                "subject_id",
+                "INVALID_SUBJECT_ID",
+                f"Invalid ID: {subject_id!r}",
+            )
+    if "object_id" in row:
+        object_id = (row.get("object_id") or "").strip()
+        if object_id and not structured_schema.id_patterns["entity_id"].fullmatch(object_id):
+            add_issue(
+                file_name,
+                row_number,
+                "object_id",
+                "INVALID_OBJECT_ID",
+                f"Invalid ID: {object_id!r}",
+            )
+    if file_name == "claims.csv":
+        claim_type = (row.get("claim_type") or "").strip()
+        if claim_type not in {"fact", "relationship"}:
+            add_issue(
+                file_name,
+                row_number,
+                "claim_type",
+                "INVALID_CLAIM_TYPE",
+                f"Invalid claim_type {claim_type!r}",
+            )
+        confidence_text = (row.get("confidence") or "").strip()
+        try:
+            confidence = float(confidence_text)
+            if confidence < 0 or confidence > 1:
+                raise ValueError("out_of_range")
+        except ValueError:
+            add_issue(
+                file_name,
+                row_number,
+                "confidence",
+                "INVALID_CONFIDENCE",
+                f"Expected confidence in [0,1], got {confidence_text!r}",
+            )
+
+
+def lint_claim_references(
+    claim: dict[str, str],
+    row_number: int,
+    *,
+    structured_schema: StructuredSchemaContract,
+    entity_ids: Container[str] | None,
+    fact_ids: Container[str] | None,
+    relationship_ids: Container[str] | None,
+    add_issue: Callable[[str, int, str, str, str], None],
+) -> None:
+    """Report claim rows whose subject or source row is missing.
+
+    An id container of ``None`` skips that check (its file could not be read).
+    """
+    subject_id = (claim.get("subject_id") or "").strip()
+    if entity_ids is not None and subject_id and subject_id not in entity_ids:
+        add_issue(
+            structured_schema.claim_file_name,
+            row_number,
+            "subject_id",
+            "UNKNOWN_SUBJECT_ID",
+            f"Unknown subject_id {subject_id!r}",
+        )
+    source_row_id = (claim.get("source_row_id") or "").strip()
+    claim_type = (claim.get("claim_type") or "").strip()
+    if fact_ids is not None and claim_type == "fact" and source_row_id not in fact_ids:
+        add_issue(
+            structured_schema.claim_file_name,
+            row_number,
+            "source_row_id",
+            "UNKNOWN_FACT_SOURCE_ROW",
+            f"Missing fact_id {source_row_id!r}",
+        )
+    if (
+        relationship_ids is not None
+        and claim_type == "relationship"
+        and source_row_id not in relationship_ids
+    ):
+        add_issue(
+            structured_schema.claim_file_name,
+            row_number,
+            "source_row_id",
+            "UNKNOWN_REL_SOURCE_ROW",
+            f"Missing rel_id {source_row_id!r}",
+        )
+
+
 def lint_and_clean_structured_csvs(
     run_id: str,
     output_dir: Path,
@@ -206,126 +378,13 @@ def lint_and_clean_structured_csvs(
             deduped, duplicates = deduplicate_rows(rows, expected_headers)
 
         for row_number, row in deduped:
-            id_field = resolved_structured_schema.id_field_by_file_name[file_name]
-            id_pattern = resolved_structured_schema.id_patterns[id_field]
-            id_value = (row.get(id_field) or "").strip()
-            if not id_pattern.fullmatch(id_value):
-                add_issue(
-                    file_name,
-                    row_number,
-                    id_field,
-                    "INVALID_ID",
-                    f"Invalid {id_field}: {id_value!r}",
-                )
-
-            predicate_pid = (row.get("predicate_pid") or "").strip()
-            if (
-                "predicate_pid" in row
-                and not resolved_structured_schema.id_patterns["predicate_pid"].fullmatch(
-                    predicate_pid
-                )
-            ):
-                add_issue(
-                    file_name,
-                    row_number,
-                    "predicate_pid",
-                    "INVALID_PID",
-                    f"Invalid PID: {predicate_pid!r}",
-                )
-            if predicate_pid in resolved_structured_schema.common_predicate_labels:
-                expected_label = resolved_structured_schema.common_predicate_labels[predicate_pid]
-                actual_label = (row.get("predicate_label") or "").strip()
-                if actual_label and actual_label != expected_label:
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "predicate_label",
-                        "PID_LABEL_MISMATCH",
-                        f"Expected label {expected_label!r} for {predicate_pid}, got {actual_label!r}",
-                    )
-
-            if "value_type" in row:
-                value_type = (row.get("value_type") or "").strip()
-                if value_type not in resolved_structured_schema.value_types:
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "value_type",
-                        "INVALID_VALUE_TYPE",
-                        f"Unsupported value_type {value_type!r}",
-                    )
-                if value_type == "date" and not is_parseable_date((row.get("value") or "").strip()):
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "value",
-                        "INVALID_DATE_VALUE",
-                        "Expected parseable date value",
-                    )
-
-            retrieved_at = (row.get("retrieved_at") or "").strip()
-            if "retrieved_at" in row and not is_parseable_date(retrieved_at):
-                add_issue(
-                    file_name,
-                    row_number,
-                    "retrieved_at",
-                    "INVALID_RETRIEVED_AT",
-                    f"Expected parseable date, got {retrieved_at!r}",
-                )
-
-            if "subject_id" in row:
-                subject_id = (row.get("subject_id") or "").strip()
-                if (
-                    subject_id
-                    and not resolved_structured_schema.id_patterns["entity_id"].fullmatch(
-                        subject_id
-                    )
-                ):
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "subject_id",
-                        "INVALID_SUBJECT_ID",
-                        f"Invalid ID: {subject_id!r}",
-                    )
-            if "object_id" in row:
-                object_id = (row.get("object_id") or "").strip()
-                if (
-                    object_id
-                    and not resolved_structured_schema.id_patterns["entity_id"].fullmatch(
-                        object_id
-                    )
-                ):
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "object_id",
-                        "INVALID_OBJECT_ID",
-                        f"Invalid ID: {object_id!r}",
-                    )
-            if file_name == "claims.csv":
-                claim_type = (row.get("claim_type") or "").strip()
-                if claim_type not in {"fact", "relationship"}:
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "claim_type",
-                        "INVALID_CLAIM_TYPE",
-                        f"Invalid claim_type {claim_type!r}",
-                    )
-                confidence_text = (row.get("confidence") or "").strip()
-                try:
-                    confidence = float(confidence_text)
-                    if confidence < 0 or confidence > 1:
-                        raise ValueError("out_of_range")
-                except ValueError:
-                    add_issue(
-                        file_name,
-                        row_number,
-                        "confidence",
-                        "INVALID_CONFIDENCE",
-                        f"Expected confidence in [0,1], got {confidence_text!r}",
-                    )
+            lint_structured_row(
+                file_name,
+                row_number,
+                row,
+                structured_schema=resolved_structured_schema,
+                add_issue=add_issue,
+            )
 
         cleaned_rows[file_name] = [row for _, row in deduped]
         cleaned_row_numbers[file_name] = [row_number for row_number, _ in deduped]
@@ -368,37 +427,15 @@ def lint_and_clean_structured_csvs(
             if index < len(claims_row_numbers)
             else index + resolved_structured_schema.csv_first_data_row
         )
-        subject_id = (claim.get("subject_id") or "").strip()
-        if can_validate_entities and subject_id and subject_id not in entity_ids:
-            add_issue(
-                resolved_structured_schema.claim_file_name,
-                row_number,
-                "subject_id",
-                "UNKNOWN_SUBJECT_ID",
-                f"Unknown subject_id {subject_id!r}",
-            )
-        source_row_id = (claim.get("source_row_id") or "").strip()
-        claim_type = (claim.get("claim_type") or "").strip()
-        if can_validate_facts and claim_type == "fact" and source_row_id not in fact_ids:
-            add_issue(
-                resolved_structured_schema.claim_file_name,
-                row_number,
-                "source_row_id",
-                "UNKNOWN_FACT_SOURCE_ROW",
-                f"Missing fact_id {source_row_id!r}",
-            )
-        if (
-            can_validate_relationships
-            and claim_type == "relationship"
-            and source_row_id not in relationship_ids
-        ):
-            add_issue(
-                resolved_structured_schema.claim_file_name,
-                row_number,
-                "source_row_id",
-                "UNKNOWN_REL_SOURCE_ROW",
-                f"Missing rel_id {source_row_id!r}",
-            )
+        lint_claim_references(
+            claim,
+            row_number,
+            structured_schema=resolved_structured_schema,
+            entity_ids=entity_ids if can_validate_entities else None,
+            fact_ids=fact_ids if can_validate_facts else None,
+            relationship_ids=relationship_ids if can_validate_relationships else None,
+            add_issue=add_issue,
+        )
 
     for file_name, expected_headers in resolved_structured_schema.file_headers.items():
         output_path = clean_dir / file_name
@@ -463,7 +500,15 @@ def run_structured_ingest_runtime(
     timestamp_factory: Callable[[], str] = timestamp,
     live_runner: Callable[..., None] = run_structured_ingest_live,
     write_graph: Callable[..., None] = write_structured_ingest_graph,
+    stream_settings: StructuredStreamIngestSettings | None = None,
+    stream_live_runner: Callable[..., dict[str, Any]] = run_structured_stream_ingest_live,
 ) -> dict[str, Any]:
+    from power_atlas.structured_stream_ingest import (
+        StructuredStreamIngestSettings,
+        stream_lint_and_clean_structured_csvs,
+        write_structured_csv_stream,
+    )
+
     resolved_structured_schema = (
         get_default_structured_schema_contract()
         if structured_schema is None
@@ -474,27 +519,50 @@ def run_structured_ingest_runtime(
         if structured_graph_shape is None
         else structured_graph_shape
     )
-    fixtures_root, effective_dataset_id = resolve_dataset(fixtures_dir, dataset_id)
-    lint_output = lint_and_clean(
-        run_id=run_id,
-        output_dir=config.output_dir,
-        fixtures_dir=fixtures_root,
-        dataset_id=effective_dataset_id,
-        structured_schema=resolved_structured_schema,
-    )
-    structured_clean_dir = Path(lint_output["structured_clean_dir"])
-    entities_rows = read_csv_rows(
-        structured_clean_dir / resolved_structured_schema.entity_file_name
-    )
-    facts_rows = read_csv_rows(
-        structured_clean_dir / resolved_structured_schema.fact_file_name
+    resolved_stream_settings = (
+        StructuredStreamIngestSettings.from_env() if stream_settings is None else stream_settings
     )
-    relationship_rows = read_csv_rows(
-        structured_clean_dir / resolved_structured_schema.relationship_file_name
-    )
-    claims_rows = read_csv_rows(
-        structured_clean_dir / resolved_structured_schema.claim_file_name
+    fixtures_root, effective_dataset_id = resolve_dataset(fixtures_dir, dataset_id)
+    streaming = resolved_stream_settings.applies_to(
+        fixtures_root / "structured", resolved_structured_schema
     )
+    file_counts = {
+        "entities": resolved_structured_schema.entity_file_name,
+        "facts": resolved_structured_schema.fact_file_name,
+        "relationships": resolved_structured_schema.relationship_file_name,
+        "claims": resolved_structured_schema.claim_file_name,
+    }
+    if streaming:
+        # Large inputs: lint/dedup in one bounded-memory pass, and later stream
+        # the cleaned CSVs to Neo4j in batches instead of loading them here.
+        lint_output = stream_lint_and_clean_structured_csvs(
+            run_id=run_id,
+            output_dir=config.output_dir,
+            fixtures_dir=fixtures_root,
+            dataset_id=effective_dataset_id,
+            structured_schema=resolved_structured_schema,
+            max_reported_issues=resolved_stream_settings.max_reported_issues,
+            progress_interval_seconds=resolved_stream_settings.progress_interval_seconds,
+        )
+        structured_clean_dir = Path(lint_output["structured_clean_dir"])
+        counts = {
+            kind: lint_output["files"][file_name]["output_rows"]
+            for kind, file_name in file_counts.items()
+        }
+    else:
+        lint_output = lint_and_clean(
+            run_id=run_id,
+            output_dir=config.output_dir,
+            fixtures_dir=fixtures_root,
+            dataset_id=effective_dataset_id,
+            structured_schema=resolved_structured_schema,
+        )
+        structured_clean_dir = Path(lint_output["structured_clean_dir"])
+        rows_by_kind = {
+            kind: read_csv_rows(structured_clean_dir / file_name)
+            for kind, file_name in file_counts.items()
+        }
+        counts = {kind: len(rows) for kind, rows in rows_by_kind.items()}
     source_uri = str(fixtures_root / "structured")
     ingested_at = timestamp_factory()
 
@@ -508,64 +576,37 @@ def run_structured_ingest_runtime(
         json.dumps(validation_warnings, indent=2),
         encoding="utf-8",
     )
-    ingest_summary = {
+    ingest_summary: dict[str, Any] = {
         "run_id": run_id,
         "dataset_id": effective_dataset_id,
         "source_uri": source_uri,
         "ingested_at": ingested_at,
-        "counts": {
-            "entities": len(entities_rows),
-            "facts": len(facts_rows),
-            "relationships": len(relationship_rows),
-            "claims": len(claims_rows),
-        },
+        "counts": counts,
         "warning_count": len(validation_warnings),
         "validation_warnings_path": str(validation_warnings_path),
         "structured_clean_dir": str(structured_clean_dir),
     }
+    if streaming:
+        ingest_summary["streaming"] = {
+            "batch_size": resolved_stream_settings.batch_size,
+            "lint_rows_per_second": {
+                kind: lint_output["files"][file_name]["rows_per_second"]
+                for kind, file_name in file_counts.items()
+            },
+            "write": None,
+        }
     ingest_summary_path = structured_ingest_dir / "ingest_summary.json"
     ingest_summary_path.write_text(
         json.dumps(ingest_summary, indent=2),
         encoding="utf-8",
     )
 
-    if config.dry_run:
-        return {
-            "status": "dry_run",
-            "claims": ingest_summary["counts"]["claims"],
-            "entities": ingest_summary["counts"]["entities"],
-            "relationships": ingest_summary["counts"]["relationships"],
-            "facts": ingest_summary["counts"]["facts"],
-            "structured_clean_dir": lint_output["structured_clean_dir"],
-            "lint_report_path": lint_output["lint_report_path"],
-            "lint_summary": lint_output["lint_summary"],
-            "structured_ingest_dir": str(structured_ingest_dir),
-            "ingest_summary_path": str(ingest_summary_path),
-            "validation_warnings_path": str(validation_warnings_path),
-            "validation_warning_count": len(validation_warnings),
-        }
-
-    live_runner(
-        neo4j_settings,
-        run_id=run_id,
-        source_uri=source_uri,
-        dataset_id=effective_dataset_id,
-        ingested_at=ingested_at,
-        neo4j_database=neo4j_settings.database,
-        entities_rows=entities_rows,
-        facts_rows=facts_rows,
-        relationship_rows=relationship_rows,
-        claims_rows=claims_rows,
-        write_graph=write_graph,
-        graph_shape=resolved_structured_graph_shape,
-    )
-
-    return {
-        "status": "live",
-        "claims": ingest_summary["counts"]["claims"],
-        "entities": ingest_summary["counts"]["entities"],
-        "relationships": ingest_summary["counts"]["relationships"],
-        "facts": ingest_summary["counts"]["facts"],
+    result: dict[str, Any] = {
+        "status": "dry_run",
+        "claims": counts["claims"],
+        "entities": counts["entities"],
+        "relationships": counts["relationships"],
+        "facts": counts["facts"],
         "structured_clean_dir": lint_output["structured_clean_dir"],
         "lint_report_path": lint_output["lint_report_path"],
         "lint_summary": lint_output["lint_summary"],
@@ -573,13 +614,55 @@ def run_structured_ingest_runtime(
         "ingest_summary_path": str(ingest_summary_path),
         "validation_warnings_path": str(validation_warnings_path),
         "validation_warning_count": len(validation_warnings),
-        "provenance": {
-            "run_id": run_id,
-            "source_uri": source_uri,
-            "dataset_id": effective_dataset_id,
-            "retrieved_at": ingested_at,
-        },
     }
+    if streaming:
+        result["streaming"] = ingest_summary["streaming"]
+    if config.dry_run:
+        return result
+
+    if streaming:
+        ingest_summary["streaming"]["write"] = stream_live_runner(
+            neo4j_settings,
+            run_id=run_id,
+            source_uri=source_uri,
+            dataset_id=effective_dataset_id,
+            ingested_at=ingested_at,
+            neo4j_database=neo4j_settings.database,
+            structured_clean_dir=structured_clean_dir,
+            structured_schema=resolved_structured_schema,
+            graph_shape=resolved_structured_graph_shape,
+            batch_size=resolved_stream_settings.batch_size,
+            progress_interval_seconds=resolved_stream_settings.progress_interval_seconds,
+            write_stream=write_structured_csv_stream,
+        )
+        ingest_summary_path.write_text(
+            json.dumps(ingest_summary, indent=2),
+            encoding="utf-8",
+        )
+    else:
+        live_runner(
+            neo4j_settings,
+            run_id=run_id,
+            source_uri=source_uri,
+            dataset_id=effective_dataset_id,
+            ingested_at=ingested_at,
+            neo4j_database=neo4j_settings.database,
+            entities_rows=rows_by_kind["entities"],
+            facts_rows=rows_by_kind["facts"],
+            relationship_rows=rows_by_kind["relationships"],
+            claims_rows=rows_by_kind["claims"],
+            write_graph=write_graph,
+            graph_shape=resolved_structured_graph_shape,
+        )
+
+    result["status"] = "live"
+    result["provenance"] = {
+        "run_id": run_id,
+        "source_uri": source_uri,
+        "dataset_id": effective_dataset_id,
+        "retrieved_at": ingested_at,
+    }
+    return result
 
 
 def run_structured_ingest_runtime_default(
@@ -609,6 +692,8 @@ __all__ = [
     "is_blank_csv_row",
     "is_parseable_date",
     "lint_and_clean_structured_csvs",
+    "lint_claim_references",
+    "lint_structured_row",
     "load_csv_rows",
     "resolve_structured_dataset",
     "run_structured_ingest_runtime",
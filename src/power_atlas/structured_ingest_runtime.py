@@ -1,4 +1,7 @@
-from power_atlas.adapters.neo4j.structured_ingest_runtime import run_structured_ingest_live
+from power_atlas.adapters.neo4j.structured_ingest_runtime import (
+    run_structured_ingest_live,
+    run_structured_stream_ingest_live,
+)
 
 
-__all__ = ["run_structured_ingest_live"]
\ No newline at end of file
+__all__ = ["run_structured_ingest_live", "run_structured_stream_ingest_live"]
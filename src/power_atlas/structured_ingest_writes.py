@@ -89,23 +89,33 @@ def _write_dataset_source(
     ).consume()
 
 
-def _write_entities(
+def _run_rows_query(
     session: Any,
+    query: str,
     *,
     rows: list[dict[str, str]],
     run_id: str,
     source_uri: str,
     dataset_id: str,
     ingested_at: str,
-    graph_shape: StructuredGraphShapeContract,
 ) -> None:
+    session.run(
+        query,
+        rows=rows,
+        run_id=run_id,
+        source_uri=source_uri,
+        dataset_id=dataset_id,
+        ingested_at=ingested_at,
+    ).consume()
+
+
+def _entities_query(graph_shape: StructuredGraphShapeContract) -> str:
     asserted_in_clause = _asserted_in_clause(
         "entity",
         retrieved_at_expr="$ingested_at",
         graph_shape=graph_shape,
     )
-    session.run(
-        """
+    return """
         UNWIND $rows AS row
         MERGE (entity:{entity_label} {{entity_id: trim(row.entity_id), run_id: $run_id}})
         SET entity.name = row.name,
@@ -119,16 +129,10 @@ def _write_entities(
         {asserted_in_clause}""".format(
             entity_label=_escape_cypher_identifier(graph_shape.entity_label),
             asserted_in_clause=asserted_in_clause,
-        ),
-        rows=rows,
-        run_id=run_id,
-        source_uri=source_uri,
-        dataset_id=dataset_id,
-        ingested_at=ingested_at,
-    ).consume()
+        )
 
 
-def _write_facts(
+def _write_entities(
     session: Any,
     *,
     rows: list[dict[str, str]],
@@ -138,6 +142,18 @@ def _write_facts(
     ingested_at: str,
     graph_shape: StructuredGraphShapeContract,
 ) -> None:
+    _run_rows_query(
+        session,
+        _entities_query(graph_shape),
+        rows=rows,
+        run_id=run_id,
+        source_uri=source_uri,
+        dataset_id=dataset_id,
+        ingested_at=ingested_at,
+    )
+
+
+def _facts_query(graph_shape: StructuredGraphShapeContract) -> str:
     asserted_in_clause = _asserted_in_clause(
         "fact",
         retrieved_at_expr="coalesce(row.retrieved_at, $ingested_at)",
@@ -148,8 +164,7 @@ def _write_facts(
         retrieved_at_expr="coalesce(row.retrieved_at, $ingested_at)",
         graph_shape=graph_shape,
     )
-    session.run(
-        """
+    return """
         UNWIND $rows AS row
         MERGE (fact:{fact_label} {{fact_id: trim(row.fact_id), run_id: $run_id}})
         SET fact.subject_id = trim(row.subject_id),
@@ -180,16 +195,10 @@ def _write_facts(
             ),
             asserted_in_clause=asserted_in_clause,
             row_source_clause=row_source_clause,
-        ),
-        rows=rows,
-        run_id=run_id,
-        source_uri=source_uri,
-        dataset_id=dataset_id,
-        ingested_at=ingested_at,
-    ).consume()
+        )
 
 
-def _write_relationships(
+def _write_facts(
     session: Any,
     *,
     rows: list[dict[str, str]],
@@ -199,6 +208,18 @@ def _write_relationships(
     ingested_at: str,
     graph_shape: StructuredGraphShapeContract,
 ) -> None:
+    _run_rows_query(
+        session,
+        _facts_query(graph_shape),
+        rows=rows,
+        run_id=run_id,
+        source_uri=source_uri,
+        dataset_id=dataset_id,
+        ingested_at=ingested_at,
+    )
+
+
+def _relationships_query(graph_shape: StructuredGraphShapeContract) -> str:
     asserted_in_clause = _asserted_in_clause(
         "relationship",
         retrieved_at_expr="coalesce(row.retrieved_at, $ingested_at)",
@@ -209,8 +230,7 @@ def _write_relationships(
         retrieved_at_expr="coalesce(row.retrieved_at, $ingested_at)",
         graph_shape=graph_shape,
     )
-    session.run(
-        """
+    return """
         UNWIND $rows AS row
         MERGE (relationship:{relationship_label} {{rel_id: trim(row.rel_id), run_id: $run_id}})
         SET relationship.subject_id = trim(row.subject_id),
@@ -257,16 +277,10 @@ def _write_relationships(
             ),
             asserted_in_clause=asserted_in_clause,
             row_source_clause=row_source_clause,
-        ),
-        rows=rows,
-        run_id=run_id,
-        source_uri=source_uri,
-        dataset_id=dataset_id,
-        ingested_at=ingested_at,
-    ).consume()
+        )
 
 
-def _write_claims(
+def _write_relationships(
     session: Any,
     *,
     rows: list[dict[str, str]],
@@ -276,6 +290,18 @@ def _write_claims(
     ingested_at: str,
     graph_shape: StructuredGraphShapeContract,
 ) -> None:
+    _run_rows_query(
+        session,
+        _relationships_query(graph_shape),
+        rows=rows,
+        run_id=run_id,
+        source_uri=source_uri,
+        dataset_id=dataset_id,
+        ingested_at=ingested_at,
+    )
+
+
+def _claims_query(graph_shape: StructuredGraphShapeContract) -> str:
     asserted_in_clause = _asserted_in_clause(
         "claim",
         retrieved_at_expr="coalesce(row.retrieved_at, $ingested_at)",
@@ -286,8 +312,7 @@ def _write_claims(
         retrieved_at_expr="coalesce(row.retrieved_at, $ingested_at)",
         graph_shape=graph_shape,
     )
-    session.run(
-        """
+    return """
         UNWIND $rows AS row
         MERGE (claim:{claim_label} {{claim_id: trim(row.claim_id), run_id: $run_id}})
         SET claim.claim_type = trim(row.claim_type),
@@ -366,13 +391,106 @@ def _write_claims(
             ),
             asserted_in_clause=asserted_in_clause,
             row_source_clause=row_source_clause,
-        ),
+        )
+
+
+def _write_claims(
+    session: Any,
+    *,
+    rows: list[dict[str, str]],
+    run_id: str,
+    source_uri: str,
+    dataset_id: str,
+    ingested_at: str,
+    graph_shape: StructuredGraphShapeContract,
+) -> None:
+    _run_rows_query(
+        session,
+        _claims_query(graph_shape),
         rows=rows,
         run_id=run_id,
         source_uri=source_uri,
         dataset_id=dataset_id,
         ingested_at=ingested_at,
-    ).consume()
+    )
+
+
+_ROW_WRITERS = {
+    "entities": _write_entities,
+    "facts": _write_facts,
+    "relationships": _write_relationships,
+    "claims": _write_claims,
+}
+STRUCTURED_ROW_KINDS: tuple[str, ...] = tuple(_ROW_WRITERS)
+_ROW_QUERIES = {
+    "entities": _entities_query,
+    "facts": _facts_query,
+    "relationships": _relationships_query,
+    "claims": _claims_query,
+}
+
+
+def write_structured_dataset_source(
+    session: Any,
+    *,
+    run_id: str,
+    source_uri: str,
+    dataset_id: str,
+    ingested_at: str,
+    graph_shape: StructuredGraphShapeContract | None = None,
+) -> None:
+    _write_dataset_source(
+        session,
+        run_id=run_id,
+        source_uri=source_uri,
+        dataset_id=dataset_id,
+        ingested_at=ingested_at,
+        graph_shape=get_default_structured_graph_shape_contract() if graph_shape is None else graph_shape,
+    )
+
+
+def structured_rows_query(kind: str, graph_shape: StructuredGraphShapeContract | None = None) -> str:
+    """Return the ``UNWIND $rows`` write query for *kind* rows.
+
+    Besides ``$rows`` the query takes ``$run_id``, ``$source_uri``,
+    ``$dataset_id`` and ``$ingested_at``.
+    """
+    try:
+        query_builder = _ROW_QUERIES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown structured row kind {kind!r}; expected one of {STRUCTURED_ROW_KINDS}") from None
+    return query_builder(get_default_structured_graph_shape_contract() if graph_shape is None else graph_shape)
+
+
+def write_structured_rows(
+    session: Any,
+    *,
+    kind: str,
+    rows: list[dict[str, str]],
+    run_id: str,
+    source_uri: str,
+    dataset_id: str,
+    ingested_at: str,
+    graph_shape: StructuredGraphShapeContract | None = None,
+) -> None:
+    """Write one batch of *kind* rows (see ``STRUCTURED_ROW_KINDS``).
+
+    The dataset source node must already exist, and claim batches must be
+    written after the facts and relationships they are supported by.
+    """
+    try:
+        writer = _ROW_WRITERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown structured row kind {kind!r}; expected one of {STRUCTURED_ROW_KINDS}") from None
+    writer(
+        session,
+        rows=rows,
+        run_id=run_id,
+        source_uri=source_uri,
+        dataset_id=dataset_id,
+        ingested_at=ingested_at,
+        graph_shape=get_default_structured_graph_shape_contract() if graph_shape is None else graph_shape,
+    )
 
 
 def write_structured_ingest_graph(
@@ -439,4 +557,10 @@ def write_structured_ingest_graph(
     )
 
 
-__all__ = ["write_structured_ingest_graph"]
\ No newline at end of file
+__all__ = [
+    "STRUCTURED_ROW_KINDS",
+    "structured_rows_query",
+    "write_structured_dataset_source",
+    "write_structured_ingest_graph",
+    "write_structured_rows",
+]
\ No newline at end of file
@@ -0,0 +1,517 @@
+"""Bounded-memory structured CSV ingest for large catalogs.
+
+The default structured ingest reads every CSV into memory twice (lint/dedup and
+graph write) and sends each file through a single ``UNWIND``.  That is fine for
+the fixtures but not for a multi-million-row ``entities.csv``.  This module
+provides the streaming equivalent used by ``run_structured_ingest_runtime``
+when the input is large (or ``POWER_ATLAS_STRUCTURED_STREAMING=on``):
+
+* :func:`stream_lint_and_clean_structured_csvs` reads each source CSV once,
+  row by row, applying the same per-row checks as the in-memory lint.  Rows go
+  straight to ``structured_clean/``.  Duplicate-row keys and the entity/fact/
+  relationship ids that claims are checked against live in a
+  :class:`DiskKeySet` (SQLite with a bounded page cache) rather than in Python
+  sets.
+* :func:`write_structured_csv_stream` then streams the cleaned CSVs to Neo4j in
+  fixed-size batches through the shared ``run_batched_write`` path (transient
+  failures are retried by the driver's managed transaction) and logs progress
+  with rows/s.
+
+Lint still gates the write: nothing is written to the graph unless the whole
+input lints clean, so a failed lint never leaves a half-ingested run behind.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from power_atlas.contracts import (
+    StructuredGraphShapeContract,
+    StructuredSchemaContract,
+    get_default_structured_schema_contract,
+)
+from power_atlas.structured_ingest_runner import (
+    is_blank_csv_row,
+    lint_claim_references,
+    lint_structured_row,
+    resolve_structured_dataset,
+)
+from power_atlas.neo4j_batch_writes import BatchWritePolicy, run_batched_write
+from power_atlas.structured_ingest_writes import structured_rows_query, write_structured_dataset_source
+
+_logger = logging.getLogger(__name__)
+
+STRUCTURED_STREAMING_MODES: tuple[str, ...] = ("auto", "on", "off")
+DEFAULT_STRUCTURED_STREAM_BATCH_SIZE = 5_000
+DEFAULT_STRUCTURED_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+DEFAULT_STRUCTURED_STREAM_MAX_REPORTED_ISSUES = 1_000
+DEFAULT_STRUCTURED_STREAM_PROGRESS_SECONDS = 10.0
+_KEY_SET_CACHE_KIB = 32 * 1024
+_DEDUPLICATED_FILE_KINDS = frozenset({"entities", "facts", "relationships"})
+
+
+@dataclass(frozen=True)
+class StructuredStreamIngestEnvNames:
+    mode: str = "POWER_ATLAS_STRUCTURED_STREAMING"
+    threshold_bytes: str = "POWER_ATLAS_STRUCTURED_STREAMING_THRESHOLD_BYTES"
+    batch_size: str = "POWER_ATLAS_STRUCTURED_BATCH_SIZE"
+
+
+DEFAULT_STRUCTURED_STREAM_INGEST_ENV_NAMES = StructuredStreamIngestEnvNames()
+
+
+@dataclass(frozen=True, slots=True)
+class StructuredStreamIngestSettings:
+    """When to stream structured ingest, and how.
+
+    ``mode="auto"`` streams once the structured CSVs together reach
+    ``threshold_bytes``; ``"on"`` and ``"off"`` force either path.
+    """
+
+    mode: str = "auto"
+    threshold_bytes: int = DEFAULT_STRUCTURED_STREAM_THRESHOLD_BYTES
+    batch_size: int = DEFAULT_STRUCTURED_STREAM_BATCH_SIZE
+    max_reported_issues: int = DEFAULT_STRUCTURED_STREAM_MAX_REPORTED_ISSUES
+    progress_interval_seconds: float = DEFAULT_STRUCTURED_STREAM_PROGRESS_SECONDS
+
+    def __post_init__(self) -> None:
+        if self.mode not in STRUCTURED_STREAMING_MODES:
+            raise ValueError(f"mode must be one of {STRUCTURED_STREAMING_MODES}, got {self.mode!r}")
+        if self.threshold_bytes < 0:
+            raise ValueError(f"threshold_bytes must be >= 0, got {self.threshold_bytes}")
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+
+    @classmethod
+    def from_env(
+        cls,
+        environ: Mapping[str, str] | None = None,
+        *,
+        env_names: StructuredStreamIngestEnvNames | None = None,
+    ) -> "StructuredStreamIngestSettings":
+        env = os.environ if environ is None else environ
+        names = DEFAULT_STRUCTURED_STREAM_INGEST_ENV_NAMES if env_names is None else env_names
+        return cls(
+            mode=env.get(names.mode, "auto").strip().lower() or "auto",
+            threshold_bytes=int(env.get(names.threshold_bytes, DEFAULT_STRUCTURED_STREAM_THRESHOLD_BYTES)),
+            batch_size=int(env.get(names.batch_size, DEFAULT_STRUCTURED_STREAM_BATCH_SIZE)),
+        )
+
+    def applies_to(self, structured_dir: Path, structured_schema: StructuredSchemaContract) -> bool:
+        if self.mode != "auto":
+            return self.mode == "on"
+        total_bytes = 0
+        for file_name in structured_schema.file_headers:
+            path = structured_dir / file_name
+            if path.is_file():
+                total_bytes += path.stat().st_size
+        return total_bytes >= self.threshold_bytes
+
+
+class DiskKeySet:
+    """Namespaced set of string keys stored on disk.
+
+    Keys are hashed to 16-byte digests and kept in a ``WITHOUT ROWID`` SQLite
+    table; memory use is capped by the SQLite page cache, not by the number of
+    keys.
+    """
+
+    def __init__(self, path: Path, *, cache_kib: int = _KEY_SET_CACHE_KIB) -> None:
+        self._connection = sqlite3.connect(str(path), isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS keys ("
+            "namespace TEXT NOT NULL, digest BLOB NOT NULL, PRIMARY KEY (namespace, digest)"
+            ") WITHOUT ROWID"
+        )
+        self._connection.execute("BEGIN")
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+    def add(self, namespace: str, key: str) -> bool:
+        """Add *key*; return ``False`` when it was already present."""
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO keys (namespace, digest) VALUES (?, ?)",
+            (namespace, self._digest(key)),
+        )
+        return cursor.rowcount == 1
+
+    def contains(self, namespace: str, key: str) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM keys WHERE namespace = ? AND digest = ?",
+            (namespace, self._digest(key)),
+        ).fetchone()
+        return row is not None
+
+    def view(self, namespace: str) -> "_DiskKeySetView":
+        return _DiskKeySetView(self, namespace)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+@dataclass(frozen=True, slots=True)
+class _DiskKeySetView:
+    key_set: DiskKeySet
+    namespace: str
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.key_set.contains(self.namespace, key)
+
+
+class _ProgressMeter:
+    def __init__(
+        self,
+        label: str,
+        *,
+        interval_seconds: float,
+        clock: Callable[[], float],
+    ) -> None:
+        self._label = label
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self.started = clock()
+        self._last_logged = self.started
+        self.rows = 0
+
+    def advance(self, rows: int) -> None:
+        self.rows += rows
+        now = self._clock()
+        if now - self._last_logged >= self._interval_seconds:
+            self._last_logged = now
+            _logger.info("%s: %d rows (%.0f rows/s)", self._label, self.rows, self.rows_per_second())
+
+    def elapsed_seconds(self) -> float:
+        return self._clock() - self.started
+
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds()
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+
+def _file_kinds(structured_schema: StructuredSchemaContract) -> dict[str, str]:
+    return {
+        structured_schema.entity_file_name: "entities",
+        structured_schema.fact_file_name: "facts",
+        structured_schema.relationship_file_name: "relationships",
+        structured_schema.claim_file_name: "claims",
+    }
+
+
+def _ordered_file_names(structured_schema: StructuredSchemaContract) -> list[str]:
+    """Schema file order with claims last, so claim references can be checked."""
+    claim_file_name = structured_schema.claim_file_name
+    names = [name for name in structured_schema.file_headers if name != claim_file_name]
+    if claim_file_name in structured_schema.file_headers:
+        names.append(claim_file_name)
+    return names
+
+
+def peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def stream_lint_and_clean_structured_csvs(
+    run_id: str,
+    output_dir: Path,
+    fixtures_dir: Path | None = None,
+    *,
+    dataset_id: str | None = None,
+    structured_schema: StructuredSchemaContract | None = None,
+    max_reported_issues: int = DEFAULT_STRUCTURED_STREAM_MAX_REPORTED_ISSUES,
+    progress_interval_seconds: float = DEFAULT_STRUCTURED_STREAM_PROGRESS_SECONDS,
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[str, Any]:
+    """Streaming counterpart of ``lint_and_clean_structured_csvs``.
+
+    Produces the same ``structured_clean/`` files and ``lint_report.json``
+    layout.  Only the first *max_reported_issues* issues are kept in the
+    report; ``summary.issue_count`` is always the full count.
+    """
+    resolved_structured_schema = (
+        get_default_structured_schema_contract() if structured_schema is None else structured_schema
+    )
+    fixtures_root, effective_dataset_id = resolve_structured_dataset(fixtures_dir, dataset_id)
+    structured_dir = fixtures_root / "structured"
+    run_root = output_dir / "runs" / run_id
+    clean_dir = run_root / "structured_clean"
+    clean_dir.mkdir(parents=True, exist_ok=True)
+    file_kinds = _file_kinds(resolved_structured_schema)
+
+    lint_issues: list[dict[str, Any]] = []
+    issue_count = 0
+    file_summaries: dict[str, dict[str, Any]] = {}
+    read_error_files: set[str] = set()
+
+    def add_issue(file_name: str, row_number: int, field: str, code: str, message: str) -> None:
+        nonlocal issue_count
+        issue_count += 1
+        if len(lint_issues) < max_reported_issues:
+            lint_issues.append(
+                {"file": file_name, "row": row_number, "field": field, "code": code, "message": message}
+            )
+
+    with tempfile.TemporaryDirectory(prefix="structured_keys_", dir=run_root) as key_dir:
+        key_set = DiskKeySet(Path(key_dir) / "keys.sqlite")
+        try:
+            for file_name in _ordered_file_names(resolved_structured_schema):
+                expected_headers = resolved_structured_schema.file_headers[file_name]
+                kind = file_kinds.get(file_name)
+                source_path = structured_dir / file_name
+                output_path = clean_dir / file_name
+                meter = _ProgressMeter(
+                    f"Structured lint {file_name}",
+                    interval_seconds=progress_interval_seconds,
+                    clock=clock,
+                )
+                input_rows = dropped_blank_rows = output_rows = duplicates = 0
+                id_field = resolved_structured_schema.id_field_by_file_name.get(file_name)
+                claim_views: dict[str, Any] = {}
+                if file_name == resolved_structured_schema.claim_file_name:
+                    for view_kind, view_file in (
+                        ("entity_ids", resolved_structured_schema.entity_file_name),
+                        ("fact_ids", resolved_structured_schema.fact_file_name),
+                        ("relationship_ids", resolved_structured_schema.relationship_file_name),
+                    ):
+                        claim_views[view_kind] = (
+                            None if view_file in read_error_files else key_set.view(f"id:{view_file}")
+                        )
+                try:
+                    with (
+                        source_path.open("r", encoding="utf-8", newline="") as handle,
+                        output_path.open("w", encoding="utf-8", newline="") as output,
+                    ):
+                        writer = csv.DictWriter(output, fieldnames=expected_headers)
+                        writer.writeheader()
+                        reader = csv.DictReader(handle)
+                        actual_headers = reader.fieldnames or []
+                        if actual_headers != list(expected_headers):
+                            add_issue(
+                                file_name,
+                                1,
+                                "header",
+                                "HEADER_MISMATCH",
+                                f"Expected {expected_headers}, got {actual_headers}",
+                            )
+                        for row_number, raw_row in enumerate(reader, start=2):
+                            meter.advance(1)
+                            if is_blank_csv_row(raw_row):
+                                dropped_blank_rows += 1
+                                continue
+                            input_rows += 1
+                            extra_columns = raw_row.get(None)
+                            if extra_columns and any(str(item).strip() for item in extra_columns):
+                                add_issue(
+                                    file_name,
+                                    row_number,
+                                    "header",
+                                    "EXTRA_COLUMNS",
+                                    f"Unexpected extra columns detected: {extra_columns}",
+                                )
+                            row = {header: (raw_row.get(header) or "") for header in expected_headers}
+                            if kind in _DEDUPLICATED_FILE_KINDS:
+                                row_key = "\x1f".join(row[header].strip() for header in expected_headers)
+                                if not key_set.add(f"row:{file_name}", row_key):
+                                    duplicates += 1
+                                    continue
+                            lint_structured_row(
+                                file_name,
+                                row_number,
+                                row,
+                                structured_schema=resolved_structured_schema,
+                                add_issue=add_issue,
+                            )
+                            if claim_views:
+                                lint_claim_references(
+                                    row,
+                                    row_number,
+                                    structured_schema=resolved_structured_schema,
+                                    add_issue=add_issue,
+                                    **claim_views,
+                                )
+                            elif id_field is not None:
+                                id_value = row[id_field].strip()
+                                if id_value:
+                                    key_set.add(f"id:{file_name}", id_value)
+                            writer.writerow(row)
+                            output_rows += 1
+                except (OSError, csv.Error, UnicodeDecodeError) as exc:
+                    add_issue(
+                        file_name,
+                        1,
+                        "file",
+                        "READ_ERROR",
+                        f"Could not read structured CSV file '{file_name}': {exc}",
+                    )
+                    read_error_files.add(file_name)
+                    with output_path.open("w", encoding="utf-8", newline="") as output:
+                        csv.DictWriter(output, fieldnames=expected_headers).writeheader()
+                    input_rows = dropped_blank_rows = output_rows = duplicates = 0
+                file_summaries[file_name] = {
+                    "input_rows": input_rows,
+                    "dropped_blank_rows": dropped_blank_rows,
+                    "output_rows": output_rows,
+                    "deduplicated_rows": duplicates,
+                    "source_uri": str(source_path),
+                    "rows_per_second": round(meter.rows_per_second(), 1),
+                }
+        finally:
+            key_set.close()
+
+    lint_issues.sort(
+        key=lambda issue: (issue["file"], issue["row"], issue["field"], issue["code"], issue["message"])
+    )
+    lint_report = {
+        "run_id": run_id,
+        "dataset_id": effective_dataset_id,
+        "method": "structured_streaming_lint_and_dedup",
+        "source_uri": str(structured_dir),
+        "structured_clean_dir": str(clean_dir),
+        "files": file_summaries,
+        "issues": lint_issues,
+        "summary": {
+            "issue_count": issue_count,
+            "reported_issue_count": len(lint_issues),
+            "status": "failed" if issue_count else "ok",
+        },
+    }
+    lint_report_path = run_root / "lint_report.json"
+    lint_report_path.write_text(json.dumps(lint_report, indent=2, sort_keys=True), encoding="utf-8")
+    if issue_count:
+        raise ValueError(f"Structured CSV lint failed with {issue_count} issue(s): {lint_report_path}")
+    return {
+        "run_id": run_id,
+        "structured_clean_dir": str(clean_dir),
+        "lint_report_path": str(lint_report_path),
+        "lint_summary": lint_report["summary"],
+        "files": file_summaries,
+    }
+
+
+def iter_csv_batches(path: Path, batch_size: int) -> Iterator[list[dict[str, str]]]:
+    """Yield the rows of *path* in lists of at most *batch_size*."""
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        batch: list[dict[str, str]] = []
+        for row in csv.DictReader(handle):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def write_structured_csv_stream(
+    driver: Any,
+    *,
+    neo4j_database: str | None,
+    structured_clean_dir: Path,
+    run_id: str,
+    source_uri: str,
+    dataset_id: str,
+    ingested_at: str,
+    structured_schema: StructuredSchemaContract | None = None,
+    graph_shape: StructuredGraphShapeContract | None = None,
+    batch_size: int = DEFAULT_STRUCTURED_STREAM_BATCH_SIZE,
+    progress_interval_seconds: float = DEFAULT_STRUCTURED_STREAM_PROGRESS_SECONDS,
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[str, Any]:
+    """Write the cleaned CSVs to the graph in batches of *batch_size* rows.
+
+    Files are written entities, facts, relationships, then claims, so claim
+    batches can link to the facts and relationships that support them.
+    Each batch is one ``run_batched_write`` call, so transient failures are
+    retried by the driver like every other batched graph write.  Returns
+    per-file row, batch and rows/s counters.
+    """
+    resolved_structured_schema = (
+        get_default_structured_schema_contract() if structured_schema is None else structured_schema
+    )
+    with driver.session(database=neo4j_database) as session:
+        write_structured_dataset_source(
+            session,
+            run_id=run_id,
+            source_uri=source_uri,
+            dataset_id=dataset_id,
+            ingested_at=ingested_at,
+            graph_shape=graph_shape,
+        )
+
+    parameters = {
+        "run_id": run_id,
+        "source_uri": source_uri,
+        "dataset_id": dataset_id,
+        "ingested_at": ingested_at,
+    }
+    batch_policy = BatchWritePolicy(batch_size=batch_size, max_workers=1)
+
+    file_stats: dict[str, dict[str, Any]] = {}
+    for file_name, kind in _file_kinds(resolved_structured_schema).items():
+        meter = _ProgressMeter(
+            f"Structured ingest {kind}",
+            interval_seconds=progress_interval_seconds,
+            clock=clock,
+        )
+        query = structured_rows_query(kind, graph_shape)
+        batches = 0
+        for batch in iter_csv_batches(structured_clean_dir / file_name, batch_size):
+            run_batched_write(
+                driver,
+                query,
+                name=f"structured_{kind}",
+                rows=batch,
+                parameters=parameters,
+                neo4j_database=neo4j_database,
+                policy=batch_policy,
+            )
+            batches += 1
+            meter.advance(len(batch))
+        file_stats[kind] = {
+            "rows": meter.rows,
+            "batches": batches,
+            "elapsed_seconds": round(meter.elapsed_seconds(), 4),
+            "rows_per_second": round(meter.rows_per_second(), 1),
+        }
+        _logger.info(
+            "Structured ingest %s: wrote %d rows in %d batches (%.0f rows/s)",
+            kind,
+            meter.rows,
+            batches,
+            meter.rows_per_second(),
+        )
+    return {"batch_size": batch_size, "files": file_stats, "peak_rss_mib": peak_rss_mib()}
+
+
+__all__ = [
+    "DEFAULT_STRUCTURED_STREAM_BATCH_SIZE",
+    "DEFAULT_STRUCTURED_STREAM_INGEST_ENV_NAMES",
+    "DEFAULT_STRUCTURED_STREAM_MAX_REPORTED_ISSUES",
+    "DEFAULT_STRUCTURED_STREAM_THRESHOLD_BYTES",
+    "DiskKeySet",
+    "STRUCTURED_STREAMING_MODES",
+    "StructuredStreamIngestEnvNames",
+    "StructuredStreamIngestSettings",
+    "iter_csv_batches",
+    "peak_rss_mib",
+    "stream_lint_and_clean_structured_csvs",
+    "write_structured_csv_stream",
+]
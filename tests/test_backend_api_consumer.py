@@ -14,11 +14,23 @@ import pytest
 from power_atlas.api import BackendAppOptions, create_backend_app
 from power_atlas.contracts import resolve_dataset_root
 
-
-def test_public_api_facade_supports_consumer_app_smoke() -> None:
+_UNCONFIGURED_NEO4J_POOL_HEALTH = {
+    "status": "not_configured",
+    "max_connection_pool_size": 50,
+    "connection_acquisition_timeout": 30.0,
+    "liveness_check_timeout": 30.0,
+    "acquisitions_total": 0,
+    "failures_total": 0,
+    "in_use": 0,
+    "peak_in_use": 0,
+}
+
+
+def test_public_api_facade_supports_consumer_app_smoke(tmp_path: Path) -> None:
+    # GET /runs maintains a run catalog index under the output directory.
     consumer_app = create_backend_app(
         BackendAppOptions(version="2.0.0-test"),
-        environ={},
+        environ={"POWER_ATLAS_OUTPUT_DIR": str(tmp_path)},
     )
 
     async def _exercise_app() -> None:
@@ -40,6 +52,7 @@ def test_public_api_facade_supports_consumer_app_smoke() -> None:
             assert health_response.json() == {
                 "status": "ok",
                 "message": "Backend is healthy",
+                "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
             }
 
             datasets_response = await client.get("/datasets")
@@ -66,10 +79,10 @@ def test_public_api_facade_supports_consumer_app_smoke() -> None:
             runs_response = await client.get("/runs")
             assert runs_response.status_code == 200
             runs_payload = runs_response.json()
-            assert set(runs_payload) == {"output_dir", "runs_root", "runs", "detail"}
+            assert set(runs_payload) == {"output_dir", "runs_root", "runs", "detail", "next_cursor"}
             assert isinstance(runs_payload["runs"], list)
-            assert runs_payload["output_dir"] == str(Path("artifacts").resolve())
-            assert runs_payload["runs_root"] == str((Path("artifacts") / "runs").resolve())
+            assert runs_payload["output_dir"] == str(tmp_path.resolve())
+            assert runs_payload["runs_root"] == str((tmp_path / "runs").resolve())
 
             missing_run_response = await client.get("/runs/unstructured_ingest-test-run")
             assert missing_run_response.status_code == 404
@@ -988,6 +1001,7 @@ def test_backend_api_direct_hooks_example_script_runs() -> None:
         "backend_health": {
             "message": "Backend is healthy",
             "status": "ok",
+            "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
         },
         "backend_root": {
             "docs": "/docs",
@@ -1064,6 +1078,7 @@ def test_backend_api_composed_app_example_script_runs() -> None:
         "backend_health": {
             "message": "Backend is healthy",
             "status": "ok",
+            "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
         },
         "backend_root": {
             "docs": "/docs",
@@ -1104,6 +1119,7 @@ def test_backend_api_guarded_app_example_script_runs() -> None:
             "body": {
                 "message": "Backend is healthy",
                 "status": "ok",
+                "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
             },
             "status_code": 200,
         },
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from power_atlas.backend_app import build_backend_runtime, create_backend_app
+from power_atlas.backend_blocking_calls import BackendBlockingCalls
+from power_atlas.backend_graph_query_service import build_backend_graph_query_service
+from power_atlas.bootstrap import build_app_context
+from power_atlas.graph_status import GraphStatusResult
+
+
+def test_backend_blocking_calls_from_env_and_validation() -> None:
+    assert BackendBlockingCalls.from_env({"POWER_ATLAS_BACKEND_BLOCKING_WORKERS": "3"}).max_workers == 3
+    with pytest.raises(ValueError):
+        BackendBlockingCalls(0)
+
+
+def test_backend_blocking_calls_bounds_concurrent_workers() -> None:
+    blocking_calls = BackendBlockingCalls(max_workers=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def _blocking() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(timeout=5)
+        with lock:
+            active -= 1
+
+    async def _exercise() -> None:
+        tasks = [asyncio.create_task(blocking_calls.run(_blocking)) for _ in range(5)]
+        while blocking_calls.statistics().waiting < 3:
+            await asyncio.sleep(0.01)
+        assert blocking_calls.statistics().in_flight == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(_exercise())
+    assert peak == 2
+    # A fresh event loop gets a fresh limiter.
+    assert asyncio.run(blocking_calls.run(lambda value: value * 2, 21)) == 42
+
+
+def test_slow_graph_query_does_not_stall_other_routes() -> None:
+    app_context = build_app_context(environ={"NEO4J_PASSWORD": "secret"})
+    graph_started = threading.Event()
+    release_graph = threading.Event()
+
+    def _slow_graph_status(runtime_app_context):
+        graph_started.set()
+        release_graph.wait(timeout=5)
+        return GraphStatusResult(200, "available", "ok", "neo4j://localhost:7687", "neo4j")
+
+    runtime = build_backend_runtime(
+        app_context=app_context,
+        environ={},
+        graph_queries=build_backend_graph_query_service(
+            app_context,
+            graph_status_resolver=_slow_graph_status,
+        ),
+    )
+    app = create_backend_app(runtime=replace(runtime, blocking_calls=BackendBlockingCalls(max_workers=2)))
+
+    async def _exercise() -> tuple[int, int, bool]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            graph_request = asyncio.create_task(client.get("/graph/status"))
+            await asyncio.to_thread(graph_started.wait, 5)
+            health_response = await asyncio.wait_for(client.get("/health"), timeout=2)
+            graph_still_running = not graph_request.done()
+            release_graph.set()
+            graph_response = await graph_request
+        return health_response.status_code, graph_response.status_code, graph_still_running
+
+    assert asyncio.run(_exercise()) == (200, 200, True)
@@ -31,9 +31,11 @@ from power_atlas.run_scoped_graph_counts import (
 )
 
 
-def test_backend_root_health_and_graph_status_contract(monkeypatch) -> None:
+def test_backend_root_health_and_graph_status_contract(monkeypatch, tmp_path) -> None:
     for env_name in ("NEO4J_URI", "NEO4J_USERNAME", "NEO4J_PASSWORD", "NEO4J_DATABASE"):
         monkeypatch.delenv(env_name, raising=False)
+    # GET /runs maintains a run catalog index under the output directory.
+    monkeypatch.setenv("POWER_ATLAS_OUTPUT_DIR", str(tmp_path))
 
     backend_main = importlib.import_module("backend.main")
     backend_main = importlib.reload(backend_main)
@@ -58,6 +60,16 @@ def test_backend_root_health_and_graph_status_contract(monkeypatch) -> None:
             assert health_response.json() == {
                 "status": "ok",
                 "message": "Backend is healthy",
+                "neo4j_pool": {
+                    "status": "not_configured",
+                    "max_connection_pool_size": 50,
+                    "connection_acquisition_timeout": 30.0,
+                    "liveness_check_timeout": 30.0,
+                    "acquisitions_total": 0,
+                    "failures_total": 0,
+                    "in_use": 0,
+                    "peak_in_use": 0,
+                },
             }
 
             datasets_response = await client.get("/datasets")
@@ -86,6 +98,7 @@ def test_backend_root_health_and_graph_status_contract(monkeypatch) -> None:
                 "runs_root",
                 "runs",
                 "detail",
+                "next_cursor",
             }
             assert isinstance(runs_payload["runs"], list)
 
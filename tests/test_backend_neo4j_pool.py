@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from power_atlas.backend_app import BackendRuntime, create_backend_app
+from power_atlas.backend_graph_query_service import build_backend_graph_query_service
+from power_atlas.backend_neo4j_pool import BackendNeo4jPoolSettings, SharedNeo4jDriver
+from power_atlas.bootstrap import build_app_context
+from power_atlas.settings import Neo4jSettings
+
+
+class _FakePooledDriver:
+    def __init__(self):
+        self.queries: list[str] = []
+        self.closed = False
+
+    def execute_query(self, query, *, database_=None, **kwargs):
+        self.queries.append(query)
+        return [{"ok": 1}], None, None
+
+    def close(self):
+        self.closed = True
+
+
+class _DriverFactorySpy:
+    def __init__(self):
+        self.calls: list[tuple[Neo4jSettings, dict]] = []
+        self.drivers: list[_FakePooledDriver] = []
+
+    def __call__(self, settings, **driver_config):
+        self.calls.append((settings, driver_config))
+        driver = _FakePooledDriver()
+        self.drivers.append(driver)
+        return driver
+
+
+def test_backend_neo4j_pool_settings_from_env() -> None:
+    assert BackendNeo4jPoolSettings.from_env({}) == BackendNeo4jPoolSettings()
+    settings = BackendNeo4jPoolSettings.from_env(
+        {
+            "POWER_ATLAS_NEO4J_MAX_POOL_SIZE": "8",
+            "POWER_ATLAS_NEO4J_ACQUISITION_TIMEOUT": "2.5",
+            "POWER_ATLAS_NEO4J_LIVENESS_CHECK_TIMEOUT": "off",
+        }
+    )
+    assert settings.driver_config() == {
+        "max_connection_pool_size": 8,
+        "connection_acquisition_timeout": 2.5,
+        "liveness_check_timeout": None,
+    }
+
+
+def test_shared_neo4j_driver_reuses_one_driver_and_tracks_metrics() -> None:
+    spy = _DriverFactorySpy()
+    pool = SharedNeo4jDriver(
+        Neo4jSettings(password="secret"),
+        BackendNeo4jPoolSettings(max_connection_pool_size=4),
+        create_driver=spy,
+    )
+    assert pool.metrics().status == "closed"
+
+    with pool.driver_factory(None) as first:
+        with pool.driver_factory(None) as second:
+            assert first is second
+            assert pool.metrics().in_use == 2
+    with pytest.raises(RuntimeError):
+        with pool.driver_factory(None):
+            raise RuntimeError("query failed")
+
+    assert len(spy.calls) == 1
+    assert spy.calls[0][1]["max_connection_pool_size"] == 4
+    metrics = pool.metrics()
+    assert metrics.status == "open"
+    assert (metrics.acquisitions_total, metrics.failures_total, metrics.in_use, metrics.peak_in_use) == (3, 1, 0, 2)
+
+    pool.close()
+    assert spy.drivers[0].closed is True
+    assert pool.metrics().status == "closed"
+
+
+def test_backend_lifespan_opens_shared_pool_and_closes_on_shutdown() -> None:
+    app_context = build_app_context(environ={"NEO4J_PASSWORD": "secret"})
+    spy = _DriverFactorySpy()
+    pool = SharedNeo4jDriver(app_context.settings.neo4j, create_driver=spy)
+    app = create_backend_app(
+        runtime=BackendRuntime(
+            app_context=app_context,
+            graph_queries=build_backend_graph_query_service(
+                app_context,
+                driver_factory=pool.driver_factory,
+            ),
+            neo4j_pool=pool,
+        )
+    )
+
+    async def _exercise_app() -> dict:
+        async with app.router.lifespan_context(app):
+            assert pool.is_open
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                for _ in range(3):
+                    response = await client.get("/graph/status")
+                    assert response.status_code == 200
+                health_response = await client.get("/health")
+                assert health_response.status_code == 200
+                return health_response.json()
+
+    health_payload = asyncio.run(_exercise_app())
+
+    assert len(spy.drivers) == 1
+    assert len(spy.drivers[0].queries) == 3
+    assert spy.drivers[0].closed is True
+    assert health_payload["neo4j_pool"]["status"] == "open"
+    assert health_payload["neo4j_pool"]["acquisitions_total"] == 3
+    assert pool.metrics().status == "closed"
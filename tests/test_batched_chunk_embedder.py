@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import types
+from pathlib import Path
+
+from power_atlas.adapters.graphrag_components import TextChunkEmbedder
+from power_atlas.adapters.graphrag_types import TextChunk, TextChunks
+from power_atlas.batched_chunk_embedder import (
+    BatchedTextChunkEmbedder,
+    ChunkEmbeddingSettings,
+    install_batched_chunk_embedder,
+)
+from power_atlas.embedding_cache import EmbeddingCache
+
+
+class _FakeOpenAIEmbeddings:
+    def __init__(self) -> None:
+        self.model = "text-embedding-test"
+        self.requests: list[list[str]] = []
+        self.client = types.SimpleNamespace(embeddings=types.SimpleNamespace(create=self._create))
+
+    def _create(self, *, input: list[str], model: str):
+        self.requests.append(list(input))
+        data = [
+            types.SimpleNamespace(index=index, embedding=[float(len(text)), float(index), 0.5])
+            for index, text in enumerate(input)
+        ]
+        return types.SimpleNamespace(data=list(reversed(data)))
+
+    def embed_query(self, text: str) -> list[float]:
+        raise AssertionError("batched embedding should not fall back to embed_query")
+
+
+def _text_chunks(texts: list[str]) -> TextChunks:
+    return TextChunks(chunks=[TextChunk(text=text, index=index) for index, text in enumerate(texts)])
+
+
+def test_embedding_cache_round_trips_and_truncates_orphaned_rows(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path, model="text-embedding-test")
+    assert cache.put_many(["a", "b", "a"], [[1.0, 2.0], [3.0, 4.0], [9.0, 9.0]]) == 2
+    assert cache.put_many(["b"], [[0.0, 0.0]]) == 0
+    with (cache.directory / "vectors.f32").open("ab") as handle:
+        handle.write(b"\0" * 8)
+
+    reopened = EmbeddingCache(tmp_path, model="text-embedding-test")
+    assert len(reopened) == 2
+    assert reopened.get_many(["b", "missing", "a"]) == {0: [3.0, 4.0], 2: [1.0, 2.0]}
+    reopened.put_many(["c"], [[5.0, 6.0]])
+    assert EmbeddingCache(tmp_path, model="text-embedding-test").get_many(["c"]) == {0: [5.0, 6.0]}
+    assert EmbeddingCache(tmp_path, model="other-model").get_many(["a"]) == {}
+
+
+def test_embedding_cache_instances_sharing_a_directory_keep_keys_on_their_rows(tmp_path: Path) -> None:
+    first = EmbeddingCache(tmp_path, model="text-embedding-test")
+    second = EmbeddingCache(tmp_path, model="text-embedding-test")
+    assert first.put_many(["a"], [[1.0, 1.0]]) == 1
+    # The second instance opened before "a" was written, so its snapshot is stale.
+    assert second.put_many(["b", "a"], [[2.0, 2.0], [9.0, 9.0]]) == 1
+    assert first.put_many(["c"], [[3.0, 3.0]]) == 1
+
+    expected = {0: [1.0, 1.0], 1: [2.0, 2.0], 2: [3.0, 3.0]}
+    assert first.get_many(["a", "b", "c"]) == expected
+    assert second.get_many(["a", "b", "c"]) == expected
+    assert EmbeddingCache(tmp_path, model="text-embedding-test").get_many(["a", "b", "c"]) == expected
+
+
+def test_batched_chunk_embedder_batches_requests_and_skips_cached_chunks(tmp_path: Path) -> None:
+    embedder = _FakeOpenAIEmbeddings()
+    texts = [f"chunk text {index}" for index in range(5)]
+
+    def _run() -> tuple[TextChunks, BatchedTextChunkEmbedder]:
+        component = BatchedTextChunkEmbedder(
+            embedder,
+            batch_size=2,
+            max_concurrency=2,
+            cache=EmbeddingCache(tmp_path, model=embedder.model),
+        )
+        return asyncio.run(component.run(_text_chunks(texts))), component
+
+    first, first_component = _run()
+    second, second_component = _run()
+
+    assert sorted(len(batch) for batch in embedder.requests) == [1, 2, 2]
+    assert [chunk.metadata["embedding"] for chunk in second.chunks] == [
+        chunk.metadata["embedding"] for chunk in first.chunks
+    ]
+    assert first.chunks[3].metadata["embedding"] == [float(len(texts[3])), 1.0, 0.5]
+    assert (first_component.last_stats.embedded, first_component.last_stats.requests) == (5, 3)
+    assert (second_component.last_stats.cached, second_component.last_stats.requests) == (5, 0)
+
+
+def test_install_batched_chunk_embedder_replaces_pipeline_component(tmp_path: Path) -> None:
+    from neo4j_graphrag.experimental.pipeline import Pipeline
+
+    embedder = _FakeOpenAIEmbeddings()
+    pipeline = Pipeline()
+    pipeline.add_component(TextChunkEmbedder(embedder=embedder), "chunk_embedder")
+    pipeline_runner = types.SimpleNamespace(pipeline=pipeline)
+
+    installed = install_batched_chunk_embedder(
+        pipeline_runner,
+        output_dir=tmp_path,
+        settings=ChunkEmbeddingSettings(batch_size=8),
+    )
+    result = asyncio.run(
+        pipeline.run({"chunk_embedder": {"text_chunks": _text_chunks(["alpha", "beta"]).model_dump()}})
+    )
+
+    assert isinstance(installed, BatchedTextChunkEmbedder)
+    assert pipeline.get_node_by_name("chunk_embedder").component is installed
+    assert [len(chunk["metadata"]["embedding"]) for chunk in result.result["chunk_embedder"]["chunks"]] == [3, 3]
+    assert embedder.requests == [["alpha", "beta"]]
+    assert installed.cache is not None and installed.cache.directory.parent == tmp_path / "cache" / "embeddings"
+    assert install_batched_chunk_embedder(types.SimpleNamespace(), output_dir=tmp_path) is None
+    assert ChunkEmbeddingSettings.from_env({"POWER_ATLAS_EMBEDDING_CACHE": "off"}).cache_enabled is False
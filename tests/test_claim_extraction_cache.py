@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph, TextChunk
+from power_atlas.claim_extraction_cache import (
+    BoundClaimExtractionCache,
+    ClaimExtractionCache,
+    extraction_schema_fingerprint,
+)
+from power_atlas.claim_extraction_scheduler import extract_chunks_scheduled
+
+
+def _chunk_graph(chunk: TextChunk) -> Neo4jGraph:
+    return Neo4jGraph(
+        nodes=[{"id": f"{chunk.uid}:0", "label": "ExtractedClaim", "properties": {"claim_text": chunk.text}}],
+        relationships=[{"start_node_id": f"{chunk.uid}:0", "end_node_id": chunk.uid, "type": "MENTIONED_IN"}],
+    )
+
+
+def test_extraction_cache_serves_repeat_chunks_across_runs(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    class _Extractor:
+        async def run(self, *, chunks, schema, lexical_graph_config):
+            (chunk,) = chunks.chunks
+            calls.append(chunk.text)
+            return _chunk_graph(chunk)
+
+    cache = ClaimExtractionCache(tmp_path / "claim_extraction.sqlite")
+
+    def _extract(run_id: str, texts: list[str], *, prompt_id: str = "claims_v1"):
+        bound = BoundClaimExtractionCache(
+            cache, model_name="gpt-test", prompt_id=prompt_id, schema=None, lexical_graph_config=None
+        )
+        chunks = [TextChunk(uid=f"{run_id}-{index}", text=text, index=index) for index, text in enumerate(texts)]
+        return asyncio.run(
+            extract_chunks_scheduled(_Extractor(), chunks, schema=None, lexical_graph_config=None, cache=bound)
+        )
+
+    _extract("run-a", ["alpha", "beta"])
+    graph, stats = _extract("run-b", ["alpha", "beta", "gamma"])
+    _extract("run-c", ["alpha"], prompt_id="claims_v2")
+    cache.close()
+
+    assert calls == ["alpha", "beta", "gamma", "alpha"]
+    assert [node.id for node in graph.nodes] == ["run-b-0:0", "run-b-1:0", "run-b-2:0"]
+    assert [relationship.end_node_id for relationship in graph.relationships] == ["run-b-0", "run-b-1", "run-b-2"]
+    assert stats.cache is not None
+    assert stats.cache.to_summary() == {
+        "hits": 2,
+        "misses": 3,
+        "hit_rate": 0.4,
+        "writes": 3,
+        "evictions": 0,
+        "errors": 0,
+    }
+    assert extraction_schema_fingerprint({"a": 1}, None) != extraction_schema_fingerprint({"a": 2}, None)
+
+
+def test_extraction_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    chunks = {text: TextChunk(uid=f"uid-{text}", text=text, index=0) for text in ("k1", "k2", "k3")}
+    probe = ClaimExtractionCache(tmp_path / "probe.sqlite")
+    probe.put("k1", _chunk_graph(chunks["k1"]), chunk_uid="uid-k1")
+    probe.close()
+    with sqlite3.connect(tmp_path / "probe.sqlite") as connection:
+        (entry_size,) = connection.execute("SELECT size FROM entries").fetchone()
+
+    cache = ClaimExtractionCache(tmp_path / "claim_extraction.sqlite", max_bytes=entry_size * 2)
+    cache.put("k1", _chunk_graph(chunks["k1"]), chunk_uid="uid-k1")
+    cache.put("k2", _chunk_graph(chunks["k2"]), chunk_uid="uid-k2")
+    assert cache.get("k1", chunk_uid="uid-k1") is not None
+    cache.put("k3", _chunk_graph(chunks["k3"]), chunk_uid="uid-k3")
+
+    assert cache.get("k2", chunk_uid="uid-k2") is None
+    assert cache.get("k1", chunk_uid="uid-k1") is not None
+    assert cache.get("k3", chunk_uid="uid-k3") is not None
+    assert cache.stats().evictions == 1
+    cache.close()
+
+
+def test_extraction_cache_from_env_and_unusable_database(tmp_path: Path) -> None:
+    assert ClaimExtractionCache.from_env(tmp_path, {"POWER_ATLAS_EXTRACTION_CACHE_MAX_BYTES": "off"}) is None
+    cache = ClaimExtractionCache.from_env(tmp_path, {})
+    assert cache is not None
+    assert cache.path == tmp_path / "cache" / "claim_extraction.sqlite"
+
+    corrupt_path = tmp_path / "corrupt.sqlite"
+    corrupt_path.write_bytes(b"not a sqlite database" * 100)
+    corrupt = ClaimExtractionCache(corrupt_path)
+    chunk = TextChunk(uid="uid", text="alpha", index=0)
+    assert corrupt.get("key", chunk_uid="uid") is None
+    corrupt.put("key", _chunk_graph(chunk), chunk_uid="uid")
+    assert (corrupt.stats().misses, corrupt.stats().writes, corrupt.stats().errors) == (1, 0, 2)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph, Neo4jNode, TextChunk
+from power_atlas.claim_extraction_journal import ClaimExtractionJournal
+from power_atlas.claim_extraction_scheduler import extract_chunks_scheduled
+from power_atlas.extraction_writes import write_all_extraction_data_in_batches
+from power_atlas.interfaces.cli.run_demo_support import parse_args
+
+
+def _bind(journal: ClaimExtractionJournal, *, model_name: str = "gpt-test") -> ClaimExtractionJournal:
+    journal.bind(run_id="run-1", model_name=model_name, prompt_id="claims_v1", schema=None, lexical_graph_config=None)
+    return journal
+
+
+def _graph(chunk_uid: str) -> Neo4jGraph:
+    return Neo4jGraph(nodes=[Neo4jNode(id=f"{chunk_uid}:claim", label="ExtractedClaim")])
+
+
+def test_journal_replays_matching_runs_and_drops_torn_lines(tmp_path: Path) -> None:
+    chunks = [TextChunk(uid=f"c{index}", text=f"text {index}", index=index) for index in range(3)]
+    journal = _bind(ClaimExtractionJournal.for_run(tmp_path))
+    for chunk in chunks[:2]:
+        journal.record(chunk, _graph(chunk.uid))
+    journal.mark_written(["c0"])
+    journal.close()
+    with journal.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"type":"extracted","chunk_uid":"c2"')
+
+    resumed = _bind(ClaimExtractionJournal.for_run(tmp_path, resume=True))
+    assert resumed.get(chunks[0]) == _graph("c0")
+    assert resumed.get(chunks[2]) is None
+    assert resumed.get(TextChunk(uid="c1", text="edited text", index=1)) is None
+    assert resumed.batch_already_written(["c0"]) and not resumed.batch_already_written(["c0", "c1"])
+    resumed.record(chunks[2], _graph("c2"))
+    resumed.close()
+    # The torn line was truncated away before the new entry was appended.
+    assert all(line.endswith("}") for line in journal.path.read_text(encoding="utf-8").splitlines())
+    assert resumed.to_summary()["resumed_chunks"] == 1
+
+    other_model = _bind(ClaimExtractionJournal.for_run(tmp_path, resume=True), model_name="gpt-other")
+    assert other_model.get(chunks[0]) is None
+    other_model.close()
+
+
+def test_batched_writes_group_rows_by_chunk_and_skip_written_batches() -> None:
+    claim_rows = [{"claim_id": f"claim-{chunk}", "chunk_ids": [chunk], "run_id": "run-1"} for chunk in ("c0", "c1", "c2")]
+    mention_rows = [{"mention_id": f"mention-{chunk}", "chunk_ids": [chunk], "run_id": "run-1"} for chunk in ("c0", "c1", "c2")]
+    edge_rows = [{"claim_id": "claim-c0", "mention_id": "mention-c2", "role": "subject", "run_id": "run-1"}]
+    writes: list[dict] = []
+    marked: list[list[str]] = []
+    refreshed: list[list[str]] = []
+
+    def _write(driver, *, neo4j_database, lexical_graph_config, claim_rows, mention_rows, edge_rows):
+        writes.append({"claims": [row["claim_id"] for row in claim_rows], "edges": len(edge_rows)})
+
+    def _refresh(driver, *, run_ids, neo4j_database):
+        refreshed.append(list(run_ids))
+
+    report = write_all_extraction_data_in_batches(
+        None,
+        neo4j_database="neo4j",
+        lexical_graph_config=None,
+        claim_rows=claim_rows,
+        mention_rows=mention_rows,
+        edge_rows=edge_rows,
+        batch_chunks=2,
+        skip_batch=lambda chunk_ids: chunk_ids == ["c0", "c1"],
+        on_batch_written=marked.append,
+        write_batch=_write,
+        refresh_run_state=_refresh,
+    )
+
+    assert report == {"batches": 2, "written_batches": 1, "skipped_batches": 1}
+    # The edge waits for the batch holding its later endpoint.
+    assert writes == [{"claims": ["claim-c2"], "edges": 1}]
+    assert marked == [["c2"]]
+    # Run state is refreshed once, after the last batch, including for the skipped batch's run.
+    assert refreshed == [["run-1"]]
+
+    writes.clear()
+    with pytest.raises(ValueError, match=r"not among.*row indices: \[0\]"):
+        write_all_extraction_data_in_batches(
+            None, neo4j_database="neo4j", lexical_graph_config=None,
+            claim_rows=claim_rows, mention_rows=mention_rows[:2], edge_rows=edge_rows,
+            write_batch=_write, refresh_run_state=_refresh,
+        )
+    assert writes == [] and refreshed == [["run-1"]]
+    with pytest.raises(ValueError, match="batch_chunks"):
+        write_all_extraction_data_in_batches(
+            None, neo4j_database="neo4j", lexical_graph_config=None,
+            claim_rows=[], mention_rows=[], edge_rows=[], batch_chunks=0,
+        )
+
+
+def test_resumed_extraction_only_sends_chunks_missing_from_the_journal(tmp_path: Path) -> None:
+    chunks = [TextChunk(uid=f"c{index}", text=f"text {index}", index=index) for index in range(3)]
+
+    class _Extractor:
+        def __init__(self, failing_uid: str | None = None) -> None:
+            self.failing_uid = failing_uid
+            self.calls: list[str] = []
+
+        async def run(self, chunks, schema, lexical_graph_config):
+            (chunk,) = chunks.chunks
+            self.calls.append(chunk.uid)
+            if chunk.uid == self.failing_uid:
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                raise ValueError("schema validation failed")
+            return _graph(chunk.uid)
+
+    first = _Extractor(failing_uid="c2")
+    journal = _bind(ClaimExtractionJournal.for_run(tmp_path))
+    with pytest.raises(ValueError, match="schema validation"):
+        asyncio.run(extract_chunks_scheduled(first, chunks, schema=None, lexical_graph_config=None, journal=journal))
+    journal.close()
+
+    second = _Extractor()
+    resumed = _bind(ClaimExtractionJournal.for_run(tmp_path, resume=True))
+    graph, stats = asyncio.run(
+        extract_chunks_scheduled(second, chunks, schema=None, lexical_graph_config=None, journal=resumed)
+    )
+    resumed.close()
+
+    assert second.calls == ["c2"]
+    assert [node.id for node in graph.nodes] == ["c0:claim", "c1:claim", "c2:claim"]
+    assert stats.chunks == 3
+    assert parse_args(["extract-claims", "--resume"]).resume is True
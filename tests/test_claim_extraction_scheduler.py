@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph, TextChunk, TextChunks
+from power_atlas.claim_extraction_scheduler import (
+    ERROR_FATAL,
+    ERROR_RATE_LIMITED,
+    ERROR_TRANSIENT,
+    AdaptiveConcurrencyLimiter,
+    ExtractionSchedulerPolicy,
+    UsageRecordingLLM,
+    classify_extraction_error,
+    disable_client_retries,
+    extract_chunks_scheduled,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("_Response", (), {"headers": headers or {}})()
+
+
+class _WrappedGenerationError(Exception):
+    pass
+
+
+def _chunks(count: int) -> list[TextChunk]:
+    return [TextChunk(uid=f"chunk-{index}", text=f"text {index}", index=index) for index in range(count)]
+
+
+def test_classify_extraction_error_walks_wrapped_errors() -> None:
+    assert classify_extraction_error(_WrappedGenerationError(_StatusError(429))) == ERROR_RATE_LIMITED
+    assert classify_extraction_error(_StatusError(503)) == ERROR_TRANSIENT
+    assert classify_extraction_error(TimeoutError()) == ERROR_TRANSIENT
+    assert classify_extraction_error(_StatusError(400)) == ERROR_FATAL
+    with pytest.raises(ValueError):
+        ExtractionSchedulerPolicy(initial_concurrency=8, max_concurrency=4)
+    assert ExtractionSchedulerPolicy.from_env(
+        {"POWER_ATLAS_EXTRACTION_MAX_CONCURRENCY": "2", "POWER_ATLAS_EXTRACTION_TOKENS_PER_MINUTE": "9000"}
+    ) == ExtractionSchedulerPolicy(initial_concurrency=2, max_concurrency=2, tokens_per_minute=9000)
+
+
+def test_adaptive_concurrency_limiter_increases_additively_and_halves_on_rate_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(4, minimum=1, maximum=6)
+    for _ in range(4):
+        limiter.on_success(0.1, latency_target_seconds=1.0)
+    assert limiter.limit == 5
+    limiter.on_rate_limited()
+    assert limiter.limit == 2
+    limiter.on_success(5.0, latency_target_seconds=1.0)
+    assert limiter.limit == 1
+    limiter.on_rate_limited()
+    assert (limiter.limit, limiter.peak_limit) == (1, 5)
+
+
+def test_extract_chunks_scheduled_retries_rate_limits_and_bounds_concurrency() -> None:
+    in_flight = 0
+    peak_in_flight = 0
+    attempts: dict[str, int] = {}
+    sleeps: list[float] = []
+
+    class _Extractor:
+        async def run(self, *, chunks, schema, lexical_graph_config):
+            nonlocal in_flight, peak_in_flight
+            (chunk,) = chunks.chunks
+            attempts[chunk.uid] = attempts.get(chunk.uid, 0) + 1
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            try:
+                await asyncio.sleep(0)
+                if chunk.index % 3 == 0 and attempts[chunk.uid] == 1:
+                    raise _WrappedGenerationError(_StatusError(429, {"retry-after": "0.5"}))
+                return Neo4jGraph(nodes=[{"id": f"claim-{chunk.index}", "label": "ExtractedClaim"}])
+            finally:
+                in_flight -= 1
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    graph, stats = asyncio.run(
+        extract_chunks_scheduled(
+            _Extractor(),
+            _chunks(9),
+            schema=None,
+            lexical_graph_config=None,
+            policy=ExtractionSchedulerPolicy(initial_concurrency=4, max_concurrency=4),
+            sleep=_sleep,
+        )
+    )
+
+    assert [node.id for node in graph.nodes] == [f"claim-{index}" for index in range(9)]
+    assert peak_in_flight <= 4
+    assert sleeps == [0.5, 0.5, 0.5]
+    assert (stats.chunks, stats.retries, stats.rate_limited) == (9, 3, 3)
+    assert stats.final_concurrency < 4
+    assert stats.tokens_estimated is True
+
+
+def test_extract_chunks_scheduled_raises_fatal_errors_and_exhausted_retries() -> None:
+    class _Extractor:
+        def __init__(self, error: Exception) -> None:
+            self.error = error
+            self.calls = 0
+
+        async def run(self, **kwargs):
+            self.calls += 1
+            raise self.error
+
+    async def _sleep(seconds: float) -> None:
+        return None
+
+    fatal = _Extractor(_StatusError(400))
+    with pytest.raises(_StatusError):
+        asyncio.run(extract_chunks_scheduled(fatal, _chunks(1), schema=None, lexical_graph_config=None, sleep=_sleep))
+    assert fatal.calls == 1
+
+    throttled = _Extractor(_StatusError(429))
+    with pytest.raises(_StatusError):
+        asyncio.run(
+            extract_chunks_scheduled(
+                throttled,
+                _chunks(1),
+                schema=None,
+                lexical_graph_config=None,
+                policy=ExtractionSchedulerPolicy(max_retries=2),
+                sleep=_sleep,
+            )
+        )
+    assert throttled.calls == 3
+
+
+def test_a_fatal_chunk_error_stops_further_extraction_and_stream_reads() -> None:
+    class _Extractor:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        async def run(self, chunks, schema, lexical_graph_config):
+            (chunk,) = chunks.chunks
+            self.calls.append(chunk.uid)
+            if chunk.uid == "chunk-0":
+                raise _StatusError(400)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            return Neo4jGraph()
+
+    pulled: list[int] = []
+
+    async def _stream():
+        for index in range(20):
+            pulled.append(index)
+            yield TextChunk(uid=f"chunk-{index}", text=f"text {index}", index=index)
+
+    async def _run(chunks, max_concurrency: int) -> _Extractor:
+        extractor = _Extractor()
+        with pytest.raises(_StatusError):
+            await extract_chunks_scheduled(
+                extractor,
+                chunks,
+                schema=None,
+                lexical_graph_config=None,
+                policy=ExtractionSchedulerPolicy(
+                    initial_concurrency=max_concurrency,
+                    min_concurrency=1,
+                    max_concurrency=max_concurrency,
+                    progress_interval_seconds=0.0,
+                ),
+            )
+        # Nothing scheduled before the failure may keep calling the LLM afterwards.
+        for _ in range(20):
+            await asyncio.sleep(0)
+        return extractor
+
+    listed = asyncio.run(_run(_chunks(10), max_concurrency=2))
+    assert listed.calls[0] == "chunk-0" and len(listed.calls) <= 3
+
+    streamed = asyncio.run(_run(_stream(), max_concurrency=1))
+    assert streamed.calls[0] == "chunk-0" and len(streamed.calls) <= 2
+    assert len(pulled) <= 3
+
+
+class _StubChatCompletionsHandler(BaseHTTPRequestHandler):
+    rate_limited_requests = 2
+    requests_seen = 0
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        prompt = json.dumps(json.loads(body)["messages"])
+        with self.lock:
+            type(self).requests_seen += 1
+            throttle = type(self).requests_seen <= self.rate_limited_requests
+        if throttle:
+            self._send(429, {"error": {"message": "slow down", "type": "rate_limit"}}, {"retry-after": "0"})
+            return
+        chunk_marker = "alpha" if "alpha" in prompt else "beta"
+        content = json.dumps(
+            {
+                "nodes": [{"id": f"claim-{chunk_marker}", "label": "ExtractedClaim", "properties": {}}],
+                "relationships": [],
+            }
+        )
+        self._send(
+            200,
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "stub-model",
+                "choices": [
+                    {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}
+                ],
+                "usage": {"prompt_tokens": 90, "completion_tokens": 10, "total_tokens": 100},
+            },
+        )
+
+    def _send(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+        encoded = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return None
+
+
+def test_extract_chunks_scheduled_against_local_stub_llm_server() -> None:
+    from neo4j_graphrag.experimental.components.entity_relation_extractor import LLMEntityRelationExtractor
+    from neo4j_graphrag.llm import OpenAILLM
+
+    _StubChatCompletionsHandler.requests_seen = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubChatCompletionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        llm = OpenAILLM(
+            model_name="stub-model",
+            base_url=f"http://127.0.0.1:{server.server_port}/v1",
+            api_key="test-key",
+        )
+        async_client = llm.async_client
+        disable_client_retries(llm)
+        extractor = LLMEntityRelationExtractor(
+            llm=UsageRecordingLLM(llm),
+            create_lexical_graph=False,
+            use_structured_output=True,
+        )
+        chunks = TextChunks(
+            chunks=[
+                TextChunk(uid="chunk-a", text="alpha", index=0),
+                TextChunk(uid="chunk-b", text="beta", index=1),
+            ]
+        )
+
+        async def _extract():
+            try:
+                return await extract_chunks_scheduled(
+                    extractor,
+                    chunks.chunks,
+                    schema=None,
+                    lexical_graph_config=None,
+                    policy=ExtractionSchedulerPolicy(initial_concurrency=2, base_backoff_seconds=0.01),
+                )
+            finally:
+                await async_client.close()
+
+        graph, stats = asyncio.run(_extract())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert sorted(node.id.split(":")[-1] for node in graph.nodes) == ["claim-alpha", "claim-beta"]
+    assert _StubChatCompletionsHandler.requests_seen == 4
+    assert (stats.rate_limited, stats.retries) == (2, 2)
+    assert (stats.tokens, stats.tokens_estimated) == (200, False)
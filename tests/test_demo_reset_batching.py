@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import types
+from pathlib import Path
+
+import pytest
+
+from power_atlas.contracts.pipeline import PipelineContractSnapshot
+from power_atlas.orchestration.cli_dispatch import reset_scope_kwargs
+from power_atlas.reset_demo_runtime import DEMO_NODE_LABELS, RUN_METADATA_NODE_LABELS, DemoResetSettings, run_reset
+
+_CONTRACT = PipelineContractSnapshot(
+    chunk_embedding_index_name="demo_chunk_embedding_index",
+    chunk_embedding_label="Chunk",
+    chunk_embedding_property="embedding",
+    chunk_embedding_dimensions=1536,
+    embedder_model_name="text-embedding-3-small",
+    chunk_fallback_stride=1000,
+)
+
+
+class _FakeDriver:
+    """Records queries; delete queries return the next count from *deleted* (then 0)."""
+
+    def __init__(self, deleted: list[int], *, fail_after: int | None = None, run_ids: list[str] | None = None):
+        self.deleted = list(deleted)
+        self.fail_after = fail_after
+        self.run_ids = run_ids or []
+        self.queries: list[tuple[str, dict]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def session(self, database):
+        return self
+
+    def run(self, query: str, **params):
+        self.queries.append((query, params))
+        if "RETURN DISTINCT n.run_id" in query:
+            return [{"run_id": run_id} for run_id in self.run_ids]
+        nodes = 0
+        if "DETACH DELETE" in query:
+            if self.fail_after is not None and len(self.queries) > self.fail_after:
+                raise RuntimeError("heap exhausted")
+            nodes = self.deleted.pop(0) if self.deleted else 0
+        counters = types.SimpleNamespace(nodes_deleted=nodes, relationships_deleted=2 * nodes)
+        return types.SimpleNamespace(consume=lambda: types.SimpleNamespace(counters=counters))
+
+    def execute_query(self, query, parameters_=None, database_=None):
+        self.queries.append((query, parameters_ or {}))
+        return [{"cnt": 1}], None, None
+
+
+def test_full_wipe_deletes_in_batches_and_reports_throughput(tmp_path: Path) -> None:
+    driver = _FakeDriver([4, 4, 3])
+    report = run_reset(
+        driver=driver,
+        database="neo4j",
+        output_dir=tmp_path,
+        pipeline_contract=_CONTRACT,
+        settings=DemoResetSettings(batch_size=4),
+    )
+
+    deletes = [(query, params) for query, params in driver.queries if "DETACH DELETE" in query]
+    assert len(deletes) == 3
+    assert all("LIMIT $batch_size" in query and params["batch_size"] == 4 for query, params in deletes)
+    assert (report["deleted_nodes"], report["deleted_relationships"], report["batches"]) == (11, 22, 3)
+    assert report["reset_mode"] == "demo_full_graph_wipe" and report["completed"] is True
+    assert report["indexes_dropped"] == ["demo_chunk_embedding_index"]
+    assert report["nodes_per_second"] is None or report["nodes_per_second"] > 0
+    saved = json.loads(Path(report["report_path"]).read_text(encoding="utf-8"))
+    assert saved["batch_size"] == 4 and "elapsed_seconds" in saved
+
+
+def test_run_scope_deletes_label_by_label_and_keeps_indexes() -> None:
+    driver = _FakeDriver([2, 1])
+    kwargs = reset_scope_kwargs(
+        types.SimpleNamespace(reset_run_id="run-1", reset_dataset_id=None, reset_batch_size=2)
+    )
+    report = run_reset(driver=driver, database="neo4j", pipeline_contract=_CONTRACT, **kwargs)
+
+    deletes = [(query, params) for query, params in driver.queries if "DETACH DELETE" in query]
+    assert len(deletes) == len(DEMO_NODE_LABELS) + len(RUN_METADATA_NODE_LABELS) + 1
+    assert all("n.run_id = $run_id" in query and params["run_id"] == "run-1" for query, params in deletes)
+    assert f"n:{DEMO_NODE_LABELS[0]})" in deletes[0][0] and f"n:{DEMO_NODE_LABELS[1]})" in deletes[2][0]
+    # The run's RunStats and Run nodes go last, once its data is gone.
+    assert "n:RunStats)" in deletes[-2][0] and "n:Run)" in deletes[-1][0]
+    assert not any("DROP INDEX" in query or "HAS_SUBJECT" in query for query, _ in driver.queries)
+    assert report["reset_mode"] == "demo_run_scoped_delete"
+    assert report["deleted_nodes"] == 3 and report["indexes_dropped"] == []
+    with pytest.raises(ValueError, match="not both"):
+        run_reset(driver=driver, database="neo4j", pipeline_contract=_CONTRACT, run_id="a", dataset_id="b")
+
+
+def test_dataset_scope_deletes_run_nodes_first_and_records_interrupted_reset(tmp_path: Path) -> None:
+    driver = _FakeDriver([1] * 30, fail_after=len(DEMO_NODE_LABELS) + 3, run_ids=["run-a", "run-b"])
+    with pytest.raises(RuntimeError, match="heap exhausted"):
+        run_reset(
+            driver=driver,
+            database="neo4j",
+            output_dir=tmp_path,
+            pipeline_contract=_CONTRACT,
+            dataset_id="demo_dataset_v1",
+            settings=DemoResetSettings(batch_size=5),
+        )
+
+    deletes = [(query, params) for query, params in driver.queries if "DETACH DELETE" in query]
+    run_phase = deletes[: len(DEMO_NODE_LABELS)]
+    assert all(params["run_ids"] == ["run-a", "run-b"] and "n.dataset_id IS NULL" in query for query, params in run_phase)
+    assert deletes[len(DEMO_NODE_LABELS)][1]["dataset_id"] == "demo_dataset_v1"
+
+    (report_path,) = tmp_path.glob("reset_report_*.json")
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["completed"] is False and "heap exhausted" in report["error"]
+    assert report["scope"]["run_ids"] == ["run-a", "run-b"]
+    assert report["deleted_nodes"] == len(DEMO_NODE_LABELS) + 2
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from power_atlas.adapters.graphrag_types import Neo4jGraph, Neo4jNode, Neo4jRelationship, TextChunk
+from power_atlas.contracts import EntityTypeNormalizationPolicy, entity_type_policy_version
+from power_atlas.entity_type_backfill import (
+    NORMALIZED_ENTITY_TYPE_WRITE_QUERY,
+    STALE_ENTITY_TYPE_MENTIONS_QUERY,
+    STALE_ENTITY_TYPE_RUN_IDS_QUERY,
+    backfill_normalized_entity_types,
+)
+from power_atlas.extraction_rows import prepare_extracted_rows
+from power_atlas.graph_health_diagnostics import _get_cluster_type_fragmentation_query
+from power_atlas.graph_health_queries import build_cluster_type_fragmentation_query
+from power_atlas.narrative_extraction_cli import build_lexical_config
+from power_atlas.neo4j_batch_writes import BatchWritePolicy
+
+
+def test_extracted_mentions_carry_normalized_type_and_policy_stamp() -> None:
+    policy = EntityTypeNormalizationPolicy(synonyms={"Company": "Organization"})
+    assert entity_type_policy_version(policy) == entity_type_policy_version(
+        EntityTypeNormalizationPolicy(synonyms={"Company": "Organization"})
+    )
+    assert entity_type_policy_version(policy) != entity_type_policy_version()
+
+    chunk = TextChunk(uid="chunk-1", text="Acme Corp", index=0, metadata={"run_id": "run-1"})
+    nodes = [
+        Neo4jNode(id="mention-1", label="EntityMention", properties={"name": "Acme", "entity_type": " Company "}),
+        Neo4jNode(id="mention-2", label="EntityMention", properties={"name": "Someone"}),
+    ]
+    relationships = [
+        Neo4jRelationship(start_node_id="chunk-1", end_node_id=node.id, type="MENTIONED_IN") for node in nodes
+    ]
+    _, mention_rows, _ = prepare_extracted_rows(
+        graph=Neo4jGraph(nodes=nodes, relationships=relationships),
+        text_chunks=[chunk],
+        run_id="run-1",
+        source_uri="file:///doc.pdf",
+        lexical_graph_config=build_lexical_config(),
+        entity_type_policy=policy,
+    )
+    assert [row["properties"]["normalized_entity_type"] for row in mention_rows] == ["Organization", None]
+    assert {row["properties"]["entity_type_policy_version"] for row in mention_rows} == {
+        entity_type_policy_version(policy)
+    }
+
+
+def test_fragmentation_query_prefers_stamped_type_over_case_expression() -> None:
+    query = _get_cluster_type_fragmentation_query()
+    stamp_branch = f"WHEN m.entity_type_policy_version = '{entity_type_policy_version()}'"
+    assert stamp_branch in query
+    # Stale or unstamped mentions still go through the policy CASE expression.
+    assert query.index(stamp_branch) < query.index("WHEN trim(m.entity_type) = 'ORG' THEN 'Organization'")
+
+    custom = EntityTypeNormalizationPolicy(synonyms={"Firm": "Organization"})
+    assert entity_type_policy_version(custom) in _get_cluster_type_fragmentation_query(custom)
+    with pytest.raises(ValueError, match="alphanumeric"):
+        build_cluster_type_fragmentation_query(
+            build_entity_type_cypher_case=lambda var: var,
+            entity_type_policy_version="x' OR 1=1",
+        )
+
+
+def test_backfill_restamps_stale_mentions_per_run_in_batches() -> None:
+    stale = {
+        "run-1": [{"mention_id": "m1", "entity_type": "ORG"}, {"mention_id": "m2", "entity_type": "person"}],
+        "run-2": [{"mention_id": "m3", "entity_type": None}],
+    }
+    writes: list[tuple[str, list[dict]]] = []
+
+    class _Driver:
+        def execute_query(self, query, parameters_=None, database_=None):
+            if query == STALE_ENTITY_TYPE_RUN_IDS_QUERY:
+                return [{"run_id": run_id} for run_id in sorted(stale) if stale[run_id]], None, None
+            if query == STALE_ENTITY_TYPE_MENTIONS_QUERY:
+                return list(stale[parameters_["run_id"]]), None, None
+            assert query == NORMALIZED_ENTITY_TYPE_WRITE_QUERY
+            assert parameters_["policy_version"] == entity_type_policy_version()
+            writes.append((parameters_["run_id"], parameters_["rows"]))
+            written = {row["mention_id"] for row in parameters_["rows"]}
+            stale[parameters_["run_id"]] = [row for row in stale[parameters_["run_id"]] if row["mention_id"] not in written]
+            return [], None, None
+
+    driver = _Driver()
+    preview = backfill_normalized_entity_types(driver, neo4j_database="neo4j", dry_run=True)
+    assert (preview["runs_checked"], preview["stale_mentions"], writes) == (2, 3, [])
+
+    report = backfill_normalized_entity_types(
+        driver,
+        neo4j_database="neo4j",
+        batch_policy=BatchWritePolicy(batch_size=1, max_workers=1),
+    )
+    assert report["stale_mentions"] == 3
+    assert report["runs"][0]["write"]["batches"] == 2
+    assert writes == [
+        ("run-1", [{"mention_id": "m1", "normalized_entity_type": "Organization"}]),
+        ("run-1", [{"mention_id": "m2", "normalized_entity_type": "Person"}]),
+        ("run-2", [{"mention_id": "m3", "normalized_entity_type": None}]),
+    ]
+    assert backfill_normalized_entity_types(driver, neo4j_database="neo4j")["runs_checked"] == 0
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import types
+from contextlib import contextmanager
+
+import neo4j
+import pytest
+
+from power_atlas.graph_schema_migrations import (
+    SCHEMA_MIGRATIONS,
+    SchemaMigration,
+    SchemaObject,
+    apply_schema_migrations,
+    ensure_graph_schema,
+    reset_ensured_graph_schema_cache,
+)
+from power_atlas.orchestration.cli_dispatch import execute_config_command
+from power_atlas.settings import Neo4jSettings
+
+
+class _FakeResult(list):
+    def consume(self) -> None:
+        return None
+
+
+class _FakeGraph:
+    """Minimal schema-aware stand-in: rejects node keys like Community Edition."""
+
+    def __init__(self, *, duplicate_labels: frozenset[str] = frozenset()) -> None:
+        self.duplicate_labels = duplicate_labels
+        self.schema: dict[str, str] = {}
+        self.migrations: dict[int, dict] = {}
+        self.queries: list[str] = []
+
+    def session(self, database: str):
+        graph = self
+
+        class _Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info) -> None:
+                return None
+
+            def run(self, query: str, **params) -> _FakeResult:
+                return graph.run(query, **params)
+
+        return _Session()
+
+    def run(self, query: str, **params) -> _FakeResult:
+        self.queries.append(query)
+        if query.startswith("CREATE "):
+            name = query.split()[2]
+            if name in self.schema:
+                return _FakeResult()
+            if name.startswith("forbidden"):
+                raise neo4j.exceptions.ClientError("Schema operations are not allowed for this user")
+            if "IS NODE KEY" in query:
+                raise neo4j.exceptions.ClientError("Node Key constraint requires Neo4j Enterprise Edition")
+            if "IS UNIQUE" in query and any(f":{label})" in query for label in self.duplicate_labels):
+                raise neo4j.exceptions.ClientError("Both Node(1) and Node(2) have the same key")
+            self.schema[name] = "unique" if "IS UNIQUE" in query else "range_index"
+            return _FakeResult()
+        if query.startswith("MATCH (m:SchemaMigration)"):
+            return _FakeResult(
+                {"version": version, "checksum": row["checksum"]} for version, row in self.migrations.items()
+            )
+        if query.startswith("MERGE (m:SchemaMigration"):
+            self.migrations[params["version"]] = dict(params)
+            return _FakeResult()
+        raise AssertionError(f"unexpected query: {query}")
+
+
+def test_migrations_fall_back_on_community_and_duplicates_and_are_idempotent() -> None:
+    graph = _FakeGraph(duplicate_labels=frozenset({"CanonicalEntity"}))
+
+    report = apply_schema_migrations(graph, database="neo4j")
+
+    assert [entry["version"] for entry in report.applied] == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert graph.schema["entity_mention_run_key"] == "unique"
+    assert graph.schema["canonical_entity_run_key"] == "range_index"
+    assert graph.schema["chunk_run_id"] == "range_index"
+    assert not any("IS NODE KEY" in query and "chunk_run_id" in query for query in graph.queries)
+    (warning,) = report.warnings
+    assert warning.startswith("canonical_entity_run_key:") and "same key" in warning
+    assert graph.migrations[2]["strategies"][-1] == "canonical_entity_run_key=range_index"
+
+    graph.queries.clear()
+    rerun = apply_schema_migrations(graph, database="neo4j")
+    assert (rerun.applied, rerun.already_applied, rerun.warnings) == ([], [1, 2, 3, 4, 5, 6, 7, 8, 9], [])
+    assert not any(query.startswith("CREATE ") for query in graph.queries)
+
+
+def test_changed_migration_is_reported_and_final_fallback_errors_raise() -> None:
+    graph = _FakeGraph()
+    apply_schema_migrations(graph, database="neo4j")
+    changed = SchemaMigration(
+        version=3,
+        name="chunk_scope_indexes",
+        objects=(SchemaObject("chunk_run_id", "Chunk", ("run_id", "dataset_id"), kind="index"),),
+    )
+    report = apply_schema_migrations(graph, database="neo4j", migrations=(*SCHEMA_MIGRATIONS[:2], changed))
+    assert report.applied == []
+    assert "Schema migration 3" in report.warnings[0]
+
+    broken = SchemaMigration(
+        version=99, name="broken", objects=(SchemaObject("forbidden_index", "Chunk", ("uid",), kind="index"),)
+    )
+    with pytest.raises(neo4j.exceptions.ClientError, match="not allowed"):
+        apply_schema_migrations(graph, database="neo4j", migrations=(broken,))
+    assert 99 not in graph.migrations
+
+    with pytest.raises(ValueError, match="Unsafe node label"):
+        SchemaObject("ok", "Bad Label", ("id",))
+
+
+def test_ensure_graph_schema_runs_once_per_database_before_live_commands() -> None:
+    reset_ensured_graph_schema_cache()
+    drivers: list[Neo4jSettings] = []
+    applied: list[str] = []
+
+    @contextmanager
+    def _fake_driver(settings):
+        drivers.append(settings)
+        yield object()
+
+    def _fake_apply(driver, *, database):
+        applied.append(database)
+        return apply_schema_migrations(_FakeGraph(), database=database)
+
+    def _ensure(settings, environ=None):
+        return ensure_graph_schema(
+            settings, environ=environ or {}, create_driver_fn=_fake_driver, apply_migrations_fn=_fake_apply
+        )
+
+    settings = Neo4jSettings(password="test")
+    try:
+        assert _ensure(settings) is not None
+        assert _ensure(settings) is None
+        assert _ensure(Neo4jSettings(password="test", database="other")) is not None
+        assert applied == ["neo4j", "other"]
+        reset_ensured_graph_schema_cache()
+        assert _ensure(settings, environ={"POWER_ATLAS_SCHEMA_MIGRATIONS": "off"}) is None
+        assert len(drivers) == 2
+
+        def _unreachable(settings):
+            raise neo4j.exceptions.ServiceUnavailable("connection refused")
+
+        assert ensure_graph_schema(settings, environ={}, create_driver_fn=_unreachable) is None
+    finally:
+        reset_ensured_graph_schema_cache()
+
+    ensured: list[object] = []
+    for dry_run in (True, False):
+        request_context = types.SimpleNamespace(config=types.SimpleNamespace(dry_run=dry_run))
+        execute_config_command(
+            types.SimpleNamespace(command="extract-claims"),
+            emit=lambda message: None,
+            build_request_context_from_args=lambda args: request_context,
+            run_demo=None,
+            prepare_ask_request_context=None,
+            run_interactive_qa_request_context=None,
+            run_independent_stage=lambda context, command: "manifest.json",
+            format_scope_label=None,
+            ensure_graph_schema=ensured.append,
+        )
+    assert [context.config.dry_run for context in ensured] == [False]
@@ -10,6 +10,16 @@ from pathlib import Path
 
 import pytest
 
+_UNCONFIGURED_NEO4J_POOL_HEALTH = {
+    "status": "not_configured",
+    "max_connection_pool_size": 50,
+    "connection_acquisition_timeout": 30.0,
+    "liveness_check_timeout": 30.0,
+    "acquisitions_total": 0,
+    "failures_total": 0,
+    "in_use": 0,
+    "peak_in_use": 0,
+}
 
 def _require_installed_power_atlas() -> None:
     try:
@@ -870,6 +880,7 @@ def test_backend_api_direct_hooks_runs_from_outside_repo_when_installed(
         "backend_health": {
             "message": "Backend is healthy",
             "status": "ok",
+            "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
         },
         "backend_root": {
             "docs": "/docs",
@@ -943,6 +954,7 @@ def test_backend_api_composed_app_runs_from_outside_repo_when_installed(
         "backend_health": {
             "message": "Backend is healthy",
             "status": "ok",
+            "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
         },
         "backend_root": {
             "docs": "/docs",
@@ -980,6 +992,7 @@ def test_backend_api_guarded_app_runs_from_outside_repo_when_installed(
             "body": {
                 "message": "Backend is healthy",
                 "status": "ok",
+                "neo4j_pool": _UNCONFIGURED_NEO4J_POOL_HEALTH,
             },
             "status_code": 200,
         },
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+import power_atlas.adapters.neo4j.pdf_ingest_runtime as pdf_ingest_runtime_module
+from power_atlas.adapters.graphrag_types import DocumentInfo, LoadedDocument, TextChunk, TextChunks
+from power_atlas.contracts.pipeline import get_pipeline_contract_snapshot
+from power_atlas.pdf_batch_ingest import (
+    PdfBatchIngestSettings,
+    PrecomputedPdfLoader,
+    PrecomputedTextSplitter,
+    install_precomputed_pdf_components,
+    prepare_pdf_documents,
+    resolve_batch_pdf_paths,
+    run_pdf_batch_ingest_runtime,
+)
+from power_atlas.settings import Neo4jSettings
+
+
+class _TextFileLoader:
+    """Picklable stand-in for the pipeline's PDF loader: reads the file as text."""
+
+    async def run(self, filepath, metadata=None, fs=None):
+        text = Path(filepath).read_text(encoding="utf-8")
+        if "unparseable" in text:
+            raise ValueError("broken PDF")
+        return LoadedDocument(text=text, document_info=DocumentInfo(path=str(filepath), metadata=metadata))
+
+
+class _WordSplitter:
+    async def run(self, text):
+        return TextChunks(chunks=[TextChunk(text=word, index=index) for index, word in enumerate(text.split())])
+
+
+def _write_pdfs(directory: Path, texts: dict[str, str]) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, text in texts.items():
+        path = directory / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_resolve_batch_pdf_paths_reads_directories_and_manifests(tmp_path: Path) -> None:
+    _write_pdfs(tmp_path / "unstructured", {"b.pdf": "b", "a.PDF": "a", "notes.txt": "x"})
+    paths, dataset_id = resolve_batch_pdf_paths(pdf_dir=tmp_path / "unstructured", pdf_manifest=None)
+    assert [path.name for path in paths] == ["a.PDF", "b.pdf"]
+    assert dataset_id is None
+
+    (tmp_path / "manifest.json").write_text(
+        json.dumps(
+            {
+                "dataset": "demo_dataset_v9",
+                "provenance": [
+                    {"kind": "pdf", "path": "unstructured/b.pdf"},
+                    {"kind": "csv", "path": "structured/claims.csv"},
+                    {"kind": "pdf", "path": "unstructured/b.pdf"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    paths, dataset_id = resolve_batch_pdf_paths(pdf_dir=None, pdf_manifest=tmp_path / "manifest.json")
+    assert ([path.name for path in paths], dataset_id) == (["b.pdf"], "demo_dataset_v9")
+
+    (tmp_path / "pdfs.txt").write_text("# batch\nunstructured/a.PDF\n\nunstructured/missing.pdf\n", encoding="utf-8")
+    paths, _ = resolve_batch_pdf_paths(pdf_dir=None, pdf_manifest=tmp_path / "pdfs.txt")
+    assert [path.name for path in paths] == ["a.PDF"]
+    (tmp_path / "empty.txt").write_text("unstructured/missing.pdf\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="No PDFs"):
+        resolve_batch_pdf_paths(pdf_dir=None, pdf_manifest=tmp_path / "empty.txt")
+    with pytest.raises(ValueError, match="exactly one"):
+        resolve_batch_pdf_paths(pdf_dir=tmp_path, pdf_manifest=tmp_path / "pdfs.txt")
+
+
+def test_precomputed_components_reuse_process_pool_parse_output(tmp_path: Path) -> None:
+    good, bad = _write_pdfs(tmp_path, {"good.pdf": "alpha beta gamma", "bad.pdf": "unparseable"})
+    requests = [(str(good), {"run_id": "r1"}), (str(bad), {"run_id": "r1"})]
+    prepared = prepare_pdf_documents(_TextFileLoader(), _WordSplitter(), requests, max_workers=2)
+    assert isinstance(prepared[str(bad)], ValueError)
+    assert [chunk.text for chunk in prepared[str(good)].chunks.chunks] == ["alpha", "beta", "gamma"]
+
+    nodes = {"file_loader": _TextFileLoader(), "splitter": _WordSplitter()}
+    pipeline = types.SimpleNamespace(
+        get_node_by_name=lambda name: types.SimpleNamespace(component=nodes[name]),
+        set_component=nodes.__setitem__,
+    )
+    install_precomputed_pdf_components(
+        types.SimpleNamespace(pipeline=pipeline),
+        requests,
+        max_workers=2,
+        prepare_documents_fn=lambda *args, **kwargs: prepared,
+    )
+    loader, splitter = nodes["file_loader"], nodes["splitter"]
+    assert isinstance(loader, PrecomputedPdfLoader) and isinstance(splitter, PrecomputedTextSplitter)
+
+    async def _load_twice():
+        document = await loader.run(str(good), metadata={"run_id": "r1"})
+        return document, await splitter.run(document.text), await splitter.run(document.text)
+
+    document, first, second = asyncio.run(_load_twice())
+    assert document is prepared[str(good)].document
+    assert [chunk.text for chunk in first.chunks] == ["alpha", "beta", "gamma"]
+    assert {chunk.uid for chunk in first.chunks}.isdisjoint(chunk.uid for chunk in second.chunks)
+    fallback = asyncio.run(splitter.run("not precomputed"))
+    assert [chunk.text for chunk in fallback.chunks] == ["not", "precomputed"]
+    with pytest.raises(ValueError, match="broken PDF"):
+        asyncio.run(loader.run(str(bad)))
+
+
+class _FakeResult:
+    def __init__(self, record: dict) -> None:
+        self._record = record
+
+    def consume(self) -> None:
+        return None
+
+    def single(self) -> dict:
+        return self._record
+
+
+class _FakeSession:
+    def __init__(self, queries: list[str]) -> None:
+        self._queries = queries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def run(self, query: str, **params) -> _FakeResult:
+        self._queries.append(query)
+        if "contract_index_count" in query:
+            return _FakeResult({"contract_index_count": 1})
+        if "document_count" in query:
+            return _FakeResult({"document_count": 1, "chunk_count": 3})
+        if "AS page_count" in query:
+            return _FakeResult({"page_count": 2})
+        for marker in (
+            "missing_chunk_order_count",
+            "missing_embedding_count",
+            "missing_page_count",
+            "missing_char_offset_count",
+        ):
+            if f"AS {marker}" in query:
+                return _FakeResult({marker: 0})
+        return _FakeResult({})
+
+
+def test_run_pdf_batch_ingest_shares_one_pipeline_and_records_failures(tmp_path: Path, monkeypatch) -> None:
+    pdf_dir = tmp_path / "pdfs"
+    _write_pdfs(pdf_dir, {f"doc{index}.pdf": f"text {index}" for index in range(5)})
+    queries: list[str] = []
+    drivers_opened: list[Neo4jSettings] = []
+
+    @contextmanager
+    def _fake_driver(settings):
+        drivers_opened.append(settings)
+        yield types.SimpleNamespace(session=lambda database: _FakeSession(queries))
+
+    monkeypatch.setattr(pdf_ingest_runtime_module, "create_neo4j_driver", _fake_driver)
+    runners: list[object] = []
+
+    class _FakeRunner:
+        def __init__(self) -> None:
+            self.do_cleaning = True
+            self.pipeline = None
+            self.config = None
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.file_paths: list[str] = []
+            self.closed = 0
+
+        @classmethod
+        def from_config_file(cls, path):
+            runner = cls()
+            runners.append(runner)
+            return runner
+
+        async def run(self, params):
+            assert self.do_cleaning is False
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                self.file_paths.append(params["file_path"])
+                if params["file_path"].endswith("doc3.pdf"):
+                    raise RuntimeError("writer failed")
+                return types.SimpleNamespace(run_id="pipeline-run")
+            finally:
+                self.in_flight -= 1
+
+        async def close(self) -> None:
+            self.closed += 1
+
+    monkeypatch.setattr("power_atlas.adapters.graphrag_components.PipelineRunner", _FakeRunner)
+    config = types.SimpleNamespace(output_dir=tmp_path / "out", dry_run=False)
+
+    result = run_pdf_batch_ingest_runtime(
+        config=config,
+        run_id="unstructured_ingest-batch",
+        pdf_dir=pdf_dir,
+        pdf_manifest=None,
+        dataset_id=None,
+        pipeline_contract=get_pipeline_contract_snapshot(),
+        neo4j_settings=Neo4jSettings(password="test"),
+        openai_model="gpt-test",
+        batch_settings=PdfBatchIngestSettings(parse_workers=2, max_concurrency=2),
+        require_openai_api_key_fn=lambda message: None,
+        install_precomputed_components_fn=lambda runner, requests, **kwargs: {},
+    )
+
+    (runner,) = runners
+    assert len(drivers_opened) == 1
+    assert sum("CREATE VECTOR INDEX" in query for query in queries) == 1
+    # The RunStats ingest section is recounted once for the batch, not once per document.
+    assert sum("MERGE (stats:RunStats" in query for query in queries) == 1
+    assert sum("MERGE (generation:RetrievalGeneration" in query for query in queries) == 1
+    assert runner.peak_in_flight == 2 and runner.closed == 1
+    assert len(runner.file_paths) == 5
+
+    manifest = json.loads(Path(result["batch_manifest_path"]).read_text(encoding="utf-8"))
+    assert manifest["status"] == "partial"
+    assert manifest["dataset_id"] == "pdfs"
+    assert (manifest["document_count"], manifest["failed_document_count"]) == (5, 1)
+    assert manifest["counts"] == {"documents": 4, "pages": 8, "chunks": 12}
+    failed = [document for document in manifest["documents"] if document["status"] == "failed"]
+    assert [Path(document["file_path"]).name for document in failed] == ["doc3.pdf"]
+    assert failed[0]["error"] == "RuntimeError: writer failed"
+    assert all(document["timings"]["pipeline_seconds"] > 0 for document in manifest["documents"])
@@ -2665,6 +2665,150 @@ def test_write_alignment_results_accepts_custom_entity_resolution_graph_contract
     assert "`ALIGNED_WITH_SECURITY`" in rendered_query
 
 
+def test_partition_rows_keeps_conflicting_rows_in_one_batch() -> None:
+    from power_atlas.neo4j_batch_writes import partition_rows
+
+    rows = [{"cluster_id": f"c{index % 3}", "mention_id": f"m{index}"} for index in range(9)]
+
+    plain = partition_rows(rows, batch_size=4)
+    keyed = partition_rows(rows, batch_size=4, conflict_key=lambda row: row["cluster_id"])
+
+    assert [len(batch) for batch in plain] == [4, 4, 1]
+    assert [len(batch) for batch in keyed] == [3, 3, 3]
+    assert [{row["cluster_id"] for row in batch} for batch in keyed] == [{"c0"}, {"c1"}, {"c2"}]
+
+
+def test_run_batched_write_chunks_rows_into_one_query_per_batch() -> None:
+    from power_atlas.neo4j_batch_writes import BatchWritePolicy, run_batched_write
+
+    driver = mock.Mock()
+    driver.execute_query.return_value = ([], None, None)
+
+    stats = run_batched_write(
+        driver,
+        "UNWIND $rows AS row RETURN row",
+        name="member_of",
+        rows=[{"mention_id": f"m{index}"} for index in range(5)],
+        parameters={"run_id": "run-123"},
+        neo4j_database="neo4j",
+        policy=BatchWritePolicy(batch_size=2, max_workers=1),
+    )
+
+    calls = driver.execute_query.call_args_list
+    assert [len(call.kwargs["parameters_"]["rows"]) for call in calls] == [2, 2, 1]
+    assert all(call.kwargs["parameters_"]["run_id"] == "run-123" for call in calls)
+    assert (stats.rows, stats.batches) == (5, 3)
+    assert stats.to_summary()["batch_seconds"] == [round(seconds, 4) for seconds in stats.batch_seconds]
+
+
+def test_run_batched_write_leaves_transient_retries_to_the_driver() -> None:
+    import neo4j
+
+    from power_atlas.neo4j_batch_writes import run_batched_write
+
+    # execute_query already retries transient errors in a managed transaction;
+    # an error it gives up on must surface without another retry layer.
+    driver = mock.Mock()
+    driver.execute_query.side_effect = neo4j.exceptions.ServiceUnavailable("gone")
+
+    with pytest.raises(neo4j.exceptions.ServiceUnavailable):
+        run_batched_write(
+            driver,
+            "UNWIND $rows AS row RETURN row",
+            name="resolves_to",
+            rows=[{"mention_id": "m1"}],
+            parameters={},
+            neo4j_database="neo4j",
+        )
+
+    assert driver.execute_query.call_count == 1
+
+
+def test_batch_write_policy_from_env_reaches_the_entity_resolution_default() -> None:
+    from power_atlas.entity_resolution_runner import run_entity_resolution_runtime_default
+    from power_atlas.neo4j_batch_writes import BatchWritePolicy
+    from power_atlas.settings import Neo4jSettings
+
+    policy = BatchWritePolicy.from_env(
+        {"POWER_ATLAS_GRAPH_WRITE_BATCH_SIZE": "250", "POWER_ATLAS_GRAPH_WRITE_MAX_WORKERS": "2"}
+    )
+    assert policy == BatchWritePolicy(batch_size=250, max_workers=2)
+    assert BatchWritePolicy.from_env({}) == BatchWritePolicy()
+    with pytest.raises(ValueError, match="batch_size"):
+        BatchWritePolicy.from_env({"POWER_ATLAS_GRAPH_WRITE_BATCH_SIZE": "0"})
+
+    captured: dict = {}
+
+    def _fake_runtime(**kwargs):
+        captured.update(kwargs)
+        return {}
+
+    with (
+        mock.patch.dict("os.environ", {"POWER_ATLAS_GRAPH_WRITE_BATCH_SIZE": "250"}),
+        mock.patch("power_atlas.entity_resolution_runner.run_entity_resolution_runtime", _fake_runtime),
+        mock.patch("power_atlas.entity_resolution_runner.write_resolution_results") as write_resolution_results,
+    ):
+        run_entity_resolution_runtime_default(
+            config=mock.Mock(),
+            run_id="run-123",
+            source_uri=None,
+            resolution_mode="unstructured_only",
+            artifact_subdir="entity_resolution",
+            effective_dataset_id="demo",
+            neo4j_settings=Neo4jSettings(password="secret"),
+        )
+        captured["write_resolution_results"](
+            mock.Mock(),
+            run_id="run-123",
+            source_uri=None,
+            resolved_rows=[],
+            unresolved_rows=[],
+            neo4j_database="neo4j",
+        )
+
+    assert write_resolution_results.call_args.kwargs["batch_policy"] == BatchWritePolicy(batch_size=250)
+
+
+def test_write_cluster_memberships_batches_concurrently_by_cluster() -> None:
+    from power_atlas.entity_resolution_writes import write_cluster_memberships
+    from power_atlas.neo4j_batch_writes import BatchWritePolicy
+
+    driver = mock.Mock()
+    cluster_rows = [
+        {
+            "mention_id": f"m{index}",
+            "cluster_id": f"cluster-{index % 4}",
+            "canonical_name": "Acme",
+            "normalized_text": "acme",
+            "entity_type": "organization",
+            "source_uri": None,
+            "score": 1.0,
+            "method": "label_cluster",
+            "status": "accepted",
+        }
+        for index in range(12)
+    ]
+
+    stats = write_cluster_memberships(
+        driver,
+        run_id="run-123",
+        cluster_rows=cluster_rows,
+        neo4j_database="neo4j",
+        resolver_version="v1",
+        created_at="2024-01-01T00:00:00+00:00",
+        batch_policy=BatchWritePolicy(batch_size=3, max_workers=2),
+    )
+
+    batches = [call.kwargs["parameters_"]["rows"] for call in driver.execute_query.call_args_list]
+    assert sorted(row["mention_id"] for batch in batches for row in batch) == sorted(
+        row["mention_id"] for row in cluster_rows
+    )
+    assert all(len({row["cluster_id"] for row in batch}) == 1 for batch in batches)
+    assert [(item.name, item.rows, item.batches, item.max_workers) for item in stats] == [
+        ("member_of", 12, 4, 2)
+    ]
+
+
 def test_entity_resolution_runtime_forwards_custom_graph_contract() -> None:
     from power_atlas.contracts import EntityResolutionGraphContract
     from power_atlas.entity_resolution_runner import run_entity_resolution_runtime
@@ -2751,6 +2895,168 @@ def test_default_retrieval_policy_matches_existing_power_atlas_defaults() -> Non
     assert retrieval_policy.ontology.aligned_with_relationship == "ALIGNED_WITH"
     assert retrieval_policy.default_expand_graph is False
     assert retrieval_policy.default_cluster_aware is False
+    assert retrieval_policy.scope_strategy == "post_filter"
+
+
+def test_select_scoped_candidates_refills_until_top_k_in_scope() -> None:
+    from power_atlas.retrieval_scoped_search import select_scoped_candidates
+
+    driver = mock.Mock()
+    driver.execute_query.side_effect = [
+        ([{"candidates_fetched": 20, "in_scope_count": 1, "hits": [{"element_id": "e1", "score": 0.9}]}], None, None),
+        (
+            [
+                {
+                    "candidates_fetched": 80,
+                    "in_scope_count": 6,
+                    "hits": [{"element_id": f"e{index}", "score": 0.9 - index / 100} for index in range(5)],
+                }
+            ],
+            None,
+            None,
+        ),
+    ]
+
+    hits, stats = select_scoped_candidates(
+        driver,
+        strategy="over_fetch",
+        index_name="chunk_embedding_index",
+        query_vector=[0.1, 0.2],
+        top_k=5,
+        run_id="run-1",
+        source_uri=None,
+        neo4j_database="neo4j",
+    )
+
+    candidate_ks = [call.kwargs["parameters_"]["candidate_k"] for call in driver.execute_query.call_args_list]
+    assert candidate_ks == [20, 80]
+    assert [hit["element_id"] for hit in hits] == ["e0", "e1", "e2", "e3", "e4"]
+    assert stats.to_metadata() == {
+        "strategy": "over_fetch",
+        "top_k": 5,
+        "candidates_fetched": 80,
+        "candidates_discarded": 74,
+        "in_scope": 6,
+        "refills": 1,
+        "underfilled": False,
+    }
+
+
+def test_select_scoped_candidates_stops_when_index_or_budget_is_exhausted() -> None:
+    from power_atlas.retrieval_scoped_search import select_scoped_candidates
+
+    exhausted_driver = mock.Mock()
+    exhausted_driver.execute_query.return_value = (
+        [{"candidates_fetched": 12, "in_scope_count": 2, "hits": [{"element_id": "e1", "score": 0.5}]}],
+        None,
+        None,
+    )
+    capped_driver = mock.Mock()
+    capped_driver.execute_query.return_value = (
+        [{"candidates_fetched": 40, "in_scope_count": 0, "hits": []}],
+        None,
+        None,
+    )
+
+    _, exhausted_stats = select_scoped_candidates(
+        exhausted_driver,
+        strategy="over_fetch",
+        index_name="chunk_embedding_index",
+        query_vector=[0.1],
+        top_k=5,
+        run_id="run-1",
+        source_uri=None,
+        neo4j_database=None,
+    )
+    _, capped_stats = select_scoped_candidates(
+        capped_driver,
+        strategy="over_fetch",
+        index_name="chunk_embedding_index",
+        query_vector=[0.1],
+        top_k=5,
+        run_id="run-1",
+        source_uri=None,
+        neo4j_database=None,
+        over_fetch_factor=2,
+        max_candidates=40,
+    )
+
+    assert exhausted_driver.execute_query.call_count == 1
+    assert exhausted_stats.underfilled is True
+    assert [call.kwargs["parameters_"]["candidate_k"] for call in capped_driver.execute_query.call_args_list] == [
+        10,
+        20,
+        40,
+    ]
+    assert (capped_stats.refills, capped_stats.candidates_discarded) == (2, 40)
+
+
+def test_select_scoped_candidates_exact_scans_scope_with_escaped_identifiers() -> None:
+    from power_atlas.retrieval_scoped_search import select_scoped_candidates
+
+    driver = mock.Mock()
+    driver.execute_query.return_value = (
+        [{"candidates_fetched": 3, "in_scope_count": 3, "hits": [{"element_id": "e1", "score": 0.8}]}],
+        None,
+        None,
+    )
+
+    hits, stats = select_scoped_candidates(
+        driver,
+        strategy="exact",
+        index_name="chunk_embedding_index",
+        query_vector=[0.1],
+        top_k=1,
+        run_id="run-1",
+        source_uri="file:///doc.pdf",
+        neo4j_database="neo4j",
+        node_label="Chunk",
+        embedding_property="embedding",
+    )
+
+    query = driver.execute_query.call_args.args[0]
+    assert "MATCH (node:`Chunk`)" in query
+    assert "vector.similarity.cosine(node.`embedding`, $query_vector)" in query
+    assert driver.execute_query.call_args.kwargs["parameters_"]["source_uri"] == "file:///doc.pdf"
+    assert hits == [{"element_id": "e1", "score": 0.8}]
+    assert (stats.candidates_discarded, stats.underfilled) == (0, False)
+    with pytest.raises(ValueError, match="Unknown retrieval scope strategy"):
+        from power_atlas.retrieval_scoped_search import validate_retrieval_scope_strategy
+
+        validate_retrieval_scope_strategy("nearest")
+
+
+def test_execute_retrieval_search_warns_when_scoped_search_is_underfilled() -> None:
+    from power_atlas.retrieval_runtime import execute_retrieval_search
+
+    scoped_search = {
+        "strategy": "over_fetch",
+        "top_k": 5,
+        "candidates_fetched": 2000,
+        "candidates_discarded": 1998,
+        "in_scope": 2,
+        "refills": 3,
+        "underfilled": True,
+    }
+    rag = mock.Mock()
+    rag.search.return_value = SimpleNamespace(
+        answer="",
+        retriever_result=SimpleNamespace(items=[], metadata={"scoped_search": scoped_search}),
+    )
+
+    result = execute_retrieval_search(
+        rag,
+        question="What happened?",
+        top_k=5,
+        query_params={"run_id": "run-1", "source_uri": None},
+        citation_optional_fields=(),
+    )
+
+    assert result.scoped_search == scoped_search
+    assert result.warnings == [
+        "Scoped vector search found 2 in-scope chunks for top_k=5 "
+        "(1998 of 2000 candidates were outside the run scope)."
+    ]
 
 
 def test_default_prompt_defaults_support_partial_prompt_id_override() -> None:
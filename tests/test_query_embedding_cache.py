@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from power_atlas.adapters.neo4j.retrieval_session import build_retriever_and_rag
+from power_atlas.query_embedding_cache import (
+    CachedQueryEmbedder,
+    QueryEmbeddingCache,
+    QueryEmbeddingCacheSettings,
+    normalize_query_text,
+)
+from power_atlas.retrieval_batch_session import precompute_query_embeddings
+from power_atlas.retrieval_interactive_session import format_turn_budget_summary
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.model = "text-embedding-3-small"
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return [float(len(self.calls)), 0.5]
+
+
+def test_settings_from_env_and_query_normalization(tmp_path: Path) -> None:
+    assert QueryEmbeddingCacheSettings.from_env({}) == QueryEmbeddingCacheSettings()
+    assert not QueryEmbeddingCacheSettings.from_env({"POWER_ATLAS_QUERY_EMBEDDING_CACHE_MAX_ENTRIES": "off"}).enabled
+    settings = QueryEmbeddingCacheSettings.from_env(
+        {"POWER_ATLAS_QUERY_EMBEDDING_CACHE_MAX_ENTRIES": "8", "POWER_ATLAS_QUERY_EMBEDDING_CACHE_DIR": str(tmp_path)}
+    )
+    assert (settings.max_entries, settings.directory) == (8, tmp_path)
+    with pytest.raises(ValueError, match="max_entries"):
+        QueryEmbeddingCacheSettings(max_entries=-1)
+    assert normalize_query_text("  Who  founded\tAcme? ") == normalize_query_text("who founded acme") == "who founded acme"
+
+
+def test_cached_embedder_serves_memory_and_persistent_tiers(tmp_path: Path) -> None:
+    settings = QueryEmbeddingCacheSettings(max_entries=2, directory=tmp_path / "query_embeddings")
+    embedder = _CountingEmbedder()
+    cached = CachedQueryEmbedder(embedder, QueryEmbeddingCache(settings), model_name="text-embedding-3-small")
+
+    first = cached.embed_query("Who founded Acme?")
+    assert cached.embed_query("who founded  acme") == first
+    cached.embed_query("Where is Acme?")
+    cached.embed_query("When was Acme founded?")  # evicts the first question from memory
+    assert cached.embed_query("Who founded Acme?") == first  # served from disk
+    assert len(embedder.calls) == 3
+    assert cached.model == "text-embedding-3-small"
+    assert cached.cache.stats().to_summary() == {
+        "lookups": 5,
+        "memory_hits": 1,
+        "persistent_hits": 1,
+        "misses": 3,
+        "hit_rate": 0.4,
+        "evictions": 2,
+        "errors": 0,
+    }
+
+    # A fresh process (new cache instance) still hits the on-disk tier; other models miss.
+    restarted = CachedQueryEmbedder(_CountingEmbedder(), QueryEmbeddingCache(settings), model_name="text-embedding-3-small")
+    assert restarted.embed_query("Where is Acme") == [2.0, 0.5]
+    other_model = CachedQueryEmbedder(_CountingEmbedder(), QueryEmbeddingCache(settings), model_name="other-model")
+    other_model.embed_query("Where is Acme?")
+    assert other_model.embedder.calls == ["Where is Acme?"]
+
+
+def test_persistent_tier_is_shared_by_concurrent_writers_without_holding_the_memory_lock(tmp_path: Path) -> None:
+    settings = QueryEmbeddingCacheSettings(max_entries=8, directory=tmp_path / "query_embeddings")
+    # Two caches stand in for two processes writing the same directory in turn.
+    first, second = QueryEmbeddingCache(settings), QueryEmbeddingCache(settings)
+    first.put("text-embedding-3-small", "Who founded Acme?", [1.0, 0.25])
+    second.put("text-embedding-3-small", "Where is Acme?", [2.0, 0.5])
+    first.put("text-embedding-3-small", "When was Acme founded?", [3.0, 0.75])
+
+    reader = QueryEmbeddingCache(settings)
+    assert reader.get("text-embedding-3-small", "who founded acme") == [1.0, 0.25]
+    assert reader.get("text-embedding-3-small", "where is acme") == [2.0, 0.5]
+    assert second.get("text-embedding-3-small", "When was Acme founded") == [3.0, 0.75]
+    assert reader.stats().persistent_hits == 2 and second.stats().persistent_hits == 1
+
+    # A slow disk lookup must not block memory hits from other threads.
+    lookup_started, release_lookup = threading.Event(), threading.Event()
+    persistent = reader._persistent
+    real_get = persistent.get
+
+    def _slow_get(key: str):
+        lookup_started.set()
+        assert release_lookup.wait(timeout=5)
+        return real_get(key)
+
+    persistent.get = _slow_get
+    slow_lookup = threading.Thread(target=reader.get, args=("text-embedding-3-small", "Unseen question"))
+    slow_lookup.start()
+    assert lookup_started.wait(timeout=5)
+    assert reader.get("text-embedding-3-small", "Who founded Acme?") == [1.0, 0.25]
+    release_lookup.set()
+    slow_lookup.join(timeout=5)
+    assert reader.stats().misses == 1
+
+
+def test_retriever_build_wraps_embedder_and_batch_precompute_uses_cache() -> None:
+    embedder = _CountingEmbedder()
+    cache = QueryEmbeddingCache()
+    retriever, rag = build_retriever_and_rag(
+        object(),
+        index_name="chunk_embedding_index",
+        retrieval_query="RETURN 1",
+        qa_model="gpt-4o-mini",
+        neo4j_database=None,
+        embedder_model_name="text-embedding-3-small",
+        result_formatter=lambda record: record,
+        embedder_factory=object,
+        retriever_factory=lambda **kwargs: types.SimpleNamespace(**kwargs),
+        rag_factory=lambda **kwargs: types.SimpleNamespace(**kwargs),
+        build_embedder=lambda model_name, *, embedder_factory: embedder,
+        build_llm=lambda model: object(),
+        prompt_template="{context}",
+        query_embedding_cache=cache,
+    )
+    assert isinstance(retriever.embedder, CachedQueryEmbedder)
+    retriever.embedder.embed_query("Who founded Acme?")
+
+    batches: list[list[str]] = []
+
+    def _embed_batch(_embedder, texts):
+        batches.append(list(texts))
+        return [[9.0, 9.0] for _ in texts]
+
+    vectors, requests = precompute_query_embeddings(
+        retriever.embedder, ["Who founded Acme?", "Where is Acme?"], batch_size=8, embed_batch=_embed_batch
+    )
+    assert (requests, batches) == (1, [["Where is Acme?"]])
+    assert vectors["Who founded Acme?"] == [1.0, 0.5]
+    assert retriever.embedder.embed_query("where is acme") == [9.0, 9.0]
+
+    history = types.SimpleNamespace(messages=[])
+    line = format_turn_budget_summary(
+        turn=1,
+        question="Who?",
+        history=history,
+        context_tokens=10,
+        latency_seconds=0.1,
+        query_embedding_cache=cache.stats(),
+    )
+    assert line.endswith("embed_cache_hit_rate=0.5 (lookups=4)")
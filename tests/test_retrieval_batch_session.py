@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from power_atlas.orchestration.cli_dispatch import execute_config_command
+from power_atlas.retrieval_batch_session import (
+    BatchQaSettings,
+    read_batch_questions,
+    run_batch_qa_session,
+)
+
+
+class _FakeEmbeddings:
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    def create(self, *, input, model):
+        self.requests.append(list(input))
+        data = [types.SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+        return types.SimpleNamespace(data=list(reversed(data)))
+
+
+class _FakeEmbedder:
+    def __init__(self) -> None:
+        self.model = "text-embedding-3-small"
+        self.client = types.SimpleNamespace(embeddings=_FakeEmbeddings())
+        self.single_calls = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        self.single_calls += 1
+        return [0.0]
+
+
+def _write_questions(path: Path, questions: list[str]) -> Path:
+    path.write_text(
+        "\n".join(json.dumps({"id": f"id-{i}", "question": q}) for i, q in enumerate(questions)) + "\n\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_read_questions_and_settings(tmp_path: Path) -> None:
+    path = tmp_path / "questions.jsonl"
+    path.write_text('{"question": " Who? "}\n\n{"id": 7, "question": "What?"}\n', encoding="utf-8")
+    questions = read_batch_questions(path)
+    assert [(q.question_id, q.question) for q in questions] == [("q1", "Who?"), ("7", "What?")]
+
+    path.write_text('{"question": "ok"}\n{"prompt": "missing"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="questions.jsonl:2"):
+        read_batch_questions(path)
+
+    assert BatchQaSettings.from_env({}) == BatchQaSettings()
+    settings = BatchQaSettings.from_env(
+        {"POWER_ATLAS_BATCH_QA_CONCURRENCY": "8", "POWER_ATLAS_BATCH_QA_EMBEDDING_BATCH_SIZE": "16"}
+    )
+    assert (settings.concurrency, settings.embedding_batch_size) == (8, 16)
+    with pytest.raises(ValueError, match="concurrency"):
+        BatchQaSettings(concurrency=0)
+
+
+def test_batch_session_embeds_in_batches_and_streams_results_in_order(tmp_path: Path) -> None:
+    texts = [f"question {i}" + "?" * (i % 3) for i in range(10)] + ["question 0"]
+    questions = read_batch_questions(_write_questions(tmp_path / "questions.jsonl", texts))
+    embedder = _FakeEmbedder()
+    retriever = types.SimpleNamespace(embedder=embedder)
+    threads: set[str] = set()
+    lock = threading.Lock()
+
+    def _answer(question: str) -> dict[str, object]:
+        vector = retriever.embedder.embed_query(question)
+        with lock:
+            threads.add(threading.current_thread().name)
+        time.sleep(0.005)
+        if question == "question 4?":
+            raise RuntimeError("LLM timeout")
+        return {"answer": f"A: {question}", "evidence_level": "full" if vector[0] > 10 else "degraded"}
+
+    summary = run_batch_qa_session(
+        retriever=retriever,
+        questions=questions,
+        output_path=tmp_path / "out" / "answers.jsonl",
+        answer_question=_answer,
+        settings=BatchQaSettings(concurrency=3, embedding_batch_size=4),
+    )
+
+    records = [json.loads(line) for line in (tmp_path / "out" / "answers.jsonl").read_text().splitlines()]
+    assert [record["question_id"] for record in records] == [f"id-{i}" for i in range(11)]
+    assert records[4]["status"] == "error" and "LLM timeout" in records[4]["error"]
+    assert all(record["latency_ms"] >= 0 for record in records)
+    assert [len(batch) for batch in embedder.client.embeddings.requests] == [4, 4, 2]
+    assert embedder.single_calls == 0 and retriever.embedder is embedder
+    assert len(threads) > 1
+    assert summary["questions"] == 11 and summary["failed"] == 1 and summary["succeeded"] == 10
+    assert summary["embedding"] == {"requests": 3, "seconds": summary["embedding"]["seconds"], "batch_size": 4, "misses": 0}
+    assert summary["evidence_levels"] == {"degraded": 5, "full": 5}
+    assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p95"] <= summary["latency_ms"]["max"]
+
+
+def _dispatch_args(**overrides):
+    values = {
+        "command": "ask",
+        "questions_file": Path("questions.jsonl"),
+        "batch_output": None,
+        "batch_concurrency": 2,
+        "interactive": False,
+        "cluster_aware": False,
+        "expand_graph": True,
+    }
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+
+def test_ask_questions_file_dispatches_to_batch_runner() -> None:
+    calls: dict[str, object] = {}
+    emitted: list[str] = []
+
+    def _context(dry_run: bool):
+        return types.SimpleNamespace(config=types.SimpleNamespace(dry_run=dry_run), run_id="run-1", all_runs=False)
+
+    def _batch(request_context, **kwargs):
+        calls.update(kwargs)
+        return {
+            "questions": 2,
+            "failed": 0,
+            "concurrency": kwargs["settings"].concurrency,
+            "elapsed_seconds": 1.0,
+            "questions_per_second": 2.0,
+            "latency_ms": {"p50": 400.0, "p95": 600.0},
+            "output_path": "answers.jsonl",
+        }
+
+    kwargs = {
+        "emit": emitted.append,
+        "run_demo": None,
+        "prepare_ask_request_context": lambda args, request_context: request_context,
+        "run_interactive_qa_request_context": None,
+        "run_independent_stage": None,
+        "format_scope_label": lambda run_id, all_runs: f"run_id={run_id}",
+        "run_batch_qa_request_context": _batch,
+    }
+    execute_config_command(_dispatch_args(), build_request_context_from_args=lambda args: _context(False), **kwargs)
+    assert calls["questions_path"] == Path("questions.jsonl") and calls["expand_graph"] is True
+    assert calls["settings"].concurrency == 2
+    assert any("questions/s=2.0" in line and "p95_ms=600.0" in line for line in emitted)
+
+    with pytest.raises(SystemExit, match="dry-run"):
+        execute_config_command(_dispatch_args(), build_request_context_from_args=lambda args: _context(True), **kwargs)
+    with pytest.raises(SystemExit, match="--interactive"):
+        execute_config_command(
+            _dispatch_args(interactive=True), build_request_context_from_args=lambda args: _context(False), **kwargs
+        )
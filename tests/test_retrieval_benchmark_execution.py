@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from power_atlas.adapters.neo4j import retrieval_benchmark_queries as queries
+from power_atlas.retrieval_benchmark_runner import (
+    BENCHMARK_CASES,
+    RetrievalBenchmarkExecutionSettings,
+    run_retrieval_benchmark_runtime,
+)
+from power_atlas.settings import Neo4jSettings
+
+_QUERY_NAMES = {
+    queries.Q_CANONICAL_SINGLE: "canonical",
+    queries.Q_CLUSTER_NAME_SINGLE: "cluster",
+    queries.Q_LOWER_LAYER_CHAIN: "lower",
+    queries.Q_FRAGMENTATION_CHECK: "fragmentation",
+    queries.Q_CATALOG_EXISTENCE_CHECK: "catalog",
+    queries.Q_PAIRWISE_CANONICAL: "pairwise",
+}
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "_FakeDriver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def execute_query(self, cypher, *, parameters_, database_, routing_):
+        with self._lock:
+            self.queries.append(cypher)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(0.002)
+        name = _QUERY_NAMES[cypher.removeprefix("PROFILE ")]
+        entity = parameters_.get("entity_name") or f"{parameters_['entity_a']}|{parameters_['entity_b']}"
+        rows = [{"claim_id": f"{name}:{entity}", "cluster_id": f"cluster:{entity}", "entity_type": "Organization"}]
+        profile = {"dbHits": 3, "children": [{"dbHits": 4, "children": []}]}
+        return rows, types.SimpleNamespace(profile=profile), ["claim_id"]
+
+
+def _run(tmp_path: Path, execution: RetrievalBenchmarkExecutionSettings) -> tuple[dict, list[_FakeDriver]]:
+    drivers: list[_FakeDriver] = []
+
+    def _create_driver(settings):
+        drivers.append(_FakeDriver())
+        return drivers[-1]
+
+    with patch("power_atlas.retrieval_benchmark_runner.create_neo4j_driver", _create_driver):
+        result = run_retrieval_benchmark_runtime(
+            dry_run=False,
+            output_dir=tmp_path,
+            neo4j_settings=Neo4jSettings(password="test"),
+            run_id="run-1",
+            dataset_id="demo_dataset_v1",
+            alignment_version="v1",
+            execution_settings=execution,
+        )
+    return result, drivers
+
+
+def test_execution_settings_from_env() -> None:
+    assert RetrievalBenchmarkExecutionSettings.from_env({}) == RetrievalBenchmarkExecutionSettings()
+    settings = RetrievalBenchmarkExecutionSettings.from_env(
+        {
+            "POWER_ATLAS_RETRIEVAL_BENCHMARK_WORKERS": "8",
+            "POWER_ATLAS_RETRIEVAL_BENCHMARK_PROFILE": "on",
+            "POWER_ATLAS_RETRIEVAL_BENCHMARK_REPEATS": "3",
+        }
+    )
+    assert (settings.workers, settings.profile, settings.repeats) == (8, True, 3)
+    with pytest.raises(ValueError, match="workers"):
+        RetrievalBenchmarkExecutionSettings(workers=0)
+
+
+def test_concurrent_run_reuses_one_driver_and_matches_sequential_results(tmp_path: Path) -> None:
+    sequential, _ = _run(tmp_path / "seq", RetrievalBenchmarkExecutionSettings())
+    concurrent, drivers = _run(tmp_path / "par", RetrievalBenchmarkExecutionSettings(workers=4, repeats=2))
+
+    assert len(drivers) == 1
+    assert len(drivers[0].threads) > 1
+    for key in ("case_results", "pairwise_results", "benchmark_summary"):
+        assert concurrent["artifact"][key] == sequential["artifact"][key]
+
+    performance = concurrent["artifact"]["query_performance"]
+    single_cases = sum(1 for case in BENCHMARK_CASES if case.case_type != "pairwise_entity")
+    assert performance["workers"] == 4
+    assert performance["query_count"] == len(drivers[0].queries) == 2 * (5 * single_cases + 1)
+    assert performance["queries"]["canonical_rows"]["count"] == 2 * single_cases
+    stats = performance["queries"]["pairwise_rows"]
+    assert stats["count"] == 2 and 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+    assert "db_hits_total" not in stats
+
+
+def test_profile_prefixes_queries_and_records_db_hits(tmp_path: Path) -> None:
+    result, drivers = _run(tmp_path, RetrievalBenchmarkExecutionSettings(profile=True))
+
+    assert all(cypher.startswith("PROFILE ") for cypher in drivers[0].queries)
+    performance = result["artifact"]["query_performance"]
+    assert all(timing["db_hits"] == 7 for timing in performance["timings"])
+    assert performance["queries"]["catalog_check_rows"]["db_hits_max"] == 7
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from power_atlas.adapters.graphrag_retrieval import LLMMessage
+from power_atlas.retrieval_interactive_session import run_interactive_session_loop
+from power_atlas.retrieval_message_history import (
+    InteractiveHistorySettings,
+    TokenBudgetMessageHistory,
+    estimate_messages_tokens,
+    strip_citation_tokens,
+)
+
+_TOKEN = "[CITATION|chunk_id=c1|run_id=r1|source_uri=file%3A%2F%2F%2Fdoc.pdf|chunk_index=0|page=1|start_char=0|end_char=50]"
+
+
+def _turn(history: TokenBudgetMessageHistory, index: int, answer_words: int = 5) -> None:
+    answer = " ".join(f"answer{index}" for _ in range(answer_words))
+    history.add_messages(
+        [
+            LLMMessage(role="user", content=f"Question {index}?"),
+            LLMMessage(role="assistant", content=f"{answer}. {_TOKEN}"),
+        ]
+    )
+
+
+def test_settings_from_env_and_citation_stripping() -> None:
+    assert InteractiveHistorySettings.from_env({}) == InteractiveHistorySettings()
+    settings = InteractiveHistorySettings.from_env(
+        {"POWER_ATLAS_QA_HISTORY_MAX_TOKENS": "500", "POWER_ATLAS_QA_HISTORY_KEEP_TURNS": "2"}
+    )
+    assert (settings.max_tokens, settings.keep_turns) == (500, 2)
+    with pytest.raises(ValueError, match="keep_turns"):
+        InteractiveHistorySettings(keep_turns=0)
+    assert strip_citation_tokens(f"First. {_TOKEN}\n- Second {_TOKEN}{_TOKEN}") == "First.\n- Second"
+
+
+def test_history_keeps_recent_turns_verbatim_and_condenses_older_ones() -> None:
+    history = TokenBudgetMessageHistory(InteractiveHistorySettings(max_tokens=10_000, keep_turns=2))
+    for index in range(1, 5):
+        _turn(history, index)
+
+    messages = history.messages
+    assert [message["role"] for message in messages] == ["system", "user", "assistant", "user", "assistant"]
+    assert "Q: Question 1?" in messages[0]["content"] and "Q: Question 2?" in messages[0]["content"]
+    assert messages[1]["content"] == "Question 3?"
+    assert all("[CITATION|" not in message["content"] for message in messages)
+    assert history.condensed_turns == 2 and history.dropped_turns == 0
+
+    budget = TokenBudgetMessageHistory(InteractiveHistorySettings(max_tokens=120, keep_turns=3))
+    for index in range(1, 8):
+        _turn(budget, index, answer_words=40)
+    assert budget.token_count <= 120 and len(budget.messages) == 2
+    assert budget.messages[-2]["content"] == "Question 7?"
+    assert budget.dropped_turns == 6
+    assert estimate_messages_tokens(budget.messages) == budget.token_count
+
+
+def test_session_loop_reports_prompt_tokens_and_latency_in_debug_mode() -> None:
+    history = TokenBudgetMessageHistory(InteractiveHistorySettings(keep_turns=1))
+    questions = iter(["What happened?", "And then?", "exit"])
+    printed: list[str] = []
+
+    def _turn_fn(rag, *, question, message_history, **_kwargs):
+        return types.SimpleNamespace(
+            display_answer=f"Answer to {question} {_TOKEN}",
+            history_answer=f"Answer to {question} {_TOKEN}",
+            citation_fallback_applied=False,
+            debug_summary="[debug] evidence_level=full",
+            context_tokens=250,
+        )
+
+    run_interactive_session_loop(
+        rag=object(),
+        history=history,
+        top_k=5,
+        query_params={},
+        citation_optional_fields=(),
+        logger=None,
+        all_runs=True,
+        debug=True,
+        run_interactive_turn=_turn_fn,
+        postprocess_answer=lambda *args, **kwargs: {},
+        build_retrieval_debug_view=lambda *args, **kwargs: {},
+        format_postprocess_debug_summary=lambda view: "",
+        count_malformed_diagnostics=lambda hits: 0,
+        llm_message_factory=LLMMessage,
+        input_fn=lambda prompt: next(questions),
+        print_fn=lambda *args: printed.append(" ".join(str(arg) for arg in args)),
+    )
+
+    budget_lines = [line for line in printed if "prompt_tokens~" in line]
+    assert len(budget_lines) == 2
+    assert budget_lines[0].startswith("[debug] turn=1 prompt_tokens~253 (history=0 context=250)")
+    assert "latency_ms=" in budget_lines[1] and "history_condensed=0" in budget_lines[1]
+    assert history.condensed_turns == 1
+    assert "[CITATION|" not in history.messages[-1]["content"]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import types
+from contextlib import contextmanager
+
+import pytest
+from neo4j_graphrag.types import RetrieverResult, RetrieverResultItem
+
+from power_atlas.adapters.graphrag_retrieval import GraphRAG
+from power_atlas.adapters.graphrag_types import LexicalGraphConfig
+from power_atlas.adapters.neo4j import structured_ingest_runtime as structured_ingest_runtime_module
+from power_atlas.adapters.neo4j.cached_retriever import ResultCachingRetriever
+from power_atlas.contracts.pipeline import PipelineContractSnapshot
+from power_atlas.extraction_writes import write_all_extraction_data
+from power_atlas.reset_demo_runtime import run_reset
+from power_atlas.retrieval_result_cache import (
+    RETRIEVAL_GENERATION_BUMP_ALL_QUERY,
+    RETRIEVAL_GENERATION_BUMP_QUERY,
+    RetrievalResultCache,
+    RetrievalResultCacheSettings,
+    bump_retrieval_generation,
+    retrieval_generation_scope,
+    retrieval_generation_scopes,
+)
+
+
+class _GenerationDriver:
+    """Serves RetrievalGeneration stamps and applies bumps; other writes are no-ops."""
+
+    def __init__(self) -> None:
+        self.stamps: dict[str, str] = {}
+        self.bumps = 0
+        self.fail = False
+
+    def _bump(self, scopes) -> None:
+        self.bumps += 1
+        for scope in scopes:
+            self.stamps[scope] = f"g{self.bumps}"
+
+    def execute_query(self, query, parameters_=None, database_=None):
+        if self.fail:
+            raise RuntimeError("connection refused")
+        if query == RETRIEVAL_GENERATION_BUMP_QUERY:
+            self._bump(parameters_["scopes"])
+            return [], None, None
+        if "scope" not in (parameters_ or {}):
+            return [{"cnt": 0}], None, None
+        return [{"stamp": self.stamps.get(parameters_["scope"])}], None, None
+
+    def session(self, database=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def run(self, query, **params):
+        if query == RETRIEVAL_GENERATION_BUMP_QUERY:
+            self._bump(params["scopes"])
+        elif query == RETRIEVAL_GENERATION_BUMP_ALL_QUERY:
+            self._bump({*self.stamps, params["all_runs_scope"]})
+        counters = types.SimpleNamespace(nodes_deleted=0, relationships_deleted=0)
+        return types.SimpleNamespace(consume=lambda: types.SimpleNamespace(counters=counters))
+
+
+class _FakeRetriever:
+    index_name = "chunk_embedding_index"
+    retrieval_query = "RETURN node"
+    neo4j_database = "neo4j"
+
+    def __init__(self) -> None:
+        self.embedder = types.SimpleNamespace(embed_query=lambda text: [float(len(text)), 1.0])
+        self.searches: list[dict[str, object]] = []
+
+    def search(self, **kwargs) -> RetrieverResult:
+        self.searches.append(kwargs)
+        item = RetrieverResultItem(content=f"hit {len(self.searches)}", metadata={"chunk_id": "c1"})
+        return RetrieverResult(items=[item], metadata={"__retriever": "VectorCypherRetriever"})
+
+
+def test_settings_scopes_and_ttl_expiry() -> None:
+    assert RetrievalResultCacheSettings.from_env({}) == RetrievalResultCacheSettings()
+    assert not RetrievalResultCacheSettings.from_env({"POWER_ATLAS_RETRIEVAL_CACHE_MAX_ENTRIES": "off"}).enabled
+    assert RetrievalResultCacheSettings.from_env({"POWER_ATLAS_RETRIEVAL_CACHE_TTL_SECONDS": "30"}).ttl_seconds == 30.0
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        RetrievalResultCacheSettings(ttl_seconds=0)
+    assert retrieval_generation_scope({"run_id": "run-1", "source_uri": None}) == "run-1"
+    assert retrieval_generation_scope({"all_runs": True}) == "*"
+    assert retrieval_generation_scopes(["run-2", None, "run-1", "run-2"]) == ["run-1", "run-2", "*"]
+    assert retrieval_generation_scopes([None]) == []
+
+    now = [0.0]
+    cache = RetrievalResultCache(RetrievalResultCacheSettings(max_entries=1, ttl_seconds=10), clock=lambda: now[0])
+    cache.put("a", {"items": [1]})
+    assert cache.get("a") == {"items": [1]}
+    now[0] = 11.0
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.stats().to_summary() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+        "expired": 1,
+        "evictions": 1,
+        "bypassed": 0,
+    }
+
+
+def test_caching_retriever_hits_until_run_generation_changes() -> None:
+    driver = _GenerationDriver()
+    inner = _FakeRetriever()
+    retriever = ResultCachingRetriever(inner, RetrievalResultCache(), driver=driver)
+    GraphRAG(retriever=retriever, llm=types.SimpleNamespace(invoke=lambda *args, **kwargs: None))
+    params = {"run_id": "run-1", "source_uri": "file:///doc.pdf"}
+
+    first = retriever.search(query_text="Who founded Acme?", top_k=5, query_params=params)
+    repeat = retriever.search(query_text="Who founded Acme?", top_k=5, query_params=dict(params))
+    assert [item.content for item in repeat.items] == [item.content for item in first.items] == ["hit 1"]
+    assert inner.searches == [{"top_k": 5, "query_params": params, "query_vector": [17.0, 1.0]}]
+
+    retriever.search(query_text="Who founded Acme?", top_k=3, query_params=params)
+    retriever.search(query_text="Who founded Acme?", top_k=5, query_params={**params, "run_id": "run-2"})
+    assert len(inner.searches) == 3
+
+    bump_retrieval_generation(driver, run_ids=["run-2"], neo4j_database="neo4j")
+    retriever.search(query_text="Who founded Acme?", top_k=5, query_params=params)
+    assert len(inner.searches) == 3  # run-1 was not written
+    bump_retrieval_generation(driver, run_ids=["run-1"], neo4j_database="neo4j")
+    after_write = retriever.search(query_text="Who founded Acme?", top_k=5, query_params=params)
+    assert after_write.items[0].content == "hit 4"
+
+    driver.fail = True
+    retriever.search(query_text="Who founded Acme?", top_k=5, query_params=params)
+    assert inner.searches[-1]["query_text"] == "Who founded Acme?"
+    assert retriever.cache.stats().to_summary()["bypassed"] == 1
+    assert retriever.embedder is inner.embedder
+
+
+def test_extraction_writes_bump_generation_in_the_same_transaction() -> None:
+    statements: list[tuple[str, dict[str, object]]] = []
+
+    class _Tx:
+        def run(self, query, **params):
+            statements.append((query, params))
+            return types.SimpleNamespace(consume=lambda: None)
+
+    class _Session:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def execute_write(self, work):
+            work(_Tx())
+
+    driver = types.SimpleNamespace(session=lambda database: _Session())
+    write_all_extraction_data(
+        driver,
+        neo4j_database="neo4j",
+        lexical_graph_config=LexicalGraphConfig(chunk_node_label="Chunk", chunk_id_property="chunk_id"),
+        claim_rows=[{"claim_id": "c1", "run_id": "run-1", "chunk_ids": ["k1"], "properties": {}}],
+        mention_rows=[],
+        edge_rows=[],
+    )
+    assert statements[-1] == (RETRIEVAL_GENERATION_BUMP_QUERY, {"scopes": ["run-1", "*"]})
+    assert len(statements) == 3
+
+
+def test_ingest_and_reset_invalidate_cached_all_runs_results(monkeypatch) -> None:
+    driver = _GenerationDriver()
+    inner = _FakeRetriever()
+    retriever = ResultCachingRetriever(inner, RetrievalResultCache(), driver=driver)
+    all_runs = {"all_runs": True}
+
+    def _search() -> None:
+        retriever.search(query_text="Who founded Acme?", top_k=5, query_params=dict(all_runs))
+
+    _search()
+    _search()
+    assert len(inner.searches) == 1
+
+    @contextmanager
+    def _fake_driver(settings):
+        yield driver
+
+    monkeypatch.setattr(structured_ingest_runtime_module, "create_neo4j_driver", _fake_driver)
+    structured_ingest_runtime_module.run_structured_stream_ingest_live(
+        None,
+        run_id="structured_ingest-run-2",
+        source_uri="file:///catalog",
+        dataset_id="demo",
+        ingested_at="2026-10-18T00:00:00Z",
+        neo4j_database="neo4j",
+        structured_clean_dir=None,
+        structured_schema=None,
+        graph_shape=None,
+        batch_size=10,
+        progress_interval_seconds=0.0,
+        write_stream=lambda driver, **kwargs: {},
+    )
+    _search()
+    assert len(inner.searches) == 2  # the new run's rows may now match
+
+    contract = PipelineContractSnapshot(
+        chunk_embedding_index_name="demo_chunk_embedding_index",
+        chunk_embedding_label="Chunk",
+        chunk_embedding_property="embedding",
+        chunk_embedding_dimensions=3,
+        embedder_model_name="text-embedding-3-small",
+        chunk_fallback_stride=1,
+    )
+    for scope in ({"run_id": "structured_ingest-run-2"}, {}):
+        _search()
+        searches = len(inner.searches)
+        run_reset(driver=driver, database="neo4j", pipeline_contract=contract, **scope)
+        _search()
+        assert len(inner.searches) == searches + 1  # cached citations may point at deleted chunks
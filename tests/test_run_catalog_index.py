@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from power_atlas.backend_run_catalog import resolve_backend_run_catalog
+from power_atlas.orchestration.artifact_routing import write_stage_manifest_artifacts
+import power_atlas.run_catalog_index as run_catalog_index_module
+from power_atlas.run_catalog_index import (
+    RUN_CATALOG_INDEX_DIRNAME,
+    RUN_CATALOG_INDEX_FILENAME,
+    RunCatalogIndex,
+    query_run_catalog,
+)
+from power_atlas.settings import AppSettings, Neo4jSettings
+
+
+def _write_run(runs_root: Path, run_id: str, stage_name: str, *, dataset_id: str) -> Path:
+    manifest_path = runs_root / run_id / stage_name / "manifest.json"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps({"run_id": run_id, "dataset_id": dataset_id, "stages": {stage_name: {"status": "live"}}}),
+        encoding="utf-8",
+    )
+    return manifest_path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_run_catalog_index_paginates_with_cursor_and_filters(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    for index in range(5):
+        _write_run(
+            runs_root,
+            f"structured_ingest-20260512T00000{index}Z-run",
+            "structured_ingest",
+            dataset_id="demo_dataset_v1" if index % 2 == 0 else "demo_dataset_v2",
+        )
+    _write_run(runs_root, "pdf_ingest-20260512T000009Z-run", "pdf_ingest", dataset_id="demo_dataset_v1")
+
+    first = query_run_catalog(runs_root, limit=4)
+    second = query_run_catalog(runs_root, limit=4, cursor=first.next_cursor)
+
+    assert [run.run_id for run in first.runs] == [
+        "structured_ingest-20260512T000004Z-run",
+        "structured_ingest-20260512T000003Z-run",
+        "structured_ingest-20260512T000002Z-run",
+        "structured_ingest-20260512T000001Z-run",
+    ]
+    assert [run.run_id for run in second.runs] == [
+        "structured_ingest-20260512T000000Z-run",
+        "pdf_ingest-20260512T000009Z-run",
+    ]
+    assert second.next_cursor is None
+    assert [run.run_id for run in query_run_catalog(runs_root, dataset_id="demo_dataset_v2").runs] == [
+        "structured_ingest-20260512T000003Z-run",
+        "structured_ingest-20260512T000001Z-run",
+    ]
+    assert [
+        run.run_id
+        for run in query_run_catalog(runs_root, dataset_id="demo_dataset_v1", latest_per_stage_prefix=True).runs
+    ] == ["structured_ingest-20260512T000004Z-run", "pdf_ingest-20260512T000009Z-run"]
+    assert query_run_catalog(runs_root, stage_name="pdf_ingest").runs[0].stage_names == ("pdf_ingest",)
+    with pytest.raises(ValueError):
+        query_run_catalog(runs_root, cursor="!!not-a-cursor")
+
+
+def test_run_catalog_index_revalidates_runs_changed_outside_the_pipeline(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    manifest_path = _write_run(runs_root, "pdf_ingest-20260512T000000Z-a", "pdf_ingest", dataset_id="old")
+    _write_run(runs_root, "pdf_ingest-20260512T000001Z-b", "pdf_ingest", dataset_id="kept")
+    index = RunCatalogIndex(runs_root)
+    assert index.sync().reindexed == 2
+    assert index.sync().reindexed == 0
+
+    manifest_path.write_text(json.dumps({"dataset_id": "new"}), encoding="utf-8")
+    _bump_mtime(manifest_path)
+    shutil.rmtree(runs_root / "pdf_ingest-20260512T000001Z-b")
+
+    stats = index.sync()
+    assert (stats.reindexed, stats.removed) == (1, 1)
+    assert [(run.run_id, run.dataset_id) for run in index.query().runs] == [
+        ("pdf_ingest-20260512T000000Z-a", "new")
+    ]
+
+
+def test_write_stage_manifest_artifacts_records_run_in_index(tmp_path: Path) -> None:
+    write_stage_manifest_artifacts(
+        tmp_path,
+        run_id="claim_extraction-20260512T000000Z-x",
+        stage_name="claim_extraction",
+        manifest={"run_id": "claim_extraction-20260512T000000Z-x", "dataset_id": "demo_dataset_v1"},
+    )
+
+    index = RunCatalogIndex(tmp_path / "runs")
+    assert [run.dataset_id for run in index.query().runs] == ["demo_dataset_v1"]
+    assert index.sync().reindexed == 0
+
+
+def test_run_catalog_falls_back_to_directory_scan_when_index_is_unusable(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    _write_run(runs_root, "pdf_ingest-20260512T000000Z-a", "pdf_ingest", dataset_id="demo_dataset_v1")
+    (runs_root / RUN_CATALOG_INDEX_DIRNAME).mkdir()
+    (runs_root / RUN_CATALOG_INDEX_DIRNAME / RUN_CATALOG_INDEX_FILENAME).write_bytes(b"not a sqlite database" * 100)
+
+    with pytest.raises(sqlite3.DatabaseError):
+        RunCatalogIndex(runs_root).sync()
+    result = resolve_backend_run_catalog(
+        AppSettings(neo4j=Neo4jSettings(password="secret"), output_dir=tmp_path),
+        limit=10,
+    )
+
+    assert [run.dataset_id for run in result.runs] == ["demo_dataset_v1"]
+    assert result.next_cursor is None
+
+
+def test_run_catalog_queries_only_rescan_when_runs_root_changed_or_the_sync_is_stale(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runs_root = tmp_path / "runs"
+    manifest_path = _write_run(runs_root, "pdf_ingest-20260512T000000Z-a", "pdf_ingest", dataset_id="old")
+    signature_calls: list[str] = []
+    real_signature = run_catalog_index_module.run_dir_signature
+
+    def _counting_signature(run_dir: Path) -> str:
+        signature_calls.append(run_dir.name)
+        return real_signature(run_dir)
+
+    monkeypatch.setattr(run_catalog_index_module, "run_dir_signature", _counting_signature)
+    assert [run.dataset_id for run in query_run_catalog(runs_root).runs] == ["old"]
+    assert len(signature_calls) == 1
+
+    # Repeated requests with nothing added or removed do not walk the run directories.
+    for _ in range(3):
+        query_run_catalog(runs_root)
+    assert len(signature_calls) == 1
+
+    # A new run directory changes the mtime of runs/ and is picked up on the next request.
+    _write_run(runs_root, "pdf_ingest-20260512T000001Z-b", "pdf_ingest", dataset_id="new")
+    _bump_mtime(runs_root)
+    assert len(query_run_catalog(runs_root).runs) == 2
+    assert len(signature_calls) == 3
+
+    # An edit inside an existing run is only seen once the sync interval has elapsed.
+    manifest_path.write_text(json.dumps({"dataset_id": "edited"}), encoding="utf-8")
+    _bump_mtime(manifest_path)
+    index = RunCatalogIndex(runs_root)
+    assert index.sync_if_stale(60.0) is None
+    assert index.sync_if_stale(60.0, clock=lambda: 10.0**12).reindexed == 1
+    assert [run.dataset_id for run in query_run_catalog(runs_root, dataset_id="edited").runs] == ["edited"]
+
+
+def test_run_catalog_index_removes_the_index_left_at_its_former_location(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    _write_run(runs_root, "pdf_ingest-20260512T000000Z-a", "pdf_ingest", dataset_id="demo")
+    for suffix in ("", "-wal"):
+        (runs_root / f".run_catalog.sqlite{suffix}").write_bytes(b"stale")
+
+    assert [run.run_id for run in query_run_catalog(runs_root).runs] == ["pdf_ingest-20260512T000000Z-a"]
+    assert sorted(path.name for path in runs_root.iterdir()) == [RUN_CATALOG_INDEX_DIRNAME, "pdf_ingest-20260512T000000Z-a"]
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import logging
+import types
+from contextlib import contextmanager
+
+import pytest
+
+import power_atlas.adapters.neo4j.pdf_ingest_runtime as pdf_ingest_runtime_module
+import power_atlas.adapters.neo4j.run_scope_queries as run_scope_queries_module
+from power_atlas.adapters.neo4j.pdf_ingest_runtime import run_pdf_ingest_live
+from power_atlas.run_registry import (
+    LATEST_DATASET_RUN_QUERY,
+    LATEST_RUN_QUERY,
+    RUN_DATASET_QUERY,
+    RUN_FINISHED_QUERY,
+    RUN_STARTED_QUERY,
+    record_run_started,
+)
+from power_atlas.run_scope_queries import fetch_dataset_id_for_run, fetch_latest_unstructured_run_id
+from power_atlas.settings import Neo4jSettings
+
+_LOGGER = logging.getLogger("test_run_registry")
+
+
+class _RegistryDriver:
+    """Keeps ``Run`` nodes in a dict and records the Chunk-scan sessions it opens."""
+
+    def __init__(
+        self,
+        runs: dict[str, dict] | None = None,
+        chunk_run_ids: list[str] | None = None,
+        chunk_dataset_ids: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.runs = runs if runs is not None else {}
+        self.chunk_run_ids = chunk_run_ids or []
+        self.chunk_dataset_ids = chunk_dataset_ids or {}
+        self.registry_queries: list[str] = []
+        self.session_queries: list[str] = []
+
+    def execute_query(self, query, parameters_=None, database_=None):
+        params = parameters_ or {}
+        if query in (RUN_STARTED_QUERY, RUN_FINISHED_QUERY):
+            run = self.runs.setdefault(params["run_id"], {})
+            run.update({key: params[key] for key in ("stage_prefix", "dataset_id", "status", "error")})
+            return [], None, None
+        if query in (LATEST_RUN_QUERY, LATEST_DATASET_RUN_QUERY):
+            self.registry_queries.append(query)
+            matches = sorted(
+                run_id
+                for run_id, run in self.runs.items()
+                if run["stage_prefix"] == params["stage_prefix"]
+                and run["status"] == params["status"]
+                and params.get("dataset_id") in (None, run["dataset_id"])
+            )
+            return [{"run_id": matches[-1]}] if matches else [], None, None
+        if query == RUN_DATASET_QUERY:
+            run = self.runs.get(params["run_id"])
+            return [{"dataset_id": run["dataset_id"]}] if run else [], None, None
+        raise AssertionError(f"unexpected query: {query}")
+
+    def session(self, database=None):
+        driver = self
+
+        class _Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def run(self, query, **params):
+                driver.session_queries.append(query)
+                payload = {"dataset_ids": driver.chunk_dataset_ids.get(params.get("run_id"), ["scanned-dataset"])}
+                if "ORDER BY run_id DESC" in query:
+                    # The scan skips run_ids registered with a status other than $status.
+                    assert "NOT EXISTS { MATCH (run:Run {run_id: run_id}) WHERE run.status <> $status }" in query
+                    candidates = sorted(
+                        run_id
+                        for run_id in driver.chunk_run_ids
+                        if driver.runs.get(run_id, {}).get("status", params["status"]) == params["status"]
+                    )
+                    payload = [candidates[-1]] if candidates else None
+                return types.SimpleNamespace(single=lambda: payload, consume=lambda: None)
+
+        return _Session()
+
+
+def _patch_driver(monkeypatch, module, driver) -> None:
+    @contextmanager
+    def _fake_driver(settings):
+        yield driver
+
+    monkeypatch.setattr(module, "create_neo4j_driver", _fake_driver)
+
+
+def test_record_run_started_derives_stage_prefix_and_never_raises(caplog) -> None:
+    driver = _RegistryDriver()
+    assert record_run_started(
+        driver,
+        run_id="unstructured_ingest-20260101T000000000000Z-abcd1234",
+        dataset_id="demo",
+        neo4j_database="neo4j",
+    )
+    assert driver.runs["unstructured_ingest-20260101T000000000000Z-abcd1234"] == {
+        "stage_prefix": "unstructured_ingest",
+        "dataset_id": "demo",
+        "status": "running",
+        "error": None,
+    }
+
+    with caplog.at_level(logging.WARNING, logger="power_atlas.run_registry"):
+        assert not record_run_started(
+            types.SimpleNamespace(), run_id="run-1", dataset_id=None, neo4j_database="neo4j"
+        )
+    assert "run registry" in caplog.text
+
+
+def test_run_scope_lookups_use_the_registry_and_fall_back_to_chunk_scans(monkeypatch) -> None:
+    settings = Neo4jSettings(password="secret")
+    driver = _RegistryDriver(
+        runs={
+            "unstructured_ingest-20260101T000000000000Z-aaaaaaaa": {
+                "stage_prefix": "unstructured_ingest", "dataset_id": "demo", "status": "completed"
+            },
+            "unstructured_ingest-20260201T000000000000Z-bbbbbbbb": {
+                "stage_prefix": "unstructured_ingest", "dataset_id": "other", "status": "completed"
+            },
+            "unstructured_ingest-20260301T000000000000Z-cccccccc": {
+                "stage_prefix": "unstructured_ingest", "dataset_id": "demo", "status": "running"
+            },
+        },
+        chunk_run_ids=["unstructured_ingest-20250101T000000000000Z-dddddddd"],
+    )
+    _patch_driver(monkeypatch, run_scope_queries_module, driver)
+
+    assert fetch_latest_unstructured_run_id(settings, "neo4j", "demo", logger=_LOGGER) == (
+        "unstructured_ingest-20260101T000000000000Z-aaaaaaaa"
+    )
+    assert fetch_latest_unstructured_run_id(settings, "neo4j", logger=_LOGGER) == (
+        "unstructured_ingest-20260201T000000000000Z-bbbbbbbb"
+    )
+    assert fetch_dataset_id_for_run(
+        settings, "neo4j", "unstructured_ingest-20260201T000000000000Z-bbbbbbbb", logger=_LOGGER
+    ) == "other"
+    # Registry hits skip the Chunk sort; only the LIMIT 2 dataset consistency check reads chunks.
+    assert len(driver.session_queries) == 2
+    assert all("LIMIT 2" in query and "ORDER BY run_id" not in query for query in driver.session_queries)
+    # A dataset-scoped lookup uses the query whose predicates match the dataset index.
+    assert driver.registry_queries[:2] == [LATEST_DATASET_RUN_QUERY, LATEST_RUN_QUERY]
+    driver.session_queries.clear()
+
+    # Unregistered datasets and runs are answered by the Chunk scans.
+    assert fetch_latest_unstructured_run_id(settings, "neo4j", "legacy", logger=_LOGGER) == (
+        "unstructured_ingest-20250101T000000000000Z-dddddddd"
+    )
+    assert fetch_dataset_id_for_run(settings, "neo4j", "legacy-run", logger=_LOGGER) == "scanned-dataset"
+    assert len(driver.session_queries) == 3
+
+
+def test_registry_resolved_latest_run_still_warns_when_its_chunks_span_datasets(monkeypatch, caplog) -> None:
+    run_id = "unstructured_ingest-20260101T000000000000Z-aaaaaaaa"
+    driver = _RegistryDriver(
+        runs={run_id: {"stage_prefix": "unstructured_ingest", "dataset_id": "demo", "status": "completed"}},
+        chunk_dataset_ids={run_id: ["demo", "other"]},
+    )
+    _patch_driver(monkeypatch, run_scope_queries_module, driver)
+
+    with caplog.at_level(logging.WARNING, logger=_LOGGER.name):
+        resolved = fetch_latest_unstructured_run_id(Neo4jSettings(password="secret"), "neo4j", logger=_LOGGER)
+
+    assert resolved == run_id
+    assert "multiple distinct dataset_ids" in caplog.text
+    # The registry only offers runs that still have chunks.
+    assert "EXISTS { MATCH (:Chunk {run_id: run.run_id}) }" in LATEST_RUN_QUERY
+
+
+def test_live_ingest_registers_the_run_as_failed_when_the_pipeline_raises(monkeypatch) -> None:
+    driver = _RegistryDriver()
+    _patch_driver(monkeypatch, pdf_ingest_runtime_module, driver)
+    monkeypatch.setattr(pdf_ingest_runtime_module, "_ensure_chunk_vector_index", lambda *args, **kwargs: "cypher")
+
+    class _FailingRunner:
+        @classmethod
+        def from_config_file(cls, path):
+            return cls()
+
+    async def _run_pipeline(pipeline, params):
+        raise RuntimeError("embedder unavailable")
+
+    with pytest.raises(RuntimeError, match="embedder unavailable"):
+        run_pdf_ingest_live(
+            Neo4jSettings(password="secret"),
+            stage_run_id="unstructured_ingest-20260101T000000000000Z-abcd1234",
+            pdf_file_path="doc.pdf",
+            pdf_source_uri="file:///doc.pdf",
+            openai_model="gpt-test",
+            effective_dataset_id="demo",
+            effective_index_name="chunk_embedding_index",
+            effective_chunk_label="Chunk",
+            effective_embedding_property="embedding",
+            effective_embedding_dimensions=3,
+            effective_chunk_stride=1,
+            pipeline_config_path="pipeline.yaml",
+            pipeline_runner_cls=_FailingRunner,
+            run_pipeline_with_cleanup=_run_pipeline,
+            record_as_mapping=dict,
+        )
+
+    run = driver.runs["unstructured_ingest-20260101T000000000000Z-abcd1234"]
+    assert (run["status"], run["dataset_id"]) == ("failed", "demo")
+    assert run["error"] == "RuntimeError: embedder unavailable"
+
+
+def test_chunk_scan_fallback_applies_the_registry_rule_to_unfinished_runs(monkeypatch) -> None:
+    failed = "unstructured_ingest-20260301T000000000000Z-ffffffff"
+    running = "unstructured_ingest-20260201T000000000000Z-eeeeeeee"
+    legacy = "unstructured_ingest-20250101T000000000000Z-dddddddd"
+    driver = _RegistryDriver(
+        runs={
+            failed: {"stage_prefix": "unstructured_ingest", "dataset_id": "demo", "status": "failed"},
+            running: {"stage_prefix": "unstructured_ingest", "dataset_id": "demo", "status": "running"},
+        },
+        chunk_run_ids=[legacy, running, failed],
+    )
+    _patch_driver(monkeypatch, run_scope_queries_module, driver)
+
+    # Neither path picks a run registered as running or failed, even when it has the newest chunks;
+    # the unregistered run counts as completed.
+    assert fetch_latest_unstructured_run_id(Neo4jSettings(password="secret"), "neo4j", logger=_LOGGER) == legacy
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import types
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from power_atlas.reset_demo_runtime import DemoResetSettings
+from power_atlas.run_retention import (
+    RETENTION_REASON_KEEP_LATEST,
+    RETENTION_REASON_MAX_AGE,
+    RetentionRun,
+    RunRetentionPolicy,
+    plan_run_retention,
+    run_run_retention,
+    run_timestamp,
+)
+
+_NOW = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+def _run_id(prefix: str, day: int) -> str:
+    return f"{prefix}-202610{day:02d}T000000000000Z-{day:08x}"
+
+
+def _run(prefix: str, day: int, dataset_id: str | None = "ds1") -> RetentionRun:
+    run_id = _run_id(prefix, day)
+    return RetentionRun(run_id=run_id, dataset_id=dataset_id, run_at=run_timestamp(run_id))
+
+
+class _FakeDriver:
+    """Serves per-label run counts and records batched deletes by run id."""
+
+    def __init__(self, graph: dict[str, dict[str, int]], *, fail_on: str | None = None) -> None:
+        self.graph = graph
+        self.fail_on = fail_on
+        self.deleted_runs: list[str] = []
+        self.bumped_scopes: list[list[str]] = []
+
+    def execute_query(self, query, parameters_=None, database_=None):
+        label = query.split("(n:", 1)[1].split(")", 1)[0]
+        records = [
+            {"run_id": run_id, "dataset_id": "ds1" if label == "Chunk" else None, "nodes": counts[label]}
+            for run_id, counts in self.graph.items()
+            if label in counts
+        ]
+        return records, None, None
+
+    def session(self, database):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def run(self, query: str, **params):
+        if "scopes" in params:
+            self.bumped_scopes.append(params["scopes"])
+            return types.SimpleNamespace(consume=lambda: None)
+        run_id = params["run_id"]
+        if run_id == self.fail_on:
+            raise RuntimeError("transaction timed out")
+        label = query.split("n:", 1)[1].split(")", 1)[0]
+        nodes = self.graph.get(run_id, {}).pop(label, 0)
+        if run_id not in self.deleted_runs:
+            self.deleted_runs.append(run_id)
+        counters = types.SimpleNamespace(nodes_deleted=nodes, relationships_deleted=nodes)
+        return types.SimpleNamespace(consume=lambda: types.SimpleNamespace(counters=counters))
+
+
+def _write_run(output_dir: Path, run_id: str, *, payload: str = "x" * 100) -> Path:
+    stage_dir = output_dir / "runs" / run_id / "pdf_ingest"
+    stage_dir.mkdir(parents=True)
+    (stage_dir / "manifest.json").write_text(json.dumps({"dataset_id": "ds1"}), encoding="utf-8")
+    (stage_dir / "chunks.json").write_text(payload, encoding="utf-8")
+    return stage_dir.parent
+
+
+def test_plan_keeps_latest_per_dataset_and_stage_prefix() -> None:
+    runs = [
+        _run("unstructured_ingest", 1),
+        _run("unstructured_ingest", 5),
+        _run("unstructured_ingest", 9),
+        _run("unstructured_ingest", 2, dataset_id="ds2"),
+        _run("structured_ingest", 3),
+    ]
+    pruned = plan_run_retention(runs, RunRetentionPolicy(keep_latest=1), now=_NOW)
+    assert [decision.run.run_id for decision in pruned] == [
+        _run_id("unstructured_ingest", 5),
+        _run_id("unstructured_ingest", 1),
+    ]
+    assert all(decision.reasons == (RETENTION_REASON_KEEP_LATEST,) for decision in pruned)
+
+    protected = RunRetentionPolicy(
+        keep_latest=1, stage_prefix="unstructured_ingest", protected_run_ids=frozenset({_run_id("unstructured_ingest", 1)})
+    )
+    assert [decision.run.run_id for decision in plan_run_retention(runs, protected, now=_NOW)] == [
+        _run_id("unstructured_ingest", 5)
+    ]
+    with pytest.raises(ValueError, match="keep_latest"):
+        RunRetentionPolicy()
+
+
+def test_plan_combines_age_and_count_rules() -> None:
+    runs = [_run("unstructured_ingest", day) for day in (1, 10, 15, 17)]
+    by_age = plan_run_retention(runs, RunRetentionPolicy(max_age_days=5), now=_NOW)
+    assert [decision.run.run_id for decision in by_age] == [_run_id("unstructured_ingest", 10), _run_id("unstructured_ingest", 1)]
+    assert by_age[0].reasons == (RETENTION_REASON_MAX_AGE,)
+
+    # A run survives if either rule keeps it: day 10 is among the latest 3.
+    both = plan_run_retention(runs, RunRetentionPolicy(keep_latest=3, max_age_days=5), now=_NOW)
+    assert [decision.run.run_id for decision in both] == [_run_id("unstructured_ingest", 1)]
+    assert both[0].reasons == (RETENTION_REASON_KEEP_LATEST, RETENTION_REASON_MAX_AGE)
+    assert run_timestamp("unstructured_ingest-20261001T000000000000Z-abc", "2026-10-02T00:00:00Z").day == 2
+
+
+def test_dry_run_reports_then_prune_deletes_graph_and_artifacts(tmp_path: Path) -> None:
+    old, new = _run_id("unstructured_ingest", 1), _run_id("unstructured_ingest", 9)
+    graph_only = _run_id("unstructured_ingest", 3)
+    old_dir = _write_run(tmp_path, old)
+    new_dir = _write_run(tmp_path, new)
+    driver = _FakeDriver(
+        {
+            old: {"Chunk": 4, "ExtractedClaim": 6, "RunStats": 1},
+            new: {"Chunk": 5},
+            graph_only: {"Chunk": 2, "EntityMention": 1},
+        }
+    )
+    policy = RunRetentionPolicy(keep_latest=1)
+
+    report = run_run_retention(output_dir=tmp_path, policy=policy, driver=driver, database="neo4j", now=_NOW)
+    assert driver.deleted_runs == [] and old_dir.exists() and driver.bumped_scopes == []
+    assert [entry["run_id"] for entry in report["pruned"]] == [graph_only, old]
+    assert report["reclaimable_graph_nodes"] == 13
+    assert report["reclaimable_artifact_bytes"] > 100
+    assert Path(report["report_path"]).parent == tmp_path / "retention_reports"
+
+    report = run_run_retention(
+        output_dir=tmp_path,
+        policy=policy,
+        driver=driver,
+        database="neo4j",
+        dry_run=False,
+        settings=DemoResetSettings(batch_size=50),
+        now=_NOW,
+    )
+    assert driver.deleted_runs == [graph_only, old]
+    # The pruned run's RunStats node goes too, on top of the 13 counted data nodes.
+    assert report["completed"] is True and report["deleted_nodes"] == 14
+    assert driver.graph[old] == {}
+    assert not old_dir.exists() and new_dir.exists()
+    assert driver.graph[new] == {"Chunk": 5}
+    # Cached retrieval results for the pruned runs and for all runs are invalidated once.
+    assert driver.bumped_scopes == [sorted([graph_only, old]) + ["*"]]
+
+    driver = _FakeDriver({new: {"Chunk": 5}}, fail_on=new)
+    with pytest.raises(RuntimeError, match="timed out"):
+        run_run_retention(
+            output_dir=tmp_path, policy=RunRetentionPolicy(max_age_days=1), driver=driver, database="neo4j", dry_run=False, now=_NOW
+        )
+    partial = json.loads(sorted((tmp_path / "retention_reports").glob("*.json"))[-1].read_text(encoding="utf-8"))
+    assert partial["completed"] is False and "timed out" in partial["error"]
+    assert new_dir.exists()
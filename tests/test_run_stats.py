@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import pytest
+
+from power_atlas.bootstrap import build_app_context
+from power_atlas.interfaces.cli.run_stats_support import parse_run_stats_args
+from power_atlas.run_scoped_graph_counts import (
+    DEFAULT_RUN_SCOPED_GRAPH_COUNTS_QUERY,
+    RUN_SCOPED_GRAPH_COUNTS_SCAN_QUERY,
+    RunScopedGraphCountsRequest,
+    resolve_run_scoped_graph_counts,
+)
+from power_atlas.run_stats import (
+    RUN_STATS_DELETE_QUERY,
+    RUN_STATS_READ_QUERY,
+    RUN_STATS_RUN_IDS_QUERY,
+    RUN_STATS_SCAN_QUERY,
+    RUN_STATS_WRITE_QUERY,
+    RunStats,
+    recompute_run_stats,
+    refresh_run_stats,
+    run_stats_refresh_query,
+)
+
+
+class _StatsDriver:
+    """Serves stored RunStats nodes and scanned counts keyed by run_id."""
+
+    def __init__(self, stored: dict[str, dict], actual: dict[str, dict]) -> None:
+        self.stored = stored
+        self.actual = actual
+        self.queries: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute_query(self, query, parameters_=None, database_=None):
+        self.queries.append(query)
+        run_id = (parameters_ or {}).get("run_id")
+        if query == RUN_STATS_RUN_IDS_QUERY:
+            return [{"run_id": run_id} for run_id in sorted({*self.stored, *self.actual})], None, None
+        if query in (RUN_STATS_READ_QUERY, DEFAULT_RUN_SCOPED_GRAPH_COUNTS_QUERY):
+            return ([self.stored[run_id]] if run_id in self.stored else []), None, None
+        if query in (RUN_STATS_SCAN_QUERY, RUN_SCOPED_GRAPH_COUNTS_SCAN_QUERY):
+            return [self.actual.get(run_id, dict.fromkeys(_full_counts(), 0))], None, None
+        if query == RUN_STATS_WRITE_QUERY:
+            self.stored[run_id] = dict(parameters_["counts"])
+        elif query == RUN_STATS_DELETE_QUERY:
+            del self.stored[run_id]
+        return [], None, None
+
+
+def _full_counts(**overrides: int) -> dict[str, int]:
+    counts = {
+        "chunk_count": 10,
+        "embedded_chunk_count": 10,
+        "claim_count": 4,
+        "mention_count": 8,
+        "chunks_with_claims": 3,
+        "claims_with_participants": 2,
+        "cluster_count": 5,
+        "clustered_mention_count": 6,
+    }
+    return {**counts, **overrides}
+
+
+def test_refresh_queries_lock_the_node_and_summaries_report_coverage() -> None:
+    query = run_stats_refresh_query("resolution")
+    assert query.index("SET stats.updated_at") < query.index("CALL {")
+    assert "stats.cluster_count = cluster_count" in query
+    assert "claim_count" not in query
+    with pytest.raises(ValueError, match="Unknown run stats sections"):
+        run_stats_refresh_query("retrieval")
+
+    driver = _StatsDriver({}, {})
+    refresh_run_stats(driver, run_ids=["run-2", None, "run-1", "run-2"], sections=("ingest",), neo4j_database="neo4j")
+    assert driver.queries == [run_stats_refresh_query("ingest")] * 2
+
+    summary = RunStats.from_record("run-1", {**_full_counts(), "cluster_count": None}).to_summary()
+    assert summary["cluster_count"] is None
+    assert summary["coverage"] == {
+        "embedded_chunks": 1.0,
+        "chunks_with_claims": 0.3,
+        "claims_with_participants": 0.5,
+        "clustered_mentions": 0.75,
+    }
+
+
+def test_run_scoped_counts_read_run_stats_and_fall_back_to_a_scan() -> None:
+    app_context = build_app_context(environ={"NEO4J_PASSWORD": "secret", "NEO4J_DATABASE": "atlas"})
+    driver = _StatsDriver(
+        stored={"run-1": _full_counts(), "run-2": {**_full_counts(), "cluster_count": None}},
+        actual={"run-2": _full_counts(cluster_count=1), "run-3": _full_counts(cluster_count=2)},
+    )
+
+    def _resolve(run_id: str):
+        driver.queries.clear()
+        return resolve_run_scoped_graph_counts(
+            app_context,
+            RunScopedGraphCountsRequest(run_id=run_id),
+            driver_factory=lambda settings: driver,
+        )
+
+    stored = _resolve("run-1")
+    assert (stored.http_status_code, stored.counts.cluster_count) == (200, 5)
+    assert driver.queries == [DEFAULT_RUN_SCOPED_GRAPH_COUNTS_QUERY]
+    # A RunStats node missing a section, or no node at all, is answered by the scan.
+    assert _resolve("run-2").counts.cluster_count == 1
+    assert _resolve("run-3").counts.cluster_count == 2
+    assert driver.queries[-1] == RUN_SCOPED_GRAPH_COUNTS_SCAN_QUERY
+    assert _resolve("run-4").http_status_code == 404
+
+
+def test_recompute_reports_drift_rewrites_and_drops_orphaned_stats() -> None:
+    zero = dict.fromkeys(_full_counts(), 0)
+    driver = _StatsDriver(
+        stored={"run-1": _full_counts(), "run-2": _full_counts(claim_count=7), "run-gone": _full_counts()},
+        actual={"run-1": _full_counts(), "run-2": _full_counts(), "run-gone": zero, "run-new": _full_counts()},
+    )
+
+    preview = recompute_run_stats(driver, neo4j_database="neo4j", dry_run=True)
+    assert (preview["runs_checked"], preview["runs_with_drift"]) == (4, 3)
+    assert RUN_STATS_WRITE_QUERY not in driver.queries and RUN_STATS_DELETE_QUERY not in driver.queries
+
+    report = recompute_run_stats(driver, neo4j_database="neo4j")
+    actions = {run["run_id"]: run["action"] for run in report["runs"]}
+    assert actions == {"run-1": "unchanged", "run-2": "rebuilt", "run-gone": "deleted", "run-new": "rebuilt"}
+    assert report["runs"][1]["drift"] == {"claim_count": {"stored": 7, "actual": 4}}
+    assert driver.stored == {"run-1": _full_counts(), "run-2": _full_counts(), "run-new": _full_counts()}
+    assert recompute_run_stats(driver, neo4j_database="neo4j", run_ids=["run-2"])["runs_with_drift"] == 0
+
+    assert parse_run_stats_args(["--recompute", "--run-id", "run-2"]).run_ids == ["run-2"]
+    with pytest.raises(SystemExit):
+        parse_run_stats_args([])
+
+
+def test_hybrid_entity_resolution_refreshes_run_state_once_after_all_writes(monkeypatch) -> None:
+    from contextlib import contextmanager
+    from types import SimpleNamespace
+
+    from power_atlas.adapters.neo4j import entity_resolution_runtime as entity_resolution_runtime_module
+    from power_atlas.settings import Neo4jSettings
+
+    calls: list[str] = []
+
+    @contextmanager
+    def _fake_driver(settings):
+        yield object()
+
+    monkeypatch.setattr(entity_resolution_runtime_module, "create_neo4j_driver", _fake_driver)
+    entity_resolution_runtime_module.run_entity_resolution_live(
+        Neo4jSettings(password="secret"),
+        run_id="run-1",
+        source_uri=None,
+        resolution_mode="hybrid",
+        effective_dataset_id="demo",
+        alignment_version="v1",
+        neo4j_database="neo4j",
+        entity_resolution_alignment=None,
+        entity_resolution_canonical_lookup=None,
+        entity_resolution_graph=None,
+        fetch_mentions=lambda driver, **kwargs: [],
+        cluster_mentions=lambda mentions: [],
+        fetch_canonicals=lambda driver, **kwargs: [],
+        build_lookup_tables=lambda nodes: ({}, {}, {}),
+        make_cluster_id=lambda run_id, entity_type, text: text,
+        align_clusters_to_canonical=lambda clusters, by_label, by_alias: [],
+        resolve_mention=lambda *args: {},
+        write_resolution_results=lambda driver, **kwargs: calls.append("resolution"),
+        write_alignment_results=lambda driver, **kwargs: calls.append("alignment"),
+        fetch_member_of_coverage=lambda driver, **kwargs: SimpleNamespace(mentions_clustered=0, mentions_unclustered=0),
+        fetch_alignment_coverage=lambda driver, **kwargs: SimpleNamespace(
+            total_clusters=0,
+            aligned_clusters=0,
+            distinct_canonical_entities_aligned=0,
+            mentions_in_aligned=0,
+            alignment_breakdown={},
+        ),
+        refresh_run_state=lambda driver, *, run_id, neo4j_database: calls.append(f"refresh:{run_id}"),
+    )
+
+    assert calls == ["resolution", "alignment", "refresh:run-1"]
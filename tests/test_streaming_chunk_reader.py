@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from power_atlas.adapters.graphrag_types import LexicalGraphConfig, Neo4jGraph, Neo4jNode, TextChunk
+from power_atlas.claim_extraction_runner import _collect_streamed_chunks
+from power_atlas.claim_extraction_scheduler import ExtractionSchedulerPolicy, extract_chunks_scheduled
+from power_atlas.neo4j_io import RunScopedNeo4jChunkReader
+
+_CONFIG = LexicalGraphConfig(
+    chunk_id_property="chunk_id",
+    chunk_index_property="chunk_index",
+    chunk_text_property="text",
+)
+
+
+class _KeysetDriver:
+    """Answers the reader's page queries over in-memory chunk rows."""
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.queries: list[tuple[str, dict]] = []
+        pool_config = type("PoolConfig", (), {"user_agent": None})
+        self._pool = type("Pool", (), {"pool_config": pool_config()})()
+
+    def execute_query(self, query, parameters_=None, **kwargs):
+        params = dict(parameters_ or {})
+        self.queries.append((query, params))
+        rows = [row for row in self.rows if row["run_id"] == params["run_id"]]
+        if "IS NOT NULL" in query:
+            rows = [row for row in rows if row["chunk_index"] is not None]
+        elif "IS NULL" in query:
+            rows = [row for row in rows if row["chunk_index"] is None]
+        elif "> $after_index" in query:
+            rows = [row for row in rows if row["chunk_index"] is not None and row["chunk_index"] > params["after_index"]]
+        elif "= $at_index" in query:
+            rows = [row for row in rows if row["chunk_index"] == params["at_index"]]
+        if "ORDER BY" in query:
+            rows.sort(key=lambda row: row["chunk_index"])
+        if "LIMIT $page_size" in query:
+            rows = rows[: params["page_size"]]
+        # Like Neo4j's map projection, absent (null) properties are left out.
+        return [{"chunk": {key: value for key, value in row.items() if value is not None}} for row in rows], None, None
+
+
+def _rows(run_id: str, document: str, indexes) -> list[dict]:
+    return [
+        {"chunk_id": f"{document}-{index}", "chunk_index": index, "text": f"{document} {index}", "run_id": run_id}
+        for index in indexes
+    ]
+
+
+async def _pages(reader: RunScopedNeo4jChunkReader, page_size: int) -> list[list[str]]:
+    return [[chunk.uid for chunk in page] async for page in reader.iter_pages(_CONFIG, page_size=page_size)]
+
+
+def test_iter_pages_keyset_paginates_without_splitting_shared_indexes() -> None:
+    # Two documents of one run share chunk_index values 0..2.
+    driver = _KeysetDriver(_rows("run-1", "a", range(3)) + _rows("run-1", "b", range(3)) + _rows("run-2", "z", range(5)))
+    reader = RunScopedNeo4jChunkReader(driver, run_id="run-1")
+
+    pages = asyncio.run(_pages(reader, page_size=3))
+
+    # The first page of three stops inside index 1, so it is completed with b-1.
+    assert [sorted(page) for page in pages] == [["a-0", "a-1", "b-0", "b-1"], ["a-2", "b-2"]]
+    first_query, first_params = driver.queries[0]
+    assert "ORDER BY c.chunk_index LIMIT $page_size" in first_query
+    assert "embedding: null" in first_query
+    assert first_params == {"run_id": "run-1", "page_size": 3}
+    assert any(params.get("after_index") == 1 for _, params in driver.queries)
+
+
+def test_iter_pages_reads_chunks_without_an_index_last() -> None:
+    rows = _rows("run-1", "a", range(3))
+    rows.append({"chunk_id": "a-unindexed", "chunk_index": None, "text": "a ?", "run_id": "run-1"})
+    driver = _KeysetDriver(rows)
+
+    pages = asyncio.run(_pages(RunScopedNeo4jChunkReader(driver, run_id="run-1"), page_size=2))
+
+    assert pages == [["a-0", "a-1"], ["a-2"], ["a-unindexed"]]
+    assert "IS NULL" in driver.queries[-1][0] and "LIMIT" not in driver.queries[-1][0]
+
+def test_iter_pages_raises_for_empty_runs_and_reads_unindexed_configs_in_one_query() -> None:
+    with pytest.raises(ValueError, match="No chunks returned"):
+        asyncio.run(_pages(RunScopedNeo4jChunkReader(_KeysetDriver([]), run_id="missing"), page_size=2))
+    with pytest.raises(ValueError, match="page_size"):
+        asyncio.run(_pages(RunScopedNeo4jChunkReader(_KeysetDriver([]), run_id="missing"), page_size=0))
+
+    driver = _KeysetDriver(_rows("run-1", "a", range(4)))
+    reader = RunScopedNeo4jChunkReader(driver, run_id="run-1")
+    unindexed_config = LexicalGraphConfig(chunk_id_property="chunk_id", chunk_index_property="", chunk_text_property="text")
+
+    async def _all_pages():
+        return [page async for page in reader.iter_pages(unindexed_config, page_size=2)]
+
+    (page,) = asyncio.run(_all_pages())
+    assert len(page) == 4
+    assert len(driver.queries) == 1
+
+
+def test_scheduler_extracts_streamed_chunks_while_later_chunks_are_still_being_read() -> None:
+    first_chunk_extracted = asyncio.Event()
+    extracted: list[str] = []
+
+    class _Extractor:
+        async def run(self, chunks, schema, lexical_graph_config):
+            (chunk,) = chunks.chunks
+            extracted.append(chunk.uid)
+            first_chunk_extracted.set()
+            return Neo4jGraph(nodes=[Neo4jNode(id=f"node-{chunk.uid}", label="EntityMention")])
+
+    async def _stream():
+        yield TextChunk(uid="c1", text="one", index=0)
+        # The second chunk only "arrives" once the first one has been extracted.
+        await asyncio.wait_for(first_chunk_extracted.wait(), timeout=5)
+        yield TextChunk(uid="c2", text="two", index=1)
+
+    graph, stats = asyncio.run(
+        extract_chunks_scheduled(
+            _Extractor(),
+            _stream(),
+            schema=None,
+            lexical_graph_config=None,
+            policy=ExtractionSchedulerPolicy(progress_interval_seconds=0.0),
+        )
+    )
+
+    assert extracted == ["c1", "c2"]
+    assert [node.id for node in graph.nodes] == ["node-c1", "node-c2"]
+    assert stats.chunks == 2
+
+
+def test_streamed_scheduling_bounds_read_ahead_and_keeps_only_text_less_chunk_copies() -> None:
+    release = asyncio.Event()
+    pulled: list[int] = []
+
+    class _BlockedExtractor:
+        async def run(self, chunks, schema, lexical_graph_config):
+            await release.wait()
+            return Neo4jGraph()
+
+    async def _stream():
+        for index in range(20):
+            pulled.append(index)
+            yield TextChunk(uid=f"c{index}", text="x" * 100, index=index)
+
+    async def _run():
+        kept: list[TextChunk] = []
+        extraction = asyncio.ensure_future(
+            extract_chunks_scheduled(
+                _BlockedExtractor(),
+                _collect_streamed_chunks(_stream(), kept),
+                schema=None,
+                lexical_graph_config=None,
+                policy=ExtractionSchedulerPolicy(
+                    initial_concurrency=1, min_concurrency=1, max_concurrency=1, progress_interval_seconds=0.0
+                ),
+            )
+        )
+        for _ in range(20):
+            await asyncio.sleep(0)
+        # Two pending chunks per unit of max_concurrency, plus the one waiting for a slot.
+        read_while_blocked = len(pulled)
+        release.set()
+        _, stats = await extraction
+        return read_while_blocked, kept, stats
+
+    read_while_blocked, kept, stats = asyncio.run(_run())
+    assert read_while_blocked == 3
+    assert stats.chunks == 20
+    assert [(chunk.uid, chunk.index, chunk.text) for chunk in kept[:2]] == [("c0", 0, ""), ("c1", 1, "")]
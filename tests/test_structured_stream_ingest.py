@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import shutil
+import types
+from pathlib import Path
+
+import pytest
+
+from power_atlas.contracts import get_default_structured_schema_contract
+from power_atlas.settings import Neo4jSettings
+from power_atlas.structured_ingest_runner import lint_and_clean_structured_csvs, run_structured_ingest_runtime
+from power_atlas.structured_stream_ingest import (
+    DiskKeySet,
+    StructuredStreamIngestSettings,
+    stream_lint_and_clean_structured_csvs,
+)
+
+_FIXTURES = Path(__file__).resolve().parents[1] / "demo" / "fixtures" / "datasets" / "demo_dataset_v1"
+
+
+def _copy_fixtures(tmp_path: Path) -> Path:
+    root = tmp_path / "dataset"
+    shutil.copytree(_FIXTURES / "structured", root / "structured")
+    return root
+
+
+def test_disk_key_set_and_settings(tmp_path: Path) -> None:
+    key_set = DiskKeySet(tmp_path / "keys.sqlite", cache_kib=64)
+    try:
+        assert key_set.add("ids", "Q1") is True
+        assert key_set.add("ids", "Q1") is False
+        assert key_set.add("other", "Q1") is True
+        assert "Q1" in key_set.view("ids") and "Q2" not in key_set.view("ids")
+    finally:
+        key_set.close()
+
+    settings = StructuredStreamIngestSettings.from_env(
+        {"POWER_ATLAS_STRUCTURED_STREAMING_THRESHOLD_BYTES": "1", "POWER_ATLAS_STRUCTURED_BATCH_SIZE": "7"}
+    )
+    schema_root = _FIXTURES / "structured"
+    schema = get_default_structured_schema_contract()
+    assert settings.batch_size == 7 and settings.applies_to(schema_root, schema)
+    assert not StructuredStreamIngestSettings().applies_to(schema_root, schema)
+    assert not StructuredStreamIngestSettings(mode="off", threshold_bytes=0).applies_to(schema_root, schema)
+    with pytest.raises(ValueError, match="mode"):
+        StructuredStreamIngestSettings.from_env({"POWER_ATLAS_STRUCTURED_STREAMING": "sometimes"})
+
+
+def test_streaming_lint_matches_in_memory_lint_and_caps_issues(tmp_path: Path) -> None:
+    root = _copy_fixtures(tmp_path)
+    entities = root / "structured" / "entities.csv"
+    lines = entities.read_text(encoding="utf-8").splitlines()
+    entities.write_text("\n".join([*lines, lines[1], ",,,,,", lines[2]]) + "\n", encoding="utf-8")
+
+    in_memory = lint_and_clean_structured_csvs("mem", tmp_path / "out", root)
+    streamed = stream_lint_and_clean_structured_csvs("stream", tmp_path / "out", root)
+    for file_name, summary in in_memory["files"].items():
+        streamed_summary = dict(streamed["files"][file_name])
+        assert streamed_summary.pop("rows_per_second") >= 0
+        assert streamed_summary == summary
+        assert (Path(streamed["structured_clean_dir"]) / file_name).read_text(encoding="utf-8") == (
+            Path(in_memory["structured_clean_dir"]) / file_name
+        ).read_text(encoding="utf-8")
+    assert streamed["files"]["entities.csv"]["deduplicated_rows"] == 2
+    assert not list((tmp_path / "out" / "runs" / "stream").glob("structured_keys_*"))
+
+    claims = root / "structured" / "claims.csv"
+    claim_lines = claims.read_text(encoding="utf-8").splitlines()
+    broken = [line.replace('"Q6551937"', '"Q999999999"', 1) for line in claim_lines[1:]]
+    claims.write_text("\n".join([claim_lines[0], *broken]) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="lint failed") as in_memory_error:
+        lint_and_clean_structured_csvs("mem2", tmp_path / "out", root)
+    with pytest.raises(ValueError, match="lint failed"):
+        stream_lint_and_clean_structured_csvs("stream2", tmp_path / "out", root, max_reported_issues=3)
+    full_report = json.loads((tmp_path / "out" / "runs" / "mem2" / "lint_report.json").read_text())
+    capped_report = json.loads((tmp_path / "out" / "runs" / "stream2" / "lint_report.json").read_text())
+    assert "issue(s)" in str(in_memory_error.value)
+    assert capped_report["summary"]["issue_count"] == full_report["summary"]["issue_count"] > 3
+    assert capped_report["summary"]["reported_issue_count"] == len(capped_report["issues"]) == 3
+    assert {issue["code"] for issue in capped_report["issues"]} == {"UNKNOWN_SUBJECT_ID"}
+
+
+def test_streaming_runtime_writes_fixed_size_batches_in_dependency_order(tmp_path: Path) -> None:
+    root = _copy_fixtures(tmp_path)
+    batches: list[tuple[str, int]] = []
+
+    def _record(query: str, params: dict) -> None:
+        kind = "source" if "rows" not in params else query.split("MERGE (", 1)[1].split(":", 1)[0]
+        batches.append((kind, len(params.get("rows", []))))
+
+    class _FakeSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+        def run(self, query: str, **params):
+            _record(query, params)
+            return types.SimpleNamespace(consume=lambda: None)
+
+    def _execute_query(query: str, parameters_=None, database_=None):
+        # Row batches go through run_batched_write, i.e. the driver's managed
+        # (retrying) transaction rather than a hand-rolled session loop.
+        assert parameters_["run_id"] == "structured_ingest-stream"
+        _record(query, parameters_)
+        return [], None, None
+
+    def _fake_stream_live_runner(neo4j_settings, *, write_stream, **kwargs):
+        driver = types.SimpleNamespace(session=lambda database: _FakeSession(), execute_query=_execute_query)
+        return write_stream(driver, **kwargs)
+
+    config = types.SimpleNamespace(output_dir=tmp_path / "out", dry_run=False)
+    result = run_structured_ingest_runtime(
+        config=config,
+        run_id="structured_ingest-stream",
+        fixtures_dir=root,
+        neo4j_settings=Neo4jSettings(password="test"),
+        stream_settings=StructuredStreamIngestSettings(mode="on", batch_size=5),
+        read_csv_rows=lambda path: pytest.fail("streaming ingest must not load CSVs into memory"),
+        live_runner=lambda *args, **kwargs: pytest.fail("streaming ingest must not use the in-memory writer"),
+        stream_live_runner=_fake_stream_live_runner,
+    )
+
+    assert result["status"] == "live"
+    assert (result["entities"], result["facts"], result["relationships"], result["claims"]) == (13, 17, 29, 37)
+    kinds = [kind for kind, _ in batches]
+    assert kinds[0] == "source" and kinds.count("source") == 1
+    assert kinds.index("claim") > max(index for index, kind in enumerate(kinds) if kind in {"fact", "relationship"})
+    assert all(size <= 5 for kind, size in batches if kind != "source")
+    summary = json.loads(Path(result["ingest_summary_path"]).read_text(encoding="utf-8"))
+    write_stats = summary["streaming"]["write"]
+    assert write_stats["batch_size"] == 5
+    assert {kind: stats["batches"] for kind, stats in write_stats["files"].items()} == {
+        "entities": 3,
+        "facts": 4,
+        "relationships": 6,
+        "claims": 8,
+    }
+    assert summary["counts"]["claims"] == write_stats["files"]["claims"]["rows"] == 37